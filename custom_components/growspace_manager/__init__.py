@@ -20,7 +20,9 @@ from homeassistant.helpers.storage import Store
 from .const import (
     ADD_GROWSPACE_SCHEMA,
     ADD_PLANT_SCHEMA,
+    ADD_PLANTS_SCHEMA,
     ADD_STRAIN_SCHEMA,
+    ARCHIVE_PLANTS_SCHEMA,
     CLEAR_STRAIN_LIBRARY_SCHEMA,
     CONFIGURE_ENVIRONMENT_SCHEMA,
     DEBUG_CLEANUP_LEGACY_SCHEMA,
@@ -29,10 +31,14 @@ from .const import (
     DEBUG_RESET_SPECIAL_GROWSPACES_SCHEMA,
     DOMAIN,
     EXPORT_STRAIN_LIBRARY_SCHEMA,
+    FIT_BAYESIAN_LIKELIHOODS_SCHEMA,
+    GET_ARCHIVED_PLANTS_SCHEMA,
     HARVEST_PLANT_SCHEMA,
+    HARVEST_PLANTS_SCHEMA,
     IMPORT_STRAIN_LIBRARY_SCHEMA,
     MOVE_CLONE_SCHEMA,
     MOVE_PLANT_SCHEMA,
+    MOVE_PLANTS_SCHEMA,
     REMOVE_ENVIRONMENT_SCHEMA,
     REMOVE_GROWSPACE_SCHEMA,
     REMOVE_PLANT_SCHEMA,
@@ -44,6 +50,7 @@ from .const import (
     SWITCH_PLANT_SCHEMA,
     TAKE_CLONE_SCHEMA,
     TRANSITION_PLANT_SCHEMA,
+    TRANSITION_PLANTS_SCHEMA,
     UPDATE_PLANT_SCHEMA,
     ASK_GROW_ADVICE_SCHEMA,
     ANALYZE_ALL_GROWSPACES_SCHEMA,
@@ -67,6 +74,7 @@ from .services import (
 )
 from .intent import async_setup_intents
 from .strain_library import StrainLibrary
+from .websocket_api import async_setup_websocket_api
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -81,9 +89,12 @@ async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> Non
     await hass.config_entries.async_reload(entry.entry_id)
 
 
-async def async_setup(_hass: HomeAssistant, _config: dict):
+async def async_setup(hass: HomeAssistant, _config: dict):
     """Set up the integration via YAML (optional)."""
     _LOGGER.debug("Running async_setup for %s", DOMAIN)
+
+    # Register the WebSocket commands used by the Lovelace card once, for all entries
+    async_setup_websocket_api(hass)
     return True
 
 
@@ -112,6 +123,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         strain_library=strain_library_instance,
     )
     await coordinator.async_load()  # Load data into the coordinator
+    coordinator.async_start_day_rollover()
+    coordinator.async_start_timed_notifications()
 
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
@@ -178,6 +191,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Perform the first refresh to populate data
     await coordinator.async_config_entry_first_refresh()
 
+    # Move plants that finished curing while Home Assistant was off to the archive
+    coordinator.async_schedule_archive()
+
     return True
 
 
@@ -354,6 +370,29 @@ async def _register_services(
 
     _LOGGER.debug("Registered AI services: ask_grow_advice, analyze_all_growspaces, strain_recommendation")
 
+    # --- Bulk plant services (SupportsResponse.OPTIONAL, per-plant results) ---
+    bulk_services_to_register = [
+        ("add_plants", plant.handle_add_plants, ADD_PLANTS_SCHEMA),
+        ("transition_plants", plant.handle_transition_plants, TRANSITION_PLANTS_SCHEMA),
+        ("move_plants", plant.handle_move_plants, MOVE_PLANTS_SCHEMA),
+        ("harvest_plants", plant.handle_harvest_plants, HARVEST_PLANTS_SCHEMA),
+        ("archive_plants", plant.handle_archive_plants, ARCHIVE_PLANTS_SCHEMA),
+    ]
+
+    for service_name, handler_func, schema in bulk_services_to_register:
+
+        async def bulk_service_wrapper(call: ServiceCall, _handler=handler_func):
+            return await _handler(hass, coordinator, strain_library_instance, call)
+
+        hass.services.async_register(
+            DOMAIN,
+            service_name,
+            bulk_service_wrapper,
+            schema=schema,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+        _LOGGER.debug("Registered service: %s", service_name)
+
     # Register the standalone 'get_strain_library' service
     async def get_strain_library_wrapper(
         call: ServiceCall, _handler=strain_library_services.handle_get_strain_library
@@ -370,6 +409,34 @@ async def _register_services(
     )
     _LOGGER.debug("Registered service: get_strain_library")
 
+    async def get_archived_plants_wrapper(
+        call: ServiceCall, _handler=plant.handle_get_archived_plants
+    ):
+        return await _handler(hass, coordinator, strain_library_instance, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        "get_archived_plants",
+        get_archived_plants_wrapper,
+        schema=GET_ARCHIVED_PLANTS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    _LOGGER.debug("Registered service: get_archived_plants")
+
+    async def fit_bayesian_likelihoods_wrapper(
+        call: ServiceCall, _handler=environment.handle_fit_bayesian_likelihoods
+    ):
+        return await _handler(hass, coordinator, strain_library_instance, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        "fit_bayesian_likelihoods",
+        fit_bayesian_likelihoods_wrapper,
+        schema=FIT_BAYESIAN_LIKELIHOODS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    _LOGGER.debug("Registered service: fit_bayesian_likelihoods")
+
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
@@ -383,6 +450,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         for coordinator in entry_data["irrigation_coordinators"].values():
             coordinator.async_cancel_listeners()
 
+    # Stop scheduled wake-ups and persist any deferred save
+    if "coordinator" in entry_data:
+        entry_data["coordinator"].async_cancel_day_rollover()
+        entry_data["coordinator"].async_cancel_timed_notifications()
+        await entry_data["coordinator"].async_flush()
+
     created_unique_ids = entry_data.get("created_entities", [])
     entity_registry = er.async_get(hass)
 
@@ -435,6 +508,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             "take_clone",
             "move_clone",
             "harvest_plant",
+            "add_plants",
+            "transition_plants",
+            "move_plants",
+            "harvest_plants",
+            "archive_plants",
+            "get_archived_plants",
             "export_strain_library",
             "import_strain_library",
             "clear_strain_library",
@@ -448,6 +527,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             "get_strain_library",
             "configure_environment",
             "remove_environment",
+            "fit_bayesian_likelihoods",
             "ask_grow_advice",
         ]
 
@@ -0,0 +1,661 @@
+"""Offline backtesting of the Bayesian sensors against recorded history.
+
+Tuning priors, thresholds and `prob_*` overrides live means waiting days to
+see their effect. The backtest replays recorded entity states through the
+same rule sets and snapshot reader as the live sensors, on a virtual clock
+that honours the evaluation interval, and reports each sensor's probability
+timeline, how often it flipped and how many notifications it would have sent.
+
+History can come from a CSV or NDJSON export (`entity_id`, `state`,
+`last_changed` or `last_updated`, and optionally a JSON `attributes` column)
+or straight from a copy of the recorder's SQLite database. Long histories are
+split into chunks that replay in parallel worker processes; each chunk starts
+from the last known state of every entity and a trend window of history, so
+only the coalescing of evaluations right at a chunk boundary can differ from
+one continuous replay.
+
+Run from the Home Assistant configuration directory:
+
+    python -m custom_components.growspace_manager.backtest history.csv \\
+        --config growspace.json --flower-start 2024-05-01
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+import csv
+from dataclasses import dataclass, field
+from datetime import date
+import json
+import logging
+import math
+from pathlib import Path
+import sqlite3
+import sys
+from types import SimpleNamespace
+from typing import Any, NamedTuple
+
+from homeassistant.util import dt as dt_util
+
+from .bayesian_evaluator import mold_risk_rules, optimal_rules, stress_rules
+from .bayesian_incremental import DependentRule, IncrementalEvaluator
+from .binary_sensor import BayesianEnvironmentSensor
+from .const import (
+    CONF_HYSTERESIS_OFF,
+    CONF_HYSTERESIS_ON,
+    CONF_MIN_OFF_DURATION,
+    CONF_MIN_ON_DURATION,
+    DEFAULT_BAYESIAN_PRIORS,
+    DEFAULT_BAYESIAN_THRESHOLDS,
+    DEFAULT_EVALUATION_INTERVAL,
+    DEFAULT_HYSTERESIS_OFF,
+    DEFAULT_HYSTERESIS_ON,
+    DEFAULT_MIN_OFF_DURATION,
+    DEFAULT_MIN_ON_DURATION,
+)
+from .environment_hub import (
+    DEFAULT_TREND_DURATION,
+    TRACKED_ENVIRONMENT_KEYS,
+    TREND_SENSOR_KEYS,
+)
+from .trend_buffer import TrendBuffer
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_DURATION = 86400.0
+DEFAULT_NOTIFICATION_COOLDOWN = 300.0
+
+RuleSet = Callable[[Any], list[DependentRule]]
+
+# sensor type: (prior key, threshold key, rule set, alerts when turning on)
+SENSOR_MODELS: dict[str, tuple[str, str, RuleSet, bool]] = {
+    "stress": ("prior_stress", "stress_threshold", stress_rules, True),
+    "mold_risk": ("prior_mold_risk", "mold_threshold", mold_risk_rules, True),
+    "optimal": ("prior_optimal", "optimal_threshold", optimal_rules, False),
+}
+
+
+class ReplayState(NamedTuple):
+    """A recorded entity state."""
+
+    entity_id: str
+    state: str
+    timestamp: float
+    attributes: dict[str, Any]
+
+    @property
+    def domain(self) -> str:
+        """Return the entity's domain."""
+        return self.entity_id.split(".", 1)[0]
+
+
+@dataclass(slots=True)
+class BacktestConfig:
+    """The growspace configuration to replay history against.
+
+    Attributes:
+        env_config: The growspace's environment configuration, including any
+            prior, threshold and `prob_*` overrides under test.
+        sensor_types: The sensors to replay.
+        veg_start: The date the growspace entered veg, for stage rules.
+        flower_start: The date the growspace entered flower.
+        evaluation_interval: The minimum seconds between evaluations.
+        notification_cooldown: The minimum seconds between notifications of
+            one sensor.
+    """
+
+    env_config: dict[str, Any]
+    sensor_types: tuple[str, ...] = tuple(SENSOR_MODELS)
+    veg_start: date | None = None
+    flower_start: date | None = None
+    evaluation_interval: float = DEFAULT_EVALUATION_INTERVAL
+    notification_cooldown: float = DEFAULT_NOTIFICATION_COOLDOWN
+
+    @property
+    def trend_window(self) -> float:
+        """Return the longest trend window in seconds."""
+        return 60 * max(
+            self.env_config.get(f"{key}_trend_duration", DEFAULT_TREND_DURATION)
+            for key in TREND_SENSOR_KEYS
+        )
+
+    @property
+    def trend_entities(self) -> set[str]:
+        """Return the entities whose history feeds fallback trend analysis."""
+        return {
+            entity_id
+            for key in TREND_SENSOR_KEYS
+            if (entity_id := self.env_config.get(f"{key}_sensor"))
+        }
+
+    @property
+    def entity_ids(self) -> set[str]:
+        """Return every entity the replayed sensors read."""
+        keys = [
+            *TRACKED_ENVIRONMENT_KEYS,
+            *(f"{key}_trend_sensor" for key in TREND_SENSOR_KEYS),
+            *(f"{key}_stats_sensor" for key in TREND_SENSOR_KEYS),
+        ]
+        return {entity_id for key in keys if (entity_id := self.env_config.get(key))}
+
+
+@dataclass(slots=True)
+class SensorReplay:
+    """The replayed behaviour of one sensor.
+
+    Attributes:
+        sensor_type: The sensor type, e.g. "stress".
+        threshold: The threshold the sensor turns on at.
+        times: The POSIX timestamp of every evaluation.
+        probabilities: The posterior after every evaluation.
+        flips: How many times the sensor changed state.
+        alerts: How many notifications the sensor would have sent.
+    """
+
+    sensor_type: str
+    threshold: float
+    times: list[float] = field(default_factory=list)
+    probabilities: list[float] = field(default_factory=list)
+    flips: int = 0
+    alerts: int = 0
+
+    def summary(self) -> dict[str, Any]:
+        """Return the replay statistics without the timeline."""
+        on_count = sum(value >= self.threshold for value in self.probabilities)
+        return {
+            "evaluations": len(self.times),
+            "flips": self.flips,
+            "alerts": self.alerts,
+            "on_ratio": round(on_count / len(self.times), 4) if self.times else 0.0,
+            "max_probability": round(max(self.probabilities, default=0.0), 4),
+        }
+
+
+@dataclass(slots=True)
+class BacktestResult:
+    """The outcome of a backtest."""
+
+    sensors: dict[str, SensorReplay]
+    events: int
+    chunks: int
+
+    def summary(self) -> dict[str, Any]:
+        """Return the replay statistics of every sensor."""
+        return {
+            "events": self.events,
+            "chunks": self.chunks,
+            "sensors": {
+                sensor_type: replay.summary()
+                for sensor_type, replay in self.sensors.items()
+            },
+        }
+
+
+def _parse_timestamp(value: Any) -> float:
+    """Convert an ISO datetime or POSIX timestamp into a POSIX timestamp."""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parsed = dt_util.parse_datetime(value)
+    if parsed is None:
+        raise ValueError(f"Invalid timestamp: {value!r}")
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt_util.UTC)
+    return parsed.timestamp()
+
+
+def _record(row: dict[str, Any]) -> ReplayState:
+    """Build a ReplayState from an exported row."""
+    attributes = row.get("attributes") or {}
+    if isinstance(attributes, str):
+        attributes = json.loads(attributes)
+    return ReplayState(
+        row["entity_id"],
+        str(row["state"]),
+        _parse_timestamp(row.get("last_updated") or row["last_changed"]),
+        attributes,
+    )
+
+
+def load_csv(path: str | Path) -> list[ReplayState]:
+    """Load recorded states from a CSV history export.
+
+    Args:
+        path: The CSV file.
+
+    Returns:
+        The recorded states.
+    """
+    with open(path, newline="", encoding="utf-8") as file:
+        return [_record(row) for row in csv.DictReader(file)]
+
+
+def load_ndjson(path: str | Path) -> list[ReplayState]:
+    """Load recorded states from a newline-delimited JSON export.
+
+    Args:
+        path: The NDJSON file.
+
+    Returns:
+        The recorded states.
+    """
+    with open(path, encoding="utf-8") as file:
+        return [_record(json.loads(line)) for line in file if line.strip()]
+
+
+def load_recorder_db(
+    path: str | Path,
+    entity_ids: Iterable[str],
+    start: float | None = None,
+    end: float | None = None,
+) -> list[ReplayState]:
+    """Load recorded states from a copy of the recorder's SQLite database.
+
+    Args:
+        path: The database file.
+        entity_ids: The entities to load.
+        start: The earliest POSIX timestamp to load.
+        end: The POSIX timestamp to load up to, exclusive.
+
+    Returns:
+        The recorded states in time order.
+    """
+    entity_ids = sorted(entity_ids)
+    query = (
+        "SELECT states_meta.entity_id, states.state, states.last_updated_ts, "
+        "state_attributes.shared_attrs FROM states "
+        "JOIN states_meta ON states.metadata_id = states_meta.metadata_id "
+        "LEFT JOIN state_attributes "
+        "ON states.attributes_id = state_attributes.attributes_id "
+        f"WHERE states_meta.entity_id IN ({', '.join('?' * len(entity_ids))})"
+    )
+    params: list[Any] = list(entity_ids)
+    if start is not None:
+        query += " AND states.last_updated_ts >= ?"
+        params.append(start)
+    if end is not None:
+        query += " AND states.last_updated_ts < ?"
+        params.append(end)
+    query += " ORDER BY states.last_updated_ts"
+
+    connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        return [
+            ReplayState(
+                entity_id,
+                state if state is not None else "unknown",
+                timestamp,
+                json.loads(attributes) if attributes else {},
+            )
+            for entity_id, state, timestamp, attributes in connection.execute(
+                query, params
+            )
+        ]
+    finally:
+        connection.close()
+
+
+def load_history(
+    path: str | Path, entity_ids: Iterable[str] | None = None
+) -> list[ReplayState]:
+    """Load recorded states, choosing the reader from the file extension.
+
+    Args:
+        path: A .csv, .ndjson/.jsonl or .db/.sqlite file.
+        entity_ids: The entities to load from a database.
+
+    Returns:
+        The recorded states.
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix == ".csv":
+        return load_csv(path)
+    if suffix in (".ndjson", ".jsonl"):
+        return load_ndjson(path)
+    if suffix in (".db", ".sqlite", ".sqlite3"):
+        if entity_ids is None:
+            raise ValueError("Loading a recorder database requires entity IDs")
+        return load_recorder_db(path, entity_ids)
+    raise ValueError(f"Unsupported history format: {path}")
+
+
+class _ReplaySensor:
+    """A Bayesian sensor stand-in reading replayed states at a virtual time."""
+
+    # The live sensor's readers, so snapshots are built exactly as in Home Assistant
+    _get_sensor_value = BayesianEnvironmentSensor._get_sensor_value
+    _read_environment_state = BayesianEnvironmentSensor._read_environment_state
+
+    def __init__(self, config: BacktestConfig) -> None:
+        """Initialize the replay sensor.
+
+        Args:
+            config: The configuration under test.
+        """
+        self.config = config
+        self.env_config = config.env_config
+        self.states: dict[str, ReplayState] = {}
+        self.hass = SimpleNamespace(states=self.states)
+        self.now = 0.0
+        # Window analyses at the current virtual time, shared by every sensor
+        self.trend_cache: dict[tuple[str, int], dict[str, Any]] = {}
+        self.trend_buffers = {
+            entity_id: TrendBuffer(config.trend_window)
+            for entity_id in config.trend_entities
+        }
+
+    def clock(self) -> float:
+        """Return the virtual time."""
+        return self.now
+
+    def apply(self, record: ReplayState) -> None:
+        """Make a recorded state current.
+
+        Args:
+            record: The recorded state.
+        """
+        self.states[record.entity_id] = record
+        if (buffer := self.trend_buffers.get(record.entity_id)) is not None:
+            try:
+                buffer.add(record.timestamp, float(record.state))
+            except ValueError:
+                pass
+
+    def _get_growth_stage_info(self) -> dict[str, int]:
+        """Return the stage day counters at the virtual time."""
+        today = dt_util.as_local(dt_util.utc_from_timestamp(self.now)).date()
+
+        def days_since(start: date | None) -> int:
+            return max((today - start).days, 0) if start else 0
+
+        return {
+            "veg_days": days_since(self.config.veg_start),
+            "flower_days": days_since(self.config.flower_start),
+        }
+
+    async def _async_analyze_sensor_trend(
+        self, sensor_id: str, duration_minutes: int, threshold: float
+    ) -> dict[str, Any]:
+        """Analyze a trend from the replayed samples up to the virtual time."""
+        if (buffer := self.trend_buffers.get(sensor_id)) is None:
+            return {"trend": "stable", "crossed_threshold": False}
+        key = (sensor_id, duration_minutes)
+        if (analysis := self.trend_cache.get(key)) is None:
+            analysis = buffer.analyze(duration_minutes * 60, -math.inf, self.now)
+            self.trend_cache[key] = analysis
+        # Only the threshold differs between sensors reading the same window
+        return {
+            **analysis,
+            "crossed_threshold": "min" in analysis and analysis["min"] > threshold,
+        }
+
+
+class _Chunk(NamedTuple):
+    """The inputs of one replay worker."""
+
+    config: BacktestConfig
+    initial: list[ReplayState]
+    warmup: list[ReplayState]
+    events: list[ReplayState]
+
+
+async def _async_replay(chunk: _Chunk) -> dict[str, tuple[list[float], list[float]]]:
+    """Replay a chunk of events and return each sensor's timeline."""
+    config = chunk.config
+    sensor = _ReplaySensor(config)
+    for record in chunk.initial:
+        sensor.states[record.entity_id] = record
+    for record in chunk.warmup:
+        sensor.apply(record)
+
+    evaluators = {}
+    for sensor_type in config.sensor_types:
+        prior_key, _, rule_set, _ = SENSOR_MODELS[sensor_type]
+        prior = config.env_config.get(prior_key, DEFAULT_BAYESIAN_PRIORS[sensor_type])
+        evaluators[sensor_type] = (
+            prior,
+            IncrementalEvaluator(rule_set(sensor), clock=sensor.clock),
+        )
+    timelines: dict[str, tuple[list[float], list[float]]] = {
+        sensor_type: ([], []) for sensor_type in evaluators
+    }
+
+    async def evaluate(at: float) -> None:
+        sensor.now = at
+        sensor.trend_cache.clear()
+        state = sensor._read_environment_state()
+        for sensor_type, (prior, evaluator) in evaluators.items():
+            await evaluator.async_evaluate(state)
+            times, probabilities = timelines[sensor_type]
+            times.append(at)
+            probabilities.append(evaluator.posterior(prior))
+
+    # Events within the evaluation interval of the last run are merged into one
+    # run when the interval elapses, like the live scheduler
+    interval = config.evaluation_interval
+    events = chunk.events
+    last_run: float | None = None
+    due: float | None = None
+    index = 0
+    while index < len(events):
+        at = events[index].timestamp
+        if due is not None and due <= at:
+            await evaluate(due)
+            last_run, due = due, None
+        while index < len(events) and events[index].timestamp == at:
+            sensor.apply(events[index])
+            index += 1
+        if due is not None:
+            continue
+        if last_run is None or at - last_run >= interval:
+            await evaluate(at)
+            last_run = at
+        else:
+            due = last_run + interval
+    if due is not None:
+        await evaluate(due)
+    return timelines
+
+
+def _replay_chunk(chunk: _Chunk) -> dict[str, tuple[list[float], list[float]]]:
+    """Replay a chunk in its own event loop, for use in worker processes."""
+    return asyncio.run(_async_replay(chunk))
+
+
+def _plan_chunks(
+    records: Sequence[ReplayState], config: BacktestConfig, chunk_duration: float
+) -> list[_Chunk]:
+    """Split time-ordered records into independently replayable chunks."""
+    timestamps = [record.timestamp for record in records]
+    trend_entities = config.trend_entities
+    chunks: list[_Chunk] = []
+    latest: dict[str, ReplayState] = {}
+    start_index = 0
+    while start_index < len(records):
+        # Chunks start at their first record, so gaps in history add no chunks
+        start = timestamps[start_index]
+        end_index = bisect_left(timestamps, start + chunk_duration, lo=start_index)
+        warmup_index = bisect_left(
+            timestamps, start - config.trend_window, hi=start_index
+        )
+        chunks.append(
+            _Chunk(
+                config,
+                list(latest.values()),
+                [
+                    record
+                    for record in records[warmup_index:start_index]
+                    if record.entity_id in trend_entities
+                ],
+                list(records[start_index:end_index]),
+            )
+        )
+        for record in records[start_index:end_index]:
+            latest[record.entity_id] = record
+        start_index = end_index
+    return chunks
+
+
+def _count_flips_and_alerts(
+    replay: SensorReplay, cooldown: float, env_config: dict[str, Any]
+) -> None:
+    """Count state changes and the notifications they would have sent.
+
+    States settle like the live sensors: with the configured hysteresis
+    bands and minimum on/off durations, checked at each evaluation.
+    """
+    _, _, _, alert_on = SENSOR_MODELS[replay.sensor_type]
+    turn_on = replay.threshold + env_config.get(
+        CONF_HYSTERESIS_ON, DEFAULT_HYSTERESIS_ON
+    )
+    turn_off = replay.threshold - env_config.get(
+        CONF_HYSTERESIS_OFF, DEFAULT_HYSTERESIS_OFF
+    )
+    min_on = env_config.get(CONF_MIN_ON_DURATION, DEFAULT_MIN_ON_DURATION)
+    min_off = env_config.get(CONF_MIN_OFF_DURATION, DEFAULT_MIN_OFF_DURATION)
+    is_on = False
+    changed_at: float | None = None
+    last_alert: float | None = None
+    for at, probability in zip(replay.times, replay.probabilities):
+        if changed_at is None:
+            # Nothing written yet: the plain threshold decides
+            now_on = probability >= replay.threshold
+        elif is_on:
+            now_on = not (probability < turn_off and at - changed_at >= min_on)
+        else:
+            now_on = probability >= turn_on and at - changed_at >= min_off
+        if changed_at is None:
+            changed_at = at
+        if now_on == is_on:
+            continue
+        is_on = now_on
+        changed_at = at
+        replay.flips += 1
+        if now_on == alert_on and (last_alert is None or at - last_alert >= cooldown):
+            replay.alerts += 1
+            last_alert = at
+
+
+def run_backtest(
+    records: Iterable[ReplayState],
+    config: BacktestConfig,
+    chunk_duration: float = DEFAULT_CHUNK_DURATION,
+    max_workers: int | None = None,
+) -> BacktestResult:
+    """Replay recorded states through the Bayesian sensors.
+
+    Args:
+        records: The recorded states, in any order.
+        config: The configuration under test.
+        chunk_duration: The seconds of history each worker replays.
+        max_workers: The number of worker processes; 1 replays in this
+            process. Defaults to the number of CPUs.
+
+    Returns:
+        The replayed timelines with their flip and alert counts.
+    """
+    for sensor_type in config.sensor_types:
+        if sensor_type not in SENSOR_MODELS:
+            raise ValueError(f"Unknown sensor type: {sensor_type}")
+    if chunk_duration <= 0:
+        raise ValueError("chunk_duration must be positive")
+
+    entity_ids = config.entity_ids
+    ordered = sorted(
+        (record for record in records if record.entity_id in entity_ids),
+        key=lambda record: record.timestamp,
+    )
+    sensors = {
+        sensor_type: SensorReplay(
+            sensor_type,
+            config.env_config.get(
+                SENSOR_MODELS[sensor_type][1], DEFAULT_BAYESIAN_THRESHOLDS[sensor_type]
+            ),
+        )
+        for sensor_type in config.sensor_types
+    }
+    if not ordered:
+        return BacktestResult(sensors, 0, 0)
+
+    chunks = _plan_chunks(ordered, config, chunk_duration)
+    if len(chunks) == 1 or max_workers == 1:
+        results = [_replay_chunk(chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_replay_chunk, chunks))
+
+    for timelines in results:
+        for sensor_type, (times, probabilities) in timelines.items():
+            sensors[sensor_type].times.extend(times)
+            sensors[sensor_type].probabilities.extend(probabilities)
+    for replay in sensors.values():
+        _count_flips_and_alerts(
+            replay, config.notification_cooldown, config.env_config
+        )
+
+    _LOGGER.debug(
+        "Replayed %d events in %d chunks for %s",
+        len(ordered),
+        len(chunks),
+        ", ".join(sensors),
+    )
+    return BacktestResult(sensors, len(ordered), len(chunks))
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Replay a history file and print the summary as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("history", help="CSV, NDJSON or recorder SQLite file")
+    parser.add_argument(
+        "--config", required=True, help="JSON file with the environment config"
+    )
+    parser.add_argument("--sensor", action="append", choices=list(SENSOR_MODELS))
+    parser.add_argument("--veg-start", type=date.fromisoformat)
+    parser.add_argument("--flower-start", type=date.fromisoformat)
+    parser.add_argument(
+        "--interval", type=float, default=DEFAULT_EVALUATION_INTERVAL
+    )
+    parser.add_argument("--chunk-hours", type=float, default=24.0)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--timeline", help="Write the timelines to this CSV file")
+    args = parser.parse_args(argv)
+
+    env_config = json.loads(Path(args.config).read_text(encoding="utf-8"))
+    config = BacktestConfig(
+        env_config,
+        sensor_types=tuple(args.sensor or SENSOR_MODELS),
+        veg_start=args.veg_start,
+        flower_start=args.flower_start,
+        evaluation_interval=args.interval,
+    )
+    result = run_backtest(
+        load_history(args.history, config.entity_ids),
+        config,
+        chunk_duration=args.chunk_hours * 3600,
+        max_workers=args.workers,
+    )
+
+    if args.timeline:
+        with open(args.timeline, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(["sensor", "time", "probability", "on"])
+            for sensor_type, replay in result.sensors.items():
+                for at, probability in zip(replay.times, replay.probabilities):
+                    writer.writerow(
+                        [
+                            sensor_type,
+                            dt_util.utc_from_timestamp(at).isoformat(),
+                            round(probability, 6),
+                            int(probability >= replay.threshold),
+                        ]
+                    )
+    sys.stdout.write(json.dumps(result.summary(), indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -146,3 +146,187 @@ VPD_OPTIMAL_THRESHOLDS: Final[
         "night": [(0.9, 1.2, (0.90, 0.20))],
     },
 }
+
+# =========================================================================
+# INTERVAL RULE TABLES
+# Structure: context -> [ (condition, prob_key, prob_default, reason), ... ]
+#
+# The first rule whose condition matches the metric value wins. Conditions are
+# ("gt", x), ("lt", x), ("between", low, high) (inclusive), ("inside", low, high)
+# (exclusive), ("outside", low, high) (exclusive) or ("any",). prob_key names
+# an env_config override, or None for a fixed probability. reason is formatted
+# with {value}; None adds the observation without a reason. Tables are compiled
+# into bisectable interval tables by bayesian_rules.py.
+# =========================================================================
+
+RuleCondition = tuple[Any, ...]
+Rule = tuple[RuleCondition, str | None, tuple[float, float], str | None]
+RuleTable = dict[str, list[Rule]]
+
+_TEMP_HEAT_RULES: Final[list[Rule]] = [
+    (("gt", 32), "prob_temp_extreme_heat", (0.98, 0.05), "Extreme Heat ({value})"),
+    (("gt", 30), "prob_temp_high_heat", (0.85, 0.15), "High Heat ({value})"),
+]
+_TEMP_WARM_AND_COLD_RULES: Final[list[Rule]] = [
+    (("gt", 28), "prob_temp_warm", (0.65, 0.30), "Temp Warm ({value})"),
+    (("lt", 15), "prob_temp_extreme_cold", (0.95, 0.08), "Extreme Cold ({value})"),
+    (("lt", 18), "prob_temp_cold", (0.80, 0.20), "Temp Cold ({value})"),
+]
+
+# Stress sensor; contexts are "default" and "flower_late" (flower day >= 42)
+TEMP_STRESS_RULES: Final[RuleTable] = {
+    "default": [*_TEMP_HEAT_RULES, *_TEMP_WARM_AND_COLD_RULES],
+    "flower_late": [
+        *_TEMP_HEAT_RULES,
+        (("gt", 27), None, (0.70, 0.30), "Temp Warm ({value})"),
+        *_TEMP_WARM_AND_COLD_RULES,
+    ],
+}
+
+# Stress sensor, checked independently while the lights are off
+NIGHT_TEMP_STRESS_RULES: Final[RuleTable] = {
+    "night": [
+        (("gt", 24), "prob_night_temp_high", (0.80, 0.20), "Night Temp High ({value})"),
+    ],
+}
+
+# Stress sensor, checked independently in every stage
+HUMIDITY_DRY_RULES: Final[RuleTable] = {
+    "any": [
+        (("lt", 35), "prob_humidity_too_dry", (0.85, 0.20), "Humidity Dry ({value})"),
+    ],
+}
+
+# Stress sensor; contexts are the stage keys
+HUMIDITY_STRESS_RULES: Final[RuleTable] = {
+    "veg_early": [
+        (
+            ("gt", 80),
+            "prob_humidity_high_veg_early",
+            (0.80, 0.20),
+            "Humidity High ({value})",
+        ),
+    ],
+    "veg_late": [
+        (
+            ("gt", 70),
+            "prob_humidity_high_veg_late",
+            (0.85, 0.15),
+            "Humidity High ({value})",
+        ),
+    ],
+    "flower_early": [
+        (
+            ("outside", 45, 60),
+            None,
+            (0.75, 0.25),
+            "Humidity out of range (<45 or >60) ({value})",
+        ),
+    ],
+    "flower_late": [
+        (
+            ("outside", 40, 60),
+            None,
+            (0.85, 0.15),
+            "Humidity out of range (<40 or >60) ({value})",
+        ),
+    ],
+}
+
+CO2_STRESS_RULES: Final[RuleTable] = {
+    "any": [
+        (("lt", 400), None, (0.80, 0.25), "CO2 Low ({value})"),
+        (("gt", 1600), None, (0.95, 0.10), "CO2 High ({value})"),
+    ],
+}
+
+# Optimal conditions sensor; reasons are weighted by P(obs | not optimal).
+# Contexts are "day", "day_flower_late" (lights on, flower day >= 42) and
+# "night"
+OPTIMAL_TEMP_RULES: Final[RuleTable] = {
+    "day_flower_late": [
+        (("between", 22, 26), None, PROB_PERFECT, None),
+        (
+            ("any",),
+            None,
+            PROB_STRESS_OUT_OF_RANGE,
+            "Temp out of range Late Flower ({value})",
+        ),
+    ],
+    "day": [
+        (("between", 24, 26), None, PROB_PERFECT, None),
+        (("between", 22, 28), None, PROB_GOOD, None),
+        (("between", 20, 29), None, PROB_ACCEPTABLE, None),
+        (("any",), None, PROB_STRESS_OUT_OF_RANGE, "Temp out of range ({value})"),
+    ],
+    "night": [
+        (("between", 20, 23), None, PROB_PERFECT, None),
+        (
+            ("any",),
+            None,
+            PROB_STRESS_OUT_OF_RANGE,
+            "Night temp out of range ({value})",
+        ),
+    ],
+}
+
+# Contexts are "default" and "flower_late" (flower day >= 42)
+OPTIMAL_CO2_RULES: Final[RuleTable] = {
+    "flower_late": [
+        (("between", 400, 800), None, (0.90, 0.25), None),
+        (("between", 800, 1200), None, (0.4, 0.6), None),
+    ],
+    "default": [
+        (("between", 1000, 1400), None, PROB_PERFECT, None),
+        (("between", 800, 1500), None, PROB_GOOD, None),
+        (("between", 400, 600), None, PROB_ACCEPTABLE, None),
+        (("lt", 400), None, PROB_STRESS_OUT_OF_RANGE, "CO2 Low ({value})"),
+        (("any",), None, PROB_STRESS_OUT_OF_RANGE, "CO2 High ({value})"),
+    ],
+}
+
+# Mold risk sensor, late flower only. The humidity and VPD tables have "day"
+# and "night" contexts; unknown light state counts as night
+MOLD_TEMP_RULES: Final[RuleTable] = {
+    "any": [
+        (
+            ("inside", 16, 23),
+            "prob_mold_temp_danger_zone",
+            (0.85, 0.30),
+            "Temp in danger zone ({value})",
+        ),
+    ],
+}
+
+MOLD_HUMIDITY_RULES: Final[RuleTable] = {
+    "night": [
+        (
+            ("gt", 60),
+            "prob_mold_humidity_high_night",
+            (0.99, 0.10),
+            "Night Humidity High ({value})",
+        ),
+    ],
+    "day": [
+        (
+            ("gt", 60),
+            "prob_mold_humidity_high_day",
+            (0.95, 0.20),
+            "Day Humidity High ({value})",
+        ),
+    ],
+}
+
+MOLD_VPD_RULES: Final[RuleTable] = {
+    "night": [
+        (
+            ("lt", 0.8),
+            "prob_mold_vpd_low_night",
+            (0.95, 0.20),
+            "Night VPD Low ({value})",
+        ),
+    ],
+    "day": [
+        (("lt", 0.9), "prob_mold_vpd_low_day", (0.90, 0.25), "Day VPD Low ({value})"),
+    ],
+}
@@ -0,0 +1,149 @@
+"""Log-odds Bayesian inference for the Growspace Manager sensors.
+
+Multiplying raw likelihoods underflows to zero once a sensor collects a few
+hundred observations, at which point the naive update falls back to the prior.
+Summing log-likelihood ratios keeps the evidence representable. The scalar
+update multiplies the likelihoods directly while the products stay well inside
+the float range, which is the common case and as fast as the naive update, and
+otherwise takes the log-odds path. Evidence can also be gathered per
+observation group and summed later, which lets a sensor keep the contribution
+of each rule and recompute only the rules whose inputs changed.
+
+Zero likelihoods keep the semantics of the multiplicative update: a zero on
+the "true" side forces the posterior to 0, a zero on the "false" side forces
+it to 1, and zeros on both sides leave the prior unchanged.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+import math
+
+Observation = tuple[float, float]
+
+# Bounds at which the running likelihood ratio is moved into log space
+_RATIO_MIN = 1e-150
+_RATIO_MAX = 1e150
+# Smallest likelihood product the direct update divides without losing precision
+_PRODUCT_MIN = 1e-280
+
+
+def _sigmoid(log_odds: float) -> float:
+    """Convert log-odds into a probability without overflowing."""
+    if log_odds >= 0:
+        return 1.0 / (1.0 + math.exp(-log_odds))
+    odds = math.exp(log_odds)
+    return odds / (1.0 + odds)
+
+
+@dataclass(frozen=True, slots=True)
+class Evidence:
+    """The combined log-likelihood ratio of a set of observations.
+
+    Attributes:
+        log_ratio: The sum of log(P(obs | event) / P(obs | not event)) over
+            the observations with two non-zero likelihoods.
+        zero_true: Whether any observation is impossible given the event.
+        zero_false: Whether any observation is impossible without the event.
+        count: The number of observations.
+    """
+
+    log_ratio: float = 0.0
+    zero_true: bool = False
+    zero_false: bool = False
+    count: int = 0
+
+
+NO_EVIDENCE = Evidence()
+
+
+def observation_evidence(observations: Sequence[Observation]) -> Evidence:
+    """Fold observations into their combined log-likelihood ratio.
+
+    Args:
+        observations: (P(obs | event), P(obs | not event)) pairs.
+
+    Returns:
+        The evidence of the observations.
+    """
+    if not observations:
+        return NO_EVIDENCE
+
+    zero_true = False
+    zero_false = False
+    # The likelihood ratio is multiplied directly and only folded into the
+    # log-odds when it approaches the limits of a float
+    ratio = 1.0
+    log_ratio = 0.0
+    for p_obs_given_true, p_obs_given_false in observations:
+        if p_obs_given_true <= 0 or p_obs_given_false <= 0:
+            zero_true = zero_true or p_obs_given_true <= 0
+            zero_false = zero_false or p_obs_given_false <= 0
+            continue
+        ratio *= p_obs_given_true / p_obs_given_false
+        if not _RATIO_MIN < ratio < _RATIO_MAX:
+            log_ratio += math.log(ratio)
+            ratio = 1.0
+
+    return Evidence(
+        log_ratio + math.log(ratio), zero_true, zero_false, len(observations)
+    )
+
+
+def posterior_from_evidence(prior: float, evidence: Iterable[Evidence]) -> float:
+    """Update a prior with independently gathered evidence.
+
+    Summing the log ratios of several observation groups gives the same
+    posterior as updating with all of their observations at once.
+
+    Args:
+        prior: The prior probability of the event.
+        evidence: The evidence of each observation group.
+
+    Returns:
+        The posterior probability of the event.
+    """
+    count = 0
+    zero_true = prior <= 0
+    zero_false = prior >= 1
+    log_ratio = 0.0
+    for group in evidence:
+        count += group.count
+        zero_true = zero_true or group.zero_true
+        zero_false = zero_false or group.zero_false
+        log_ratio += group.log_ratio
+
+    if not count or (zero_true and zero_false):
+        return prior
+    if zero_true:
+        return 0.0
+    if zero_false:
+        return 1.0
+    return _sigmoid(log_ratio + math.log(prior) - math.log1p(-prior))
+
+
+def posterior_probability(prior: float, observations: Sequence[Observation]) -> float:
+    """Update a prior with independent observations.
+
+    Args:
+        prior: The prior probability of the event.
+        observations: (P(obs | event), P(obs | not event)) pairs.
+
+    Returns:
+        The posterior probability of the event.
+    """
+    if not observations:
+        return prior
+
+    # Direct update while both products stay normal floats
+    prob_true = prior
+    prob_false = 1 - prior
+    for p_obs_given_true, p_obs_given_false in observations:
+        prob_true *= p_obs_given_true
+        prob_false *= p_obs_given_false
+    if _PRODUCT_MIN < prob_true < math.inf and _PRODUCT_MIN < prob_false < math.inf:
+        return prob_true / (prob_true + prob_false)
+
+    # Zeros, near-underflow and out-of-range likelihoods go through log-odds
+    return posterior_from_evidence(prior, (observation_evidence(observations),))
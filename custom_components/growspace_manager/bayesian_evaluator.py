@@ -2,19 +2,13 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Awaitable
+from functools import partial
 from typing import TYPE_CHECKING, Callable
 
 from homeassistant.core import State
 
-from .bayesian_data import (
-    PROB_ACCEPTABLE,
-    PROB_GOOD,
-    PROB_PERFECT,
-    PROB_STRESS_OUT_OF_RANGE,
-    PROB_VPD_STRESS_OUT_OF_RANGE,
-    VPD_OPTIMAL_THRESHOLDS,
-    VPD_STRESS_THRESHOLDS,
-)
+from .bayesian_incremental import DependentRule
+from .bayesian_rules import IntervalTable, rules_for
 from .models import EnvironmentState
 
 if TYPE_CHECKING:
@@ -46,6 +40,22 @@ def _determine_stage_key(state: EnvironmentState) -> str | None:
     return None
 
 
+def _time_of_day(state: EnvironmentState) -> str:
+    """Return "night" when the lights are off, treating unknown as "day"."""
+    return "night" if state.is_lights_on is False else "day"
+
+
+def _apply(
+    table: IntervalTable,
+    value: float,
+    observations: ObservationList,
+    reasons: ReasonList,
+) -> None:
+    """Add the outcome of the rule matching a value, if any."""
+    if (outcome := table.lookup(value)) is not None:
+        outcome.apply(value, observations, reasons)
+
+
 # =========================================================================
 # STRESS SENSOR EVALUATION
 # =========================================================================
@@ -58,71 +68,77 @@ async def async_evaluate_stress_trend(
     observations: ObservationList = []
     reasons: ReasonList = []
     trend_states: dict[str, str] = {}
-    env_config = sensor_instance.env_config
 
-    trend_states["temperature_trend"] = "stable"
-    trend_states["humidity_trend"] = "stable"
-    trend_states["vpd_trend"] = "stable"
+    for sensor_key in TREND_FIELDS:
+        metric_obs, metric_reasons, metric_states = (
+            await async_evaluate_stress_metric_trend(sensor_instance, sensor_key)
+        )
+        observations.extend(metric_obs)
+        reasons.extend(metric_reasons)
+        trend_states.update(metric_states)
+
+    return observations, reasons, trend_states
+
+
+async def async_evaluate_stress_metric_trend(
+    sensor_instance: BayesianEnvironmentSensor, sensor_key: str
+) -> tuple[ObservationList, ReasonList, dict[str, str]]:
+    """Evaluate the rising trend of one metric from sensors/history."""
+    observations: ObservationList = []
+    reasons: ReasonList = []
+    env_config = sensor_instance.env_config
+    trend_key = f"{sensor_key}_trend"
+    trend_states: dict[str, str] = {trend_key: "stable"}
 
-    # Define common variables and helpers outside the loop for cleaner logic
     analyze_trend: Callable[[str, int, float], Awaitable[dict]] = (
         sensor_instance._async_analyze_sensor_trend
     )
 
-    # --- Trend Analysis Logic (Moved from BayesianStressSensor) ---
-    for sensor_key, trend_key in [
-        ("temperature", "temperature_trend"),
-        ("humidity", "humidity_trend"),
-        ("vpd", "vpd_trend"),
-    ]:
-        trend_sensor_id = env_config.get(f"{sensor_key}_trend_sensor")
-        stats_sensor_id = env_config.get(f"{sensor_key}_stats_sensor")
-
-        # --- External Trend Sensor Logic ---
-        if trend_sensor_id:
-            trend_state: State | None = sensor_instance.hass.states.get(trend_sensor_id)
-            if trend_state and trend_state.state == "on":  # Rising trend
+    trend_sensor_id = env_config.get(f"{sensor_key}_trend_sensor")
+    stats_sensor_id = env_config.get(f"{sensor_key}_stats_sensor")
+
+    # --- External Trend Sensor Logic ---
+    if trend_sensor_id:
+        trend_state: State | None = sensor_instance.hass.states.get(trend_sensor_id)
+        if trend_state and trend_state.state == "on":  # Rising trend
+            trend_states[trend_key] = "rising"
+            gradient = trend_state.attributes.get("gradient", 0)
+            prob = (
+                env_config.get("prob_trend_fast_rise", (0.95, 0.15))
+                if gradient > 0.1
+                else env_config.get("prob_trend_slow_rise", (0.75, 0.30))
+            )
+            observations.append(prob)
+            reason_suffix = " fast" if gradient > 0.1 else ""
+            reasons.append(
+                (prob[0], f"{sensor_key.capitalize()} rising{reason_suffix}")
+            )
+
+    elif stats_sensor_id:
+        stats_state: State | None = sensor_instance.hass.states.get(stats_sensor_id)
+        if stats_state and (change := stats_state.attributes.get("change")) is not None:
+            threshold = 0.2 if sensor_key == "vpd" else 1.0
+            if change > threshold:
                 trend_states[trend_key] = "rising"
-                gradient = trend_state.attributes.get("gradient", 0)
-                prob = (
-                    env_config.get("prob_trend_fast_rise", (0.95, 0.15))
-                    if gradient > 0.1
-                    else env_config.get("prob_trend_slow_rise", (0.75, 0.30))
-                )
+                prob = (0.85, 0.25)
                 observations.append(prob)
-                reason_suffix = " fast" if gradient > 0.1 else ""
-                reasons.append(
-                    (prob[0], f"{sensor_key.capitalize()} rising{reason_suffix}")
-                )
-
-        elif stats_sensor_id:
-            stats_state: State | None = sensor_instance.hass.states.get(stats_sensor_id)
-            if (
-                stats_state
-                and (change := stats_state.attributes.get("change")) is not None
-            ):
-                threshold = 0.2 if sensor_key == "vpd" else 1.0
-                if change > threshold:
-                    trend_states[trend_key] = "rising"
-                    prob = (0.85, 0.25)
-                    observations.append(prob)
-                    reasons.append((prob[0], f"{sensor_key.capitalize()} rising"))
-
-        else:  # Fallback to manual analysis (Requires await)
-            duration = env_config.get(f"{sensor_key}_trend_duration", 30)
-            threshold = env_config.get(f"{sensor_key}_trend_threshold", 26.0)
-            sensitivity = env_config.get(f"{sensor_key}_trend_sensitivity", 0.5)
-            if env_config.get(f"{sensor_key}_sensor"):
-                analysis = await analyze_trend(
-                    env_config[f"{sensor_key}_sensor"], duration, threshold
-                )
-                trend_states[trend_key] = analysis["trend"]
-                if analysis["trend"] == "rising" and analysis["crossed_threshold"]:
-                    p_true = 0.5 + (sensitivity * 0.45)
-                    p_false = 0.5 - (sensitivity * 0.4)
-                    prob = (p_true, p_false)
-                    observations.append(prob)
-                    reasons.append((prob[0], f"{sensor_key.capitalize()} rising"))
+                reasons.append((prob[0], f"{sensor_key.capitalize()} rising"))
+
+    else:  # Fallback to manual analysis (Requires await)
+        duration = env_config.get(f"{sensor_key}_trend_duration", 30)
+        threshold = env_config.get(f"{sensor_key}_trend_threshold", 26.0)
+        sensitivity = env_config.get(f"{sensor_key}_trend_sensitivity", 0.5)
+        if env_config.get(f"{sensor_key}_sensor"):
+            analysis = await analyze_trend(
+                env_config[f"{sensor_key}_sensor"], duration, threshold
+            )
+            trend_states[trend_key] = analysis["trend"]
+            if analysis["trend"] == "rising" and analysis["crossed_threshold"]:
+                p_true = 0.5 + (sensitivity * 0.45)
+                p_false = 0.5 - (sensitivity * 0.4)
+                prob = (p_true, p_false)
+                observations.append(prob)
+                reasons.append((prob[0], f"{sensor_key.capitalize()} rising"))
 
     return observations, reasons, trend_states
 
@@ -201,25 +217,41 @@ async def async_evaluate_mold_risk_trend(
     observations: ObservationList = []
     reasons: ReasonList = []
     trend_states: dict[str, str] = {}
-    env_config = sensor_instance.env_config
 
-    trend_states["humidity_trend"] = "stable"
-    trend_states["vpd_trend"] = "stable"
+    for sensor_key in ("humidity", "vpd"):
+        metric_obs, metric_reasons, metric_states = (
+            await async_evaluate_mold_risk_metric_trend(sensor_instance, sensor_key)
+        )
+        observations.extend(metric_obs)
+        reasons.extend(metric_reasons)
+        trend_states.update(metric_states)
 
-    analyze_trend: Callable[[str, int, float], Awaitable[dict]] = (
-        sensor_instance._async_analyze_sensor_trend
-    )
+    return observations, reasons, trend_states
 
-    for sensor_key, trend_key in [
-        ("humidity", "humidity_trend"),
-        ("vpd", "vpd_trend"),
-    ]:
-        await _async_evaluate_external_mold_trend_sensor(
-            sensor_instance, env_config, sensor_key, trend_key, observations, reasons, trend_states
-        )
-        await _async_evaluate_fallback_mold_trend_analysis(
-            sensor_instance, env_config, sensor_key, trend_key, observations, reasons, trend_states, analyze_trend
-        )
+
+async def async_evaluate_mold_risk_metric_trend(
+    sensor_instance: BayesianEnvironmentSensor, sensor_key: str
+) -> tuple[ObservationList, ReasonList, dict[str, str]]:
+    """Evaluate the mold-risk trend of humidity or VPD."""
+    observations: ObservationList = []
+    reasons: ReasonList = []
+    env_config = sensor_instance.env_config
+    trend_key = f"{sensor_key}_trend"
+    trend_states: dict[str, str] = {trend_key: "stable"}
+
+    await _async_evaluate_external_mold_trend_sensor(
+        sensor_instance, env_config, sensor_key, trend_key, observations, reasons, trend_states
+    )
+    await _async_evaluate_fallback_mold_trend_analysis(
+        sensor_instance,
+        env_config,
+        sensor_key,
+        trend_key,
+        observations,
+        reasons,
+        trend_states,
+        sensor_instance._async_analyze_sensor_trend,
+    )
 
     return observations, reasons, trend_states
 
@@ -235,38 +267,15 @@ def evaluate_direct_temp_stress(
         return observations, reasons
 
     temp = state.temp
+    rules = rules_for(env_config)
 
-    # 1: Night High Temp Check (Independent IF)
-    if state.is_lights_on is False and temp > 24:
-        prob = env_config.get("prob_night_temp_high", (0.80, 0.20))
-        observations.append(prob)
-        reasons.append((prob[0], f"Night Temp High ({temp})"))
+    # 1: Night High Temp Check (independent of the chain below)
+    if state.is_lights_on is False:
+        _apply(rules.night_temp_stress["night"], temp, observations, reasons)
 
-    # 2: General Stress/Warm/Cold Checks (Cascaded IF/ELIF Chain)
-    if temp > 32:
-        prob = env_config.get("prob_temp_extreme_heat", (0.98, 0.05))
-        observations.append(prob)
-        reasons.append((prob[0], f"Extreme Heat ({temp})"))
-    elif temp > 30:
-        prob = env_config.get("prob_temp_high_heat", (0.85, 0.15))
-        observations.append(prob)
-        reasons.append((prob[0], f"High Heat ({temp})"))
-    elif state.flower_days >= 42 and temp > 27:
-        prob = (0.70, 0.30)
-        observations.append(prob)
-        reasons.append((prob[0], f"Temp Warm ({temp})"))
-    elif temp > 28:
-        prob = env_config.get("prob_temp_warm", (0.65, 0.30))
-        observations.append(prob)
-        reasons.append((prob[0], f"Temp Warm ({temp})"))
-    elif temp < 15:
-        prob = env_config.get("prob_temp_extreme_cold", (0.95, 0.08))
-        observations.append(prob)
-        reasons.append((prob[0], f"Extreme Cold ({temp})"))
-    elif temp < 18:
-        prob = env_config.get("prob_temp_cold", (0.80, 0.20))
-        observations.append(prob)
-        reasons.append((prob[0], f"Temp Cold ({temp})"))
+    # 2: General Stress/Warm/Cold Checks (first matching rule)
+    context = "flower_late" if state.flower_days >= 42 else "default"
+    _apply(rules.temp_stress[context], temp, observations, reasons)
 
     return observations, reasons
 
@@ -282,36 +291,14 @@ def evaluate_direct_humidity_stress(
         return observations, reasons
 
     hum = state.humidity
+    rules = rules_for(env_config)
 
     # Universal low humidity check
-    if hum < 35:
-        prob = env_config.get("prob_humidity_too_dry", (0.85, 0.20))
-        observations.append(prob)
-        reasons.append((prob[0], f"Humidity Dry ({hum})"))
+    _apply(rules.humidity_dry["any"], hum, observations, reasons)
 
     # Stage-specific high humidity/out-of-range checks
-    veg_early = state.flower_days == 0 and state.veg_days < 14
-    veg_late = state.flower_days == 0 and state.veg_days >= 14
-    flower_early = 0 < state.flower_days < 42
-    flower_late = state.flower_days >= 42
-
-    # Use elif for mutually exclusive stage checks
-    if veg_early and hum > 80:
-        prob = env_config.get("prob_humidity_high_veg_early", (0.80, 0.20))
-        observations.append(prob)
-        reasons.append((prob[0], f"Humidity High ({hum})"))
-    elif veg_late and hum > 70:
-        prob = env_config.get("prob_humidity_high_veg_late", (0.85, 0.15))
-        observations.append(prob)
-        reasons.append((prob[0], f"Humidity High ({hum})"))
-    elif flower_early and (hum > 60 or hum < 45):
-        prob = (0.75, 0.25)
-        observations.append(prob)
-        reasons.append((prob[0], f"Humidity out of range (<45 or >60) ({hum})"))
-    elif flower_late and (hum > 60 or hum < 40):
-        prob = (0.85, 0.15)
-        observations.append(prob)
-        reasons.append((prob[0], f"Humidity out of range (<40 or >60) ({hum})"))
+    if stage_key := _determine_stage_key(state):
+        _apply(rules.humidity_stress[stage_key], hum, observations, reasons)
 
     return observations, reasons
 
@@ -326,27 +313,13 @@ def evaluate_direct_vpd_stress(
     if state.vpd is None:
         return observations, reasons
 
-    # Determine stage thresholds using the data from bayesian_data.py
-    stage_key = _determine_stage_key(state)
-
-    if stage_key:
-        # Treat None (missing sensor) as "day" (active) for threshold lookup
-        time_of_day = "night" if state.is_lights_on is False else "day"
-        thresholds = VPD_STRESS_THRESHOLDS[stage_key][time_of_day]
-
-        stress_low, stress_high = thresholds["stress"]
-        mild_low, mild_high = thresholds["mild"]
-        prob_stress_key, prob_mild_key = thresholds["prob_keys"]
-        prob_stress_default, prob_mild_default = thresholds["prob_defaults"]
-
-        if state.vpd < stress_low or state.vpd > stress_high:
-            prob = env_config.get(prob_stress_key, prob_stress_default)
-            observations.append(prob)
-            reasons.append((prob[0], f"VPD out of range ({state.vpd})"))
-        elif state.vpd < mild_low or state.vpd > mild_high:
-            prob = env_config.get(prob_mild_key, prob_mild_default)
-            observations.append(prob)
-            reasons.append((prob[0], f"VPD out of range ({state.vpd})"))
+    if stage_key := _determine_stage_key(state):
+        _apply(
+            rules_for(env_config).vpd_stress[f"{stage_key}_{_time_of_day(state)}"],
+            state.vpd,
+            observations,
+            reasons,
+        )
 
     return observations, reasons
 
@@ -361,17 +334,8 @@ def evaluate_direct_co2_stress(
     if state.co2 is None:
         return observations, reasons
 
-    co2 = state.co2
-
     # Universal CO2 stress checks (not stage-dependent in this sensor's logic)
-    if co2 < 400:
-        prob = (0.80, 0.25)
-        observations.append(prob)
-        reasons.append((prob[0], f"CO2 Low ({co2})"))
-    elif co2 > 1600:
-        prob = (0.95, 0.10)
-        observations.append(prob)
-        reasons.append((prob[0], f"CO2 High ({co2})"))
+    _apply(rules_for(env_config).co2_stress["any"], state.co2, observations, reasons)
 
     return observations, reasons
 
@@ -391,49 +355,16 @@ def evaluate_optimal_temperature(
     if state.temp is None:
         return observations, reasons
 
-    prob_out_of_range = PROB_STRESS_OUT_OF_RANGE  # Reuse stress probability
+    # Missing light sensor (None) is treated as lights on
+    if state.is_lights_on is False:
+        context = "night"
+    elif state.is_lights_on is True and state.flower_days >= 42:
+        context = "day_flower_late"
+    else:
+        context = "day"
+    table = rules_for(env_config).optimal_temp[context]
+    _apply(table, state.temp, observations, reasons)
 
-    # Match against (is_lights_on, flower_days) for branching logic
-    match (state.is_lights_on, state.flower_days):
-        # Case A: Lights ON & Late Flower (Days >= 42)
-        case True, days if days >= 42:
-            if 22 <= state.temp <= 26:  # Perfect range for late flower
-                observations.append(PROB_PERFECT)
-            else:
-                observations.append(prob_out_of_range)
-                reasons.append(
-                    (
-                        prob_out_of_range[1],
-                        f"Temp out of range Late Flower ({state.temp})",
-                    )
-                )
-
-        # Case B: Lights ON & Normal (Days < 42 or Veg) OR Missing Sensor (None)
-        case (True, _) | (None, _):
-            if 24 <= state.temp <= 26:
-                observations.append(PROB_PERFECT)
-            elif 22 <= state.temp <= 28:
-                observations.append(PROB_GOOD)
-            elif 20 <= state.temp <= 29:
-                observations.append(PROB_ACCEPTABLE)
-            else:
-                observations.append(prob_out_of_range)
-                reasons.append(
-                    (prob_out_of_range[1], f"Temp out of range ({state.temp})")
-                )
-
-        # Case C: Lights OFF (Nighttime)
-        case False, _:
-            if 20 <= state.temp <= 23:
-                observations.append(PROB_PERFECT)
-            else:
-                observations.append(prob_out_of_range)
-                reasons.append(
-                    (
-                        prob_out_of_range[1],
-                        f"Night temp out of range ({state.temp})",
-                    )
-                )
     return observations, reasons
 
 
@@ -447,29 +378,9 @@ def evaluate_optimal_vpd(
     if state.vpd is None:
         return observations, reasons
 
-    vpd_optimal = False
-    prob_vpd_out_of_range = PROB_VPD_STRESS_OUT_OF_RANGE  # Reuse stress probability
-
     stage_key = _determine_stage_key(state)
-
-    if stage_key:
-        # Treat None (missing sensor) as "day" (active) for threshold lookup
-        time_of_day = "night" if state.is_lights_on is False else "day"
-
-        # Look up optimal thresholds from the data constant
-        stage_limits = VPD_OPTIMAL_THRESHOLDS.get(stage_key, {}).get(time_of_day, [])
-
-        for p_low, p_high, prob in stage_limits:
-            if p_low <= state.vpd <= p_high:
-                vpd_optimal = True
-                observations.append(prob)
-                # Only log the best (first match) positive observation
-                break
-
-    # If no optimal range was met for the identified stage, reduce probability
-    if not vpd_optimal:
-        observations.append(prob_vpd_out_of_range)
-        reasons.append((prob_vpd_out_of_range[1], f"VPD out of range ({state.vpd})"))
+    context = f"{stage_key}_{_time_of_day(state)}" if stage_key else "unknown"
+    _apply(rules_for(env_config).optimal_vpd[context], state.vpd, observations, reasons)
 
     return observations, reasons
 
@@ -484,27 +395,249 @@ def evaluate_optimal_co2(
     if state.co2 is None:
         return observations, reasons
 
-    prob_out_of_range = PROB_STRESS_OUT_OF_RANGE
-    co2 = state.co2
-
-    # Use match/case on the result of the stage check (True or False)
-    match state.flower_days >= 42:
-        case True:  # Late Flower Logic (Prefers lower CO2)
-            if 400 <= co2 <= 800:
-                observations.append((0.90, 0.25))
-            elif 800 < co2 <= 1200:
-                observations.append((0.4, 0.6))
-            # Else: fall through (no observation is added if outside of these two ranges)
-
-        case False:  # Normal/Veg/Early Flower logic
-            if 1000 <= co2 <= 1400:
-                observations.append(PROB_PERFECT)
-            elif 800 <= co2 <= 1500:
-                observations.append(PROB_GOOD)
-            elif 400 <= co2 <= 600:
-                observations.append(PROB_ACCEPTABLE)
+    # Late flower prefers lower CO2 and adds nothing outside its two ranges
+    context = "flower_late" if state.flower_days >= 42 else "default"
+    _apply(rules_for(env_config).optimal_co2[context], state.co2, observations, reasons)
+
+    return observations, reasons
+
+
+# =========================================================================
+# MOLD RISK SENSOR EVALUATION
+# =========================================================================
+
+
+def evaluate_mold_risk_conditions(
+    state: EnvironmentState, env_config: dict
+) -> tuple[ObservationList, ReasonList]:
+    """Evaluate late-flower mold risk factors from the current environment."""
+    observations: ObservationList = []
+    reasons: ReasonList = []
+
+    if state.flower_days >= 35:
+        rules = rules_for(env_config)
+        prob = (0.80, 0.20)
+        observations.append(prob)
+        reasons.append((prob[0], "Late Flower"))
+
+        if state.temp is not None:
+            _apply(rules.mold_temp["any"], state.temp, observations, reasons)
+
+        # Unknown light state counts as night for mold risk
+        if not state.is_lights_on:
+            prob = env_config.get("prob_mold_lights_off", (0.75, 0.30))
+            observations.append(prob)
+            reasons.append((prob[0], "Lights Off"))
+            context = "night"
+        else:
+            context = "day"
+        if state.humidity is not None:
+            _apply(
+                rules.mold_humidity[context], state.humidity, observations, reasons
+            )
+        if state.vpd is not None:
+            _apply(rules.mold_vpd[context], state.vpd, observations, reasons)
+
+        if state.fan_off:
+            prob = env_config.get("prob_mold_fan_off", (0.80, 0.15))
+            observations.append(prob)
+            reasons.append((prob[0], "Circulation Fan Off"))
+
+    # Control Saturation: Dehumidifier running but humidity still high
+    if state.dehumidifier_on and state.humidity is not None and state.humidity > 60:
+        prob = (0.95, 0.1)
+        observations.append(prob)
+        reasons.append(
+            (prob[0], f"Dehumidifier Ineffective (ON + Hum {state.humidity}%)")
+        )
+
+    return observations, reasons
+
+
+def evaluate_active_desiccation(
+    state: EnvironmentState, env_config: dict
+) -> tuple[ObservationList, ReasonList]:
+    """Evaluate a dehumidifier running while the air is already dry or high VPD."""
+    observations: ObservationList = []
+    reasons: ReasonList = []
+
+    if state.dehumidifier_on:
+        is_dry = state.humidity is not None and state.humidity < 40
+        is_high_vpd = state.vpd is not None and state.vpd > 1.5
+
+        if is_dry or is_high_vpd:
+            prob = (0.99, 0.01)
+            observations.append(prob)
+            reason = "Active Desiccation (Dehum ON + "
+            if is_dry:
+                reason += f"Low Humidity {state.humidity}%)"
             else:
-                observations.append(prob_out_of_range)
-                reason_detail = "CO2 Low" if co2 < 400 else "CO2 High"
-                reasons.append((prob_out_of_range[1], f"{reason_detail} ({co2})"))
+                reason += f"High VPD {state.vpd}kPa)"
+            reasons.append((prob[0], reason))
+
+    return observations, reasons
+
+
+def evaluate_system_fighting(
+    state: EnvironmentState, env_config: dict
+) -> tuple[ObservationList, ReasonList]:
+    """Evaluate a dehumidifier fighting the environment of an optimal growspace."""
+    observations: ObservationList = []
+    reasons: ReasonList = []
+
+    if state.dehumidifier_on:
+        prob = (0.4, 0.7)
+        observations.append(prob)
+        reasons.append((prob[0], "System Fighting (Dehumidifier ON)"))
+
     return observations, reasons
+
+
+# =========================================================================
+# RULE SETS FOR INCREMENTAL EVALUATION
+# =========================================================================
+
+# Trend sources and the EnvironmentState field each one follows
+TREND_FIELDS = {"temperature": "temp", "humidity": "humidity", "vpd": "vpd"}
+
+# Trend analysis also depends on time passing, so cached trends expire
+TREND_MAX_AGE = 60.0
+
+_STAGE_INPUTS = ("veg_days", "flower_days")
+
+
+def _direct_rule(
+    name: str,
+    inputs: tuple[str, ...],
+    evaluate: Callable[[EnvironmentState, dict], tuple[ObservationList, ReasonList]],
+    env_config: dict,
+) -> DependentRule:
+    """Wrap a synchronous evaluator as a rule reading the given fields."""
+    return DependentRule(
+        name,
+        frozenset(inputs),
+        lambda state: (*evaluate(state, env_config), {}),
+    )
+
+
+def _trend_rule(
+    name: str,
+    sensor_key: str,
+    evaluate: Callable[[], Awaitable[tuple[ObservationList, ReasonList, dict]]],
+    env_config: dict,
+) -> DependentRule:
+    """Build a trend rule for a metric.
+
+    External trend and statistics sensors are not part of the snapshot, so a
+    trend read from one runs on every evaluation.
+    """
+    external = env_config.get(f"{sensor_key}_trend_sensor") or env_config.get(
+        f"{sensor_key}_stats_sensor"
+    )
+    return DependentRule(
+        name,
+        None if external else frozenset((TREND_FIELDS[sensor_key],)),
+        lambda state: evaluate(),
+        max_age=TREND_MAX_AGE,
+    )
+
+
+def stress_rules(sensor_instance: BayesianEnvironmentSensor) -> list[DependentRule]:
+    """Return the rules of the stress sensor with their snapshot inputs."""
+    env_config = sensor_instance.env_config
+    trend_rules = [
+        _trend_rule(
+            f"{sensor_key}_trend",
+            sensor_key,
+            partial(async_evaluate_stress_metric_trend, sensor_instance, sensor_key),
+            env_config,
+        )
+        for sensor_key in TREND_FIELDS
+    ]
+    return [
+        *trend_rules,
+        _direct_rule(
+            "temp",
+            ("temp", "is_lights_on", "flower_days"),
+            evaluate_direct_temp_stress,
+            env_config,
+        ),
+        _direct_rule(
+            "humidity",
+            ("humidity", *_STAGE_INPUTS),
+            evaluate_direct_humidity_stress,
+            env_config,
+        ),
+        _direct_rule(
+            "vpd",
+            ("vpd", "is_lights_on", *_STAGE_INPUTS),
+            evaluate_direct_vpd_stress,
+            env_config,
+        ),
+        _direct_rule("co2", ("co2",), evaluate_direct_co2_stress, env_config),
+        _direct_rule(
+            "desiccation",
+            ("dehumidifier_on", "humidity", "vpd"),
+            evaluate_active_desiccation,
+            env_config,
+        ),
+    ]
+
+
+def mold_risk_rules(
+    sensor_instance: BayesianEnvironmentSensor,
+) -> list[DependentRule]:
+    """Return the rules of the mold-risk sensor with their snapshot inputs."""
+    env_config = sensor_instance.env_config
+    trend_rules = [
+        _trend_rule(
+            f"{sensor_key}_trend",
+            sensor_key,
+            partial(async_evaluate_mold_risk_metric_trend, sensor_instance, sensor_key),
+            env_config,
+        )
+        for sensor_key in ("humidity", "vpd")
+    ]
+    return [
+        *trend_rules,
+        _direct_rule(
+            "conditions",
+            (
+                "temp",
+                "humidity",
+                "vpd",
+                "flower_days",
+                "is_lights_on",
+                "fan_off",
+                "dehumidifier_on",
+            ),
+            evaluate_mold_risk_conditions,
+            env_config,
+        ),
+    ]
+
+
+def optimal_rules(sensor_instance: BayesianEnvironmentSensor) -> list[DependentRule]:
+    """Return the rules of the optimal-conditions sensor with their snapshot inputs."""
+    env_config = sensor_instance.env_config
+    return [
+        _direct_rule(
+            "temp",
+            ("temp", "is_lights_on", "flower_days"),
+            evaluate_optimal_temperature,
+            env_config,
+        ),
+        _direct_rule(
+            "vpd",
+            ("vpd", "is_lights_on", *_STAGE_INPUTS),
+            evaluate_optimal_vpd,
+            env_config,
+        ),
+        _direct_rule("co2", ("co2", "flower_days"), evaluate_optimal_co2, env_config),
+        _direct_rule(
+            "system_fighting",
+            ("dehumidifier_on",),
+            evaluate_system_fighting,
+            env_config,
+        ),
+    ]
@@ -0,0 +1,513 @@
+"""Fit Bayesian likelihoods and priors from labeled incident history.
+
+Every `prob_*` override is the likelihood pair (P(obs | event), P(obs | not
+event)) of one rule outcome. Given windows in which a user marked a stress or
+mold incident, both can be estimated by counting: resample the recorded
+history onto a fixed grid, evaluate every compiled rule table over the whole
+grid at once with NumPy, and count how often each outcome fires inside and
+outside the incident windows. The fraction of samples inside a window
+estimates the sensor's prior.
+
+History is consumed in time chunks. Only running counts and the last value of
+each entity are kept between chunks, so memory stays bounded however long the
+history is.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+import logging
+import math
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from homeassistant.components.recorder import history
+from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers.recorder import get_instance as get_recorder_instance
+from homeassistant.util import dt as dt_util
+
+from .bayesian_rules import IntervalTable, rules_for
+
+if TYPE_CHECKING:
+    from .backtest import ReplayState
+
+_LOGGER = logging.getLogger(__name__)
+
+# Sensors whose likelihoods can be fitted, and the option holding each prior
+PRIOR_KEYS = {"stress": "prior_stress", "mold_risk": "prior_mold_risk"}
+
+# env_config entity keys and the sample column each one fills
+FIELD_SOURCES = {
+    "temperature_sensor": "temp",
+    "humidity_sensor": "humidity",
+    "vpd_sensor": "vpd",
+    "co2_sensor": "co2",
+    "light_sensor": "lights",
+    "circulation_fan": "fan_off",
+    "dehumidifier_entity": "dehumidifier_on",
+}
+_METRICS = ("temp", "humidity", "vpd", "co2")
+_STAGES = ("veg_early", "veg_late", "flower_early", "flower_late")
+
+DEFAULT_SAMPLE_INTERVAL = 60.0
+DEFAULT_CHUNK_DURATION = 86400.0
+DEFAULT_MIN_SAMPLES = 30
+
+# Fitted values are kept away from 0 and 1, which would veto every other rule
+_PROBABILITY_RANGE = (0.001, 0.999)
+_PRIOR_RANGE = (0.01, 0.99)
+
+# Running counts per prob key: fired outside/inside incidents, known outside/inside
+_FIRED_FALSE, _FIRED_TRUE, _KNOWN_FALSE, _KNOWN_TRUE = range(4)
+
+
+@dataclass(frozen=True, slots=True)
+class Incident:
+    """A window in which a sensor should have been on.
+
+    Attributes:
+        sensor_type: "stress" or "mold_risk".
+        start: The POSIX timestamp the incident started.
+        end: The POSIX timestamp the incident ended.
+    """
+
+    sensor_type: str
+    start: float
+    end: float
+
+
+@dataclass(slots=True)
+class FitResult:
+    """Fitted priors and likelihoods with the samples that support them.
+
+    Attributes:
+        samples: The number of grid samples with at least one reading.
+        priors: The fitted prior of each sensor type.
+        likelihoods: The fitted likelihood pair of each prob key.
+        support: The (inside, outside) incident sample counts behind each
+            fitted value.
+    """
+
+    samples: int = 0
+    priors: dict[str, float] = field(default_factory=dict)
+    likelihoods: dict[str, tuple[float, float]] = field(default_factory=dict)
+    support: dict[str, tuple[int, int]] = field(default_factory=dict)
+
+    @property
+    def overrides(self) -> dict[str, Any]:
+        """Return the fitted values as env_config overrides."""
+        return {
+            **{PRIOR_KEYS[sensor]: prior for sensor, prior in self.priors.items()},
+            **self.likelihoods,
+        }
+
+
+def _clamp(value: float, bounds: tuple[float, float]) -> float:
+    """Round a probability to three places within bounds."""
+    return round(min(max(value, bounds[0]), bounds[1]), 3)
+
+
+def _day_number(day: date) -> int:
+    """Return the number of days between the POSIX epoch and a date."""
+    return day.toordinal() - date(1970, 1, 1).toordinal()
+
+
+def _table_keys(table: IntervalTable) -> dict[str, list[int]]:
+    """Return the interval pieces of a table that each prob key covers."""
+    keys: dict[str, list[int]] = {}
+    for piece, outcome in enumerate(table.outcomes):
+        if outcome is not None and outcome.prob_key:
+            keys.setdefault(outcome.prob_key, []).append(piece)
+    return keys
+
+
+def _table_pieces(table: IntervalTable, values: np.ndarray) -> np.ndarray:
+    """Vectorized IntervalTable.lookup returning the piece of every value."""
+    breakpoints = np.asarray(table.breakpoints, dtype=float)
+    index = np.searchsorted(breakpoints, values, side="left")
+    at_point = np.zeros(len(values), dtype=bool)
+    inside = index < len(breakpoints)
+    at_point[inside] = breakpoints[index[inside]] == values[inside]
+    return 2 * index + at_point
+
+
+class LikelihoodFitter:
+    """Accumulate rule counts over streamed history chunks."""
+
+    def __init__(
+        self,
+        env_config: dict[str, Any],
+        incidents: Iterable[Incident],
+        sample_interval: float = DEFAULT_SAMPLE_INTERVAL,
+        veg_start: date | None = None,
+        flower_start: date | None = None,
+    ) -> None:
+        """Initialize the fitter.
+
+        Args:
+            env_config: The growspace's environment configuration; its
+                current overrides decide nothing but which rules exist.
+            incidents: The labeled incident windows.
+            sample_interval: The seconds between grid samples.
+            veg_start: The date the growspace entered veg.
+            flower_start: The date the growspace entered flower.
+        """
+        if sample_interval <= 0:
+            raise ValueError("sample_interval must be positive")
+        self.env_config = env_config
+        self.sample_interval = sample_interval
+        self.veg_start = veg_start
+        self.flower_start = flower_start
+        self.samples = 0
+        self._sources = {
+            entity_id: column
+            for key, column in FIELD_SOURCES.items()
+            if (entity_id := env_config.get(key))
+        }
+        self._carry: dict[str, float] = {}
+        self._windows: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        for sensor_type in PRIOR_KEYS:
+            spans = sorted(
+                (incident.start, incident.end)
+                for incident in incidents
+                if incident.sensor_type == sensor_type
+            )
+            starts = np.array([start for start, _ in spans], dtype=float)
+            # Overlapping windows: each start is covered up to the latest end so far
+            ends = np.maximum.accumulate(np.array([end for _, end in spans], dtype=float))
+            self._windows[sensor_type] = (starts, ends)
+        self._totals = {sensor_type: np.zeros(2, np.int64) for sensor_type in PRIOR_KEYS}
+        self._counts: dict[str, dict[str, np.ndarray]] = {
+            sensor_type: {} for sensor_type in PRIOR_KEYS
+        }
+
+    @property
+    def entity_ids(self) -> list[str]:
+        """Return the entities the fit reads."""
+        return sorted(self._sources)
+
+    def add_chunk(
+        self,
+        start: float,
+        end: float,
+        states: Mapping[str, Sequence[tuple[float, str]]],
+    ) -> None:
+        """Count the rules over one chunk of history.
+
+        Args:
+            start: The POSIX timestamp the chunk starts at.
+            end: The POSIX timestamp the chunk ends at, exclusive.
+            states: (timestamp, state) pairs of each entity, including the
+                state in effect at `start` if known.
+        """
+        first = math.ceil(start / self.sample_interval) * self.sample_interval
+        grid = np.arange(first, end, self.sample_interval)
+        if not len(grid):
+            return
+
+        columns = {
+            column: np.full(len(grid), self._carry.get(column, np.nan))
+            for column in FIELD_SOURCES.values()
+        }
+        for entity_id, column in self._sources.items():
+            records = sorted(
+                (timestamp, state)
+                for timestamp, state in states.get(entity_id, ())
+                if timestamp < end
+            )
+            if not records:
+                continue
+            times = np.fromiter((timestamp for timestamp, _ in records), float)
+            values = np.fromiter(
+                (self._convert(entity_id, column, state) for _, state in records),
+                float,
+            )
+            index = np.searchsorted(times, grid, side="right") - 1
+            columns[column] = np.where(
+                index >= 0, values[np.maximum(index, 0)], columns[column]
+            )
+            self._carry[column] = values[-1]
+
+        self._count(grid, columns)
+
+    @staticmethod
+    def _convert(entity_id: str, column: str, state: str) -> float:
+        """Convert a recorded state into a sample value, like the live sensor."""
+        if column in _METRICS or (
+            column == "lights" and entity_id.startswith("sensor.")
+        ):
+            try:
+                value = float(state)
+            except (TypeError, ValueError):
+                return np.nan
+            return float(value > 0) if column == "lights" else value
+        if column == "fan_off":
+            return float(state == "off")
+        return float(state == "on")
+
+    def _stage_days(self, grid: np.ndarray, start: date | None) -> np.ndarray:
+        """Return the days since a stage start at every grid sample."""
+        if start is None:
+            return np.zeros(len(grid), np.int64)
+        offset = dt_util.as_local(dt_util.utc_from_timestamp(grid[0])).utcoffset()
+        local_days = np.floor((grid + offset.total_seconds()) / 86400).astype(np.int64)
+        return np.maximum(local_days - _day_number(start), 0)
+
+    def _labels(self, sensor_type: str, grid: np.ndarray) -> np.ndarray:
+        """Return whether each grid sample lies inside an incident window."""
+        starts, ends = self._windows[sensor_type]
+        if not len(starts):
+            return np.zeros(len(grid), dtype=bool)
+        index = np.searchsorted(starts, grid, side="right") - 1
+        return (index >= 0) & (grid < ends[np.maximum(index, 0)])
+
+    def _count(self, grid: np.ndarray, columns: dict[str, np.ndarray]) -> None:
+        """Evaluate every rule table over the grid and add up the hits."""
+        valid = np.zeros(len(grid), dtype=bool)
+        for metric in _METRICS:
+            valid |= np.isfinite(columns[metric])
+        if not valid.any():
+            return
+        self.samples += int(valid.sum())
+
+        rules = rules_for(self.env_config)
+        veg_days = self._stage_days(grid, self.veg_start)
+        flower_days = self._stage_days(grid, self.flower_start)
+        stage = np.select(
+            [
+                (flower_days == 0) & (veg_days < 14),
+                flower_days == 0,
+                flower_days < 42,
+            ],
+            list(_STAGES[:3]),
+            default=_STAGES[3],
+        )
+        lights = columns["lights"]
+        # Unknown light state counts as day for stress and as night for mold
+        stress_night = lights == 0
+        mold_night = lights != 1
+        late_flower = flower_days >= 35
+
+        hits: dict[str, dict[str, tuple[str | None, np.ndarray]]] = {
+            sensor_type: {} for sensor_type in PRIOR_KEYS
+        }
+
+        def fire(
+            sensor_type: str,
+            table: IntervalTable,
+            column: str,
+            mask: np.ndarray,
+        ) -> None:
+            values = columns[column]
+            mask = mask & np.isfinite(values)
+            if not mask.any():
+                return
+            pieces = _table_pieces(table, values)
+            for key, key_pieces in _table_keys(table).items():
+                _, fired = hits[sensor_type].setdefault(
+                    key, (column, np.zeros(len(grid), dtype=bool))
+                )
+                fired |= mask & np.isin(pieces, key_pieces)
+
+        everywhere = np.ones(len(grid), dtype=bool)
+        fire("stress", rules.night_temp_stress["night"], "temp", stress_night)
+        fire("stress", rules.temp_stress["flower_late"], "temp", flower_days >= 42)
+        fire("stress", rules.temp_stress["default"], "temp", flower_days < 42)
+        fire("stress", rules.humidity_dry["any"], "humidity", everywhere)
+        fire("stress", rules.co2_stress["any"], "co2", everywhere)
+        for stage_key in _STAGES:
+            in_stage = stage == stage_key
+            fire(
+                "stress", rules.humidity_stress[stage_key], "humidity", in_stage
+            )
+            for time_of_day, in_period in (
+                ("day", ~stress_night),
+                ("night", stress_night),
+            ):
+                fire(
+                    "stress",
+                    rules.vpd_stress[f"{stage_key}_{time_of_day}"],
+                    "vpd",
+                    in_stage & in_period,
+                )
+
+        fire("mold_risk", rules.mold_temp["any"], "temp", late_flower)
+        for time_of_day, in_period in (("day", ~mold_night), ("night", mold_night)):
+            fire(
+                "mold_risk",
+                rules.mold_humidity[time_of_day],
+                "humidity",
+                late_flower & in_period,
+            )
+            fire(
+                "mold_risk", rules.mold_vpd[time_of_day], "vpd", late_flower & in_period
+            )
+        hits["mold_risk"]["prob_mold_lights_off"] = (None, late_flower & mold_night)
+        hits["mold_risk"]["prob_mold_fan_off"] = (
+            None,
+            late_flower & (columns["fan_off"] == 1),
+        )
+
+        for sensor_type, sensor_hits in hits.items():
+            label = self._labels(sensor_type, grid)
+            outside = valid & ~label
+            inside = valid & label
+            self._totals[sensor_type] += (int(outside.sum()), int(inside.sum()))
+            counts = self._counts[sensor_type]
+            for key, (column, fired) in sensor_hits.items():
+                known = valid if column is None else np.isfinite(columns[column])
+                counts.setdefault(key, np.zeros(4, np.int64))[:] += (
+                    int((fired & outside).sum()),
+                    int((fired & inside).sum()),
+                    int((known & outside).sum()),
+                    int((known & inside).sum()),
+                )
+
+    def result(self, min_samples: int = DEFAULT_MIN_SAMPLES) -> FitResult:
+        """Turn the counts into priors and Laplace-smoothed likelihoods.
+
+        Args:
+            min_samples: The fewest samples inside and outside incidents a
+                value needs before it is fitted.
+
+        Returns:
+            The fitted values.
+        """
+        result = FitResult(samples=self.samples)
+        for sensor_type, (outside, inside) in self._totals.items():
+            if inside < min_samples or outside < min_samples:
+                continue
+            prior_key = PRIOR_KEYS[sensor_type]
+            result.priors[sensor_type] = _clamp(
+                inside / (inside + outside), _PRIOR_RANGE
+            )
+            result.support[prior_key] = (int(inside), int(outside))
+            for key, counts in sorted(self._counts[sensor_type].items()):
+                if (
+                    counts[_KNOWN_TRUE] < min_samples
+                    or counts[_KNOWN_FALSE] < min_samples
+                ):
+                    continue
+                result.likelihoods[key] = (
+                    _clamp(
+                        (counts[_FIRED_TRUE] + 1) / (counts[_KNOWN_TRUE] + 2),
+                        _PROBABILITY_RANGE,
+                    ),
+                    _clamp(
+                        (counts[_FIRED_FALSE] + 1) / (counts[_KNOWN_FALSE] + 2),
+                        _PROBABILITY_RANGE,
+                    ),
+                )
+                result.support[key] = (
+                    int(counts[_KNOWN_TRUE]),
+                    int(counts[_KNOWN_FALSE]),
+                )
+        return result
+
+
+def record_chunks(
+    records: Iterable[ReplayState], chunk_duration: float = DEFAULT_CHUNK_DURATION
+) -> Iterator[tuple[float, float, dict[str, list[tuple[float, str]]]]]:
+    """Group time-ordered recorded states into chunks for the fitter.
+
+    Args:
+        records: Recorded states in time order, e.g. from the backtest loaders.
+        chunk_duration: The seconds of history per chunk.
+
+    Yields:
+        (start, end, states by entity) for every chunk.
+    """
+    states: dict[str, list[tuple[float, str]]] = {}
+    start: float | None = None
+    for record in records:
+        if start is None:
+            start = record.timestamp
+        while record.timestamp >= start + chunk_duration:
+            yield start, start + chunk_duration, states
+            states = {}
+            start += chunk_duration
+        states.setdefault(record.entity_id, []).append(
+            (record.timestamp, record.state)
+        )
+    if start is not None:
+        yield start, start + chunk_duration, states
+
+
+def fit_from_recorder(
+    hass: HomeAssistant,
+    fitter: LikelihoodFitter,
+    start: datetime,
+    end: datetime,
+    chunk_duration: timedelta = timedelta(seconds=DEFAULT_CHUNK_DURATION),
+) -> None:
+    """Stream recorder history into a fitter, one chunk per query.
+
+    Runs in the recorder's executor.
+
+    Args:
+        hass: The Home Assistant instance.
+        fitter: The fitter to feed.
+        start: The start of the history to fit.
+        end: The end of the history to fit.
+        chunk_duration: The history covered by each recorder query.
+    """
+    chunk_start = start
+    while chunk_start < end:
+        chunk_end = min(chunk_start + chunk_duration, end)
+        history_states = history.get_significant_states(
+            hass,
+            chunk_start,
+            chunk_end,
+            fitter.entity_ids,
+            include_start_time_state=True,
+            significant_changes_only=False,
+            no_attributes=True,
+        )
+        fitter.add_chunk(
+            chunk_start.timestamp(),
+            chunk_end.timestamp(),
+            {
+                entity_id: [
+                    (state.last_updated.timestamp(), state.state)
+                    for state in states
+                    if isinstance(state, State)
+                ]
+                for entity_id, states in history_states.items()
+            },
+        )
+        chunk_start = chunk_end
+
+
+async def async_fit_likelihoods(
+    hass: HomeAssistant,
+    fitter: LikelihoodFitter,
+    start: datetime,
+    end: datetime,
+    min_samples: int = DEFAULT_MIN_SAMPLES,
+) -> FitResult:
+    """Fit a growspace's likelihoods from recorder history in the executor.
+
+    Args:
+        hass: The Home Assistant instance.
+        fitter: The fitter holding the configuration and incidents.
+        start: The start of the history to fit.
+        end: The end of the history to fit.
+        min_samples: The fewest samples a fitted value needs.
+
+    Returns:
+        The fitted values.
+    """
+    await get_recorder_instance(hass).async_add_executor_job(
+        fit_from_recorder, hass, fitter, start, end
+    )
+    result = fitter.result(min_samples)
+    _LOGGER.debug(
+        "Fitted %d likelihoods and %d priors from %d samples",
+        len(result.likelihoods),
+        len(result.priors),
+        result.samples,
+    )
+    return result
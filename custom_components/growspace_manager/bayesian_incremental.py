@@ -0,0 +1,217 @@
+"""Incremental evaluation of the Bayesian sensor rules.
+
+Each rule of a sensor declares the EnvironmentState fields it reads. The
+evaluator keeps every rule's observations, reasons and log-likelihood ratio
+from the previous run and, when a new snapshot arrives, re-runs only the rules
+whose inputs differ from the snapshot they last saw. The posterior is then the
+prior plus the sum of the cached log ratios, so a single-metric update costs
+the rules that metric touches rather than the whole rule set.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, fields
+import inspect
+import logging
+from operator import attrgetter
+import time
+from typing import Any
+
+from .bayesian_engine import Evidence, observation_evidence, posterior_from_evidence
+from .models import EnvironmentState
+
+_LOGGER = logging.getLogger(__name__)
+
+Obs = tuple[float, float]
+Reason = tuple[float, str]
+RuleResult = tuple[list[Obs], list[Reason], dict[str, Any]]
+RuleFunction = Callable[[EnvironmentState], RuleResult | Awaitable[RuleResult]]
+
+_STATE_FIELDS = tuple(state_field.name for state_field in fields(EnvironmentState))
+_state_values = attrgetter(*_STATE_FIELDS)
+
+
+@dataclass(frozen=True, slots=True)
+class DependentRule:
+    """A sensor rule and the snapshot fields it depends on.
+
+    Attributes:
+        name: A unique name for the rule within its sensor.
+        inputs: The EnvironmentState fields the rule reads, or None if it
+            reads state the snapshot does not capture and must run every time.
+        evaluate: Returns the rule's observations, reasons and any attributes
+            it reports. May be a coroutine function.
+        max_age: Seconds after which the rule re-runs even with unchanged
+            inputs, for rules that also depend on the passage of time.
+    """
+
+    name: str
+    inputs: frozenset[str] | None
+    evaluate: RuleFunction
+    max_age: float | None = None
+
+
+@dataclass(slots=True)
+class _Contribution:
+    """The cached result of one rule run."""
+
+    observations: list[Obs]
+    reasons: list[Reason]
+    attributes: dict[str, Any]
+    evidence: Evidence
+    evaluated_at: float
+
+
+def changed_fields(
+    old: EnvironmentState | None, new: EnvironmentState
+) -> frozenset[str] | None:
+    """Return the snapshot fields that differ between two states.
+
+    Args:
+        old: The previous snapshot, if any.
+        new: The current snapshot.
+
+    Returns:
+        The names of the changed fields, or None if there is no previous
+        snapshot to compare with.
+    """
+    if old is None:
+        return None
+    if old is new:
+        return frozenset()
+    return frozenset(
+        name
+        for name, old_value, new_value in zip(
+            _STATE_FIELDS, _state_values(old), _state_values(new)
+        )
+        if old_value != new_value
+    )
+
+
+class IncrementalEvaluator:
+    """Evaluate a sensor's rules, re-running only those with changed inputs."""
+
+    def __init__(
+        self,
+        rules: Iterable[DependentRule],
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the evaluator.
+
+        Args:
+            rules: The sensor's rules, in the order their observations and
+                reasons are reported.
+            clock: Returns the current time in seconds, for rule expiry.
+                Replays pass their virtual clock.
+        """
+        self.rules = list(rules)
+        self._clock = clock
+        self._contributions: dict[str, _Contribution] = {}
+        self._state: EnvironmentState | None = None
+        self.evaluations = 0
+        self.rules_run = 0
+        self.rules_reused = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return how many evaluations ran and how many rule runs were saved."""
+        return {
+            "evaluations": self.evaluations,
+            "rules_run": self.rules_run,
+            "rules_reused": self.rules_reused,
+        }
+
+    @property
+    def observations(self) -> list[Obs]:
+        """Return the observations of every rule, in rule order."""
+        return [
+            observation
+            for contribution in self._ordered_contributions()
+            for observation in contribution.observations
+        ]
+
+    @property
+    def reasons(self) -> list[Reason]:
+        """Return the reasons of every rule, in rule order."""
+        return [
+            reason
+            for contribution in self._ordered_contributions()
+            for reason in contribution.reasons
+        ]
+
+    @property
+    def attributes(self) -> dict[str, Any]:
+        """Return the attributes reported by the rules, merged in rule order."""
+        attributes: dict[str, Any] = {}
+        for contribution in self._ordered_contributions():
+            attributes.update(contribution.attributes)
+        return attributes
+
+    def invalidate(self) -> None:
+        """Drop every cached contribution so the next evaluation runs all rules."""
+        self._contributions.clear()
+        self._state = None
+
+    def posterior(self, prior: float) -> float:
+        """Return the posterior from the cached contributions.
+
+        Args:
+            prior: The prior probability of the event.
+
+        Returns:
+            The posterior probability of the event.
+        """
+        return posterior_from_evidence(
+            prior,
+            (contribution.evidence for contribution in self._ordered_contributions()),
+        )
+
+    async def async_evaluate(self, state: EnvironmentState) -> None:
+        """Bring the cached contributions up to date with a snapshot.
+
+        Args:
+            state: The current environment snapshot.
+        """
+        changed = changed_fields(self._state, state)
+        now = self._clock()
+        self.evaluations += 1
+        for rule in self.rules:
+            cached = self._contributions.get(rule.name)
+            if (
+                cached is not None
+                and changed is not None
+                and rule.inputs is not None
+                and rule.inputs.isdisjoint(changed)
+                and (rule.max_age is None or now - cached.evaluated_at < rule.max_age)
+            ):
+                self.rules_reused += 1
+                continue
+
+            result = rule.evaluate(state)
+            if inspect.isawaitable(result):
+                result = await result
+            observations, reasons, attributes = result
+            self._contributions[rule.name] = _Contribution(
+                observations,
+                reasons,
+                attributes,
+                observation_evidence(observations),
+                now,
+            )
+            self.rules_run += 1
+        self._state = state
+        _LOGGER.debug(
+            "Evaluated rules (changed: %s; %d run, %d reused so far)",
+            "all" if changed is None else sorted(changed),
+            self.rules_run,
+            self.rules_reused,
+        )
+
+    def _ordered_contributions(self) -> list[_Contribution]:
+        """Return the cached contributions in rule order."""
+        return [
+            contribution
+            for rule in self.rules
+            if (contribution := self._contributions.get(rule.name)) is not None
+        ]
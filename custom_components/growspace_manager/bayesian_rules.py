@@ -0,0 +1,290 @@
+"""Compile the declarative Bayesian rule tables into bisectable interval tables.
+
+Each rule table in bayesian_data.py maps a context (stage, light state) to an
+ordered list of interval rules. Compiling a context collects every threshold
+into a sorted breakpoint list, splits the number line into the breakpoints
+themselves and the open intervals between them, and resolves, once, which rule
+wins in each piece and which likelihood it uses for the growspace's
+env_config. Evaluating a metric is then one bisect.
+
+Compiled rules are cached per env_config dictionary. Options changes replace a
+growspace's env_config with a new dictionary, which compiles afresh.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from .bayesian_data import (
+    CO2_STRESS_RULES,
+    HUMIDITY_DRY_RULES,
+    HUMIDITY_STRESS_RULES,
+    MOLD_HUMIDITY_RULES,
+    MOLD_TEMP_RULES,
+    MOLD_VPD_RULES,
+    NIGHT_TEMP_STRESS_RULES,
+    OPTIMAL_CO2_RULES,
+    OPTIMAL_TEMP_RULES,
+    PROB_VPD_STRESS_OUT_OF_RANGE,
+    TEMP_STRESS_RULES,
+    VPD_OPTIMAL_THRESHOLDS,
+    VPD_STRESS_THRESHOLDS,
+    Rule,
+    RuleCondition,
+    RuleTable,
+)
+
+# Compiled rule sets kept for the most recently used env_configs
+_CACHE_SIZE = 64
+
+_PREDICATES: dict[str, Callable[..., bool]] = {
+    "gt": lambda value, limit: value > limit,
+    "lt": lambda value, limit: value < limit,
+    "between": lambda value, low, high: low <= value <= high,
+    "inside": lambda value, low, high: low < value < high,
+    "outside": lambda value, low, high: value < low or value > high,
+    "any": lambda value: True,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class RuleOutcome:
+    """The observation a matched rule contributes."""
+
+    probability: Any
+    reason: str | None
+    reason_index: int
+    prob_key: str | None = None
+
+    def apply(
+        self,
+        value: float,
+        observations: list[tuple[float, float]],
+        reasons: list[tuple[float, str]],
+    ) -> None:
+        """Append the observation and, if the rule has one, its reason.
+
+        Args:
+            value: The metric value, used to format the reason.
+            observations: The observation list to extend.
+            reasons: The reason list to extend.
+        """
+        observations.append(self.probability)
+        if self.reason is not None:
+            reasons.append(
+                (self.probability[self.reason_index], self.reason.format(value=value))
+            )
+
+
+@dataclass(frozen=True, slots=True)
+class IntervalTable:
+    """Rule outcomes for the pieces of the number line between breakpoints.
+
+    `outcomes[2 * i]` covers the open interval below `breakpoints[i]` (and
+    above the previous breakpoint); `outcomes[2 * i + 1]` covers the
+    breakpoint itself.
+    """
+
+    breakpoints: tuple[float, ...]
+    outcomes: tuple[RuleOutcome | None, ...]
+
+    def lookup(self, value: float) -> RuleOutcome | None:
+        """Return the outcome of the first rule matching a value.
+
+        Args:
+            value: The metric value.
+
+        Returns:
+            The outcome, or None if no rule matches.
+        """
+        index = bisect_left(self.breakpoints, value)
+        if index < len(self.breakpoints) and self.breakpoints[index] == value:
+            return self.outcomes[2 * index + 1]
+        return self.outcomes[2 * index]
+
+
+def _matches(condition: RuleCondition, value: float) -> bool:
+    """Return whether a value satisfies a rule condition."""
+    return _PREDICATES[condition[0]](value, *condition[1:])
+
+
+def compile_table(
+    rules: list[Rule], env_config: dict[str, Any], reason_index: int = 0
+) -> IntervalTable:
+    """Compile an ordered rule list into an interval table.
+
+    Args:
+        rules: The rules of one context, in priority order.
+        env_config: The growspace configuration holding likelihood overrides.
+        reason_index: Which likelihood of the pair weights the reason.
+
+    Returns:
+        The compiled table.
+    """
+    breakpoints = sorted({limit for condition, *_ in rules for limit in condition[1:]})
+    outcomes = [
+        RuleOutcome(
+            env_config.get(prob_key, default) if prob_key else default,
+            reason,
+            reason_index,
+            prob_key,
+        )
+        for _, prob_key, default, reason in rules
+    ]
+
+    # One representative value per piece of the number line
+    samples: list[float] = []
+    for index, point in enumerate(breakpoints):
+        below = breakpoints[index - 1] if index else point - 1
+        samples.extend(((below + point) / 2, point))
+    samples.append(breakpoints[-1] + 1 if breakpoints else 0.0)
+
+    return IntervalTable(
+        tuple(breakpoints),
+        tuple(
+            next(
+                (
+                    outcome
+                    for (condition, *_), outcome in zip(rules, outcomes)
+                    if _matches(condition, sample)
+                ),
+                None,
+            )
+            for sample in samples
+        ),
+    )
+
+
+def compile_rule_table(
+    table: RuleTable, env_config: dict[str, Any], reason_index: int = 0
+) -> dict[str, IntervalTable]:
+    """Compile every context of a rule table.
+
+    Args:
+        table: The rule table.
+        env_config: The growspace configuration holding likelihood overrides.
+        reason_index: Which likelihood of the pair weights the reasons.
+
+    Returns:
+        The compiled interval table of every context.
+    """
+    return {
+        context: compile_table(rules, env_config, reason_index)
+        for context, rules in table.items()
+    }
+
+
+def _vpd_stress_table() -> RuleTable:
+    """Express the VPD stress thresholds as rules keyed "<stage>_<time of day>"."""
+    table: RuleTable = {}
+    for stage, by_time in VPD_STRESS_THRESHOLDS.items():
+        for time_of_day, limits in by_time.items():
+            stress_key, mild_key = limits["prob_keys"]
+            stress_default, mild_default = limits["prob_defaults"]
+            table[f"{stage}_{time_of_day}"] = [
+                (
+                    ("outside", *limits["stress"]),
+                    stress_key,
+                    stress_default,
+                    "VPD out of range ({value})",
+                ),
+                (
+                    ("outside", *limits["mild"]),
+                    mild_key,
+                    mild_default,
+                    "VPD out of range ({value})",
+                ),
+            ]
+    return table
+
+
+def _vpd_optimal_table() -> RuleTable:
+    """Express the optimal VPD ranges as rules keyed "<stage>_<time of day>"."""
+    out_of_range: Rule = (
+        ("any",),
+        None,
+        PROB_VPD_STRESS_OUT_OF_RANGE,
+        "VPD out of range ({value})",
+    )
+    table: RuleTable = {"unknown": [out_of_range]}
+    for stage, by_time in VPD_OPTIMAL_THRESHOLDS.items():
+        for time_of_day, ranges in by_time.items():
+            table[f"{stage}_{time_of_day}"] = [
+                (("between", low, high), None, prob, None) for low, high, prob in ranges
+            ] + [out_of_range]
+    return table
+
+
+VPD_STRESS_RULES = _vpd_stress_table()
+VPD_OPTIMAL_RULES = _vpd_optimal_table()
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledRules:
+    """The compiled interval tables of one env_config."""
+
+    temp_stress: dict[str, IntervalTable]
+    night_temp_stress: dict[str, IntervalTable]
+    humidity_dry: dict[str, IntervalTable]
+    humidity_stress: dict[str, IntervalTable]
+    vpd_stress: dict[str, IntervalTable]
+    co2_stress: dict[str, IntervalTable]
+    optimal_temp: dict[str, IntervalTable]
+    optimal_vpd: dict[str, IntervalTable]
+    optimal_co2: dict[str, IntervalTable]
+    mold_temp: dict[str, IntervalTable]
+    mold_humidity: dict[str, IntervalTable]
+    mold_vpd: dict[str, IntervalTable]
+
+
+def compile_rules(env_config: dict[str, Any]) -> CompiledRules:
+    """Compile every rule table against an env_config.
+
+    Args:
+        env_config: The growspace configuration holding likelihood overrides.
+
+    Returns:
+        The compiled rules.
+    """
+    return CompiledRules(
+        temp_stress=compile_rule_table(TEMP_STRESS_RULES, env_config),
+        night_temp_stress=compile_rule_table(NIGHT_TEMP_STRESS_RULES, env_config),
+        humidity_dry=compile_rule_table(HUMIDITY_DRY_RULES, env_config),
+        humidity_stress=compile_rule_table(HUMIDITY_STRESS_RULES, env_config),
+        vpd_stress=compile_rule_table(VPD_STRESS_RULES, env_config),
+        co2_stress=compile_rule_table(CO2_STRESS_RULES, env_config),
+        optimal_temp=compile_rule_table(OPTIMAL_TEMP_RULES, env_config, 1),
+        optimal_vpd=compile_rule_table(VPD_OPTIMAL_RULES, env_config, 1),
+        optimal_co2=compile_rule_table(OPTIMAL_CO2_RULES, env_config, 1),
+        mold_temp=compile_rule_table(MOLD_TEMP_RULES, env_config),
+        mold_humidity=compile_rule_table(MOLD_HUMIDITY_RULES, env_config),
+        mold_vpd=compile_rule_table(MOLD_VPD_RULES, env_config),
+    )
+
+
+_compiled: dict[int, tuple[dict[str, Any], CompiledRules]] = {}
+
+
+def rules_for(env_config: dict[str, Any]) -> CompiledRules:
+    """Return the compiled rules of an env_config, compiling on first use.
+
+    The cache holds a reference to each env_config, so an ID is never reused
+    while its entry exists.
+
+    Args:
+        env_config: The growspace configuration.
+
+    Returns:
+        The compiled rules.
+    """
+    entry = _compiled.get(id(env_config))
+    if entry is not None and entry[0] is env_config:
+        return entry[1]
+    if len(_compiled) >= _CACHE_SIZE:
+        del _compiled[next(iter(_compiled))]
+    rules = compile_rules(env_config)
+    _compiled[id(env_config)] = (env_config, rules)
+    return rules
@@ -17,35 +17,46 @@ from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.components.recorder import history
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
-from homeassistant.core import Context, HomeAssistant, State, callback
+from homeassistant.core import CALLBACK_TYPE, Context, HomeAssistant, State, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+)
 from homeassistant.helpers.recorder import get_instance as get_recorder_instance
 from homeassistant.util.dt import utcnow
 
 from .bayesian_data import CURING_THRESHOLDS, DRYING_THRESHOLDS
+from .bayesian_engine import posterior_probability
 from .bayesian_evaluator import (
     ReasonList,
-    async_evaluate_mold_risk_trend,
-    async_evaluate_stress_trend,
-    evaluate_direct_co2_stress,
-    evaluate_direct_humidity_stress,
-    evaluate_direct_temp_stress,
-    evaluate_direct_vpd_stress,
-    evaluate_optimal_co2,
-    evaluate_optimal_temperature,
-    evaluate_optimal_vpd,
+    mold_risk_rules,
+    optimal_rules,
+    stress_rules,
 )
+from .bayesian_incremental import IncrementalEvaluator
 from .const import (
     CONF_AI_ENABLED,
     CONF_ASSISTANT_ID,
+    CONF_EVALUATION_INTERVAL,
+    CONF_HYSTERESIS_OFF,
+    CONF_HYSTERESIS_ON,
+    CONF_MIN_OFF_DURATION,
+    CONF_MIN_ON_DURATION,
     CONF_NOTIFICATION_PERSONALITY,
     DEFAULT_BAYESIAN_PRIORS,
     DEFAULT_BAYESIAN_THRESHOLDS,
+    DEFAULT_EVALUATION_INTERVAL,
+    DEFAULT_HYSTERESIS_OFF,
+    DEFAULT_HYSTERESIS_ON,
+    DEFAULT_MIN_OFF_DURATION,
+    DEFAULT_MIN_ON_DURATION,
     DOMAIN,
+    PROBABILITY_WRITE_DELTA,
 )
 from .coordinator import GrowspaceCoordinator
+from .environment_hub import EnvironmentHub, async_start_trend_warmup
 from .models import EnvironmentState
 
 _LOGGER = logging.getLogger(__name__)
@@ -58,22 +69,33 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Growspace Manager Bayesian binary sensors from a config entry."""
     coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+    min_interval = config_entry.options.get("global_settings", {}).get(
+        CONF_EVALUATION_INTERVAL, DEFAULT_EVALUATION_INTERVAL
+    )
 
     entities = []
+    hubs: list[EnvironmentHub] = []
 
     # Create Bayesian sensors for each growspace that has environment config
     for growspace_id, growspace in coordinator.growspaces.items():
         env_config = getattr(growspace, "environment_config", None)
 
         if env_config and _validate_env_config(env_config):
-            # --- MODIFIED LOGIC START ---
+            # All Bayesian sensors of a growspace share one environment snapshot
+            hub = EnvironmentHub(coordinator, growspace_id, env_config, min_interval)
+            coordinator.environment_hubs[growspace_id] = hub
+            hubs.append(hub)
 
             if growspace_id == "dry":
                 # For 'dry', only add Drying and Mold Risk sensors
                 entities.extend(
                     [
-                        BayesianDryingSensor(coordinator, growspace_id, env_config),
-                        BayesianMoldRiskSensor(coordinator, growspace_id, env_config),
+                        BayesianDryingSensor(
+                            coordinator, growspace_id, env_config, hub
+                        ),
+                        BayesianMoldRiskSensor(
+                            coordinator, growspace_id, env_config, hub
+                        ),
                     ]
                 )
                 _LOGGER.info(
@@ -85,8 +107,12 @@ async def async_setup_entry(
                 # For 'cure', only add Curing and Mold Risk sensors
                 entities.extend(
                     [
-                        BayesianCuringSensor(coordinator, growspace_id, env_config),
-                        BayesianMoldRiskSensor(coordinator, growspace_id, env_config),
+                        BayesianCuringSensor(
+                            coordinator, growspace_id, env_config, hub
+                        ),
+                        BayesianMoldRiskSensor(
+                            coordinator, growspace_id, env_config, hub
+                        ),
                     ]
                 )
                 _LOGGER.info(
@@ -98,10 +124,14 @@ async def async_setup_entry(
                 # For all other growspaces, add the standard set
                 entities.extend(
                     [
-                        BayesianStressSensor(coordinator, growspace_id, env_config),
-                        BayesianMoldRiskSensor(coordinator, growspace_id, env_config),
+                        BayesianStressSensor(
+                            coordinator, growspace_id, env_config, hub
+                        ),
+                        BayesianMoldRiskSensor(
+                            coordinator, growspace_id, env_config, hub
+                        ),
                         BayesianOptimalConditionsSensor(
-                            coordinator, growspace_id, env_config
+                            coordinator, growspace_id, env_config, hub
                         ),
                     ]
                 )
@@ -117,6 +147,10 @@ async def async_setup_entry(
                 )
 
     if entities:
+        # One recorder query warms the trend buffers of every growspace before
+        # the sensors' first evaluations, which wait for it
+        if hubs:
+            async_start_trend_warmup(hass, hubs)
         async_add_entities(entities)
 
 
@@ -136,6 +170,9 @@ def _validate_env_config(config: dict) -> bool:
 class BayesianEnvironmentSensor(BinarySensorEntity):
     """Base class for Bayesian environment monitoring binary sensors."""
 
+    # These change on nearly every evaluation; the recorder keeps `summary`
+    _unrecorded_attributes = frozenset({"probability", "observations", "reasons"})
+
     def __init__(
         self,
         coordinator: GrowspaceCoordinator,
@@ -145,11 +182,13 @@ class BayesianEnvironmentSensor(BinarySensorEntity):
         name_suffix: str,
         prior_key: str,
         threshold_key: str,
+        hub: EnvironmentHub | None = None,
     ) -> None:
         """Initialize the Bayesian environment sensor."""
         self.coordinator = coordinator
         self.growspace_id = growspace_id
         self.env_config = env_config
+        self._hub = hub or EnvironmentHub(coordinator, growspace_id, env_config)
         self._attr_should_poll = False
 
         growspace = coordinator.growspaces[growspace_id]
@@ -160,6 +199,16 @@ class BayesianEnvironmentSensor(BinarySensorEntity):
         self.threshold = env_config.get(
             threshold_key, DEFAULT_BAYESIAN_THRESHOLDS.get(sensor_type)
         )
+        self.hysteresis_on = env_config.get(CONF_HYSTERESIS_ON, DEFAULT_HYSTERESIS_ON)
+        self.hysteresis_off = env_config.get(
+            CONF_HYSTERESIS_OFF, DEFAULT_HYSTERESIS_OFF
+        )
+        self.min_on_duration = timedelta(
+            seconds=env_config.get(CONF_MIN_ON_DURATION, DEFAULT_MIN_ON_DURATION)
+        )
+        self.min_off_duration = timedelta(
+            seconds=env_config.get(CONF_MIN_OFF_DURATION, DEFAULT_MIN_OFF_DURATION)
+        )
 
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, growspace_id)},
@@ -171,10 +220,31 @@ class BayesianEnvironmentSensor(BinarySensorEntity):
         self._sensor_states = {}
         self._reasons: ReasonList = []
         self._probability = 0.0
+        # Set by sensors whose probability comes from declarative rules
+        self._evaluation: IncrementalEvaluator | None = None
         self._last_notification_sent: datetime | None = None
         self._notification_cooldown = timedelta(minutes=5)
 
+        # The on/off state last written, decided with hysteresis and dwell
+        self._state_on: bool | None = None
+        self._state_changed_at: datetime | None = None
+        self._written: tuple[bool, float, list[str]] | None = None
+        self._unsub_dwell: CALLBACK_TYPE | None = None
+        self.writes = 0
+        self.writes_suppressed = 0
+        self.flips_suppressed = 0
+
     def _get_base_environment_state(self) -> EnvironmentState:
+        """Return the growspace's shared EnvironmentState snapshot.
+
+        The snapshot is built at most once per environment change, by whichever
+        sensor of the growspace asks first.
+        """
+        state = self._hub.get_state(self._read_environment_state)
+        self._sensor_states = self._hub.observations
+        return state
+
+    def _read_environment_state(self) -> EnvironmentState:
         """Fetch sensor values and return a structured EnvironmentState object."""
         temp = self._get_sensor_value(self.env_config.get("temperature_sensor"))
         humidity = self._get_sensor_value(self.env_config.get("humidity_sensor"))
@@ -211,18 +281,6 @@ class BayesianEnvironmentSensor(BinarySensorEntity):
             if dehum_state and dehum_state.state == "on":
                 dehumidifier_on = True
 
-        self._sensor_states = {
-            "temperature": temp,
-            "humidity": humidity,
-            "vpd": vpd,
-            "co2": co2,
-            "veg_days": veg_days,
-            "flower_days": flower_days,
-            "is_lights_on": is_lights_on,
-            "fan_off": fan_off,
-            "dehumidifier_on": dehumidifier_on,
-        }
-
         return EnvironmentState(
             temp=temp,
             humidity=humidity,
@@ -237,39 +295,102 @@ class BayesianEnvironmentSensor(BinarySensorEntity):
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks when the entity is added to Home Assistant."""
-        self.coordinator.async_add_listener(self._handle_coordinator_update)
-
-        sensors = [
-            self.env_config.get("temperature_sensor"),
-            self.env_config.get("humidity_sensor"),
-            self.env_config.get("vpd_sensor"),
-            self.env_config.get("co2_sensor"),
-            self.env_config.get("circulation_fan"),
-            self.env_config.get("dehumidifier_entity"),
-        ]
-
-        sensors = [s for s in sensors if s]
-
         self.async_on_remove(
-            async_track_state_change_event(
-                self.hass,
-                sensors,
-                self._async_sensor_changed,
-            )
+            self._hub.async_add_evaluator(self.async_update_and_notify)
         )
-
         await self.async_update_and_notify()
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending dwell re-evaluation when the entity is removed."""
+        self._async_cancel_dwell()
+
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updates from the data coordinator."""
-        self.hass.async_create_task(self.async_update_and_notify())
+    def _async_cancel_dwell(self) -> None:
+        """Cancel a pending re-evaluation at the end of a dwell time."""
+        if self._unsub_dwell is not None:
+            self._unsub_dwell()
+            self._unsub_dwell = None
 
     @callback
-    def _async_sensor_changed(self, event) -> None:
-        """Handle state changes of the monitored environment sensors."""
+    def _async_dwell_elapsed(self, _now: datetime) -> None:
+        """Re-evaluate once a held-back state change is allowed."""
+        self._unsub_dwell = None
         self.hass.async_create_task(self.async_update_and_notify())
 
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return how many state writes were made and how many were saved."""
+        return {
+            "writes": self.writes,
+            "writes_suppressed": self.writes_suppressed,
+            "flips_suppressed": self.flips_suppressed,
+        }
+
+    def _next_state(self, now: datetime) -> bool:
+        """Return the on/off state the current probability leads to.
+
+        A written state only flips once the probability leaves the hysteresis
+        band around the threshold and the state has been held for its minimum
+        duration. Without a written state the plain threshold decides.
+
+        Args:
+            now: The current time.
+
+        Returns:
+            The new on/off state.
+        """
+        current = self._state_on
+        if current is None:
+            return self._probability >= self.threshold
+
+        if current:
+            crossed = self._probability < self.threshold - self.hysteresis_off
+            dwell = self.min_on_duration
+        else:
+            crossed = self._probability >= self.threshold + self.hysteresis_on
+            dwell = self.min_off_duration
+
+        if crossed and self._state_changed_at is not None:
+            remaining = self._state_changed_at + dwell - now
+            if remaining > timedelta(0):
+                if self._unsub_dwell is None:
+                    self._unsub_dwell = async_call_later(
+                        self.hass, remaining, self._async_dwell_elapsed
+                    )
+                crossed = False
+
+        if not crossed and (self._probability >= self.threshold) != current:
+            self.flips_suppressed += 1
+        return not current if crossed else current
+
+    @callback
+    def _async_write_state(self) -> None:
+        """Settle the on/off state and write it if anything material changed.
+
+        Writes are skipped while the state and reasons are unchanged and the
+        probability moved by less than PROBABILITY_WRITE_DELTA.
+        """
+        now = utcnow()
+        state_on = self._next_state(now)
+        if state_on != self._state_on:
+            self._state_on = state_on
+            self._state_changed_at = now
+            self._async_cancel_dwell()
+
+        reasons = [r[1] for r in sorted(self._reasons, reverse=True)]
+        if (
+            self._written is not None
+            and self._written[0] == state_on
+            and abs(self._written[1] - self._probability) < PROBABILITY_WRITE_DELTA
+            and self._written[2] == reasons
+        ):
+            self.writes_suppressed += 1
+            return
+
+        self._written = (state_on, self._probability, reasons)
+        self.writes += 1
+        self.async_write_ha_state()
+
     def _get_sensor_value(self, sensor_id: str | None) -> float | None:
         """Safely get the numeric value from a sensor's state."""
         if not sensor_id:
@@ -295,28 +416,23 @@ class BayesianEnvironmentSensor(BinarySensorEntity):
 
     def _get_growth_stage_info(self) -> dict[str, int]:
         """Get the current growth stage duration (veg and flower days) for the growspace."""
-        plants = self.coordinator.get_growspace_plants(self.growspace_id)
-
-        if not plants:
-            return {"veg_days": 0, "flower_days": 0}
-
-        max_veg = max(
-            (self._days_since(p.veg_start) for p in plants if p.veg_start), default=0
-        )
-        max_flower = max(
-            (self._days_since(p.flower_start) for p in plants if p.flower_start),
-            default=0,
-        )
-
+        summary = self.coordinator.get_growspace_stage_summary(self.growspace_id)
         return {
-            "veg_days": max_veg,
-            "flower_days": max_flower,
+            "veg_days": summary["veg_days"],
+            "flower_days": summary["flower_days"],
         }
 
     async def _async_analyze_sensor_trend(
         self, sensor_id: str, duration_minutes: int, threshold: float
     ) -> dict[str, Any]:
-        """Analyze the trend of a sensor's history to detect rising or falling patterns."""
+        """Analyze the trend of a sensor's history to detect rising or falling patterns.
+
+        Uses the hub's in-memory trend buffer when the sensor is buffered and
+        only queries the recorder otherwise.
+        """
+        if (buffer := await self._hub.async_get_trend_buffer(sensor_id)) is not None:
+            return buffer.analyze(duration_minutes * 60, threshold)
+
         start_time = utcnow() - timedelta(minutes=duration_minutes)
         end_time = utcnow()
 
@@ -545,31 +661,29 @@ class BayesianEnvironmentSensor(BinarySensorEntity):
         """Calculate the Bayesian probability based on environmental observations."""
         raise NotImplementedError
 
+    async def _async_evaluate_rules(self) -> None:
+        """Update the probability from the rules whose inputs changed."""
+        state = self._get_base_environment_state()
+        await self._evaluation.async_evaluate(state)
+        self._reasons = self._evaluation.reasons
+        # The base observations are shared with the other sensors of the hub
+        self._sensor_states = {**self._sensor_states, **self._evaluation.attributes}
+        self._probability = self._evaluation.posterior(self.prior)
+        self._async_write_state()
+
     @staticmethod
     def _calculate_bayesian_probability(
         prior: float, observations: list[tuple[float, float]]
     ) -> float:
-        """Perform the Bayesian calculation."""
-        if not observations:
-            return prior
-
-        prob_true = prior
-        prob_false = 1 - prior
-
-        for p_obs_given_true, p_obs_given_false in observations:
-            prob_true *= p_obs_given_true
-            prob_false *= p_obs_given_false
-
-        total = prob_true + prob_false
-        if total == 0:
-            return prior
-
-        return prob_true / total
+        """Perform the Bayesian calculation in log-odds space."""
+        return posterior_probability(prior, observations)
 
     @property
     def is_on(self) -> bool:
-        """Return true if the calculated probability exceeds the configured threshold."""
-        return self._probability >= self.threshold
+        """Return true if the probability has settled above the threshold."""
+        if self._state_on is None:
+            return self._probability >= self.threshold
+        return self._state_on
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -579,13 +693,18 @@ class BayesianEnvironmentSensor(BinarySensorEntity):
             "threshold": self.threshold,
             "observations": self._sensor_states,
             "reasons": [r[1] for r in sorted(self._reasons, reverse=True)],
+            # Coarse enough that the recorder mostly reuses one attributes row
+            "summary": {
+                "probability": round(self._probability, 1),
+                "reasons": len(self._reasons),
+            },
         }
 
 
 class BayesianStressSensor(BayesianEnvironmentSensor):
     """A Bayesian binary sensor for detecting plant stress conditions."""
 
-    def __init__(self, coordinator, growspace_id, env_config):
+    def __init__(self, coordinator, growspace_id, env_config, hub=None):
         """Initialize the plant stress sensor."""
         super().__init__(
             coordinator,
@@ -595,7 +714,9 @@ class BayesianStressSensor(BayesianEnvironmentSensor):
             name_suffix="Plants Under Stress",
             prior_key="prior_stress",
             threshold_key="stress_threshold",
+            hub=hub,
         )
+        self._evaluation = IncrementalEvaluator(stress_rules(self))
 
     def get_notification_title_message(
         self, new_state_on: bool
@@ -611,55 +732,7 @@ class BayesianStressSensor(BayesianEnvironmentSensor):
 
     async def _async_update_probability(self) -> None:
         """Calculate the probability of plant stress based on environmental factors."""
-        self._reasons = []
-        state = self._get_base_environment_state()
-        observations = []
-
-        # 1. ASYNCHRONOUS TREND ANALYSIS (Logic moved to bayesian_evaluator.py)
-        trend_obs, trend_reasons, trend_states = await async_evaluate_stress_trend(
-            self, state
-        )
-        observations.extend(trend_obs)
-        self._reasons.extend(trend_reasons)
-        self._sensor_states.update(trend_states)
-
-        # 2. DIRECT OBSERVATIONS (Logic moved to bayesian_evaluator.py)
-
-        temp_obs, temp_reasons = evaluate_direct_temp_stress(state, self.env_config)
-        observations.extend(temp_obs)
-        self._reasons.extend(temp_reasons)
-
-        hum_obs, hum_reasons = evaluate_direct_humidity_stress(state, self.env_config)
-        observations.extend(hum_obs)
-        self._reasons.extend(hum_reasons)
-
-        vpd_obs, vpd_reasons = evaluate_direct_vpd_stress(state, self.env_config)
-        observations.extend(vpd_obs)
-        self._reasons.extend(vpd_reasons)
-
-        co2_obs, co2_reasons = evaluate_direct_co2_stress(state, self.env_config)
-        observations.extend(co2_obs)
-        self._reasons.extend(co2_reasons)
-
-        # 3. ACTIVE DESICCATION (Dehumidifier running while dry/high VPD)
-        if state.dehumidifier_on:
-            is_dry = state.humidity is not None and state.humidity < 40
-            is_high_vpd = state.vpd is not None and state.vpd > 1.5
-            
-            if is_dry or is_high_vpd:
-                prob = (0.99, 0.01)
-                observations.append(prob)
-                reason = "Active Desiccation (Dehum ON + "
-                if is_dry:
-                    reason += f"Low Humidity {state.humidity}%)"
-                else:
-                    reason += f"High VPD {state.vpd}kPa)"
-                self._reasons.append((prob[0], reason))
-
-        self._probability = self._calculate_bayesian_probability(
-            self.prior, observations
-        )
-        self.async_write_ha_state()
+        await self._async_evaluate_rules()
 
 
 class LightCycleVerificationSensor(BinarySensorEntity):
@@ -695,7 +768,11 @@ class LightCycleVerificationSensor(BinarySensorEntity):
 
     async def async_added_to_hass(self) -> None:
         """Register callbacks when the entity is added to Home Assistant."""
-        self.coordinator.async_add_listener(self._handle_coordinator_update)
+        self.async_on_remove(
+            self.coordinator.async_subscribe_growspace(
+                self.growspace_id, self._handle_coordinator_update
+            )
+        )
         if self.light_entity_id:
             self.async_on_remove(
                 async_track_state_change_event(
@@ -718,27 +795,11 @@ class LightCycleVerificationSensor(BinarySensorEntity):
 
     def _get_growth_stage_info(self) -> dict[str, int]:
         """Get the current growth stage duration for the growspace."""
-        plants = self.coordinator.get_growspace_plants(self.growspace_id)
-        if not plants:
-            return {"veg_days": 0, "flower_days": 0}
-
-        max_veg = max(
-            (
-                self.coordinator.calculate_days(p.veg_start)
-                for p in plants
-                if p.veg_start
-            ),
-            default=0,
-        )
-        max_flower = max(
-            (
-                self.coordinator.calculate_days(p.flower_start)
-                for p in plants
-                if p.flower_start
-            ),
-            default=0,
-        )
-        return {"veg_days": max_veg, "flower_days": max_flower}
+        summary = self.coordinator.get_growspace_stage_summary(self.growspace_id)
+        return {
+            "veg_days": summary["veg_days"],
+            "flower_days": summary["flower_days"],
+        }
 
     async def async_update(self) -> None:
         """Update the sensor's state based on the light's on/off duration."""
@@ -795,7 +856,7 @@ class LightCycleVerificationSensor(BinarySensorEntity):
 class BayesianDryingSensor(BayesianEnvironmentSensor):
     """A Bayesian binary sensor for detecting optimal drying conditions."""
 
-    def __init__(self, coordinator, growspace_id, env_config):
+    def __init__(self, coordinator, growspace_id, env_config, hub=None):
         """Initialize the optimal drying sensor."""
         super().__init__(
             coordinator,
@@ -805,13 +866,14 @@ class BayesianDryingSensor(BayesianEnvironmentSensor):
             name_suffix="Optimal Drying",
             prior_key="prior_drying",
             threshold_key="drying_threshold",
+            hub=hub,
         )
 
     async def _async_update_probability(self) -> None:
         """Calculate the probability of optimal drying conditions."""
         if self.growspace_id != "dry":
             self._probability = 0
-            self.async_write_ha_state()
+            self._async_write_state()
             return
 
         self._reasons = []
@@ -842,13 +904,13 @@ class BayesianDryingSensor(BayesianEnvironmentSensor):
         self._probability = self._calculate_bayesian_probability(
             self.prior, observations
         )
-        self.async_write_ha_state()
+        self._async_write_state()
 
 
 class BayesianCuringSensor(BayesianEnvironmentSensor):
     """A Bayesian binary sensor for detecting optimal curing conditions."""
 
-    def __init__(self, coordinator, growspace_id, env_config):
+    def __init__(self, coordinator, growspace_id, env_config, hub=None):
         """Initialize the optimal curing sensor."""
         super().__init__(
             coordinator,
@@ -858,13 +920,14 @@ class BayesianCuringSensor(BayesianEnvironmentSensor):
             name_suffix="Optimal Curing",
             prior_key="prior_curing",
             threshold_key="curing_threshold",
+            hub=hub,
         )
 
     async def _async_update_probability(self) -> None:
         """Calculate the probability of optimal curing conditions."""
         if self.growspace_id != "cure":
             self._probability = 0
-            self.async_write_ha_state()
+            self._async_write_state()
             return
 
         self._reasons = []
@@ -895,13 +958,13 @@ class BayesianCuringSensor(BayesianEnvironmentSensor):
         self._probability = self._calculate_bayesian_probability(
             self.prior, observations
         )
-        self.async_write_ha_state()
+        self._async_write_state()
 
 
 class BayesianMoldRiskSensor(BayesianEnvironmentSensor):
     """A Bayesian binary sensor for detecting high mold risk conditions."""
 
-    def __init__(self, coordinator, growspace_id, env_config):
+    def __init__(self, coordinator, growspace_id, env_config, hub=None):
         """Initialize the mold risk sensor."""
         super().__init__(
             coordinator,
@@ -911,7 +974,9 @@ class BayesianMoldRiskSensor(BayesianEnvironmentSensor):
             name_suffix="High Mold Risk",
             prior_key="prior_mold_risk",
             threshold_key="mold_threshold",
+            hub=hub,
         )
+        self._evaluation = IncrementalEvaluator(mold_risk_rules(self))
 
     def get_notification_title_message(
         self, new_state_on: bool
@@ -927,78 +992,13 @@ class BayesianMoldRiskSensor(BayesianEnvironmentSensor):
 
     async def _async_update_probability(self) -> None:
         """Calculate the probability of mold risk, focusing on late flower conditions."""
-        self._reasons = []
-        state = self._get_base_environment_state()
-        observations = []
-
-        # --- Trend Analysis for Mold Risk (Moved to bayesian_evaluator.py) ---
-        trend_obs, trend_reasons, trend_states = await async_evaluate_mold_risk_trend(
-            self, state
-        )
-        observations.extend(trend_obs)
-        self._reasons.extend(trend_reasons)
-        self._sensor_states.update(trend_states)
-
-        if state.flower_days >= 35:
-            prob = (0.80, 0.20)
-            observations.append(prob)
-            self._reasons.append((prob[0], "Late Flower"))
-
-            if state.temp is not None and 16 < state.temp < 23:
-                prob = self.env_config.get("prob_mold_temp_danger_zone", (0.85, 0.30))
-                observations.append(prob)
-                self._reasons.append((prob[0], f"Temp in danger zone ({state.temp})"))
-
-            if not state.is_lights_on:
-                prob = self.env_config.get("prob_mold_lights_off", (0.75, 0.30))
-                observations.append(prob)
-                self._reasons.append((prob[0], "Lights Off"))
-                if state.humidity is not None and state.humidity > 60:
-                    prob = self.env_config.get(
-                        "prob_mold_humidity_high_night", (0.99, 0.10)
-                    )
-                    observations.append(prob)
-                    self._reasons.append(
-                        (prob[0], f"Night Humidity High ({state.humidity})")
-                    )
-                if state.vpd is not None and state.vpd < 0.8:
-                    prob = self.env_config.get("prob_mold_vpd_low_night", (0.95, 0.20))
-                    observations.append(prob)
-                    self._reasons.append((prob[0], f"Night VPD Low ({state.vpd})"))
-            else:  # Daytime checks
-                if state.humidity is not None and state.humidity > 60:
-                    prob = self.env_config.get(
-                        "prob_mold_humidity_high_day", (0.95, 0.20)
-                    )
-                    observations.append(prob)
-                    self._reasons.append(
-                        (prob[0], f"Day Humidity High ({state.humidity})")
-                    )
-                if state.vpd is not None and state.vpd < 0.9:
-                    prob = self.env_config.get("prob_mold_vpd_low_day", (0.90, 0.25))
-                    observations.append(prob)
-                    self._reasons.append((prob[0], f"Day VPD Low ({state.vpd})"))
-            if state.fan_off:
-                prob = self.env_config.get("prob_mold_fan_off", (0.80, 0.15))
-                observations.append(prob)
-                self._reasons.append((prob[0], "Circulation Fan Off"))
-
-        # Control Saturation: Dehumidifier running but humidity still high
-        if state.dehumidifier_on and state.humidity is not None and state.humidity > 60:
-            prob = (0.95, 0.1)
-            observations.append(prob)
-            self._reasons.append((prob[0], f"Dehumidifier Ineffective (ON + Hum {state.humidity}%)"))
-
-        self._probability = self._calculate_bayesian_probability(
-            self.prior, observations
-        )
-        self.async_write_ha_state()
+        await self._async_evaluate_rules()
 
 
 class BayesianOptimalConditionsSensor(BayesianEnvironmentSensor):
     """A Bayesian binary sensor for detecting optimal growing conditions."""
 
-    def __init__(self, coordinator, growspace_id, env_config):
+    def __init__(self, coordinator, growspace_id, env_config, hub=None):
         """Initialize the optimal conditions sensor."""
         super().__init__(
             coordinator,
@@ -1008,7 +1008,9 @@ class BayesianOptimalConditionsSensor(BayesianEnvironmentSensor):
             name_suffix="Optimal Conditions",
             prior_key="prior_optimal",
             threshold_key="optimal_threshold",
+            hub=hub,
         )
+        self._evaluation = IncrementalEvaluator(optimal_rules(self))
 
     def get_notification_title_message(
         self, new_state_on: bool
@@ -1024,32 +1026,4 @@ class BayesianOptimalConditionsSensor(BayesianEnvironmentSensor):
 
     async def _async_update_probability(self) -> None:
         """Calculate the probability that the environment is in an optimal state."""
-        self._reasons = []
-        state = self._get_base_environment_state()
-        observations = []
-
-        # 1. OPTIMAL TEMPERATURE (Logic moved to bayesian_evaluator.py)
-        temp_obs, temp_reasons = evaluate_optimal_temperature(state, self.env_config)
-        observations.extend(temp_obs)
-        self._reasons.extend(temp_reasons)
-
-        # 2. OPTIMAL VPD (Logic moved to bayesian_evaluator.py)
-        vpd_obs, vpd_reasons = evaluate_optimal_vpd(state, self.env_config)
-        observations.extend(vpd_obs)
-        self._reasons.extend(vpd_reasons)
-
-        # 3. OPTIMAL CO2 LEVELS (Logic moved to bayesian_evaluator.py)
-        co2_obs, co2_reasons = evaluate_optimal_co2(state, self.env_config)
-        observations.extend(co2_obs)
-        self._reasons.extend(co2_reasons)
-
-        # 4. SYSTEM STABILITY (Dehumidifier fighting)
-        if state.dehumidifier_on:
-            prob = (0.4, 0.7)
-            observations.append(prob)
-            self._reasons.append((prob[0], "System Fighting (Dehumidifier ON)"))
-
-        self._probability = self._calculate_bayesian_probability(
-            self.prior, observations
-        )
-        self.async_write_ha_state()
+        await self._async_evaluate_rules()
@@ -31,10 +31,30 @@ from homeassistant.helpers import selector
 from .const import (
     AI_PERSONALITIES,
     CONF_AI_ENABLED,
+    CONF_ARCHIVE_AFTER_DAYS,
     CONF_ASSISTANT_ID,
+    CONF_EVALUATION_INTERVAL,
+    CONF_GRID_FORMAT,
+    CONF_HYSTERESIS_OFF,
+    CONF_HYSTERESIS_ON,
+    CONF_MIN_OFF_DURATION,
+    CONF_MIN_ON_DURATION,
     CONF_NOTIFICATION_PERSONALITY,
+    CONF_SAVE_DELAY,
+    CONF_STORAGE_BACKEND,
+    DEFAULT_ARCHIVE_AFTER_DAYS,
+    DEFAULT_EVALUATION_INTERVAL,
+    DEFAULT_GRID_FORMAT,
+    DEFAULT_HYSTERESIS_OFF,
+    DEFAULT_HYSTERESIS_ON,
+    DEFAULT_MIN_OFF_DURATION,
+    DEFAULT_MIN_ON_DURATION,
     DEFAULT_NAME,
+    DEFAULT_SAVE_DELAY,
+    DEFAULT_STORAGE_BACKEND,
     DOMAIN,
+    GRID_FORMATS,
+    STORAGE_BACKENDS,
 )
 from .models import Growspace, Plant
 
@@ -970,6 +990,35 @@ class OptionsFlowHandler(OptionsFlow):
                     mode=selector.NumberSelectorMode.SLIDER,
                 )
             )
+        for key, default in [
+            (CONF_HYSTERESIS_ON, DEFAULT_HYSTERESIS_ON),
+            (CONF_HYSTERESIS_OFF, DEFAULT_HYSTERESIS_OFF),
+        ]:
+            schema_dict[
+                vol.Optional(key, default=growspace_options.get(key, default))
+            ] = selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=0.2,
+                    step=0.01,
+                    mode=selector.NumberSelectorMode.SLIDER,
+                )
+            )
+        for key, default in [
+            (CONF_MIN_ON_DURATION, DEFAULT_MIN_ON_DURATION),
+            (CONF_MIN_OFF_DURATION, DEFAULT_MIN_OFF_DURATION),
+        ]:
+            schema_dict[
+                vol.Optional(key, default=growspace_options.get(key, default))
+            ] = selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=3600,
+                    step=1,
+                    unit_of_measurement="seconds",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            )
 
         # Thresholds
         schema_dict[
@@ -1682,6 +1731,68 @@ class OptionsFlowHandler(OptionsFlow):
                     domain=["sensor", "input_number"], device_class="humidity"
                 )
             ),
+            vol.Optional(
+                CONF_SAVE_DELAY,
+                default=global_settings.get(CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=300,
+                    step=1,
+                    unit_of_measurement="seconds",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Optional(
+                CONF_STORAGE_BACKEND,
+                default=global_settings.get(
+                    CONF_STORAGE_BACKEND, DEFAULT_STORAGE_BACKEND
+                ),
+            ): selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=STORAGE_BACKENDS,
+                    translation_key=CONF_STORAGE_BACKEND,
+                    mode=selector.SelectSelectorMode.DROPDOWN,
+                )
+            ),
+            vol.Optional(
+                CONF_ARCHIVE_AFTER_DAYS,
+                default=global_settings.get(
+                    CONF_ARCHIVE_AFTER_DAYS, DEFAULT_ARCHIVE_AFTER_DAYS
+                ),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=365,
+                    step=1,
+                    unit_of_measurement="days",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Optional(
+                CONF_EVALUATION_INTERVAL,
+                default=global_settings.get(
+                    CONF_EVALUATION_INTERVAL, DEFAULT_EVALUATION_INTERVAL
+                ),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=300,
+                    step=1,
+                    unit_of_measurement="seconds",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+            vol.Optional(
+                CONF_GRID_FORMAT,
+                default=global_settings.get(CONF_GRID_FORMAT, DEFAULT_GRID_FORMAT),
+            ): selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=GRID_FORMATS,
+                    translation_key=CONF_GRID_FORMAT,
+                    mode=selector.SelectSelectorMode.DROPDOWN,
+                )
+            ),
         }
 
         return self.async_show_form(
@@ -7,6 +7,53 @@ import voluptuous as vol
 DOMAIN = "growspace_manager"
 STORAGE_VERSION = 1
 STORAGE_KEY = f"{DOMAIN}_storage"
+
+# Write-behind persistence: saves requested within this many seconds are
+# coalesced into a single store write (0 writes through immediately)
+CONF_SAVE_DELAY = "save_delay"
+DEFAULT_SAVE_DELAY = 0
+
+# Storage backend: "single" keeps everything in one store file; "sharded" writes
+# a small index plus one file per growspace and only rewrites changed shards
+CONF_STORAGE_BACKEND = "storage_backend"
+STORAGE_BACKEND_SINGLE = "single"
+STORAGE_BACKEND_SHARDED = "sharded"
+STORAGE_BACKENDS = [STORAGE_BACKEND_SINGLE, STORAGE_BACKEND_SHARDED]
+DEFAULT_STORAGE_BACKEND = STORAGE_BACKEND_SINGLE
+
+# Overview grid attribute: "full" lists every position, "sparse" only the
+# occupied ones plus a row bitmap of occupancy
+CONF_GRID_FORMAT = "grid_format"
+GRID_FORMAT_FULL = "full"
+GRID_FORMAT_SPARSE = "sparse"
+GRID_FORMATS = [GRID_FORMAT_FULL, GRID_FORMAT_SPARSE]
+DEFAULT_GRID_FORMAT = GRID_FORMAT_FULL
+
+# Cold archive: cured plants older than this many days in cure are moved out of
+# the in-memory working set into the strain library database (0 disables)
+CONF_ARCHIVE_AFTER_DAYS = "archive_after_days"
+DEFAULT_ARCHIVE_AFTER_DAYS = 0
+
+# Bayesian sensor evaluation: bursts of environment events are coalesced into
+# one run per growspace, started at most once per this many seconds
+CONF_EVALUATION_INTERVAL = "evaluation_interval"
+DEFAULT_EVALUATION_INTERVAL = 5
+
+# Bayesian sensor debouncing, per growspace environment config: a sensor turns
+# on once the probability reaches threshold + hysteresis_on and off once it
+# drops below threshold - hysteresis_off, and stays in a state at least the
+# minimum on/off duration (seconds)
+CONF_HYSTERESIS_ON = "hysteresis_on"
+CONF_HYSTERESIS_OFF = "hysteresis_off"
+CONF_MIN_ON_DURATION = "min_on_duration"
+CONF_MIN_OFF_DURATION = "min_off_duration"
+DEFAULT_HYSTERESIS_ON = 0.0
+DEFAULT_HYSTERESIS_OFF = 0.0
+DEFAULT_MIN_ON_DURATION = 0
+DEFAULT_MIN_OFF_DURATION = 0
+# Probability changes smaller than this, with the same state and reasons, are
+# not written to the state machine
+PROBABILITY_WRITE_DELTA = 0.005
 PLATFORMS: list[str] = [
     "binary_sensor",
     "sensor",
@@ -152,6 +199,22 @@ def valid_date_or_none(value):
             f"'{value}' is not a valid date or ISO format string"
         ) from None
 
+def valid_date(value):
+    """Validate that a value is a valid date or datetime, rejecting empty values.
+
+    Args:
+        value: The value to validate.
+
+    Returns:
+        The parsed date or datetime object.
+
+    Raises:
+        vol.Invalid: If the value is empty or not a valid date format.
+    """
+    if value is None or value == "":
+        raise vol.Invalid("A date is required")
+    return valid_date_or_none(value)
+
 def valid_growspace_id(value):
     """Validate that a value is a non-empty string for a growspace ID.
 
@@ -305,6 +368,118 @@ HARVEST_PLANT_SCHEMA = vol.Schema(
     }
 )
 
+# Bulk plant services: target an explicit list of plants or a whole growspace
+def valid_bulk_target(value):
+    """Validate that a bulk plant service call names the plants it applies to.
+
+    Args:
+        value: The service data dictionary.
+
+    Returns:
+        The validated service data.
+
+    Raises:
+        vol.Invalid: If neither plant_ids nor growspace_id is provided.
+    """
+    if not value.get("plant_ids") and not value.get("growspace_id"):
+        raise vol.Invalid("Either plant_ids or growspace_id is required")
+    return value
+
+
+_BULK_PLANT_TARGET = {
+    vol.Exclusive("plant_ids", "target"): vol.All([str], vol.Length(min=1)),
+    vol.Exclusive("growspace_id", "target"): vol.All(str, valid_growspace_id),
+}
+
+# Add Plants (bulk)
+ADD_PLANTS_SCHEMA = vol.Schema(
+    {
+        vol.Required("growspace_id"): vol.All(str, valid_growspace_id),
+        vol.Required("plants"): vol.All(
+            [
+                vol.Schema(
+                    {
+                        vol.Required("strain"): str,
+                        vol.Optional("phenotype"): str,
+                        vol.Optional("row"): vol.All(int, vol.Range(min=1)),
+                        vol.Optional("col"): vol.All(int, vol.Range(min=1)),
+                        vol.Optional("stage"): vol.In(PLANT_STAGES),
+                        vol.Optional("seedling_start"): valid_date_or_none,
+                        vol.Optional("mother_start"): valid_date_or_none,
+                        vol.Optional("clone_start"): valid_date_or_none,
+                        vol.Optional("veg_start"): valid_date_or_none,
+                        vol.Optional("flower_start"): valid_date_or_none,
+                        vol.Optional("dry_start"): valid_date_or_none,
+                        vol.Optional("cure_start"): valid_date_or_none,
+                    }
+                )
+            ],
+            vol.Length(min=1),
+        ),
+    }
+)
+
+# Transition Plants (bulk)
+TRANSITION_PLANTS_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **_BULK_PLANT_TARGET,
+            vol.Required("new_stage"): vol.In(PLANT_STAGES),
+            vol.Optional("transition_date"): valid_date_or_none,
+        }
+    ),
+    valid_bulk_target,
+)
+
+# Harvest Plants (bulk)
+HARVEST_PLANTS_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **_BULK_PLANT_TARGET,
+            vol.Optional("target_growspace_id"): str,
+            vol.Optional("transition_date"): valid_date_or_none,
+        }
+    ),
+    valid_bulk_target,
+)
+
+# Move Plants (bulk)
+MOVE_PLANTS_SCHEMA = vol.Schema(
+    {
+        vol.Required("moves"): vol.All(
+            [
+                vol.Schema(
+                    {
+                        vol.Required("plant_id"): str,
+                        vol.Required("new_row"): vol.All(int, vol.Range(min=1)),
+                        vol.Required("new_col"): vol.All(int, vol.Range(min=1)),
+                    }
+                )
+            ],
+            vol.Length(min=1),
+        ),
+    }
+)
+
+# Archive finished plants
+ARCHIVE_PLANTS_SCHEMA = vol.Schema(
+    {
+        vol.Exclusive("plant_ids", "target"): vol.All([str], vol.Length(min=1)),
+        vol.Exclusive("min_cure_days", "target"): vol.All(int, vol.Range(min=0)),
+    }
+)
+
+# Query archived plants
+GET_ARCHIVED_PLANTS_SCHEMA = vol.Schema(
+    {
+        vol.Optional("plant_id"): str,
+        vol.Optional("strain"): str,
+        vol.Optional("phenotype"): str,
+        vol.Optional("growspace_id"): str,
+        vol.Optional("limit", default=100): vol.All(int, vol.Range(min=1, max=1000)),
+    }
+)
+
 # Strain Library Schemas
 EXPORT_STRAIN_LIBRARY_SCHEMA = vol.Schema(
     {
@@ -424,6 +599,30 @@ REMOVE_ENVIRONMENT_SCHEMA = vol.Schema(
     }
 )
 
+FIT_BAYESIAN_LIKELIHOODS_SCHEMA = vol.Schema(
+    {
+        vol.Required("growspace_id"): vol.All(str, valid_growspace_id),
+        vol.Required("incidents"): vol.All(
+            [
+                vol.Schema(
+                    {
+                        vol.Required("sensor"): vol.In(["stress", "mold_risk"]),
+                        vol.Required("start"): valid_date,
+                        vol.Required("end"): valid_date,
+                    }
+                )
+            ],
+            vol.Length(min=1),
+        ),
+        vol.Optional("days", default=30): vol.All(int, vol.Range(min=1, max=365)),
+        vol.Optional("sample_interval", default=60): vol.All(
+            int, vol.Range(min=10, max=3600)
+        ),
+        vol.Optional("min_samples", default=30): vol.All(int, vol.Range(min=1)),
+        vol.Optional("apply", default=False): bool,
+    }
+)
+
 # AI Service Schemas
 ASK_GROW_ADVICE_SCHEMA = vol.Schema(
     {
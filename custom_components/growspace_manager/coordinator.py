@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import copy
+import heapq
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
 from dataclasses import asdict
-from .models import Plant, Growspace
+from .models import ChangeSet, Plant, Growspace
 from .utils import (
     format_date,
     find_first_free_position,
     generate_growspace_grid,
+    get_plant_date,
     VPDCalculator,
-    parse_date_field as util_parse_date_field,
 )
+from .storage import ShardedStore
 from .strain_library import StrainLibrary
 from .const import (
     STORAGE_KEY,
@@ -19,19 +24,32 @@ from .const import (
     DOMAIN,
     STORAGE_VERSION,
     SPECIAL_GROWSPACES,
+    CONF_ARCHIVE_AFTER_DAYS,
+    CONF_SAVE_DELAY,
+    CONF_STORAGE_BACKEND,
+    DEFAULT_ARCHIVE_AFTER_DAYS,
+    DEFAULT_SAVE_DELAY,
+    DEFAULT_STORAGE_BACKEND,
+    STORAGE_BACKEND_SHARDED,
 )
 import logging
 import uuid
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from typing import TYPE_CHECKING, Any, Optional
 
 from dateutil import parser
+from homeassistant.core import CALLBACK_TYPE, callback
 from homeassistant.helpers import (
     device_registry as dr,
     entity_registry as er,
 )
+from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
+
+if TYPE_CHECKING:
+    from .environment_hub import EnvironmentHub
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -42,6 +60,8 @@ PlantDict = dict[str, Any]
 GrowspaceDict = dict[str, Any]
 NotificationDict = dict[str, Any]
 DateInput = str | datetime | date | None
+PositionKey = tuple[str, int, int]
+StrainKey = tuple[str, str]
 
 
 class GrowspaceCoordinator(DataUpdateCoordinator):
@@ -95,6 +115,64 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
         # Initialize Env options
         self.options = options or {}
 
+        # Write-behind persistence state
+        self._save_delay: float = float(
+            self.options.get("global_settings", {}).get(
+                CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY
+            )
+            or 0
+        )
+        self._save_dirty = False
+        self._save_requests = 0
+        self._save_writes = 0
+
+        # Optional sharded backend (see `storage.ShardedStore`); the single-file
+        # store above is kept for migrating between backends
+        self._sharded_store: ShardedStore | None = None
+        if (
+            self.options.get("global_settings", {}).get(
+                CONF_STORAGE_BACKEND, DEFAULT_STORAGE_BACKEND
+            )
+            == STORAGE_BACKEND_SHARDED
+        ):
+            self._sharded_store = ShardedStore(hass, STORAGE_VERSION, STORAGE_KEY)
+
+        # Cold archive of cured plants (see `async_archive_finished_plants`)
+        self._archive_after_days: int = int(
+            self.options.get("global_settings", {}).get(
+                CONF_ARCHIVE_AFTER_DAYS, DEFAULT_ARCHIVE_AFTER_DAYS
+            )
+            or 0
+        )
+
+        # Batch mutation state (see `batch`)
+        self._batch_depth = 0
+        self._batch_save_pending = False
+        self._batch_notify_pending = False
+        # Copy-on-first-write journal of the outermost batch: each record as it
+        # was before the batch first changed it (None if it did not exist),
+        # with its notification state
+        self._batch_plants: dict[str, tuple[Plant | None, dict | None]] = {}
+        self._batch_growspaces: dict[str, tuple[Growspace | None, bool | None]] = {}
+
+        # Change tracking for targeted entity updates (see `async_update_listeners`)
+        self._pending_changes = ChangeSet()
+        self.last_changes = ChangeSet(full=True)
+        self._plant_subscribers: dict[str, list[CALLBACK_TYPE]] = {}
+        self._growspace_subscribers: dict[str, list[CALLBACK_TYPE]] = {}
+
+        # Every published update gets the next data version; each growspace
+        # remembers the last version that touched it (see `growspace_data_version`)
+        self.data_version = 0
+        self._full_data_version = 0
+        self._growspace_data_versions: dict[str, int] = {}
+
+        # Shared environment snapshots of the Bayesian sensors, by growspace ID
+        self.environment_hubs: dict[str, EnvironmentHub] = {}
+
+        # Harvest analytics collected during a bulk harvest, written in one transaction
+        self._pending_harvests: list[tuple[str, str, int, int]] | None = None
+
         # Load plants safely, ignoring invalid keys
         raw_plants = data.get("plants", {})
         for pid, pdata in raw_plants.items():
@@ -123,6 +201,35 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
             except Exception as e:
                 _LOGGER.warning("Failed to load growspace %s: %s", gid, e)
 
+        # Day counters per plant and growspace, valid until midnight or a change
+        self._plant_stage_summaries: dict[str, dict[str, int]] = {}
+        self._growspace_stage_summaries: dict[str, dict[str, int]] = {}
+        self._stage_summary_day: date | None = None
+        self._unsub_day_rollover: CALLBACK_TYPE | None = None
+
+        # Timed notification schedule: a heap of (due date, plant ID,
+        # notification ID), with stale entries skipped lazily (see
+        # `_refresh_timed_schedule`)
+        self._timed_heap: list[tuple[date, str, str]] = []
+        self._timed_due: dict[tuple[str, str], date] = {}
+        self._timed_config: dict[str, dict[str, Any]] = {}
+        self._timed_by_growspace: dict[str, list[str]] = {}
+        self._timed_signature: tuple | None = None
+        self._timed_dirty_plants: set[str] = set()
+        self._timed_started = False
+        self._timed_armed_for: date | None = None
+        self._unsub_timed_notification: CALLBACK_TYPE | None = None
+
+        # Secondary indexes over self.plants, maintained by the mutators below
+        self._plants_by_growspace: dict[str, dict[str, None]] = {}
+        self._plant_positions: dict[PositionKey, str] = {}
+        self._plants_by_strain: dict[StrainKey, dict[str, None]] = {}
+        self._plant_index_keys: dict[
+            str, tuple[str, PositionKey | None, StrainKey]
+        ] = {}
+        self._indexed_plants: dict[str, Plant] | None = None
+        self._rebuild_plant_index()
+
         _LOGGER.debug(
             "Loaded %d plants and %d growspaces", len(self.plants), len(self.growspaces)
         )
@@ -219,6 +326,8 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
             canonical_name: The standard name for the new growspace.
         """
         src = self.growspaces[alias_id]
+        self._journal_growspace(canonical_id)
+        self._journal_growspace(alias_id)
         self.growspaces[canonical_id] = Growspace(
             id=canonical_id,
             name=canonical_name,
@@ -240,8 +349,10 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
             else None,
         )
 
+        self._mark_growspace_added(canonical_id)
         self._migrate_plants_to_growspace(alias_id, canonical_id)
         self.growspaces.pop(alias_id, None)
+        self._mark_growspace_removed(alias_id)
         self.update_data_property()
 
         _LOGGER.info("Migrated growspace alias '%s' → '%s'", alias_id, canonical_id)
@@ -258,8 +369,10 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
             alias_id: The legacy ID of the growspace.
             canonical_id: The existing standard ID to consolidate into.
         """
+        self._journal_growspace(alias_id)
         self._migrate_plants_to_growspace(alias_id, canonical_id)
         self.growspaces.pop(alias_id, None)
+        self._mark_growspace_removed(alias_id)
         self.update_data_property()
 
         _LOGGER.info(
@@ -273,9 +386,190 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
             from_id: The ID of the source growspace.
             to_id: The ID of the target growspace.
         """
+        for plant in self.get_growspace_plants(from_id):
+            self._journal_plant(plant.plant_id)
+            plant.growspace_id = to_id
+            self.reindex_plant(plant.plant_id)
+
+    # =============================================================================
+    # PLANT INDEX
+    # =============================================================================
+
+    @staticmethod
+    def _position_key(plant: Plant) -> PositionKey | None:
+        """Build the position index key for a plant.
+
+        Args:
+            plant: The Plant object.
+
+        Returns:
+            A (growspace_id, row, col) tuple, or None if the position is invalid.
+        """
+        try:
+            return (plant.growspace_id, int(plant.row), int(plant.col))
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _strain_key(plant: Plant) -> StrainKey:
+        """Build the strain index key for a plant.
+
+        Stage is deliberately not part of the key since it is frequently set
+        directly on the plant; mother lookups filter on it instead.
+
+        Args:
+            plant: The Plant object.
+
+        Returns:
+            A lowercased (strain, phenotype) tuple.
+        """
+        return ((plant.strain or "").lower(), (plant.phenotype or "").lower())
+
+    def _index_plant(self, plant: Plant) -> None:
+        """Add a plant to the secondary indexes.
+
+        Args:
+            plant: The Plant object to index.
+        """
+        plant_id = plant.plant_id
+        position_key = self._position_key(plant)
+        strain_key = self._strain_key(plant)
+
+        self._plants_by_growspace.setdefault(plant.growspace_id, {})[plant_id] = None
+        if position_key is not None:
+            self._plant_positions.setdefault(position_key, plant_id)
+        self._plants_by_strain.setdefault(strain_key, {})[plant_id] = None
+
+        self._plant_index_keys[plant_id] = (
+            plant.growspace_id,
+            position_key,
+            strain_key,
+        )
+
+    def _unindex_plant(self, plant_id: str) -> None:
+        """Remove a plant from the secondary indexes using its last indexed keys.
+
+        Args:
+            plant_id: The ID of the plant to remove from the indexes.
+        """
+        keys = self._plant_index_keys.pop(plant_id, None)
+        if keys is None:
+            return
+        growspace_id, position_key, strain_key = keys
+
+        members = self._plants_by_growspace.get(growspace_id)
+        if members is not None:
+            members.pop(plant_id, None)
+            if not members:
+                del self._plants_by_growspace[growspace_id]
+
+        if position_key is not None and self._plant_positions.get(position_key) == plant_id:
+            del self._plant_positions[position_key]
+            # Hand the cell over to any other plant stacked on the same position
+            for other_id in self._plants_by_growspace.get(growspace_id, {}):
+                if self._plant_index_keys[other_id][1] == position_key:
+                    self._plant_positions[position_key] = other_id
+                    break
+
+        strain_members = self._plants_by_strain.get(strain_key)
+        if strain_members is not None:
+            strain_members.pop(plant_id, None)
+            if not strain_members:
+                del self._plants_by_strain[strain_key]
+
+    def reindex_plant(self, plant_id: str) -> None:
+        """Refresh the index entries of a plant after its fields were changed.
+
+        Callers that mutate a plant's growspace, position, strain or phenotype
+        directly must call this so lookups stay consistent. The plant and its
+        old and new growspaces are also recorded in the pending change set.
+
+        Args:
+            plant_id: The ID of the plant to re-index.
+        """
+        keys = self._plant_index_keys.get(plant_id)
+        plant = self.plants.get(plant_id)
+        self._mark_plant_changed(
+            plant_id,
+            *{
+                growspace_id
+                for growspace_id in (
+                    keys[0] if keys else None,
+                    plant.growspace_id if plant else None,
+                )
+                if growspace_id
+            },
+        )
+
+        if self._indexed_plants is not self.plants:
+            self._rebuild_plant_index()
+            return
+        self._unindex_plant(plant_id)
+        if plant is not None:
+            self._index_plant(plant)
+
+    def _rebuild_plant_index(self) -> None:
+        """Rebuild all secondary indexes from scratch."""
+        self._invalidate_stage_summaries()
+        self._plants_by_growspace = {}
+        self._plant_positions = {}
+        self._plants_by_strain = {}
+        self._plant_index_keys = {}
         for plant in self.plants.values():
-            if plant.growspace_id == from_id:
-                plant.growspace_id = to_id
+            self._index_plant(plant)
+        self._indexed_plants = self.plants
+
+    def _ensure_plant_index(self) -> None:
+        """Rebuild the indexes if self.plants was replaced or changed size behind our back."""
+        if self._indexed_plants is not self.plants or len(
+            self._plant_index_keys
+        ) != len(self.plants):
+            self._rebuild_plant_index()
+
+    def verify_plant_index(self) -> list[str]:
+        """Compare the maintained indexes against a full scan of all plants.
+
+        Returns:
+            A list of human-readable inconsistencies; empty when the index is valid.
+        """
+        problems: list[str] = []
+        if self._indexed_plants is not self.plants:
+            problems.append("plant index is bound to a stale plants dictionary")
+
+        for plant_id in self._plant_index_keys.keys() - self.plants.keys():
+            problems.append(f"indexed plant {plant_id} no longer exists")
+
+        for plant_id, plant in self.plants.items():
+            keys = self._plant_index_keys.get(plant_id)
+            expected = (
+                plant.growspace_id,
+                self._position_key(plant),
+                self._strain_key(plant),
+            )
+            if keys is None:
+                problems.append(f"plant {plant_id} is missing from the index")
+                continue
+            if keys != expected:
+                problems.append(
+                    f"plant {plant_id} is indexed as {keys} but is {expected}"
+                )
+            if plant_id not in self._plants_by_growspace.get(plant.growspace_id, {}):
+                problems.append(
+                    f"plant {plant_id} missing from growspace {plant.growspace_id}"
+                )
+            if expected[1] is not None and expected[1] not in self._plant_positions:
+                problems.append(f"position {expected[1]} of plant {plant_id} not indexed")
+            if plant_id not in self._plants_by_strain.get(expected[2], {}):
+                problems.append(f"plant {plant_id} missing from strain index")
+
+        for position_key, plant_id in self._plant_positions.items():
+            plant = self.plants.get(plant_id)
+            if plant is None or self._position_key(plant) != position_key:
+                problems.append(f"position {position_key} points at stale plant {plant_id}")
+
+        if problems:
+            _LOGGER.warning("Plant index inconsistencies: %s", problems)
+        return problems
 
     # =============================================================================
     # UTILITY AND HELPER METHODS
@@ -294,7 +588,7 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
         Returns:
             The determined stage as a string.
         """
-        now = date.today()
+        today = date.today()
 
         # 1. Special growspaces override everything
         if plant.growspace_id == "mother":
@@ -307,35 +601,18 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
             return "cure"
 
         # 2. Date-based progression (most advanced stage wins)
-        # Use util_parse_date_field to get date objects for comparison
-        if (
-            cs := util_parse_date_field(getattr(plant, "cure_start", None))
-        ) and cs <= now:
-            return "cure"
-        if (
-            ds := util_parse_date_field(getattr(plant, "dry_start", None))
-        ) and ds <= now:
-            return "dry"
-        if (
-            fs := util_parse_date_field(getattr(plant, "flower_start", None))
-        ) and fs <= now:
-            return "flower"
-        if (
-            vs := util_parse_date_field(getattr(plant, "veg_start", None))
-        ) and vs <= now:
-            return "veg"
-        if (
-            cs := util_parse_date_field(getattr(plant, "clone_start", None))
-        ) and cs <= now:
-            return "clone"
-        if (
-            ms := util_parse_date_field(getattr(plant, "mother_start", None))
-        ) and ms <= now:
-            return "mother"
-        if (
-            ss := util_parse_date_field(getattr(plant, "seedling_start", None))
-        ) and ss <= now:
-            return "seedling"
+        for stage in (
+            "cure",
+            "dry",
+            "flower",
+            "veg",
+            "clone",
+            "mother",
+            "seedling",
+        ):
+            started = get_plant_date(plant, f"{stage}_start")
+            if started and started <= today:
+                return stage
 
         # 3. Fallback to explicitly set stage
         if plant.stage in PLANT_STAGES:
@@ -448,16 +725,24 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
         Raises:
             ValueError: If the position is already occupied.
         """
-        existing_plants = self.get_growspace_plants(growspace_id)
-        for existing_plant in existing_plants:
-            if (
-                existing_plant.plant_id != exclude_plant_id
-                and existing_plant.row == row
-                and existing_plant.col == col
-            ):
-                raise ValueError(
-                    f"Position ({row},{col}) is already occupied by {existing_plant.strain}"
-                )
+        self._ensure_plant_index()
+        position_key = (growspace_id, int(row), int(col))
+        occupant_id = self._plant_positions.get(position_key)
+        if occupant_id is not None and occupant_id == exclude_plant_id:
+            # The excluded plant may be stacked on the cell with another plant
+            occupant_id = next(
+                (
+                    plant_id
+                    for plant_id in self._plants_by_growspace.get(growspace_id, {})
+                    if plant_id != exclude_plant_id
+                    and self._plant_index_keys[plant_id][1] == position_key
+                ),
+                None,
+            )
+        if occupant_id is not None:
+            raise ValueError(
+                f"Position ({row},{col}) is already occupied by {self.plants[occupant_id].strain}"
+            )
 
     def _find_first_available_position(self, growspace_id: str) -> tuple[int, int]:
         """Find the first available (row, col) position in a growspace.
@@ -469,7 +754,12 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
             A tuple containing the first free row and column.
         """
         growspace = self.growspaces[growspace_id]
-        occupied = {(p.row, p.col) for p in self.get_growspace_plants(growspace_id)}
+        self._ensure_plant_index()
+        occupied = {
+            position_key[1:]
+            for plant_id in self._plants_by_growspace.get(growspace_id, {})
+            if (position_key := self._plant_index_keys[plant_id][1]) is not None
+        }
         return find_first_free_position(growspace, occupied)
 
     def _parse_date_field(self, date_value: str | datetime | date | None) -> str | None:
@@ -591,6 +881,7 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
         self._cleanup_legacy_aliases(canonical_id)
 
         # Create or update the canonical growspace
+        self._journal_growspace(canonical_id)
         if canonical_id not in self.growspaces:
             self._create_special_growspace(
                 canonical_id, name, rows, plants_per_row
@@ -616,8 +907,10 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
             for legacy_id in list(self.growspaces.keys()):
                 # Only remove if it's an exact alias match, not a user-created growspace
                 if legacy_id in aliases and legacy_id != canonical_id:
+                    self._journal_growspace(legacy_id)
                     self._migrate_plants_to_growspace(legacy_id, canonical_id)
                     self.growspaces.pop(legacy_id, None)
+                    self._mark_growspace_removed(legacy_id)
                     _LOGGER.info("Removed legacy growspace: %s", legacy_id)
 
     def _create_special_growspace(
@@ -637,6 +930,7 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
             rows=rows,
             plants_per_row=plants_per_row,
         )
+        self._mark_growspace_added(canonical_id)
         _LOGGER.info(
             "Created canonical growspace: %s with name '%s'",
             canonical_id,
@@ -655,6 +949,7 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
         existing = self.growspaces[canonical_id]
         if existing.name != canonical_name:
             existing.name = canonical_name
+            self._mark_growspace_changed(canonical_id)
             _LOGGER.info(
                 "Updated growspace name: %s -> '%s'", canonical_id, canonical_name
             )
@@ -676,31 +971,177 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
     async def _async_update_data(self) -> dict[str, Any]:
         """Refresh data, called periodically by the DataUpdateCoordinator.
 
-        This method updates the central `self.data` property and triggers checks
-        for air exchange recommendations and timed notifications.
+        This method updates the central `self.data` property, sends any timed
+        notifications that have come due and updates air exchange
+        recommendations.
 
         Returns:
             The updated data dictionary.
         """
         self.update_data_property()
+        await self._async_check_timed_notifications()
         await self._async_update_air_exchange_recommendations()
 
         return self.data
 
+    def _data_to_save(self) -> dict[str, Any]:
+        """Serialize the current state for the store.
+
+        This is invoked when the store physically writes, so deferred saves
+        always persist the latest in-memory state.
+
+        Returns:
+            The dictionary to persist.
+        """
+        self._save_dirty = False
+        self._save_writes += 1
+        return {
+            "plants": {pid: asdict(p) for pid, p in self.plants.items()},
+            "growspaces": {gid: asdict(g) for gid, g in self.growspaces.items()},
+            "notifications_sent": self._notifications_sent,  # ✅ Save notification tracking
+            "notifications_enabled": self._notifications_enabled,  # ✅ Save switch states
+        }
+
+    def _index_to_save(self) -> dict[str, Any]:
+        """Serialize the growspace index for the sharded backend.
+
+        Returns:
+            The growspaces, notification switch states and the IDs of every
+            growspace that has a shard.
+        """
+        self._ensure_plant_index()
+        shards = set(self.growspaces)
+        shards.update(gid for gid, pids in self._plants_by_growspace.items() if pids)
+        return {
+            "growspaces": {gid: asdict(g) for gid, g in self.growspaces.items()},
+            "notifications_enabled": self._notifications_enabled,
+            "shards": sorted(shards),
+        }
+
+    def _shard_to_save(self, growspace_id: str) -> dict[str, Any]:
+        """Serialize the plants of one growspace for the sharded backend.
+
+        Args:
+            growspace_id: The growspace whose shard is being written.
+
+        Returns:
+            The growspace's plants and their sent-notification flags.
+        """
+        self._ensure_plant_index()
+        plant_ids = sorted(self._plants_by_growspace.get(growspace_id, ()))
+        return {
+            "plants": {pid: asdict(self.plants[pid]) for pid in plant_ids},
+            "notifications_sent": {
+                pid: self._notifications_sent[pid]
+                for pid in plant_ids
+                if pid in self._notifications_sent
+            },
+        }
+
+    @callback
+    def _mark_storage_dirty(self, growspace_ids: Iterable[str]) -> None:
+        """Record which storage shards must be rewritten on the next save.
+
+        Args:
+            growspace_ids: The growspaces whose plants changed.
+        """
+        if self._sharded_store is not None:
+            self._sharded_store.mark_dirty(growspace_ids)
+
+    async def _async_write_now(self) -> None:
+        """Write the current state to the configured backend immediately."""
+        if self._sharded_store is None:
+            await self.store.async_save(self._data_to_save())
+            return
+        self._save_dirty = False
+        self._save_writes += 1
+        await self._sharded_store.async_save(self._index_to_save, self._shard_to_save)
+
     async def async_save(self) -> None:
-        """Save the current state of all data to persistent storage."""
-        await self.store.async_save(
-            {
-                "plants": {pid: asdict(p) for pid, p in self.plants.items()},
-                "growspaces": {gid: asdict(g) for gid, g in self.growspaces.items()},
-                "notifications_sent": self._notifications_sent,  # ✅ Save notification tracking
-                "notifications_enabled": self._notifications_enabled,  # ✅ Save switch states
-            }
+        """Save the current state of all data to persistent storage.
+
+        When a save delay is configured, the write is deferred and every save
+        requested within the window is coalesced into one store write. Pending
+        writes are flushed by Home Assistant on shutdown and by `async_flush`.
+        With the sharded backend only the growspaces with recorded changes are
+        rewritten.
+        """
+        if self._batch_depth:
+            self._batch_save_pending = True
+            return
+        self._save_requests += 1
+        self._save_dirty = True
+        if self._save_delay > 0:
+            if self._sharded_store is not None:
+                await self._sharded_store.async_delay_save(
+                    self._index_to_save, self._shard_to_save, self._save_delay
+                )
+                return
+            self.store.async_delay_save(self._data_to_save, self._save_delay)
+            return
+        await self._async_write_now()
+
+    async def async_flush(self) -> None:
+        """Write any pending deferred save to storage immediately."""
+        if not self._save_dirty:
+            return
+        _LOGGER.debug(
+            "Flushing pending save (%d requested, %d written)",
+            self._save_requests,
+            self._save_writes,
         )
+        await self._async_write_now()
+
+    @property
+    def save_stats(self) -> dict[str, Any]:
+        """Return counters for requested versus physical storage writes.
+
+        Returns:
+            A dictionary with the requested and written save counts, and
+            whether a deferred save is pending.
+        """
+        stats = {
+            "requested": self._save_requests,
+            "written": self._save_writes,
+            "pending": self._save_dirty,
+            "delay": self._save_delay,
+        }
+        if self._sharded_store is not None:
+            stats["index_writes"] = self._sharded_store.index_writes
+            stats["shard_writes"] = self._sharded_store.shard_writes
+        return stats
+
+    async def _async_load_stored_data(
+        self,
+    ) -> tuple[dict[str, Any] | None, Store | ShardedStore | None]:
+        """Read stored data from the configured backend.
+
+        If the configured backend is empty, the other backend is read instead
+        so that switching backends carries the data over.
+
+        Returns:
+            The stored data, and the backend it was migrated from, if any.
+        """
+        if self._sharded_store is None:
+            if data := await self.store.async_load():
+                return data, None
+            sharded = ShardedStore(self.hass, STORAGE_VERSION, STORAGE_KEY)
+            if data := await sharded.async_load():
+                _LOGGER.info("Migrating data from sharded storage to a single file")
+                return data, sharded
+            return data, None
+
+        if (data := await self._sharded_store.async_load()) is not None:
+            return data, None
+        if data := await self.store.async_load():
+            _LOGGER.info("Migrating data from single-file storage to shards")
+            self._sharded_store.mark_all_dirty()
+            return data, self.store
+        return data, None
 
     async def async_load(self) -> None:
         """Load data from persistent storage and handle migrations."""
-        data = await self.store.async_load()
+        data, migrated_from = await self._async_load_stored_data()
         if not data:
             _LOGGER.info("No stored data found, starting fresh")
             return
@@ -721,6 +1162,7 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
         except Exception as e:
             _LOGGER.error("Error loading plants: %s", e, exc_info=True)
             self.plants = {}
+        self._rebuild_plant_index()
 
         # Load growspaces using from_dict (handles migration)
         try:
@@ -770,6 +1212,9 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
 
         # Save migrated data back to storage
         await self.async_save()
+        if migrated_from is not None:
+            await self.async_flush()
+            await migrated_from.async_remove()
         _LOGGER.info("Saved migrated data to storage")
 
     def update_data_property(self) -> None:
@@ -781,6 +1226,312 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
             "notifications_enabled": self._notifications_enabled,  # ✅ Add switch states
         }
 
+    @callback
+    def async_set_updated_data(self, data: dict[str, Any]) -> None:
+        """Notify listeners of new data, deferring the notification inside a batch.
+
+        Args:
+            data: The updated data dictionary.
+        """
+        if self._batch_depth:
+            self._batch_notify_pending = True
+            return
+        super().async_set_updated_data(data)
+
+    # =============================================================================
+    # BATCH MUTATIONS
+    # =============================================================================
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[None]:
+        """Group several mutations into one save and one listener notification.
+
+        Saves and `async_set_updated_data` calls made inside the block are
+        deferred until the outermost batch exits. If an exception escapes, the
+        plants, growspaces and notification state the batch changed are
+        restored from the journal (see `_journal_plant`) and nothing is saved
+        or published. Nested batches join the outermost one. Strain library
+        writes are not rolled back.
+
+        Yields:
+            None.
+        """
+        if self._batch_depth:
+            self._batch_depth += 1
+            try:
+                yield
+            finally:
+                self._batch_depth -= 1
+            return
+
+        self._batch_plants = {}
+        self._batch_growspaces = {}
+        self._batch_depth = 1
+        self._batch_save_pending = False
+        self._batch_notify_pending = False
+        try:
+            yield
+        except BaseException:
+            self._batch_depth = 0
+            self._rollback_batch()
+            _LOGGER.warning("Batch mutation failed, in-memory changes rolled back")
+            raise
+        finally:
+            self._batch_plants = {}
+            self._batch_growspaces = {}
+
+        self._batch_depth = 0
+        if self._batch_save_pending:
+            await self.async_save()
+        if self._batch_notify_pending:
+            self.update_data_property()
+            self.async_set_updated_data(self.data)
+
+    def _journal_plant(self, plant_id: str) -> None:
+        """Remember a plant as it was before the current batch first changes it.
+
+        Mutators call this before changing a plant or its sent notifications.
+        Outside a batch it does nothing.
+
+        Args:
+            plant_id: The ID of the plant about to change or be created.
+        """
+        if self._batch_depth and plant_id not in self._batch_plants:
+            self._batch_plants[plant_id] = (
+                copy.deepcopy(self.plants.get(plant_id)),
+                copy.deepcopy(self._notifications_sent.get(plant_id)),
+            )
+
+    def _journal_growspace(self, growspace_id: str) -> None:
+        """Remember a growspace as it was before the current batch first changes it.
+
+        Mutators call this before changing a growspace or its notification
+        switch. Outside a batch it does nothing.
+
+        Args:
+            growspace_id: The ID of the growspace about to change or be created.
+        """
+        if self._batch_depth and growspace_id not in self._batch_growspaces:
+            self._batch_growspaces[growspace_id] = (
+                copy.deepcopy(self.growspaces.get(growspace_id)),
+                self._notifications_enabled.get(growspace_id),
+            )
+
+    def _rollback_batch(self) -> None:
+        """Restore every record in the batch journal and refresh derived state."""
+
+        def restore(records: dict[str, Any], key: str, value: Any) -> None:
+            if value is None:
+                records.pop(key, None)
+            else:
+                records[key] = value
+
+        self._ensure_plant_index()
+        for plant_id in self._batch_plants:
+            self._unindex_plant(plant_id)
+        for plant_id, (plant, sent) in self._batch_plants.items():
+            restore(self.plants, plant_id, plant)
+            restore(self._notifications_sent, plant_id, sent)
+            if plant is not None:
+                self._index_plant(plant)
+        for growspace_id, (growspace, enabled) in self._batch_growspaces.items():
+            restore(self.growspaces, growspace_id, growspace)
+            restore(self._notifications_enabled, growspace_id, enabled)
+
+        self._invalidate_stage_summaries()
+        self.update_data_property()
+        self._pending_changes = ChangeSet()
+        self._timed_dirty_plants.update(self._batch_plants)
+
+    # =============================================================================
+    # CHANGE TRACKING
+    # =============================================================================
+
+    def _mark_plant_added(self, plant: Plant) -> None:
+        """Record that a plant was created in the pending change set.
+
+        Args:
+            plant: The new Plant object.
+        """
+        self._pending_changes.plants_added.add(plant.plant_id)
+        self._pending_changes.growspaces_changed.add(plant.growspace_id)
+        self._invalidate_stage_summaries([plant.plant_id], [plant.growspace_id])
+        self._mark_storage_dirty([plant.growspace_id])
+
+    def _mark_plant_removed(self, plant_id: str, growspace_id: str) -> None:
+        """Record that a plant was deleted in the pending change set.
+
+        Args:
+            plant_id: The ID of the removed plant.
+            growspace_id: The growspace the plant was in.
+        """
+        self._pending_changes.plants_removed.add(plant_id)
+        self._pending_changes.growspaces_changed.add(growspace_id)
+        self._invalidate_stage_summaries([plant_id], [growspace_id])
+        self._mark_storage_dirty([growspace_id])
+
+    def _mark_plant_changed(self, plant_id: str, *growspace_ids: str) -> None:
+        """Record that a plant's fields changed in the pending change set.
+
+        Args:
+            plant_id: The ID of the changed plant.
+            *growspace_ids: The growspaces affected, including the previous
+                growspace if the plant was moved.
+        """
+        self._pending_changes.plants_changed.add(plant_id)
+        if not growspace_ids and (plant := self.plants.get(plant_id)):
+            growspace_ids = (plant.growspace_id,)
+        self._pending_changes.growspaces_changed.update(growspace_ids)
+        self._invalidate_stage_summaries([plant_id], growspace_ids)
+        self._mark_storage_dirty(growspace_ids)
+
+    def _mark_growspace_added(self, growspace_id: str) -> None:
+        """Record that a growspace was created in the pending change set.
+
+        Args:
+            growspace_id: The ID of the new growspace.
+        """
+        self._pending_changes.growspaces_added.add(growspace_id)
+
+    def _mark_growspace_removed(self, growspace_id: str) -> None:
+        """Record that a growspace was deleted in the pending change set.
+
+        Args:
+            growspace_id: The ID of the removed growspace.
+        """
+        self._pending_changes.growspaces_removed.add(growspace_id)
+        self._invalidate_stage_summaries((), [growspace_id])
+
+    def _mark_growspace_changed(self, growspace_id: str) -> None:
+        """Record that a growspace's fields changed in the pending change set.
+
+        Args:
+            growspace_id: The ID of the changed growspace.
+        """
+        self._pending_changes.growspaces_changed.add(growspace_id)
+
+    def growspace_data_version(self, growspace_id: str) -> int:
+        """Return the data version of the last update that touched a growspace.
+
+        Anything derived from a growspace and its plants stays valid while
+        this version is unchanged, apart from day counters.
+
+        Args:
+            growspace_id: The ID of the growspace.
+
+        Returns:
+            The data version.
+        """
+        return max(
+            self._full_data_version, self._growspace_data_versions.get(growspace_id, 0)
+        )
+
+    @callback
+    def async_subscribe_plant(
+        self, plant_id: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for updates that touch a single plant.
+
+        Args:
+            plant_id: The ID of the plant to follow.
+            update_callback: Called after any update whose change set includes the plant.
+
+        Returns:
+            A callable that removes the subscription.
+        """
+        return self._async_subscribe(self._plant_subscribers, plant_id, update_callback)
+
+    @callback
+    def async_subscribe_growspace(
+        self, growspace_id: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for updates that touch a growspace or any plant in it.
+
+        Args:
+            growspace_id: The ID of the growspace to follow.
+            update_callback: Called after any update whose change set includes the growspace.
+
+        Returns:
+            A callable that removes the subscription.
+        """
+        return self._async_subscribe(
+            self._growspace_subscribers, growspace_id, update_callback
+        )
+
+    @staticmethod
+    def _async_subscribe(
+        subscribers: dict[str, list[CALLBACK_TYPE]],
+        key: str,
+        update_callback: CALLBACK_TYPE,
+    ) -> CALLBACK_TYPE:
+        """Add a keyed subscription and return its remover.
+
+        Args:
+            subscribers: The subscriber table to add to.
+            key: The plant or growspace ID.
+            update_callback: The callback to register.
+
+        Returns:
+            A callable that removes the subscription.
+        """
+        subscribers.setdefault(key, []).append(update_callback)
+
+        @callback
+        def remove_subscription() -> None:
+            callbacks = subscribers.get(key)
+            if callbacks and update_callback in callbacks:
+                callbacks.remove(update_callback)
+                if not callbacks:
+                    del subscribers[key]
+
+        return remove_subscription
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Publish the pending change set to all listeners.
+
+        Broadcast listeners registered with `async_add_listener` are always
+        called and can inspect `last_changes`. Keyed subscribers are only called
+        when the change set touches their plant or growspace. Updates without
+        recorded changes, such as a refresh, are published as a full change set.
+        """
+        changes = self._pending_changes
+        self._pending_changes = ChangeSet()
+        if changes.is_empty:
+            changes = ChangeSet(full=True)
+        if changes.full:
+            self._invalidate_stage_summaries()
+        self.last_changes = changes
+        self.data_version += 1
+        if changes.full:
+            self._full_data_version = self.data_version
+        else:
+            for growspace_id in changes.growspace_ids:
+                self._growspace_data_versions[growspace_id] = self.data_version
+        self._timed_dirty_plants.update(changes.plant_ids)
+        self._refresh_timed_schedule()
+        self._arm_timed_notifications()
+
+        super().async_update_listeners()
+
+        if changes.full:
+            targets = [
+                *self._plant_subscribers.values(),
+                *self._growspace_subscribers.values(),
+            ]
+        else:
+            targets = [
+                self._plant_subscribers[plant_id]
+                for plant_id in changes.plant_ids
+                if plant_id in self._plant_subscribers
+            ] + [
+                self._growspace_subscribers[growspace_id]
+                for growspace_id in changes.growspace_ids
+                if growspace_id in self._growspace_subscribers
+            ]
+        for update_callback in [cb for callbacks in targets for cb in callbacks]:
+            update_callback()
+
     # =============================================================================
     # GROWSPACE MANAGEMENT METHODS
     # =============================================================================
@@ -819,7 +1570,9 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
             notification_target=notification_target,
             device_id=device_id,
         )
+        self._journal_growspace(growspace_id)
         self.growspaces[growspace_id] = growspace
+        self._mark_growspace_added(growspace_id)
 
         # ✅ Enable notifications by default for new growspace
         self._notifications_enabled[growspace_id] = True
@@ -838,26 +1591,30 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
         """
         self._validate_growspace_exists(growspace_id)
 
-        # Remove all plants in this growspace
-        plants_to_remove = [
-            plant_id
-            for plant_id, plant in self.plants.items()
-            if plant.growspace_id == growspace_id
-        ]
+        async with self.batch():
+            # Remove all plants in this growspace
+            plants_to_remove = [
+                plant.plant_id for plant in self.get_growspace_plants(growspace_id)
+            ]
 
-        for plant_id in plants_to_remove:
-            self.plants.pop(plant_id, None)
-            self._notifications_sent.pop(plant_id, None)  # ✅ Use _notifications_sent
+            for plant_id in plants_to_remove:
+                self._journal_plant(plant_id)
+                self._unindex_plant(plant_id)
+                self.plants.pop(plant_id, None)
+                self._mark_plant_removed(plant_id, growspace_id)
+                self._notifications_sent.pop(plant_id, None)  # ✅ Use _notifications_sent
 
-        growspace_name = self.growspaces[growspace_id].name
-        self.growspaces.pop(growspace_id, None)
+            growspace_name = self.growspaces[growspace_id].name
+            self._journal_growspace(growspace_id)
+            self.growspaces.pop(growspace_id, None)
+            self._mark_growspace_removed(growspace_id)
 
-        # ✅ Remove notification state
-        self._notifications_enabled.pop(growspace_id, None)
+            # ✅ Remove notification state
+            self._notifications_enabled.pop(growspace_id, None)
 
-        self.update_data_property()
-        await self.async_save()
-        self.async_set_updated_data(self.data)
+            self.update_data_property()
+            await self.async_save()
+            self.async_set_updated_data(self.data)
 
         _LOGGER.info(
             "Removed growspace %s (%s) and %d plants",
@@ -892,6 +1649,7 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
             )
             raise ValueError(f"Growspace {growspace_id} not found")
 
+        self._journal_growspace(growspace_id)
         growspace = self.growspaces[growspace_id]
         updated = False
 
@@ -931,6 +1689,7 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
                 updated = True
 
         if updated:
+            self._mark_growspace_changed(growspace_id)
             _LOGGER.info(
                 "Updated growspace %s (%s): %s",
                 growspace_id,
@@ -1026,7 +1785,9 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
             return
 
         old_state = self._notifications_enabled.get(growspace_id, True)
+        self._journal_growspace(growspace_id)
         self._notifications_enabled[growspace_id] = enabled
+        self._mark_growspace_changed(growspace_id)
 
         # Notify listeners (updates switch state)
         # Update data dictionary
@@ -1136,7 +1897,11 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
             cure_start=str(cure_start),
             source_mother=source_mother,
         )
+        self._ensure_plant_index()
+        self._journal_plant(plant_id)
         self.plants[plant_id] = plant
+        self._index_plant(plant)
+        self._mark_plant_added(plant)
 
         self.update_data_property()
         await self.async_save()
@@ -1234,7 +1999,11 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
         self._parse_date_fields(clone_data)
 
         # Save the clone
+        self._ensure_plant_index()
+        self._journal_plant(plant_id)
         self.plants[plant_id] = Plant(**clone_data)
+        self._index_plant(self.plants[plant_id])
+        self._mark_plant_added(self.plants[plant_id])
         self.update_data_property()
         await self.async_save()
         self.async_set_updated_data(self.data)
@@ -1260,12 +2029,13 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
         Returns:
             The Plant object of the mother if found, otherwise None.
         """
-        for plant in self.plants.values():
-            if (
-                plant.stage == "mother"
-                and plant.strain.lower() == strain.lower()
-                and plant.phenotype.lower() == phenotype.lower()
-            ):
+        self._ensure_plant_index()
+        candidates = self._plants_by_strain.get(
+            ((strain or "").lower(), (phenotype or "").lower()), {}
+        )
+        for plant_id in candidates:
+            plant = self.plants[plant_id]
+            if plant.stage == "mother":
                 return plant
 
         return None
@@ -1330,23 +2100,24 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
         self._validate_plant_exists(mother_plant_id)
 
         mother = self.plants[mother_plant_id]
-        clone_gs_id = self._ensure_special_growspace("clone", "clone", 5, 5)
         clone_ids = []
 
-        for _ in range(num_clones):
-            row, col = self._find_first_available_position(clone_gs_id)
-            clone_data = {
-                "strain": mother.strain,
-                "phenotype": mother.phenotype,
-                "type": "clone",
-                "source_mother": mother_plant_id,
-                "stage": "clone",
-                "clone_start": date.today(),
-            }
-            clone_id = await self.async_add_plant(
-                clone_gs_id, **clone_data, row=row, col=col
-            )
-            clone_ids.append(clone_id)
+        async with self.batch():
+            clone_gs_id = self._ensure_special_growspace("clone", "clone", 5, 5)
+            for _ in range(num_clones):
+                row, col = self._find_first_available_position(clone_gs_id)
+                clone_data = {
+                    "strain": mother.strain,
+                    "phenotype": mother.phenotype,
+                    "type": "clone",
+                    "source_mother": mother_plant_id,
+                    "stage": "clone",
+                    "clone_start": date.today(),
+                }
+                clone_id = await self.async_add_plant(
+                    clone_gs_id, **clone_data, row=row, col=col
+                )
+                clone_ids.append(clone_id)
 
         return clone_ids
 
@@ -1396,6 +2167,7 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
         if not plant:
             raise ValueError(f"Plant {plant_id} does not exist")
 
+        self._journal_plant(plant_id)
         _LOGGER.debug("COORDINATOR: Updating plant %s", plant_id)
         for key, value in updates.items():
             _LOGGER.debug(
@@ -1416,6 +2188,7 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
                 _LOGGER.warning("COORDINATOR: Invalid field %s", key)
 
         plant.updated_at = date.today().isoformat()
+        self.reindex_plant(plant_id)
         await self.async_save()
         self.update_data_property()
         self.async_set_updated_data(self.data)
@@ -1484,11 +2257,20 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
             raise ValueError("Cannot switch plants in different growspaces")
 
         # Store and swap positions
+        self._journal_plant(plant1_id)
+        self._journal_plant(plant2_id)
         plant1_row, plant1_col = plant1.row, plant1.col
         plant2_row, plant2_col = plant2.row, plant2.col
 
         plant1.row, plant1.col = plant2_row, plant2_col
         plant2.row, plant2.col = plant1_row, plant1_col
+        self._ensure_plant_index()
+        self._unindex_plant(plant1_id)
+        self._unindex_plant(plant2_id)
+        self._index_plant(plant1)
+        self._index_plant(plant2)
+        self._mark_plant_changed(plant1_id)
+        self._mark_plant_changed(plant2_id)
 
         # Update timestamps
         update_time = date.today().isoformat()
@@ -1572,9 +2354,11 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
         if not plant:
             raise ValueError(f"Plant {plant_id} not found")
 
+        self._journal_plant(plant_id)
         plant.stage = "flower"
         plant.flower_start = date.today().isoformat()
         plant.updated_at = plant.flower_start
+        self._mark_plant_changed(plant_id)
         await self.async_save()
         self.update_data_property()
         self.async_set_updated_data(self.data)
@@ -1593,9 +2377,11 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
         if not plant:
             raise ValueError(f"Plant {plant_id} not found")
 
+        self._journal_plant(plant_id)
         plant.stage = "drying"
         plant.dry_start = date.today().isoformat()
         plant.updated_at = plant.dry_start
+        self._mark_plant_changed(plant_id)
         await self.async_save()
         self.update_data_property()
         self.async_set_updated_data(self.data)
@@ -1614,9 +2400,11 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
         if not plant:
             raise ValueError(f"Plant {plant_id} not found")
 
+        self._journal_plant(plant_id)
         plant.stage = "curing"
         plant.cure_start = date.today().isoformat()
         plant.updated_at = plant.cure_start
+        self._mark_plant_changed(plant_id)
         await self.async_save()
         self.update_data_property()
         self.async_set_updated_data(self.data)
@@ -1635,9 +2423,11 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
         if not plant:
             raise ValueError(f"Plant {plant_id} not found")
 
+        self._journal_plant(plant_id)
         plant.stage = "dry"
         plant.dry_start = date.today().isoformat()
         plant.updated_at = plant.dry_start
+        self._mark_plant_changed(plant_id)
         await self.async_save()
         self.update_data_property()
         self.async_set_updated_data(self.data)
@@ -1678,14 +2468,22 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
             transition_date,
         )
 
-        # Handle harvest logic
-        moved = await self._handle_harvest_logic(
-            plant_id, plant, target_growspace_id, target_growspace_name, transition_date
-        )
+        # Handle harvest logic as one save and one listener notification
+        async with self.batch():
+            self._journal_plant(plant_id)
+            moved = await self._handle_harvest_logic(
+                plant_id,
+                plant,
+                target_growspace_id,
+                target_growspace_name,
+                transition_date,
+            )
+            # The harvest flows mutate the plant directly, so refresh its index entry
+            self.reindex_plant(plant_id)
 
-        self.update_data_property()
-        await self.async_save()
-        self.async_set_updated_data(self.data)
+            self.update_data_property()
+            await self.async_save()
+            self.async_set_updated_data(self.data)
 
         _LOGGER.info(
             "Harvest end: plant_id=%s moved=%s target_growspace_id=%s row=%s col=%s stage=%s dry_start=%s cure_start=%s",
@@ -1901,9 +2699,14 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
         flower_days = self.calculate_days_in_stage(plant, "flower")
 
         if veg_days > 0 or flower_days > 0:
-            await self.strains.record_harvest(
-                plant.strain, plant.phenotype, veg_days, flower_days
-            )
+            if self._pending_harvests is not None:
+                self._pending_harvests.append(
+                    (plant.strain, plant.phenotype, veg_days, flower_days)
+                )
+            else:
+                await self.strains.record_harvest(
+                    plant.strain, plant.phenotype, veg_days, flower_days
+                )
 
         # Now, proceed with moving the plant
         dry_id = self._ensure_special_growspace("dry", "dry")
@@ -1977,6 +2780,10 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
             True if the plant was removed, False if it was not found.
         """
         if plant_id in self.plants:
+            self._journal_plant(plant_id)
+            self._ensure_plant_index()
+            self._unindex_plant(plant_id)
+            self._mark_plant_removed(plant_id, self.plants[plant_id].growspace_id)
             del self.plants[plant_id]
             await self.async_save()
             return True
@@ -1996,6 +2803,277 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
                 _LOGGER.info("Removing entity %s for plant %s", entity_id, plant_id)
                 entity_registry.async_remove(entity_id)
 
+    # =============================================================================
+    # BULK PLANT OPERATIONS
+    # =============================================================================
+
+    async def async_add_plants(
+        self, growspace_id: str, plants: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Add several plants to a growspace as a single coordinator operation.
+
+        Args:
+            growspace_id: The ID of the growspace to add the plants to.
+            plants: A list of keyword-argument dictionaries for `async_add_plant`.
+
+        Returns:
+            A list of per-plant result dictionaries, in request order.
+        """
+        self._validate_growspace_exists(growspace_id)
+        results: list[dict[str, Any]] = []
+
+        async with self.batch():
+            for spec in plants:
+                try:
+                    plant = await self.async_add_plant(growspace_id, **spec)
+                except (TypeError, ValueError) as err:
+                    results.append(
+                        {"strain": spec.get("strain"), "success": False, "error": str(err)}
+                    )
+                    continue
+                results.append(
+                    {
+                        "plant_id": plant.plant_id,
+                        "strain": plant.strain,
+                        "row": plant.row,
+                        "col": plant.col,
+                        "success": True,
+                    }
+                )
+
+        return results
+
+    async def async_transition_plants(
+        self, plant_ids: list[str], new_stage: str, transition_date: DateInput = None
+    ) -> list[dict[str, Any]]:
+        """Transition several plants to a new stage as a single coordinator operation.
+
+        Args:
+            plant_ids: The IDs of the plants to transition.
+            new_stage: The stage to transition the plants to.
+            transition_date: The date of the transition (optional, defaults to today).
+
+        Returns:
+            A list of per-plant result dictionaries, in request order.
+
+        Raises:
+            ValueError: If the new stage is invalid.
+        """
+        if new_stage not in PLANT_STAGES:
+            raise ValueError(
+                f"Invalid stage {new_stage}. Must be one of: {PLANT_STAGES}"
+            )
+
+        results: list[dict[str, Any]] = []
+        async with self.batch():
+            for plant_id in plant_ids:
+                try:
+                    await self.async_transition_plant_stage(
+                        plant_id, new_stage, transition_date
+                    )
+                except ValueError as err:
+                    results.append(
+                        {"plant_id": plant_id, "success": False, "error": str(err)}
+                    )
+                    continue
+                results.append(
+                    {"plant_id": plant_id, "stage": new_stage, "success": True}
+                )
+
+        return results
+
+    async def async_move_plants(
+        self, moves: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Move several plants within their growspaces as a single coordinator operation.
+
+        A move onto a cell occupied by another plant swaps the two plants,
+        matching the single `move_plant` service.
+
+        Args:
+            moves: A list of dictionaries with `plant_id`, `new_row` and `new_col`.
+
+        Returns:
+            A list of per-plant result dictionaries, in request order.
+        """
+        results: list[dict[str, Any]] = []
+        async with self.batch():
+            for move in moves:
+                plant_id = move["plant_id"]
+                try:
+                    self._validate_plant_exists(plant_id)
+                    plant = self.plants[plant_id]
+                    new_row, new_col = int(move["new_row"]), int(move["new_col"])
+                    self._validate_position_bounds(plant.growspace_id, new_row, new_col)
+
+                    self._ensure_plant_index()
+                    occupant_id = self._plant_positions.get(
+                        (plant.growspace_id, new_row, new_col)
+                    )
+                    if occupant_id == plant_id:
+                        occupant_id = None
+                    if occupant_id is not None:
+                        await self.async_switch_plants(plant_id, occupant_id)
+                    else:
+                        await self.async_move_plant(plant_id, new_row, new_col)
+                except (KeyError, ValueError) as err:
+                    results.append(
+                        {"plant_id": plant_id, "success": False, "error": str(err)}
+                    )
+                    continue
+                results.append(
+                    {
+                        "plant_id": plant_id,
+                        "row": plant.row,
+                        "col": plant.col,
+                        "swapped_with": occupant_id,
+                        "success": True,
+                    }
+                )
+
+        return results
+
+    async def async_harvest_plants(
+        self,
+        plant_ids: list[str],
+        target_growspace_id: str | None = None,
+        target_growspace_name: str | None = None,
+        transition_date: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Harvest several plants as a single coordinator operation.
+
+        Harvest analytics for all plants are written to the strain library in
+        one transaction once every move has been applied.
+
+        Args:
+            plant_ids: The IDs of the plants to harvest.
+            target_growspace_id: An explicit destination growspace (optional).
+            target_growspace_name: A destination name hint (optional).
+            transition_date: The date of the harvest (optional, defaults to today).
+
+        Returns:
+            A list of per-plant result dictionaries, in request order.
+        """
+        results: list[dict[str, Any]] = []
+        self._pending_harvests = []
+        try:
+            async with self.batch():
+                for plant_id in plant_ids:
+                    try:
+                        await self.async_harvest_plant(
+                            plant_id,
+                            target_growspace_id,
+                            target_growspace_name,
+                            transition_date,
+                        )
+                    except ValueError as err:
+                        results.append(
+                            {"plant_id": plant_id, "success": False, "error": str(err)}
+                        )
+                        continue
+                    plant = self.plants[plant_id]
+                    results.append(
+                        {
+                            "plant_id": plant_id,
+                            "growspace_id": plant.growspace_id,
+                            "stage": plant.stage,
+                            "success": True,
+                        }
+                    )
+
+            if self._pending_harvests:
+                await self.strains.record_harvests(self._pending_harvests)
+        finally:
+            self._pending_harvests = None
+
+        return results
+
+    # =============================================================================
+    # COLD ARCHIVE
+    # =============================================================================
+
+    async def async_archive_finished_plants(
+        self,
+        plant_ids: list[str] | None = None,
+        min_cure_days: int | None = None,
+    ) -> list[str]:
+        """Move finished plants out of the working set into the archive.
+
+        Archived plants are written to the strain library database and then
+        removed from the coordinator, so they no longer cost anything on saves,
+        updates or entity reconciliation. They can be read back with
+        `StrainLibrary.get_archived_plants`.
+
+        Args:
+            plant_ids: Specific dry or cured plants to archive (optional).
+            min_cure_days: Archive every cured plant at least this many days
+                into cure (optional, defaults to the configured archive age).
+
+        Returns:
+            The IDs of the archived plants.
+        """
+        if plant_ids is not None:
+            candidates = []
+            for plant_id in plant_ids:
+                plant = self.plants.get(plant_id)
+                if plant is None or plant.stage not in ("dry", "cure"):
+                    _LOGGER.warning(
+                        "Not archiving plant %s: it is not drying or curing", plant_id
+                    )
+                    continue
+                candidates.append(plant)
+        else:
+            threshold = (
+                self._archive_after_days if min_cure_days is None else min_cure_days
+            )
+            if min_cure_days is None and threshold <= 0:
+                return []
+            candidates = [
+                plant
+                for plant in self.plants.values()
+                if plant.stage == "cure"
+                and (cure_start := get_plant_date(plant, "cure_start")) is not None
+                and self.calculate_days(cure_start) >= threshold
+            ]
+
+        if not candidates:
+            return []
+
+        # Write the archive first so a database failure leaves the plants in place
+        await self.strains.archive_plants([asdict(plant) for plant in candidates])
+
+        self._ensure_plant_index()
+        for plant in candidates:
+            self._journal_plant(plant.plant_id)
+            self._unindex_plant(plant.plant_id)
+            self._mark_plant_removed(plant.plant_id, plant.growspace_id)
+            del self.plants[plant.plant_id]
+            self._notifications_sent.pop(plant.plant_id, None)
+
+        await self.async_save()
+        self.update_data_property()
+        self.async_set_updated_data(self.data)
+        return [plant.plant_id for plant in candidates]
+
+    @callback
+    def async_schedule_archive(self) -> None:
+        """Archive the plants past the configured cure age in the background.
+
+        Does nothing when automatic archiving is disabled.
+        """
+        if self._archive_after_days > 0:
+            self.hass.async_create_background_task(
+                self._async_archive_in_background(),
+                "growspace_manager archive finished plants",
+            )
+
+    async def _async_archive_in_background(self) -> None:
+        """Run the automatic archive, logging failures instead of raising them."""
+        try:
+            await self.async_archive_finished_plants()
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Failed to archive finished plants, will retry tomorrow")
+
     # =============================================================================
     # STRAIN LIBRARY MANAGEMENT
     # =============================================================================
@@ -2040,10 +3118,10 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
         Returns:
             A list of Plant objects.
         """
+        self._ensure_plant_index()
         return [
-            plant
-            for plant in self.plants.values()
-            if plant.growspace_id == growspace_id
+            self.plants[plant_id]
+            for plant_id in self._plants_by_growspace.get(growspace_id, {})
         ]
 
     def calculate_days_in_stage(self, plant: Plant, stage: str) -> int:
@@ -2056,19 +3134,176 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
         Returns:
             The number of days in the stage.
         """
-        start_date = getattr(plant, f"{stage}_start", None)
+        start_date = get_plant_date(plant, f"{stage}_start")
+        return self.calculate_days(start_date, self._stage_end_date(plant, stage))
+
+    @staticmethod
+    def _stage_end_date(plant: Plant, stage: str) -> date | None:
+        """Return the date a plant left a stage, if it has.
 
-        end_date = None
+        Args:
+            plant: The Plant object.
+            stage: The name of the stage.
+
+        Returns:
+            The start date of the following stage, or None.
+        """
         if stage == "seedling" or stage == "clone":
-            end_date = getattr(plant, "veg_start", None)
-        elif stage == "veg":
-            end_date = getattr(plant, "flower_start", None)
-        elif stage == "flower":
-            end_date = getattr(plant, "dry_start", None)
-        elif stage == "dry":
-            end_date = getattr(plant, "cure_start", None)
+            return get_plant_date(plant, "veg_start")
+        if stage == "veg":
+            return get_plant_date(plant, "flower_start")
+        if stage == "flower":
+            return get_plant_date(plant, "dry_start")
+        if stage == "dry":
+            return get_plant_date(plant, "cure_start")
+        return None
 
-        return self.calculate_days(start_date, end_date)
+    # =============================================================================
+    # STAGE SUMMARY CACHE
+    # =============================================================================
+
+    @staticmethod
+    def _days_to_week(days: int) -> int:
+        """Convert a number of days into a week number (1-indexed).
+
+        Args:
+            days: The number of days.
+
+        Returns:
+            The corresponding week number.
+        """
+        if days <= 0:
+            return 0
+        return (days - 1) // 7 + 1
+
+    def _invalidate_stage_summaries(
+        self,
+        plant_ids: Iterable[str] | None = None,
+        growspace_ids: Iterable[str] | None = None,
+    ) -> None:
+        """Drop cached stage summaries.
+
+        Args:
+            plant_ids: Plants whose summaries to drop (optional).
+            growspace_ids: Growspaces whose summaries to drop (optional).
+                If neither is given, the whole cache is dropped.
+        """
+        if plant_ids is None and growspace_ids is None:
+            self._plant_stage_summaries = {}
+            self._growspace_stage_summaries = {}
+            return
+        for plant_id in plant_ids or ():
+            self._plant_stage_summaries.pop(plant_id, None)
+        for growspace_id in growspace_ids or ():
+            self._growspace_stage_summaries.pop(growspace_id, None)
+
+    def _check_stage_summary_day(self) -> None:
+        """Drop the stage summary cache if it was built on a previous day."""
+        today = date.today()
+        if self._stage_summary_day != today:
+            self._invalidate_stage_summaries()
+            self._stage_summary_day = today
+
+    def get_plant_stage_summary(self, plant_id: str) -> dict[str, int]:
+        """Return the cached day counters for a plant.
+
+        The summary holds `<stage>_days` for every stage plus `veg_week` and
+        `flower_week`. It is computed once and reused until the plant changes
+        or the day rolls over.
+
+        Args:
+            plant_id: The ID of the plant.
+
+        Returns:
+            The plant's stage summary, or an empty dict if the plant is unknown.
+        """
+        self._check_stage_summary_day()
+        summary = self._plant_stage_summaries.get(plant_id)
+        if summary is not None:
+            return summary
+
+        plant = self.plants.get(plant_id)
+        if plant is None:
+            return {}
+
+        summary = {
+            f"{stage}_days": self.calculate_days_in_stage(plant, stage) or 0
+            for stage in PLANT_STAGES
+        }
+        summary["veg_week"] = self._days_to_week(summary["veg_days"])
+        summary["flower_week"] = self._days_to_week(summary["flower_days"])
+        self._plant_stage_summaries[plant_id] = summary
+        return summary
+
+    def get_growspace_stage_summary(self, growspace_id: str) -> dict[str, int]:
+        """Return the cached day counters for a growspace.
+
+        `veg_days` and `flower_days` are the longest time any plant in the
+        growspace has spent since entering that stage; `veg_week` and
+        `flower_week` are derived from them. The summary is reused until a
+        plant in the growspace changes or the day rolls over.
+
+        Args:
+            growspace_id: The ID of the growspace.
+
+        Returns:
+            The growspace's stage summary.
+        """
+        self._check_stage_summary_day()
+        summary = self._growspace_stage_summaries.get(growspace_id)
+        if summary is not None:
+            return summary
+
+        plants = self.get_growspace_plants(growspace_id)
+        veg_days = max(
+            (self.calculate_days(get_plant_date(p, "veg_start")) for p in plants),
+            default=0,
+        )
+        flower_days = max(
+            (self.calculate_days(get_plant_date(p, "flower_start")) for p in plants),
+            default=0,
+        )
+        summary = {
+            "veg_days": veg_days,
+            "flower_days": flower_days,
+            "veg_week": self._days_to_week(veg_days),
+            "flower_week": self._days_to_week(flower_days),
+        }
+        self._growspace_stage_summaries[growspace_id] = summary
+        return summary
+
+    @callback
+    def async_start_day_rollover(self) -> None:
+        """Schedule the stage summary refresh at the next local midnight."""
+        self.async_cancel_day_rollover()
+        next_midnight = dt_util.start_of_local_day(
+            dt_util.now().date() + timedelta(days=1)
+        )
+        self._unsub_day_rollover = async_track_point_in_time(
+            self.hass, self._async_handle_day_rollover, next_midnight
+        )
+
+    @callback
+    def async_cancel_day_rollover(self) -> None:
+        """Cancel the scheduled midnight stage summary refresh."""
+        if self._unsub_day_rollover is not None:
+            self._unsub_day_rollover()
+            self._unsub_day_rollover = None
+
+    @callback
+    def _async_handle_day_rollover(self, now: datetime) -> None:
+        """Refresh day counters at midnight and reschedule for the next day.
+
+        Args:
+            now: The time the callback fired.
+        """
+        self._unsub_day_rollover = None
+        self._stage_summary_day = None
+        _LOGGER.debug("Day rolled over at %s, refreshing stage summaries", now)
+        self.async_start_day_rollover()
+        # Every day counter moved, so publish a full change set
+        self.async_update_listeners()
+        self.async_schedule_archive()
 
     def get_growspace_grid(self, growspace_id: str) -> list[list[str | None]]:
         """Generate a 2D grid representation of a growspace's plant layout.
@@ -2152,57 +3387,232 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
             stage: The growth stage of the event.
             days: The day number of the event.
         """
+        self._journal_plant(plant_id)
         if plant_id not in self._notifications_sent:
             self._notifications_sent[plant_id] = {}
         if stage not in self._notifications_sent[plant_id]:
             self._notifications_sent[plant_id][stage] = {}
 
         self._notifications_sent[plant_id][stage][str(days)] = True
+        if plant := self.plants.get(plant_id):
+            self._mark_storage_dirty([plant.growspace_id])
         await self.async_save()
 
     # =============================================================================
     # TIMED NOTIFICATION MANAGEMENT
     # =============================================================================
-    async def _async_check_timed_notifications(self) -> None:
-        """Check all configured timed notifications and send them if the conditions are met."""
+    @callback
+    def async_start_timed_notifications(self) -> None:
+        """Start waking up for the next due timed notification."""
+        self._timed_started = True
+        self._arm_timed_notifications()
+
+    @callback
+    def async_cancel_timed_notifications(self) -> None:
+        """Cancel the wake-up for the next due timed notification."""
+        self._timed_started = False
+        self._timed_armed_for = None
+        if self._unsub_timed_notification is not None:
+            self._unsub_timed_notification()
+            self._unsub_timed_notification = None
+
+    def _timed_notification_due(
+        self, plant: Plant, notification: dict[str, Any]
+    ) -> date | None:
+        """Return the date a timed notification comes due for a plant.
+
+        Args:
+            plant: The Plant object.
+            notification: The timed notification configuration.
+
+        Returns:
+            The due date, or None if the plant never reaches the trigger day.
+        """
+        stage = notification["trigger_type"]  # 'veg' or 'flower'
+        start = get_plant_date(plant, f"{stage}_start")
+        if start is None:
+            return None
+        due = start + timedelta(days=int(notification["day"]))
+        end = self._stage_end_date(plant, stage)
+        if end is not None and end < due:
+            # The plant left the stage before the trigger day
+            return None
+        return due
+
+    @callback
+    def _refresh_timed_schedule(self) -> None:
+        """Bring the timed notification heap up to date.
+
+        The heap is rebuilt when the configured notifications change, and
+        otherwise only the plants recorded in `_timed_dirty_plants` are
+        rescheduled. Superseded heap entries are left in place and skipped
+        when they reach the top.
+        """
         notifications = self.options.get("timed_notifications", [])
-        if not notifications:
+        signature = tuple(
+            (
+                n["id"],
+                n["trigger_type"],
+                str(n["day"]),
+                tuple(n.get("growspace_ids", [])),
+            )
+            for n in notifications
+        )
+        self._timed_config = {n["id"]: n for n in notifications}
+        if signature != self._timed_signature:
+            self._timed_signature = signature
+            self._timed_by_growspace = {}
+            for n in notifications:
+                for gs_id in n.get("growspace_ids", []):
+                    self._timed_by_growspace.setdefault(gs_id, []).append(n["id"])
+            self._timed_heap = []
+            self._timed_due = {}
+            plant_ids: Iterable[str] = list(self.plants)
+        else:
+            plant_ids = self._timed_dirty_plants
+        self._timed_dirty_plants = set()
+
+        for plant_id in plant_ids:
+            for notification_id in self._timed_config:
+                self._timed_due.pop((plant_id, notification_id), None)
+            plant = self.plants.get(plant_id)
+            if plant is None:
+                continue
+            sent = self._notifications_sent.get(plant_id, {})
+            for notification_id in self._timed_by_growspace.get(plant.growspace_id, ()):
+                if sent.get(f"timed_{notification_id}", False):
+                    continue
+                due = self._timed_notification_due(
+                    plant, self._timed_config[notification_id]
+                )
+                if due is None:
+                    continue
+                self._timed_due[(plant_id, notification_id)] = due
+                heapq.heappush(self._timed_heap, (due, plant_id, notification_id))
+
+        # Compact once superseded entries dominate the heap
+        if len(self._timed_heap) > 2 * len(self._timed_due) + 16:
+            self._timed_heap = [
+                (due, plant_id, notification_id)
+                for (plant_id, notification_id), due in self._timed_due.items()
+            ]
+            heapq.heapify(self._timed_heap)
+
+    def _timed_entry_is_current(self, entry: tuple[date, str, str]) -> bool:
+        """Return whether a heap entry still reflects the plant's schedule.
+
+        Args:
+            entry: A (due date, plant ID, notification ID) heap entry.
+
+        Returns:
+            True if the entry has not been superseded.
+        """
+        due, plant_id, notification_id = entry
+        return self._timed_due.get((plant_id, notification_id)) == due
+
+    @callback
+    def _arm_timed_notifications(self, not_before: date | None = None) -> None:
+        """Schedule a single wake-up at local midnight of the earliest due date.
+
+        Args:
+            not_before: The earliest day to wake up on, so notifications that
+                failed to send are retried then rather than immediately.
+        """
+        if not self._timed_started:
+            return
+        while self._timed_heap and not self._timed_entry_is_current(
+            self._timed_heap[0]
+        ):
+            heapq.heappop(self._timed_heap)
+        next_due = self._timed_heap[0][0] if self._timed_heap else None
+        if next_due is not None and not_before is not None:
+            next_due = max(next_due, not_before)
+        if next_due == self._timed_armed_for:
             return
+        if self._unsub_timed_notification is not None:
+            self._unsub_timed_notification()
+            self._unsub_timed_notification = None
+        self._timed_armed_for = next_due
+        if next_due is not None:
+            self._unsub_timed_notification = async_track_point_in_time(
+                self.hass,
+                self._async_handle_timed_notification_due,
+                dt_util.start_of_local_day(next_due),
+            )
+
+    @callback
+    def _async_handle_timed_notification_due(self, now: datetime) -> None:
+        """Send the timed notifications that came due.
+
+        Args:
+            now: The time the callback fired.
+        """
+        self._unsub_timed_notification = None
+        self._timed_armed_for = None
+        self.hass.async_create_task(self._async_check_timed_notifications())
+
+    async def _async_check_timed_notifications(self) -> None:
+        """Send every timed notification that has come due, then save once.
+
+        A notification that fails to send stays due and is retried on the
+        next check, at the latest after the next local midnight.
+        """
+        self._refresh_timed_schedule()
+        today = date.today()
+
+        sent_any = False
+        failed: list[tuple[date, str, str]] = []
+        while self._timed_heap and self._timed_heap[0][0] <= today:
+            entry = heapq.heappop(self._timed_heap)
+            if not self._timed_entry_is_current(entry):
+                continue
+            _, plant_id, notification_id = entry
 
-        for notification in notifications:
-            trigger_type = notification["trigger_type"]  # 'veg' or 'flower'
+            plant = self.plants.get(plant_id)
+            notification = self._timed_config.get(notification_id)
+            growspace = self.growspaces.get(plant.growspace_id) if plant else None
+            if plant is None or notification is None or not growspace:
+                del self._timed_due[(plant_id, notification_id)]
+                continue
+
+            trigger_type = notification["trigger_type"]
             day_to_trigger = int(notification["day"])
-            message = notification["message"]
-            growspace_ids = notification["growspace_ids"]
-            notification_id = notification["id"]
+            _LOGGER.info(
+                "Triggering timed notification for plant %s in %s",
+                plant_id,
+                growspace.name,
+            )
+            title = f"{growspace.name} - {trigger_type.capitalize()} Day {day_to_trigger}"
+            try:
+                await self._send_notification(
+                    plant.growspace_id, title, notification["message"]
+                )
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Failed to send timed notification %s for plant %s, will retry",
+                    notification_id,
+                    plant_id,
+                )
+                failed.append(entry)
+                continue
 
-            for gs_id in growspace_ids:
-                growspace = self.growspaces.get(gs_id)
-                if not growspace:
-                    continue
+            del self._timed_due[(plant_id, notification_id)]
+            self._journal_plant(plant_id)
+            self._notifications_sent.setdefault(plant_id, {})[
+                f"timed_{notification_id}"
+            ] = True
+            self._mark_storage_dirty([plant.growspace_id])
+            sent_any = True
 
-                plants = self.get_growspace_plants(gs_id)
-                for plant in plants:
-                    days_in_stage = self.calculate_days_in_stage(plant, trigger_type)
-
-                    if days_in_stage >= day_to_trigger:
-                        notification_key = f"timed_{notification_id}"
-                        if not self._notifications_sent.get(plant.plant_id, {}).get(
-                            notification_key, False
-                        ):
-                            _LOGGER.info(
-                                f"Triggering timed notification for plant {plant.plant_id} in {growspace.name}"
-                            )
-                            title = f"{growspace.name} - {trigger_type.capitalize()} Day {day_to_trigger}"
-
-                            await self._send_notification(gs_id, title, message)
-
-                            if plant.plant_id not in self._notifications_sent:
-                                self._notifications_sent[plant.plant_id] = {}
-                            self._notifications_sent[plant.plant_id][
-                                notification_key
-                            ] = True
-                            await self.async_save()
+        for entry in failed:
+            heapq.heappush(self._timed_heap, entry)
+        try:
+            if sent_any:
+                await self.async_save()
+        finally:
+            self._arm_timed_notifications(
+                not_before=today + timedelta(days=1) if failed else None
+            )
 
     async def _send_notification(
         self, growspace_id: str, title: str, message: str
@@ -2261,7 +3671,6 @@ class GrowspaceCoordinator(DataUpdateCoordinator):
         'lung room' to the conditions in each growspace under stress, recommending
         the best source for air exchange to correct the environment.
         """
-        await self._async_check_timed_notifications()
         recommendations = {}
         global_settings = self.options.get("global_settings", {})
 
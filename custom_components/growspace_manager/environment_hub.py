@@ -0,0 +1,351 @@
+"""Shared per-growspace environment snapshots for the Bayesian sensors."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import timedelta
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.recorder import history
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.recorder import get_instance as get_recorder_instance
+from homeassistant.util import dt as dt_util
+
+from .evaluation_scheduler import EvaluationScheduler, Evaluator
+from .models import EnvironmentState
+from .trend_buffer import TrendBuffer, numeric_sample
+
+if TYPE_CHECKING:
+    from .coordinator import GrowspaceCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Entities whose state changes invalidate the snapshot
+TRACKED_ENVIRONMENT_KEYS = (
+    "temperature_sensor",
+    "humidity_sensor",
+    "vpd_sensor",
+    "co2_sensor",
+    "light_sensor",
+    "circulation_fan",
+    "dehumidifier_entity",
+)
+
+# Sensors whose recent history feeds the fallback trend analysis
+TREND_SENSOR_KEYS = ("temperature", "humidity", "vpd")
+DEFAULT_TREND_DURATION = 30
+
+
+class EnvironmentHub:
+    """Build one EnvironmentState per change and share it across sensors.
+
+    Every Bayesian sensor of a growspace reads the same entities. The hub
+    listens for state changes of those entities and for coordinator updates of
+    the growspace once, invalidates its snapshot, and notifies each sensor. The
+    first sensor to ask for the state afterwards builds the snapshot; the others
+    reuse it.
+
+    While it has listeners the hub also keeps a TrendBuffer per trend source,
+    warmed from the recorder once and then fed by state change events, so trend
+    analysis does not query the database on every evaluation.
+    """
+
+    def __init__(
+        self,
+        coordinator: GrowspaceCoordinator,
+        growspace_id: str,
+        env_config: dict[str, Any],
+        min_interval: float = 0.0,
+    ) -> None:
+        """Initialize the hub.
+
+        Args:
+            coordinator: The Growspace Manager data coordinator.
+            growspace_id: The ID of the growspace the hub serves.
+            env_config: The growspace's environment configuration.
+            min_interval: The minimum number of seconds between sensor
+                evaluation runs.
+        """
+        self.coordinator = coordinator
+        self.growspace_id = growspace_id
+        self.env_config = env_config
+        self._state: EnvironmentState | None = None
+        self._observations: dict[str, Any] = {}
+        self._listeners: list[CALLBACK_TYPE] = []
+        self._unsubs: list[CALLBACK_TYPE] = []
+        self._unsub_scheduler: CALLBACK_TYPE | None = None
+        self.scheduler = EvaluationScheduler(
+            coordinator.hass, growspace_id, min_interval
+        )
+        self.snapshots_built = 0
+        self.snapshots_served = 0
+        self._trend_buffers = self._new_trend_buffers()
+        self._warmup_task: asyncio.Task | None = None
+
+    @property
+    def tracked_entities(self) -> list[str]:
+        """Return the configured entities whose changes invalidate the snapshot."""
+        return [
+            entity_id
+            for key in TRACKED_ENVIRONMENT_KEYS
+            if (entity_id := self.env_config.get(key))
+        ]
+
+    @property
+    def trend_window(self) -> timedelta:
+        """Return the longest trend window configured for the growspace."""
+        return timedelta(
+            minutes=max(
+                self.env_config.get(f"{key}_trend_duration", DEFAULT_TREND_DURATION)
+                for key in TREND_SENSOR_KEYS
+            )
+        )
+
+    @property
+    def trend_entities(self) -> list[str]:
+        """Return the configured entities that trend analysis may read."""
+        return [
+            entity_id
+            for key in TREND_SENSOR_KEYS
+            if (entity_id := self.env_config.get(f"{key}_sensor"))
+        ]
+
+    @property
+    def observations(self) -> dict[str, Any]:
+        """Return the observation attributes of the current snapshot.
+
+        The dictionary is shared between sensors and must not be mutated.
+        """
+        return self._observations
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return how many snapshots were built and how many reads were saved."""
+        return {
+            "built": self.snapshots_built,
+            "served": self.snapshots_served,
+            "reads_saved": self.snapshots_served - self.snapshots_built,
+        }
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for changes to the growspace environment.
+
+        The hub subscribes to Home Assistant and the coordinator while it has
+        at least one listener.
+
+        Args:
+            update_callback: Called after the snapshot has been invalidated.
+
+        Returns:
+            A callable that removes the listener.
+        """
+        if not self._listeners:
+            if self._warmup_task is None:
+                async_start_trend_warmup(self.coordinator.hass, [self])
+            self._unsubs = [
+                self.coordinator.async_subscribe_growspace(
+                    self.growspace_id, self._async_invalidate
+                ),
+                async_track_state_change_event(
+                    self.coordinator.hass,
+                    self.tracked_entities,
+                    self._async_state_changed,
+                ),
+            ]
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            if update_callback in self._listeners:
+                self._listeners.remove(update_callback)
+            if not self._listeners:
+                for unsub in self._unsubs:
+                    unsub()
+                self._unsubs = []
+                self._state = None
+                # Buffers go stale without events; the next listener re-warms
+                self._warmup_task = None
+                self._trend_buffers = self._new_trend_buffers()
+
+        return remove_listener
+
+    @callback
+    def async_add_evaluator(self, evaluator: Evaluator) -> CALLBACK_TYPE:
+        """Evaluate a sensor through the coalescing scheduler on every change.
+
+        Args:
+            evaluator: The sensor's update coroutine function.
+
+        Returns:
+            A callable that removes the evaluator.
+        """
+        remove_evaluator = self.scheduler.async_add_evaluator(evaluator)
+        if self._unsub_scheduler is None:
+            self._unsub_scheduler = self.async_add_listener(
+                self.scheduler.async_request
+            )
+
+        @callback
+        def remove() -> None:
+            remove_evaluator()
+            if not self.scheduler.has_evaluators and self._unsub_scheduler:
+                self._unsub_scheduler()
+                self._unsub_scheduler = None
+
+        return remove
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Handle a state change of a tracked entity.
+
+        Args:
+            event: The state change event.
+        """
+        if (buffer := self._trend_buffers.get(event.data["entity_id"])) is not None:
+            buffer.add_state(event.data.get("new_state"))
+        self._async_invalidate()
+
+    @callback
+    def _async_invalidate(self) -> None:
+        """Drop the snapshot and notify every listener."""
+        self._state = None
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    def _new_trend_buffers(self) -> dict[str, TrendBuffer]:
+        """Create empty trend buffers for the configured trend sources."""
+        max_age = self.trend_window.total_seconds()
+        return {entity_id: TrendBuffer(max_age) for entity_id in self.trend_entities}
+
+    def _seed_trend_history(self, history_states: dict[str, list[State]]) -> None:
+        """Prepend recorder history to the trend buffers.
+
+        Args:
+            history_states: Recorder states by entity ID.
+        """
+        for entity_id, buffer in self._trend_buffers.items():
+            buffer.add_history(
+                sample
+                for state in history_states.get(entity_id, [])
+                if isinstance(state, State)
+                and (sample := numeric_sample(state)) is not None
+            )
+
+    async def async_get_trend_buffer(self, entity_id: str) -> TrendBuffer | None:
+        """Return the warmed trend buffer of an entity.
+
+        Args:
+            entity_id: The source entity of the trend.
+
+        Returns:
+            The buffer, or None if the hub is not listening or does not buffer
+            the entity, in which case callers query the recorder themselves.
+        """
+        if not self._listeners:
+            return None
+        if (buffer := self._trend_buffers.get(entity_id)) is None:
+            return None
+        if self._warmup_task is not None and not self._warmup_task.done():
+            await asyncio.wait([self._warmup_task])
+        return buffer
+
+    def get_state(
+        self, build: Callable[[], EnvironmentState]
+    ) -> EnvironmentState:
+        """Return the current snapshot, building it if it is stale.
+
+        Args:
+            build: Reads the environment into a new EnvironmentState.
+
+        Returns:
+            The shared EnvironmentState.
+        """
+        self.snapshots_served += 1
+        if self._state is None or not self._listeners:
+            self._state = build()
+            self.snapshots_built += 1
+            self._observations = {
+                "temperature": self._state.temp,
+                "humidity": self._state.humidity,
+                "vpd": self._state.vpd,
+                "co2": self._state.co2,
+                "veg_days": self._state.veg_days,
+                "flower_days": self._state.flower_days,
+                "is_lights_on": self._state.is_lights_on,
+                "fan_off": self._state.fan_off,
+                "dehumidifier_on": self._state.dehumidifier_on,
+            }
+            _LOGGER.debug(
+                "Built environment snapshot for %s (%d built, %d served)",
+                self.growspace_id,
+                self.snapshots_built,
+                self.snapshots_served,
+            )
+        return self._state
+
+
+async def async_warm_trend_buffers(
+    hass: HomeAssistant, hubs: list[EnvironmentHub]
+) -> None:
+    """Seed the trend buffers of several hubs from one recorder query.
+
+    The query covers every trend source of every hub over the longest trend
+    window among them, and runs once in the recorder executor.
+
+    Args:
+        hass: The Home Assistant instance.
+        hubs: The hubs to warm.
+    """
+    entity_ids = sorted({entity for hub in hubs for entity in hub.trend_entities})
+    if not entity_ids or "recorder" not in hass.config.components:
+        return
+    end_time = dt_util.utcnow()
+    start_time = end_time - max(hub.trend_window for hub in hubs)
+    try:
+        history_states = await get_recorder_instance(hass).async_add_executor_job(
+            lambda: history.get_significant_states(
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state=True,
+            )
+        )
+    except (AttributeError, TypeError, ValueError) as err:
+        _LOGGER.error("Error loading trend history for %s: %s", entity_ids, err)
+        return
+    for hub in hubs:
+        hub._seed_trend_history(history_states)
+    _LOGGER.debug(
+        "Warmed trend buffers of %d growspaces from %d entities",
+        len(hubs),
+        len(entity_ids),
+    )
+
+
+@callback
+def async_start_trend_warmup(
+    hass: HomeAssistant, hubs: list[EnvironmentHub]
+) -> asyncio.Task:
+    """Start one shared warm-up for several hubs.
+
+    Trend queries on each hub wait for this task until it has finished, so the
+    first sensor evaluations after startup read warmed buffers.
+
+    Args:
+        hass: The Home Assistant instance.
+        hubs: The hubs to warm.
+
+    Returns:
+        The warm-up task.
+    """
+    task = hass.async_create_background_task(
+        async_warm_trend_buffers(hass, hubs), "growspace_manager trend warm-up"
+    )
+    for hub in hubs:
+        hub._warmup_task = task
+    return task
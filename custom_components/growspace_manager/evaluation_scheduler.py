@@ -0,0 +1,156 @@
+"""Coalescing evaluation scheduler for the Bayesian sensors of a growspace."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Coroutine
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+_LOGGER = logging.getLogger(__name__)
+
+Evaluator = Callable[[], Coroutine[Any, Any, None]]
+
+
+class EvaluationScheduler:
+    """Run a growspace's sensor evaluations with bounded concurrency.
+
+    Environment events can arrive every few seconds from several probes. Rather
+    than starting an evaluation task per event, requests are coalesced into at
+    most one in-flight run plus one pending re-run. Runs start no sooner than
+    `min_interval` seconds after the previous run started. Every evaluator of
+    the growspace is awaited in turn during a run.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, growspace_id: str, min_interval: float = 0.0
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            hass: The Home Assistant instance.
+            growspace_id: The ID of the growspace, used in logs and task names.
+            min_interval: The minimum number of seconds between run starts.
+        """
+        self.hass = hass
+        self.growspace_id = growspace_id
+        self.min_interval = min_interval
+        self._evaluators: list[Evaluator] = []
+        self._running = False
+        self._rerun = False
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._last_start: float | None = None
+        self.requests = 0
+        self.runs = 0
+        self.merged = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of runs in flight or waiting (0, 1 or 2)."""
+        scheduled = self._rerun or self._unsub_timer is not None
+        return int(self._running) + int(scheduled)
+
+    @property
+    def has_evaluators(self) -> bool:
+        """Return whether any evaluator is registered."""
+        return bool(self._evaluators)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return request, run and merge counters plus the current queue depth."""
+        return {
+            "requests": self.requests,
+            "runs": self.runs,
+            "merged": self.merged,
+            "queue_depth": self.queue_depth,
+        }
+
+    @callback
+    def async_add_evaluator(self, evaluator: Evaluator) -> CALLBACK_TYPE:
+        """Register a coroutine function to await on every run.
+
+        Args:
+            evaluator: The coroutine function, typically a sensor's update.
+
+        Returns:
+            A callable that removes the evaluator. Removing the last one
+            cancels any waiting run.
+        """
+        self._evaluators.append(evaluator)
+
+        @callback
+        def remove_evaluator() -> None:
+            if evaluator in self._evaluators:
+                self._evaluators.remove(evaluator)
+            if not self._evaluators:
+                self.async_cancel()
+
+        return remove_evaluator
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop any waiting run; an in-flight run finishes normally."""
+        self._rerun = False
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    @callback
+    def async_request(self) -> None:
+        """Request an evaluation, merging it into a waiting run if there is one."""
+        self.requests += 1
+        if self._rerun or self._unsub_timer is not None:
+            # A run is already waiting and will read the latest state
+            self.merged += 1
+        elif self._running:
+            self._rerun = True
+        else:
+            self._async_schedule()
+
+    @callback
+    def _async_schedule(self) -> None:
+        """Start a run now or arm a timer for the end of the minimum interval."""
+        delay = 0.0
+        if self._last_start is not None:
+            delay = self._last_start + self.min_interval - time.monotonic()
+        if delay > 0:
+            self._unsub_timer = async_call_later(
+                self.hass, delay, self._async_timer_fired
+            )
+            return
+        self._async_start()
+
+    @callback
+    def _async_start(self) -> None:
+        """Start a run in a background task."""
+        self._running = True
+        self.hass.async_create_background_task(
+            self._async_run(), f"growspace_manager evaluate {self.growspace_id}"
+        )
+
+    @callback
+    def _async_timer_fired(self, _now: Any) -> None:
+        """Start the run that was waiting for the minimum interval."""
+        self._unsub_timer = None
+        self._async_start()
+
+    async def _async_run(self) -> None:
+        """Await every evaluator once, then start a pending re-run if requested."""
+        self._last_start = time.monotonic()
+        self.runs += 1
+        try:
+            for evaluator in list(self._evaluators):
+                try:
+                    await evaluator()
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception(
+                        "Error evaluating sensors for growspace %s", self.growspace_id
+                    )
+        finally:
+            self._running = False
+        if self._rerun and self._evaluators:
+            self._rerun = False
+            self._async_schedule()
@@ -8,7 +8,25 @@ provide a structured way to handle and pass around data.
 from __future__ import annotations
 from dataclasses import dataclass, field, asdict, fields
 from typing import Any, Optional
-from datetime import datetime
+from datetime import date, datetime
+
+from dateutil import parser
+
+# Stage start dates on Plant; parsed values are memoized per plant
+STAGE_DATE_FIELDS = frozenset(
+    (
+        "seedling_start",
+        "mother_start",
+        "clone_start",
+        "veg_start",
+        "flower_start",
+        "dry_start",
+        "cure_start",
+    )
+)
+
+# Legacy placeholders written by older versions instead of a missing date
+_EMPTY_DATE_VALUES = ("", "None", "none", "null")
 
 
 @dataclass
@@ -98,6 +116,11 @@ class Plant:
         updated_at: The ISO-formatted date the plant was last updated.
         transition_date: The date of the last stage transition.
         source_mother: The ID of the mother plant this plant was cloned from.
+
+    Stage start dates are stored as given (usually ISO strings) so that
+    serialization is unchanged. `get_date` returns them parsed, memoizing the
+    result until the field is assigned again. Legacy "None" strings are
+    normalized to None on assignment.
     """
     plant_id: str
     growspace_id: str
@@ -120,6 +143,46 @@ class Plant:
     transition_date: str | None = None
     source_mother: str | None = None
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, normalizing stage dates and invalidating their cache."""
+        if name in STAGE_DATE_FIELDS:
+            if isinstance(value, str) and value.strip() in _EMPTY_DATE_VALUES:
+                value = None
+            cache = self.__dict__.get("_date_cache")
+            if cache:
+                cache.pop(name, None)
+        super().__setattr__(name, value)
+
+    def get_date(self, field_name: str) -> date | None:
+        """Return a stage start date as a parsed date object.
+
+        Args:
+            field_name: The name of the stage date field (e.g. 'veg_start').
+
+        Returns:
+            The parsed date, or None if the field is unset or invalid.
+        """
+        cache = self.__dict__.setdefault("_date_cache", {})
+        try:
+            return cache[field_name]
+        except KeyError:
+            pass
+
+        value = getattr(self, field_name, None)
+        parsed: date | None = None
+        if isinstance(value, datetime):
+            parsed = value.date()
+        elif isinstance(value, date):
+            parsed = value
+        elif isinstance(value, str):
+            try:
+                parsed = parser.isoparse(value).date()
+            except (ValueError, OverflowError):
+                parsed = None
+
+        cache[field_name] = parsed
+        return parsed
+
     def to_dict(self) -> dict:
         """Convert the dataclass instance to a dictionary.
 
@@ -158,12 +221,14 @@ class Plant:
         return Plant(**filtered_data)
 
 
-@dataclass
+@dataclass(frozen=True)
 class EnvironmentState:
     """Represents a snapshot of the current environment state in a growspace.
 
     This dataclass is used to pass around a consistent set of environmental
     readings for use in calculations, particularly for the Bayesian sensors.
+    It is immutable so one snapshot can be shared by every sensor of a
+    growspace.
 
     Attributes:
         temp: The current temperature.
@@ -184,3 +249,85 @@ class EnvironmentState:
     is_lights_on: bool | None
     fan_off: bool
     dehumidifier_on: bool | None = None
+
+
+@dataclass
+class ChangeSet:
+    """Describes what changed in a single coordinator update.
+
+    Entities use this to decide whether an update concerns them. A change set
+    with `full` set means the scope of the update is unknown (for example a
+    periodic refresh or an options change) and every subscriber should refresh.
+
+    Attributes:
+        plants_added: IDs of plants created in this update.
+        plants_removed: IDs of plants deleted in this update.
+        plants_changed: IDs of existing plants whose fields changed.
+        growspaces_added: IDs of growspaces created in this update.
+        growspaces_removed: IDs of growspaces deleted in this update.
+        growspaces_changed: IDs of growspaces whose fields or plants changed.
+        full: Whether every plant and growspace should be treated as changed.
+    """
+    plants_added: set[str] = field(default_factory=set)
+    plants_removed: set[str] = field(default_factory=set)
+    plants_changed: set[str] = field(default_factory=set)
+    growspaces_added: set[str] = field(default_factory=set)
+    growspaces_removed: set[str] = field(default_factory=set)
+    growspaces_changed: set[str] = field(default_factory=set)
+    full: bool = False
+
+    @property
+    def is_empty(self) -> bool:
+        """Return True if the change set records no changes at all."""
+        return not (
+            self.full
+            or self.plants_added
+            or self.plants_removed
+            or self.plants_changed
+            or self.growspaces_added
+            or self.growspaces_removed
+            or self.growspaces_changed
+        )
+
+    @property
+    def is_structural(self) -> bool:
+        """Return True if plants or growspaces were added or removed."""
+        return bool(
+            self.full
+            or self.plants_added
+            or self.plants_removed
+            or self.growspaces_added
+            or self.growspaces_removed
+        )
+
+    @property
+    def plant_ids(self) -> set[str]:
+        """Return the IDs of every plant touched by this change set."""
+        return self.plants_added | self.plants_removed | self.plants_changed
+
+    @property
+    def growspace_ids(self) -> set[str]:
+        """Return the IDs of every growspace touched by this change set."""
+        return self.growspaces_added | self.growspaces_removed | self.growspaces_changed
+
+    def affects_plant(self, plant_id: str) -> bool:
+        """Check whether a plant is touched by this change set.
+
+        Args:
+            plant_id: The ID of the plant.
+
+        Returns:
+            True if the plant should refresh.
+        """
+        return self.full or plant_id in self.plant_ids
+
+    def affects_growspace(self, growspace_id: str) -> bool:
+        """Check whether a growspace is touched by this change set.
+
+        Args:
+            growspace_id: The ID of the growspace.
+
+        Returns:
+            True if the growspace should refresh.
+        """
+        return self.full or growspace_id in self.growspace_ids
@@ -8,8 +8,10 @@ and environmental calculations like VPD.
 from __future__ import annotations
 
 # Standard library
+import asyncio
 import logging
-from datetime import date, datetime
+from collections import Counter
+from datetime import date
 from typing import Any
 
 # Third-party / external
@@ -18,22 +20,24 @@ from dateutil import parser
 # Home Assistant
 from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import CONF_GRID_FORMAT, DEFAULT_GRID_FORMAT, DOMAIN, GRID_FORMAT_SPARSE
 
 # Local / relative imports
 from .coordinator import GrowspaceCoordinator
 from .helpers import async_setup_statistics_sensor, async_setup_trend_sensor
-from .models import Growspace, Plant
+from .models import ChangeSet, Growspace, Plant
 from .utils import (
     VPDCalculator,
-    parse_date_field,
     calculate_days_since,
+    generate_sparse_growspace_grid,
+    get_plant_date,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -194,54 +198,67 @@ async def async_setup_entry(
         mother_id,
     )
 
-    async def _handlecoordinator_update_async() -> None:
-        """Add new entities and remove missing ones when coordinator changes."""
-        # Growspaces: add new
-        for growspace_id, growspace in coordinator.growspaces.items():
-            if growspace_id not in growspace_entities:
+    async def _handlecoordinator_update_async(changes: ChangeSet) -> None:
+        """Add and remove entities for the plants and growspaces a change set touched.
+
+        Args:
+            changes: The structural change set; a full change set compares
+                every plant and growspace.
+        """
+        if changes.full:
+            growspace_ids = coordinator.growspaces.keys() | growspace_entities.keys()
+            plant_ids = coordinator.plants.keys() | plant_entities.keys()
+        else:
+            growspace_ids = changes.growspaces_added | changes.growspaces_removed
+            plant_ids = changes.plants_added | changes.plants_removed
+
+        new_entities: list[Entity] = []
+        new_growspaces: list[Growspace] = []
+        removed_entities: list[Entity] = []
+
+        for growspace_id in sorted(growspace_ids):
+            growspace = coordinator.growspaces.get(growspace_id)
+            if growspace is not None and growspace_id not in growspace_entities:
                 entity = GrowspaceOverviewSensor(coordinator, growspace_id, growspace)
                 growspace_entities[growspace_id] = entity
-                async_add_entities([entity])
-
-                await _async_create_derivative_sensors(hass, config_entry, growspace)
+                new_entities.append(entity)
+                new_growspaces.append(growspace)
+            elif growspace is None and growspace_id in growspace_entities:
+                removed_entities.append(growspace_entities.pop(growspace_id))
 
-        # Growspaces: remove deleted
-        for removed_gs_id in list(growspace_entities.keys()):
-            if removed_gs_id not in coordinator.growspaces:
-                entity = growspace_entities.pop(removed_gs_id)
-                await entity.async_remove()
-
-        # Plants: add new
-        for plant in list(coordinator.plants.values()):
-            plant_id = plant.plant_id
-            if plant_id not in plant_entities:
+        entity_registry = er.async_get(coordinator.hass)
+        for plant_id in sorted(plant_ids):
+            plant = coordinator.plants.get(plant_id)
+            if plant is not None and plant_id not in plant_entities:
                 entity = PlantEntity(coordinator, plant)
                 plant_entities[plant_id] = entity
-                async_add_entities([entity])
-
-        # Plants: remove deleted
-        from homeassistant.helpers import entity_registry as er
-
-        entity_registry = er.async_get(coordinator.hass)
-
-        for existing_id in list(plant_entities.keys()):
-            if existing_id not in coordinator.plants:
-                entity = plant_entities.pop(existing_id)
-
-                # Try to find and remove from registry
-                ent_reg_entry = entity_registry.async_get(entity.entity_id)
-                if ent_reg_entry:
+                new_entities.append(entity)
+            elif plant is None and plant_id in plant_entities:
+                entity = plant_entities.pop(plant_id)
+                # Drop the orphaned registry entry as well
+                if entity.entity_id and entity_registry.async_get(entity.entity_id):
                     _LOGGER.info(
                         "Removing orphaned plant entity from registry: %s",
                         entity.entity_id,
                     )
-                    entity_registry.async_remove(ent_reg_entry.entity_id)
-
-                await entity.async_remove()
+                    entity_registry.async_remove(entity.entity_id)
+                removed_entities.append(entity)
+
+        if new_entities:
+            async_add_entities(new_entities)
+        if removed_entities:
+            await asyncio.gather(
+                *(entity.async_remove() for entity in removed_entities)
+            )
+        for growspace in new_growspaces:
+            await _async_create_derivative_sensors(hass, config_entry, growspace)
 
     # Listen for coordinator updates to manage dynamic entities
     def _listener_callback() -> None:
-        hass.async_create_task(_handlecoordinator_update_async())
+        # Field-only changes are handled by the affected entities themselves
+        changes = coordinator.last_changes
+        if changes.is_structural:
+            hass.async_create_task(_handlecoordinator_update_async(changes))
 
     coordinator.async_add_listener(_listener_callback)
 
@@ -488,6 +505,9 @@ class GrowspaceOverviewSensor(CoordinatorEntity[GrowspaceCoordinator], SensorEnt
     entity for the companion Lovelace card.
     """
 
+    # The grid is rewritten on every plant change; the recorder keeps `summary`
+    _unrecorded_attributes = frozenset({"grid", "occupancy"})
+
     def __init__(
         self, coordinator: GrowspaceCoordinator, growspace_id: str, growspace: Growspace
     ) -> None:
@@ -505,6 +525,16 @@ class GrowspaceOverviewSensor(CoordinatorEntity[GrowspaceCoordinator], SensorEnt
         self._attr_name = growspace.name
         self._attr_unique_id = f"{DOMAIN}_{growspace_id}"
 
+        # Attributes derived from coordinator data, keyed by (data version, date)
+        self._attributes: dict[str, Any] = {}
+        self._attributes_key: tuple[int, date] | None = None
+        self._sparse_grid = (
+            coordinator.options.get("global_settings", {}).get(
+                CONF_GRID_FORMAT, DEFAULT_GRID_FORMAT
+            )
+            == GRID_FORMAT_SPARSE
+        )
+
         # Set up device info
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, growspace_id)},
@@ -513,6 +543,12 @@ class GrowspaceOverviewSensor(CoordinatorEntity[GrowspaceCoordinator], SensorEnt
             manufacturer="Growspace Manager",
         )
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the update touches this growspace."""
+        if self.coordinator.last_changes.affects_growspace(self.growspace_id):
+            super()._handle_coordinator_update()
+
     @property
     def state(self) -> int:
         """Return the number of plants in the growspace."""
@@ -547,64 +583,63 @@ class GrowspaceOverviewSensor(CoordinatorEntity[GrowspaceCoordinator], SensorEnt
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the detailed state attributes for the growspace."""
+        """Return the detailed state attributes for the growspace.
+
+        The grid and stage attributes are rebuilt only when an update touched
+        the growspace or the day rolled over; the live device states are read
+        on every call.
+        """
         # Always fetch the latest growspace object from the coordinator
         growspace = self.coordinator.growspaces[self.growspace_id]
+        key = (self.coordinator.growspace_data_version(self.growspace_id), date.today())
+        if key != self._attributes_key:
+            self._attributes = self._build_attributes(growspace)
+            self._attributes_key = key
+        return {**self._attributes, **self._device_attributes(growspace)}
+
+    def _build_attributes(self, growspace: Growspace) -> dict[str, Any]:
+        """Build the grid, stage and irrigation attributes of the growspace.
+
+        Args:
+            growspace: The Growspace data object.
+
+        Returns:
+            The attributes derived from coordinator data.
+        """
         plants = self.coordinator.get_growspace_plants(self.growspace_id)
 
-        # Calculate max stage days
-        max_veg = max(
-            (self._days_since(p.veg_start) for p in plants if p.veg_start), default=0
-        )
-        max_flower = max(
-            (self._days_since(p.flower_start) for p in plants if p.flower_start),
-            default=0,
-        )
+        # Max stage days and weeks, cached by the coordinator until the day rolls over
+        stage_summary = self.coordinator.get_growspace_stage_summary(self.growspace_id)
+        max_veg = stage_summary["veg_days"]
+        max_flower = stage_summary["flower_days"]
+        veg_week = stage_summary["veg_week"]
+        flower_week = stage_summary["flower_week"]
 
-        # Calculate weeks from days
-        veg_week = self._days_to_week(max_veg)
-        flower_week = self._days_to_week(max_flower)
-        
         # Get irrigation settings from growspace object
         irrigation_options = growspace.irrigation_config
 
         _LOGGER.debug(
-            "GrowspaceOverviewSensor attributes update for %s. Irrigation items: %d",
+            "GrowspaceOverviewSensor attributes rebuild for %s. Irrigation items: %d",
             self.growspace_id,
             len(irrigation_options.get("irrigation_times", []))
         )
 
-        # Create grid representation
-        grid = {}
-        for row in range(1, int(growspace.rows) + 1):
-            for col in range(
-                1,
-                int(
-                    growspace.plants_per_row,
-                )
-                + 1,
-            ):
-                grid[f"position_{row}_{col}"] = None
-
-        # Fill grid with plants (include position inside grid entry)
-        for plant in plants:
-            row_i = int(plant.row)
-            col_i = int(plant.col)
-            position_key = f"position_{row_i}_{col_i}"
-            grid[position_key] = {
-                "plant_id": plant.plant_id,
-                "strain": plant.strain,
-                "phenotype": plant.phenotype,
-                "veg_days": self.coordinator.calculate_days_in_stage(plant, "veg"),
-                "flower_days": self.coordinator.calculate_days_in_stage(
-                    plant, "flower"
-                ),
-                "row": row_i,
-                "col": col_i,
-                "position": f"({row_i},{col_i})",
+        rows, cols = int(growspace.rows), int(growspace.plants_per_row)
+        if self._sparse_grid:
+            sparse = generate_sparse_growspace_grid(rows, cols, plants, self._grid_cell)
+            grid = sparse["grid"]
+        else:
+            # Create grid representation
+            grid = {
+                f"position_{row}_{col}": None
+                for row in range(1, rows + 1)
+                for col in range(1, cols + 1)
             }
+            # Fill grid with plants (include position inside grid entry)
+            for plant in plants:
+                position_key = f"position_{int(plant.row)}_{int(plant.col)}"
+                grid[position_key] = self._grid_cell(plant)
 
-        # Build attributes dict
         attributes = {
             "growspace_id": growspace.id,
             "rows": growspace.rows,
@@ -619,36 +654,78 @@ class GrowspaceOverviewSensor(CoordinatorEntity[GrowspaceCoordinator], SensorEnt
             "irrigation_times": irrigation_options.get("irrigation_times", []),
             "drain_times": irrigation_options.get("drain_times", []),
             "grid": grid,
+            "summary": {
+                "plants": len(plants),
+                "stages": dict(Counter(plant.stage for plant in plants)),
+            },
         }
+        if self._sparse_grid:
+            attributes["grid_format"] = GRID_FORMAT_SPARSE
+            attributes["occupancy"] = sparse["occupancy"]
+        return attributes
+
+    def _grid_cell(self, plant: Plant) -> dict[str, Any]:
+        """Build the grid entry of a plant.
+
+        Args:
+            plant: The Plant object.
+
+        Returns:
+            The plant's ID, strain, day counters and position.
+        """
+        row_i = int(plant.row)
+        col_i = int(plant.col)
+        # Day counters are cached by the coordinator until the day rolls over
+        summary = self.coordinator.get_plant_stage_summary(plant.plant_id)
+        return {
+            "plant_id": plant.plant_id,
+            "strain": plant.strain,
+            "phenotype": plant.phenotype,
+            "veg_days": summary["veg_days"],
+            "flower_days": summary["flower_days"],
+            "row": row_i,
+            "col": col_i,
+            "position": f"({row_i},{col_i})",
+        }
+
+    def _device_attributes(self, growspace: Growspace) -> dict[str, Any]:
+        """Read the current states of the growspace's climate devices.
+
+        Args:
+            growspace: The Growspace data object.
 
-        # Add dehumidifier state if configured
-        if growspace.environment_config:
-            env_config = growspace.environment_config
-            
-            # Dehumidifier
-            dehumidifier_entity = env_config.get("dehumidifier_entity")
-            if dehumidifier_entity:
-                state_obj = self.coordinator.hass.states.get(dehumidifier_entity)
-                attributes["dehumidifier_entity"] = dehumidifier_entity
-                attributes["dehumidifier_state"] = state_obj.state if state_obj else None
-                if state_obj:
-                    attributes["dehumidifier_humidity"] = state_obj.attributes.get("humidity")
-                    attributes["dehumidifier_current_humidity"] = state_obj.attributes.get("current_humidity")
-                    attributes["dehumidifier_mode"] = state_obj.attributes.get("mode")
-
-            # Exhaust Sensor
-            exhaust_entity = env_config.get("exhaust_sensor")
-            if exhaust_entity:
-                state_obj = self.coordinator.hass.states.get(exhaust_entity)
-                attributes["exhaust_entity"] = exhaust_entity
-                attributes["exhaust_value"] = state_obj.state if state_obj else None
-
-            # Humidifier Sensor
-            humidifier_entity = env_config.get("humidifier_sensor")
-            if humidifier_entity:
-                state_obj = self.coordinator.hass.states.get(humidifier_entity)
-                attributes["humidifier_entity"] = humidifier_entity
-                attributes["humidifier_value"] = state_obj.state if state_obj else None
+        Returns:
+            The dehumidifier, exhaust and humidifier attributes.
+        """
+        attributes: dict[str, Any] = {}
+        if not growspace.environment_config:
+            return attributes
+        env_config = growspace.environment_config
+
+        # Dehumidifier
+        dehumidifier_entity = env_config.get("dehumidifier_entity")
+        if dehumidifier_entity:
+            state_obj = self.coordinator.hass.states.get(dehumidifier_entity)
+            attributes["dehumidifier_entity"] = dehumidifier_entity
+            attributes["dehumidifier_state"] = state_obj.state if state_obj else None
+            if state_obj:
+                attributes["dehumidifier_humidity"] = state_obj.attributes.get("humidity")
+                attributes["dehumidifier_current_humidity"] = state_obj.attributes.get("current_humidity")
+                attributes["dehumidifier_mode"] = state_obj.attributes.get("mode")
+
+        # Exhaust Sensor
+        exhaust_entity = env_config.get("exhaust_sensor")
+        if exhaust_entity:
+            state_obj = self.coordinator.hass.states.get(exhaust_entity)
+            attributes["exhaust_entity"] = exhaust_entity
+            attributes["exhaust_value"] = state_obj.state if state_obj else None
+
+        # Humidifier Sensor
+        humidifier_entity = env_config.get("humidifier_sensor")
+        if humidifier_entity:
+            state_obj = self.coordinator.hass.states.get(humidifier_entity)
+            attributes["humidifier_entity"] = humidifier_entity
+            attributes["humidifier_value"] = state_obj.state if state_obj else None
 
         return attributes
 
@@ -673,6 +750,8 @@ class PlantEntity(SensorEntity):
         self._attr_unique_id = f"{DOMAIN}_{plant.plant_id}"
         self._attr_name = f"{plant.strain} ({plant.row},{plant.col})"
         self._attr_icon = "mdi:cannabis"
+        # The state and attributes last written (see `_async_plant_updated`)
+        self._written: tuple[str, dict[str, Any]] | None = None
 
         # Set up device info - plant belongs to growspace device
         growspace_id = plant.growspace_id
@@ -699,7 +778,7 @@ class PlantEntity(SensorEntity):
         Returns:
             The determined stage as a string.
         """
-        now = datetime.now()
+        today = date.today()
 
         # 1. Special growspaces override everything
         if plant.growspace_id == "mother":
@@ -712,16 +791,10 @@ class PlantEntity(SensorEntity):
             return "cure"
 
         # 2. Date-based progression (most advanced stage wins)
-        flower_start = parse_date_field(plant.flower_start)
-        veg_start = parse_date_field(plant.veg_start)
-        seedling_start = parse_date_field(plant.seedling_start)
-
-        if flower_start and flower_start <= now:
-            return "flower"
-        if veg_start and veg_start <= now:
-            return "veg"
-        if seedling_start and seedling_start <= now:
-            return "seedling"
+        for stage in ("flower", "veg", "seedling"):
+            started = get_plant_date(plant, f"{stage}_start")
+            if started and started <= today:
+                return stage
 
         # 3. Fallback to explicitly set stage if none of the above applies
         if plant.stage in [
@@ -775,17 +848,17 @@ class PlantEntity(SensorEntity):
             return {}
 
         stage = self._determine_stage(plant)
-        seedling_days = self.coordinator.calculate_days_in_stage(plant, "seedling")
-        mother_days = self.coordinator.calculate_days_in_stage(plant, "mother")
-        clone_days = self.coordinator.calculate_days_in_stage(plant, "clone")
-        veg_days = self.coordinator.calculate_days_in_stage(plant, "veg")
-        flower_days = self.coordinator.calculate_days_in_stage(plant, "flower")
-        dry_days = self.coordinator.calculate_days_in_stage(plant, "dry")
-        cure_days = self.coordinator.calculate_days_in_stage(plant, "cure")
-
-        # Calculate weeks
-        veg_week = self._days_to_week(veg_days or 0)
-        flower_week = self._days_to_week(flower_days or 0)
+        # Day counters are cached by the coordinator until the day rolls over
+        summary = self.coordinator.get_plant_stage_summary(plant.plant_id)
+        seedling_days = summary["seedling_days"]
+        mother_days = summary["mother_days"]
+        clone_days = summary["clone_days"]
+        veg_days = summary["veg_days"]
+        flower_days = summary["flower_days"]
+        dry_days = summary["dry_days"]
+        cure_days = summary["cure_days"]
+        veg_week = summary["veg_week"]
+        flower_week = summary["flower_week"]
 
         return {
             "stage": stage,
@@ -814,9 +887,28 @@ class PlantEntity(SensorEntity):
             "flower_week": flower_week,
         }
 
+    @callback
+    def _async_plant_updated(self) -> None:
+        """Write state only if the plant's record or day counters changed.
+
+        Full updates, such as a refresh or the day rolling over, reach every
+        plant; most of them leave a given plant as it was.
+        """
+        written = (self.state, self.extra_state_attributes)
+        if written == self._written:
+            return
+        self._written = written
+        self.async_write_ha_state()
+
     async def async_added_to_hass(self) -> None:
-        """Register callbacks when the entity is added to Home Assistant."""
-        self.coordinator.async_add_listener(self.async_write_ha_state)
+        """Subscribe to coordinator updates that touch this plant."""
+        # Home Assistant writes the initial state right after this returns
+        self._written = (self.state, self.extra_state_attributes)
+        self.async_on_remove(
+            self.coordinator.async_subscribe_plant(
+                self._plant.plant_id, self._async_plant_updated
+            )
+        )
 
 
 class StrainLibrarySensor(CoordinatorEntity[GrowspaceCoordinator], SensorEntity):
@@ -828,6 +920,9 @@ class StrainLibrarySensor(CoordinatorEntity[GrowspaceCoordinator], SensorEntity)
     based on recorded harvest data.
     """
 
+    # The analytics tree is large; the recorder keeps `summary`
+    _unrecorded_attributes = frozenset({"strains", "strain_list"})
+
     def __init__(self, coordinator: GrowspaceCoordinator) -> None:
         """Initialize the Strain Library sensor."""
         super().__init__(coordinator)
@@ -844,7 +939,21 @@ class StrainLibrarySensor(CoordinatorEntity[GrowspaceCoordinator], SensorEntity)
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the calculated strain analytics as state attributes."""
         # Use the cached analytics from StrainLibrary to avoid heavy computation on the main loop.
-        return self.coordinator.strains.get_analytics()
+        analytics = self.coordinator.strains.get_analytics()
+        strains = analytics.get("strains", {})
+        return {
+            **analytics,
+            "summary": {
+                "strains": len(strains),
+                "phenotypes": sum(
+                    len(strain.get("phenotypes", {})) for strain in strains.values()
+                ),
+                "harvests": sum(
+                    strain.get("analytics", {}).get("total_harvests", 0)
+                    for strain in strains.values()
+                ),
+            },
+        }
 
 
 class GrowspaceListSensor(SensorEntity):
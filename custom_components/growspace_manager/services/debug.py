@@ -48,6 +48,7 @@ async def _migrate_plants_from_legacy_growspace(
                 )
                 coordinator.plants[plant_id].row = new_row
                 coordinator.plants[plant_id].col = new_col
+                coordinator.reindex_plant(plant_id)
                 migrated_plants_info.append(
                     f"{plant.strain} ({plant_id}) to {canonical_id} at ({new_row},{new_col})"
                 )
@@ -229,6 +230,7 @@ async def _restore_plants_to_canonical_growspace(
                 coordinator.plants[plant_id].growspace_id = canonical_id
                 coordinator.plants[plant_id].row = new_row
                 coordinator.plants[plant_id].col = new_col
+                coordinator.reindex_plant(plant_id)
                 restored_count += 1
                 _LOGGER.debug(
                     "Restored %s to %s at (%d,%d) from %s",
@@ -453,6 +455,7 @@ async def _consolidate_plants_to_canonical_growspace(
                     coordinator.plants[plant_id].growspace_id = canonical_id
                     coordinator.plants[plant_id].row = new_row
                     coordinator.plants[plant_id].col = new_col
+                    coordinator.reindex_plant(plant_id)
                     _LOGGER.debug(
                         "Moved plant %s from duplicate %s %s to %s at (%d,%d)",
                         plant_id,
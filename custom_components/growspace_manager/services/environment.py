@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+from datetime import date, datetime, timedelta
 import logging
+from typing import Any
+
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.components.persistent_notification import (
     async_create as create_notification,
 )
+from homeassistant.util import dt as dt_util
 
+from ..bayesian_fitting import Incident, LikelihoodFitter, async_fit_likelihoods
 from ..coordinator import GrowspaceCoordinator
 from ..strain_library import StrainLibrary
+from ..utils import get_plant_date
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -110,3 +116,116 @@ async def handle_remove_environment(
         f"{success_msg}\n\nPlease reload the integration for binary sensors to be removed.",
         title="Growspace Manager - Environment Removed",
     )
+
+
+def _incident_timestamp(value: date | datetime) -> float:
+    """Return the POSIX timestamp of an incident bound, reading naive values as local."""
+    if not isinstance(value, datetime):
+        return dt_util.start_of_local_day(value).timestamp()
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=dt_util.get_default_time_zone())
+    return value.timestamp()
+
+
+async def handle_fit_bayesian_likelihoods(
+    hass: HomeAssistant,
+    coordinator: GrowspaceCoordinator,
+    strain_library: StrainLibrary,
+    call: ServiceCall,
+) -> dict[str, Any]:
+    """Fit a growspace's Bayesian likelihoods and priors from labeled incidents.
+
+    Counts how often each rule fired inside and outside the given incident
+    windows over the recorded history and, with `apply`, stores the fitted
+    values as environment config overrides. The binary sensors pick up
+    applied values after the integration is reloaded.
+    """
+    growspace_id = call.data["growspace_id"]
+    growspace = coordinator.growspaces.get(growspace_id)
+    if growspace is None or not growspace.environment_config:
+        error_msg = (
+            f"Growspace '{growspace_id}' not found"
+            if growspace is None
+            else f"Growspace '{growspace_id}' has no environment monitoring configured"
+        )
+        _LOGGER.error(error_msg)
+        create_notification(
+            hass,
+            error_msg,
+            title="Growspace Manager - Environment Config Error",
+        )
+        raise ValueError(error_msg)
+
+    incidents = [
+        Incident(
+            incident["sensor"],
+            _incident_timestamp(incident["start"]),
+            _incident_timestamp(incident["end"]),
+        )
+        for incident in call.data["incidents"]
+    ]
+    if invalid := [incident for incident in incidents if incident.end <= incident.start]:
+        error_msg = (
+            f"{len(invalid)} incident(s) for '{growspace_id}' "
+            "do not end after they start"
+        )
+        _LOGGER.error(error_msg)
+        create_notification(
+            hass,
+            error_msg,
+            title="Growspace Manager - Environment Config Error",
+        )
+        raise ValueError(error_msg)
+
+    env_config = growspace.environment_config
+    plants = coordinator.get_growspace_plants(growspace_id)
+    veg_start = min(
+        filter(None, (get_plant_date(plant, "veg_start") for plant in plants)),
+        default=None,
+    )
+    flower_start = min(
+        filter(None, (get_plant_date(plant, "flower_start") for plant in plants)),
+        default=None,
+    )
+    fitter = LikelihoodFitter(
+        env_config,
+        incidents,
+        sample_interval=call.data["sample_interval"],
+        veg_start=veg_start,
+        flower_start=flower_start,
+    )
+    end = dt_util.utcnow()
+    result = await async_fit_likelihoods(
+        hass,
+        fitter,
+        end - timedelta(days=call.data["days"]),
+        end,
+        call.data["min_samples"],
+    )
+    overrides = result.overrides
+
+    applied = bool(call.data["apply"] and overrides)
+    if applied:
+        growspace.environment_config = {**env_config, **overrides}
+        await coordinator.async_save()
+        await coordinator.async_refresh()
+        _LOGGER.info(
+            "Applied %d fitted Bayesian values to '%s'", len(overrides), growspace.name
+        )
+        # Running sensors keep the env_config they were created with
+        create_notification(
+            hass,
+            f"Applied {len(overrides)} fitted Bayesian values to '{growspace.name}'"
+            "\n\nPlease reload the integration for the binary sensors to use them.",
+            title="Growspace Manager - Bayesian Likelihoods Fitted",
+        )
+
+    return {
+        "growspace_id": growspace_id,
+        "samples": result.samples,
+        "priors": result.priors,
+        "likelihoods": {key: list(pair) for key, pair in result.likelihoods.items()},
+        "support": {key: list(pair) for key, pair in result.support.items()},
+        "applied": applied,
+        "reload_required": applied,
+    }
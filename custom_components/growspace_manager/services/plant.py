@@ -3,6 +3,7 @@
 import logging
 from datetime import date, datetime
 from dataclasses import replace
+from typing import Any
 
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.components.persistent_notification import (
@@ -975,3 +976,251 @@ async def handle_harvest_plant(
             title="Growspace Manager Error",
         )
         raise
+
+
+def _resolve_bulk_plant_ids(
+    coordinator: GrowspaceCoordinator, call: ServiceCall
+) -> list[str]:
+    """Return the plant IDs targeted by a bulk service call.
+
+    Args:
+        coordinator: The Growspace coordinator.
+        call: The service call, carrying either `plant_ids` or `growspace_id`.
+
+    Returns:
+        The list of targeted plant IDs.
+    """
+    if plant_ids := call.data.get("plant_ids"):
+        return list(plant_ids)
+    return [
+        plant.plant_id
+        for plant in coordinator.get_growspace_plants(call.data["growspace_id"])
+    ]
+
+
+def _bulk_response(results: list[dict[str, Any]]) -> dict[str, Any]:
+    """Build the service response for a bulk plant operation.
+
+    Args:
+        results: The per-plant results returned by the coordinator.
+
+    Returns:
+        A response dictionary with the per-plant results and summary counts.
+    """
+    succeeded = sum(1 for result in results if result["success"])
+    return {
+        "results": results,
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+    }
+
+
+async def handle_add_plants(
+    hass: HomeAssistant,
+    coordinator: GrowspaceCoordinator,
+    strain_library: StrainLibrary,
+    call: ServiceCall,
+) -> dict[str, Any]:
+    """Handle the bulk add plants service call."""
+    growspace_id = call.data["growspace_id"]
+    if growspace_id not in coordinator.growspaces:
+        _LOGGER.error("Growspace %s does not exist for add_plants", growspace_id)
+        create_notification(
+            hass,
+            f"Growspace '{growspace_id}' not found.",
+            title="Growspace Manager Error",
+        )
+        return _bulk_response([])
+
+    try:
+        results = await coordinator.async_add_plants(
+            growspace_id, [dict(spec) for spec in call.data["plants"]]
+        )
+    except Exception as err:
+        _LOGGER.exception("Failed to add plants: %s", err)
+        create_notification(
+            hass,
+            f"Failed to add plants: {str(err)}",
+            title="Growspace Manager Error",
+        )
+        raise
+
+    for result in results:
+        if result["success"]:
+            hass.bus.async_fire(
+                f"{DOMAIN}_plant_added",
+                {
+                    "plant_id": result["plant_id"],
+                    "growspace_id": growspace_id,
+                    "strain": result["strain"],
+                    "position": f"({result['row']},{result['col']})",
+                },
+            )
+
+    _LOGGER.info("Added %d plants to growspace %s", len(results), growspace_id)
+    return _bulk_response(results)
+
+
+async def handle_transition_plants(
+    hass: HomeAssistant,
+    coordinator: GrowspaceCoordinator,
+    strain_library: StrainLibrary,
+    call: ServiceCall,
+) -> dict[str, Any]:
+    """Handle the bulk transition plant stage service call."""
+    plant_ids = _resolve_bulk_plant_ids(coordinator, call)
+    new_stage = call.data["new_stage"]
+    transition_date = call.data.get("transition_date")
+
+    try:
+        results = await coordinator.async_transition_plants(
+            plant_ids, new_stage, transition_date
+        )
+    except Exception as err:
+        _LOGGER.exception("Failed to transition plants: %s", err)
+        create_notification(
+            hass,
+            f"Failed to transition plants: {str(err)}",
+            title="Growspace Manager Error",
+        )
+        raise
+
+    for result in results:
+        if result["success"]:
+            hass.bus.async_fire(
+                f"{DOMAIN}_plant_transitioned",
+                {
+                    "plant_id": result["plant_id"],
+                    "new_stage": new_stage,
+                    "transition_date": transition_date.isoformat()
+                    if transition_date
+                    else None,
+                },
+            )
+
+    _LOGGER.info("Transitioned %d plants to %s stage", len(results), new_stage)
+    return _bulk_response(results)
+
+
+async def handle_move_plants(
+    hass: HomeAssistant,
+    coordinator: GrowspaceCoordinator,
+    strain_library: StrainLibrary,
+    call: ServiceCall,
+) -> dict[str, Any]:
+    """Handle the bulk move plants service call."""
+    try:
+        results = await coordinator.async_move_plants(
+            [dict(move) for move in call.data["moves"]]
+        )
+    except Exception as err:
+        _LOGGER.exception("Failed to move plants: %s", err)
+        create_notification(
+            hass,
+            f"Failed to move plants: {str(err)}",
+            title="Growspace Manager Error",
+        )
+        raise
+
+    for result in results:
+        if result["success"]:
+            hass.bus.async_fire(
+                f"{DOMAIN}_plant_moved",
+                {
+                    "plant_id": result["plant_id"],
+                    "new_position": f"({result['row']},{result['col']})",
+                    "swapped_with": result["swapped_with"],
+                },
+            )
+
+    _LOGGER.info("Moved %d plants", len(results))
+    return _bulk_response(results)
+
+
+async def handle_harvest_plants(
+    hass: HomeAssistant,
+    coordinator: GrowspaceCoordinator,
+    strain_library: StrainLibrary,
+    call: ServiceCall,
+) -> dict[str, Any]:
+    """Handle the bulk harvest plants service call."""
+    plant_ids = _resolve_bulk_plant_ids(coordinator, call)
+    target_growspace_id = call.data.get("target_growspace_id")
+    transition_date = call.data.get("transition_date")
+    if isinstance(transition_date, datetime):
+        transition_date = transition_date.date()
+    harvest_date = transition_date.isoformat() if transition_date else None
+
+    try:
+        results = await coordinator.async_harvest_plants(
+            plant_ids,
+            target_growspace_id=target_growspace_id,
+            transition_date=harvest_date,
+        )
+    except Exception as err:
+        _LOGGER.exception("Failed to harvest plants: %s", err)
+        create_notification(
+            hass,
+            f"Failed to harvest plants: {str(err)}",
+            title="Growspace Manager Error",
+        )
+        raise
+
+    for result in results:
+        if result["success"]:
+            hass.bus.async_fire(
+                f"{DOMAIN}_plant_harvested",
+                {
+                    "plant_id": result["plant_id"],
+                    "target_growspace_id": result["growspace_id"],
+                    "harvest_date": harvest_date,
+                },
+            )
+
+    _LOGGER.info("Harvested %d plants", len(results))
+    return _bulk_response(results)
+
+
+async def handle_archive_plants(
+    hass: HomeAssistant,
+    coordinator: GrowspaceCoordinator,
+    strain_library: StrainLibrary,
+    call: ServiceCall,
+) -> dict[str, Any]:
+    """Handle the archive plants service call."""
+    try:
+        archived = await coordinator.async_archive_finished_plants(
+            plant_ids=call.data.get("plant_ids"),
+            min_cure_days=call.data.get("min_cure_days"),
+        )
+    except Exception as err:
+        _LOGGER.exception("Failed to archive plants: %s", err)
+        create_notification(
+            hass,
+            f"Failed to archive plants: {str(err)}",
+            title="Growspace Manager Error",
+        )
+        raise
+
+    if archived:
+        hass.bus.async_fire(f"{DOMAIN}_plants_archived", {"plant_ids": archived})
+    _LOGGER.info("Archived %d plants", len(archived))
+    return {"archived": archived}
+
+
+async def handle_get_archived_plants(
+    hass: HomeAssistant,
+    coordinator: GrowspaceCoordinator,
+    strain_library: StrainLibrary,
+    call: ServiceCall,
+) -> dict[str, Any]:
+    """Return archived plants matching the given filters, newest first."""
+    plants = await strain_library.get_archived_plants(
+        strain=call.data.get("strain"),
+        phenotype=call.data.get("phenotype"),
+        growspace_id=call.data.get("growspace_id"),
+        plant_id=call.data.get("plant_id"),
+        limit=call.data.get("limit"),
+    )
+    _LOGGER.debug("Fetched %d archived plants", len(plants))
+    return {"plants": plants}
@@ -0,0 +1,252 @@
+"""Sharded persistence backend for the Growspace Manager integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.storage import Store
+
+_LOGGER = logging.getLogger(__name__)
+
+IndexFunc = Callable[[], dict[str, Any]]
+ShardFunc = Callable[[str], dict[str, Any]]
+
+
+class ShardedStore:
+    """Persist coordinator state as a small index plus one shard per growspace.
+
+    The index holds the growspaces, the notification switch states and the list
+    of shard IDs. Each shard holds the plants of one growspace together with
+    their sent-notification flags. Only shards marked dirty are rewritten, so a
+    save after editing one plant costs the size of its growspace rather than
+    the size of the whole garden. Flags of deleted plants are dropped the next
+    time their shard is written.
+    """
+
+    def __init__(self, hass: HomeAssistant, version: int, key: str) -> None:
+        """Initialize the sharded store.
+
+        Args:
+            hass: The Home Assistant instance.
+            version: The storage schema version.
+            key: The base storage key; files are written as `<key>.index` and
+                `<key>.shard.<growspace_id>`.
+        """
+        self.hass = hass
+        self._version = version
+        self._key = key
+        self._index_store: Store = Store(hass, version, f"{key}.index")
+        self._shard_stores: dict[str, Store] = {}
+        self._known_shards: set[str] = set()
+        self._written_index: bytes | None = None
+        self._dirty: set[str] = set()
+        self._all_dirty = True
+        self._index_pending = False
+        self.index_writes = 0
+        self.shard_writes = 0
+
+    def _shard_store(self, shard_id: str) -> Store:
+        """Return the Store for a shard, creating it on first use.
+
+        Args:
+            shard_id: The growspace ID of the shard.
+
+        Returns:
+            The Store backing the shard.
+        """
+        if (store := self._shard_stores.get(shard_id)) is None:
+            store = Store(self.hass, self._version, f"{self._key}.shard.{shard_id}")
+            self._shard_stores[shard_id] = store
+        return store
+
+    @callback
+    def mark_dirty(self, shard_ids: Iterable[str]) -> None:
+        """Schedule shards to be rewritten on the next save.
+
+        Args:
+            shard_ids: The growspace IDs whose shards changed.
+        """
+        self._dirty.update(shard_ids)
+
+    @callback
+    def mark_all_dirty(self) -> None:
+        """Schedule every shard to be rewritten on the next save."""
+        self._all_dirty = True
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Load the index and all shards into the single-file data layout.
+
+        Returns:
+            A dictionary shaped like the single-file store payload, or None if
+            no sharded data exists yet.
+        """
+        index = await self._index_store.async_load()
+        if index is None:
+            return None
+
+        shard_ids = list(index.get("shards", []))
+        shards = await asyncio.gather(
+            *(self._shard_store(shard_id).async_load() for shard_id in shard_ids)
+        )
+
+        plants: dict[str, Any] = {}
+        notifications_sent: dict[str, Any] = {}
+        for shard_id, shard in zip(shard_ids, shards):
+            if shard is None:
+                _LOGGER.warning("Storage shard for growspace %s is missing", shard_id)
+                continue
+            plants.update(shard.get("plants", {}))
+            notifications_sent.update(shard.get("notifications_sent", {}))
+
+        self._known_shards = set(shard_ids)
+        self._written_index = json_bytes(index)
+        self._all_dirty = False
+        self._dirty.clear()
+        _LOGGER.debug(
+            "Loaded %d plants from %d storage shards", len(plants), len(shard_ids)
+        )
+        return {
+            "plants": plants,
+            "growspaces": index.get("growspaces", {}),
+            "notifications_sent": notifications_sent,
+            "notifications_enabled": index.get("notifications_enabled", {}),
+        }
+
+    def _pending_shards(self, shard_ids: set[str]) -> list[str]:
+        """Work out which shards must be written for the given index.
+
+        Shards that are new since the last save are always written, and shards
+        no longer in the index are dropped from the dirty set.
+
+        Args:
+            shard_ids: The shard IDs in the current index.
+
+        Returns:
+            The sorted shard IDs to write.
+        """
+        if self._all_dirty:
+            self._dirty = set(shard_ids)
+            self._all_dirty = False
+        else:
+            self._dirty |= shard_ids - self._known_shards
+            self._dirty &= shard_ids
+        return sorted(self._dirty)
+
+    def _shard_payload(self, shard_id: str, shard_func: ShardFunc) -> dict[str, Any]:
+        """Serialize a shard at write time and clear its dirty flag.
+
+        Args:
+            shard_id: The shard ID being written.
+            shard_func: Returns the payload for one shard ID.
+
+        Returns:
+            The shard payload.
+        """
+        self._dirty.discard(shard_id)
+        self.shard_writes += 1
+        return shard_func(shard_id)
+
+    def _index_payload(self, index_func: IndexFunc) -> dict[str, Any]:
+        """Serialize the index at write time and clear its pending flag.
+
+        Args:
+            index_func: Returns the current index payload.
+
+        Returns:
+            The index payload.
+        """
+        index = index_func()
+        self._index_pending = False
+        self._written_index = json_bytes(index)
+        self.index_writes += 1
+        return index
+
+    def _index_changed(self, index: dict[str, Any]) -> bool:
+        """Return whether the index differs from the last written copy.
+
+        Args:
+            index: The current index payload.
+
+        Returns:
+            True if the index must be written.
+        """
+        return self._index_pending or json_bytes(index) != self._written_index
+
+    async def _async_remove_stale(self, shard_ids: set[str]) -> None:
+        """Delete shards whose growspace no longer has any data.
+
+        Args:
+            shard_ids: The shard IDs present in the current index.
+        """
+        for shard_id in self._known_shards - shard_ids:
+            await self._shard_store(shard_id).async_remove()
+            self._shard_stores.pop(shard_id, None)
+        self._known_shards = set(shard_ids)
+
+    async def async_save(self, index_func: IndexFunc, shard_func: ShardFunc) -> None:
+        """Write the index if it changed and every dirty shard immediately.
+
+        This also flushes any writes scheduled by `async_delay_save`.
+
+        Args:
+            index_func: Returns the current index payload, including the list
+                of shard IDs under "shards".
+            shard_func: Returns the payload for one shard ID.
+        """
+        index = index_func()
+        shard_ids = set(index["shards"])
+        writes = [
+            self._shard_store(shard_id).async_save(
+                self._shard_payload(shard_id, shard_func)
+            )
+            for shard_id in self._pending_shards(shard_ids)
+        ]
+        if self._index_changed(index):
+            writes.append(
+                self._index_store.async_save(self._index_payload(lambda: index))
+            )
+        await asyncio.gather(*writes)
+        await self._async_remove_stale(shard_ids)
+
+    async def async_delay_save(
+        self, index_func: IndexFunc, shard_func: ShardFunc, delay: float
+    ) -> None:
+        """Schedule deferred writes of the index and every dirty shard.
+
+        Each Store coalesces its own pending writes and serializes the latest
+        state when it physically writes, including on shutdown.
+
+        Args:
+            index_func: Returns the current index payload.
+            shard_func: Returns the payload for one shard ID.
+            delay: The number of seconds to wait before writing.
+        """
+        index = index_func()
+        shard_ids = set(index["shards"])
+        for shard_id in self._pending_shards(shard_ids):
+            self._shard_store(shard_id).async_delay_save(
+                lambda shard_id=shard_id: self._shard_payload(shard_id, shard_func),
+                delay,
+            )
+        if self._index_changed(index):
+            self._index_pending = True
+            self._index_store.async_delay_save(
+                lambda: self._index_payload(index_func), delay
+            )
+        await self._async_remove_stale(shard_ids)
+
+    async def async_remove(self) -> None:
+        """Delete the index and every known shard from disk."""
+        for shard_id in list(self._known_shards):
+            await self._shard_store(shard_id).async_remove()
+        await self._index_store.async_remove()
+        self._shard_stores.clear()
+        self._known_shards.clear()
+        self._written_index = None
+        self._index_pending = False
+        self._all_dirty = True
@@ -55,6 +55,17 @@ CREATE TABLE IF NOT EXISTS harvests (
     harvest_date TEXT NOT NULL,
     FOREIGN KEY(phenotype_id) REFERENCES phenotypes(phenotype_id)
 );
+CREATE TABLE IF NOT EXISTS archived_plants (
+    plant_id TEXT PRIMARY KEY,
+    strain TEXT,
+    phenotype TEXT,
+    growspace_id TEXT,
+    stage TEXT,
+    archived_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_archived_plants_strain
+    ON archived_plants (strain, phenotype);
 """
 
 
@@ -171,30 +182,51 @@ class StrainLibrary:
 
     async def record_harvest(self, strain: str, phenotype: str, veg_days: int, flower_days: int) -> None:
         """Record a harvest event for a specific strain and phenotype."""
-        strain = strain.strip()
-        phenotype = phenotype.strip() or "default"
-        phenotype_id = await self._ensure_strain_and_phenotype_exist(strain, phenotype)
+        await self.record_harvests([(strain, phenotype, veg_days, flower_days)])
+
+    async def record_harvests(self, harvests: list[tuple[str, str, int, int]]) -> None:
+        """Record several harvest events in a single transaction.
+
+        Args:
+            harvests: A list of (strain, phenotype, veg_days, flower_days) tuples.
+        """
+        if not harvests:
+            return
         harvest_date = datetime.datetime.now().isoformat()
+        records = []
+        for strain, phenotype, veg_days, flower_days in harvests:
+            strain = strain.strip()
+            phenotype = (phenotype or "").strip() or "default"
+            phenotype_id = await self._ensure_strain_and_phenotype_exist(strain, phenotype)
+            records.append((strain, phenotype, phenotype_id, veg_days, flower_days))
+
         query = """
             INSERT INTO harvests (phenotype_id, veg_days, flower_days, harvest_date)
             VALUES (?, ?, ?, ?)
         """
-        await self._db.execute(query, (phenotype_id, veg_days, flower_days, harvest_date))
+        await self._db.executemany(
+            query,
+            [
+                (phenotype_id, veg_days, flower_days, harvest_date)
+                for _, _, phenotype_id, veg_days, flower_days in records
+            ],
+        )
         await self._db.commit()
         # Invalidate analytics cache
         self._analytics_cache = None
-        # Update in‑memory cache for immediate sensor use
-        if strain in self.strains and phenotype in self.strains[strain]["phenotypes"]:
-            self.strains[strain]["phenotypes"][phenotype]["harvests"].append(
-                {"veg_days": veg_days, "flower_days": flower_days, "harvest_date": harvest_date}
+        for strain, phenotype, _, veg_days, flower_days in records:
+            # Update in‑memory cache for immediate sensor use
+            if strain in self.strains and phenotype in self.strains[strain]["phenotypes"]:
+                self.strains[strain]["phenotypes"][phenotype]["harvests"].append(
+                    {"veg_days": veg_days, "flower_days": flower_days, "harvest_date": harvest_date}
+                )
+            _LOGGER.info(
+                "Recorded harvest for %s (%s): veg=%d days, flower=%d days",
+                strain,
+                phenotype,
+                veg_days,
+                flower_days,
             )
-        _LOGGER.info(
-            "Recorded harvest for %s (%s): veg=%d days, flower=%d days",
-            strain,
-            phenotype,
-            veg_days,
-            flower_days,
-        )
 
     async def _ensure_strain_and_phenotype_exist(self, strain_name: str, phenotype_name: str) -> int:
         """Ensure the strain and phenotype exist, returning the phenotype ID."""
@@ -429,6 +461,85 @@ class StrainLibrary:
         await self.load()
         _LOGGER.info("Removed strain %s from library", strain)
 
+    async def archive_plants(self, plants: list[dict[str, Any]]) -> str:
+        """Store finished plants in the archive table in a single transaction.
+
+        Args:
+            plants: Serialized plant dictionaries, as produced by `asdict`.
+
+        Returns:
+            The ISO timestamp recorded as the archive time.
+        """
+        archived_at = datetime.datetime.now().isoformat()
+        if not plants:
+            return archived_at
+        await self._db.executemany(
+            """
+            INSERT OR REPLACE INTO archived_plants
+                (plant_id, strain, phenotype, growspace_id, stage, archived_at, data)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    plant["plant_id"],
+                    plant.get("strain"),
+                    plant.get("phenotype"),
+                    plant.get("growspace_id"),
+                    plant.get("stage"),
+                    archived_at,
+                    json.dumps(plant),
+                )
+                for plant in plants
+            ],
+        )
+        await self._db.commit()
+        _LOGGER.info("Archived %d finished plants", len(plants))
+        return archived_at
+
+    async def get_archived_plants(
+        self,
+        strain: str | None = None,
+        phenotype: str | None = None,
+        growspace_id: str | None = None,
+        plant_id: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Read archived plants back, newest first.
+
+        Args:
+            strain: Only return plants of this strain (optional).
+            phenotype: Only return plants of this phenotype (optional).
+            growspace_id: Only return plants last kept in this growspace (optional).
+            plant_id: Only return the plant with this ID (optional).
+            limit: The maximum number of plants to return (optional).
+
+        Returns:
+            A list of plant dictionaries, each with an added "archived_at" key.
+        """
+        filters = {
+            "strain": strain,
+            "phenotype": phenotype,
+            "growspace_id": growspace_id,
+            "plant_id": plant_id,
+        }
+        clauses = [f"{column} = ?" for column, value in filters.items() if value]
+        params: list[Any] = [value for value in filters.values() if value]
+        query = "SELECT archived_at, data FROM archived_plants"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY archived_at DESC, plant_id"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        plants = []
+        async with self._db.execute(query, params) as cursor:
+            async for row in cursor:
+                plant = json.loads(row["data"])
+                plant["archived_at"] = row["archived_at"]
+                plants.append(plant)
+        return plants
+
     def get_all(self) -> dict[str, dict[str, Any]]:
         """Return the raw in‑memory strain dictionary."""
         return self.strains
@@ -107,4 +107,8 @@ class GrowspaceNotificationSwitch(SwitchEntity):
 
     async def async_added_to_hass(self) -> None:
         """Register a listener when the entity is added to Home Assistant."""
-        self._coordinator.async_add_listener(self.async_write_ha_state)
+        self.async_on_remove(
+            self._coordinator.async_subscribe_growspace(
+                self._growspace_id, self.async_write_ha_state
+            )
+        )
@@ -0,0 +1,186 @@
+"""In-memory sample buffers for the trend analysis of environment sensors."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import deque
+from collections.abc import Iterable
+from itertools import islice
+from operator import itemgetter, mul
+from typing import Any
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import State
+from homeassistant.util import dt as dt_util
+
+# Upper bound on retained samples per entity, independent of the time window
+DEFAULT_MAX_SAMPLES = 2048
+
+# Minimum change between the first and last sample to call a trend
+TREND_CHANGE_THRESHOLD = 0.01
+
+Sample = tuple[float, float]
+
+_timestamp = itemgetter(0)
+
+
+def numeric_sample(state: State | None) -> Sample | None:
+    """Convert a numeric state into a (timestamp, value) sample.
+
+    Args:
+        state: The state to convert.
+
+    Returns:
+        The sample, or None if the state is missing or not numeric.
+    """
+    if state is None or state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+        return None
+    try:
+        return state.last_updated.timestamp(), float(state.state)
+    except (TypeError, ValueError):
+        return None
+
+
+class TrendBuffer:
+    """A bounded, time-ordered buffer of numeric samples for one entity.
+
+    Samples older than `max_age` seconds are pruned, except the newest of them,
+    which stands for the value at the start of the window the same way the
+    recorder's start-time state does. Analysing a window walks only the
+    samples inside it.
+    """
+
+    def __init__(self, max_age: float, max_samples: int = DEFAULT_MAX_SAMPLES) -> None:
+        """Initialize the buffer.
+
+        Args:
+            max_age: The longest window in seconds that will be analysed.
+            max_samples: The maximum number of samples to retain.
+        """
+        self.max_age = max_age
+        self._samples: deque[Sample] = deque(maxlen=max_samples)
+
+    def __len__(self) -> int:
+        """Return the number of retained samples."""
+        return len(self._samples)
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Append a sample, ignoring samples older than the newest one.
+
+        Args:
+            timestamp: The POSIX timestamp of the sample.
+            value: The numeric value.
+        """
+        if self._samples and timestamp < self._samples[-1][0]:
+            return
+        self._samples.append((timestamp, value))
+        self._prune(timestamp)
+
+    def add_state(self, state: State | None) -> None:
+        """Append a state if it is numeric.
+
+        Args:
+            state: The new state of the entity.
+        """
+        if (sample := numeric_sample(state)) is not None:
+            self.add(*sample)
+
+    def add_history(self, samples: Iterable[Sample]) -> None:
+        """Prepend historical samples older than everything already buffered.
+
+        Live samples recorded while the history was loading take precedence.
+
+        Args:
+            samples: Time-ordered (timestamp, value) pairs.
+        """
+        oldest = self._samples[0][0] if self._samples else None
+        older = [s for s in samples if oldest is None or s[0] < oldest]
+        if not older:
+            return
+        free = (self._samples.maxlen or len(older)) - len(self._samples)
+        if free <= 0:
+            return
+        self._samples.extendleft(reversed(older[-free:]))
+        self._prune(self._samples[-1][0])
+
+    def _prune(self, now: float) -> None:
+        """Drop samples that can no longer affect any window.
+
+        Args:
+            now: The current POSIX timestamp.
+        """
+        cutoff = now - self.max_age
+        while len(self._samples) > 1 and self._samples[1][0] <= cutoff:
+            self._samples.popleft()
+
+    def window(self, duration: float, now: float | None = None) -> list[Sample]:
+        """Return the samples of the last `duration` seconds.
+
+        The newest sample before the window is included, clamped to the window
+        start, as the value the entity had when the window opened.
+
+        Args:
+            duration: The window length in seconds.
+            now: The end of the window; defaults to the current time.
+
+        Returns:
+            The samples in time order.
+        """
+        if now is None:
+            now = dt_util.utcnow().timestamp()
+        start = now - duration
+        end = bisect_right(self._samples, now, key=_timestamp)
+        before = bisect_right(self._samples, start, hi=end, key=_timestamp)
+        samples = list(islice(self._samples, max(before - 1, 0), end))
+        if before:
+            samples[0] = (start, samples[0][1])
+        return samples
+
+    def analyze(
+        self, duration: float, threshold: float, now: float | None = None
+    ) -> dict[str, Any]:
+        """Analyse the trend of a window.
+
+        Args:
+            duration: The window length in seconds.
+            threshold: The value every sample must exceed for
+                `crossed_threshold`.
+            now: The end of the window; defaults to the current time.
+
+        Returns:
+            A dictionary with "trend" ("rising", "falling" or "stable") and
+            "crossed_threshold", plus "slope" (least-squares change per
+            minute), "min" and "max" when the window has at least two samples.
+        """
+        samples = self.window(duration, now)
+        if len(samples) < 2:
+            return {"trend": "stable", "crossed_threshold": False}
+
+        timestamps, values = zip(*samples)
+        origin = timestamps[0]
+        minutes = [(timestamp - origin) / 60 for timestamp in timestamps]
+        count = len(samples)
+        sum_x = sum(minutes)
+        sum_y = sum(values)
+        sum_xx = sum(map(mul, minutes, minutes))
+        sum_xy = sum(map(mul, minutes, values))
+        low = min(values)
+        high = max(values)
+
+        denominator = count * sum_xx - sum_x * sum_x
+        slope = (count * sum_xy - sum_x * sum_y) / denominator if denominator else 0.0
+
+        change = samples[-1][1] - samples[0][1]
+        trend = "stable"
+        if change > TREND_CHANGE_THRESHOLD:
+            trend = "rising"
+        elif change < -TREND_CHANGE_THRESHOLD:
+            trend = "falling"
+
+        return {
+            "trend": trend,
+            "crossed_threshold": low > threshold,
+            "slope": slope,
+            "min": low,
+            "max": high,
+        }
@@ -1,8 +1,10 @@
 """Utility functions for date parsing, formatting, and calculations in growspace_manager."""
 
 from __future__ import annotations
+from collections.abc import Callable, Iterable
 import math
 from datetime import date, datetime
+from typing import Any
 from dateutil import parser
 from .models import Plant, Growspace
 
@@ -26,6 +28,14 @@ def parse_date_field(date_value: DateInput) -> datetime | None:
     return None
 
 
+def get_plant_date(plant: Plant, field_name: str) -> date | None:
+    """Return a plant's stage date as a date, using the Plant's memoized parse."""
+    if isinstance(plant, Plant):
+        return plant.get_date(field_name)
+    parsed = parse_date_field(getattr(plant, field_name, None))
+    return parsed.date() if parsed else None
+
+
 def format_date(date_value: DateInput) -> str | None:
     """Format a date input into an ISO string."""
     dt = parse_date_field(date_value)
@@ -81,6 +91,65 @@ def generate_growspace_grid(
     return grid
 
 
+def encode_row_bitmap(
+    rows: int, cols: int, positions: Iterable[tuple[int, int]]
+) -> list[str]:
+    """Encode occupied grid positions as one hexadecimal bitmap per row.
+
+    Bit `col - 1` of entry `row - 1` is set when the position is occupied, so
+    a client can expand a row with `BigInt("0x" + bitmap)`. Positions outside
+    the grid are ignored.
+
+    Args:
+        rows: The number of rows.
+        cols: The number of columns.
+        positions: The occupied (row, col) positions, 1-indexed.
+
+    Returns:
+        The bitmap of every row, without a "0x" prefix.
+    """
+    bitmaps = [0] * rows
+    for row, col in positions:
+        if 1 <= row <= rows and 1 <= col <= cols:
+            bitmaps[row - 1] |= 1 << (col - 1)
+    return [format(bitmap, "x") for bitmap in bitmaps]
+
+
+def generate_sparse_growspace_grid(
+    rows: int,
+    cols: int,
+    plant_positions: list[Plant],
+    cell: Callable[[Plant], Any],
+) -> dict[str, Any]:
+    """Generate the sparse overview grid, holding only the occupied positions.
+
+    This is the `grid` and `occupancy` of a growspace overview sensor with the
+    sparse grid format. The full format lists the same `grid` keys for every
+    position, with None for the empty ones.
+
+    Args:
+        rows: The number of rows.
+        cols: The number of columns.
+        plant_positions: The plants in the growspace.
+        cell: Builds the grid entry of a plant.
+
+    Returns:
+        `grid`, mapping "position_<row>_<col>" to the entry of the plant
+        there, and `occupancy`, the row bitmaps from `encode_row_bitmap`.
+    """
+    return {
+        "grid": {
+            f"position_{int(plant.row)}_{int(plant.col)}": cell(plant)
+            for plant in plant_positions
+        },
+        "occupancy": encode_row_bitmap(
+            rows,
+            cols,
+            ((int(plant.row), int(plant.col)) for plant in plant_positions),
+        ),
+    }
+
+
 class VPDCalculator:
     """A utility class for calculating Vapor Pressure Deficit (VPD)."""
 
@@ -0,0 +1,226 @@
+"""WebSocket commands serving growspace data to the Lovelace card.
+
+The card can read plants here instead of from the overview sensor attributes.
+`growspace_manager/subscribe_growspace` sends a snapshot of one growspace and
+its plants, then after each coordinator update only the plants and growspace
+fields that changed, using the coordinator's change set to decide which plants
+to compare.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+import voluptuous as vol
+
+from .const import DOMAIN
+from .coordinator import GrowspaceCoordinator
+from .models import ChangeSet
+
+_LOGGER = logging.getLogger(__name__)
+
+WS_GET_PLANTS = f"{DOMAIN}/get_plants"
+WS_SUBSCRIBE_GROWSPACE = f"{DOMAIN}/subscribe_growspace"
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Register the Growspace Manager WebSocket commands."""
+    websocket_api.async_register_command(hass, websocket_get_plants)
+    websocket_api.async_register_command(hass, websocket_subscribe_growspace)
+
+
+def _coordinators(hass: HomeAssistant) -> list[GrowspaceCoordinator]:
+    """Return the coordinators of every loaded config entry."""
+    return [
+        entry_data["coordinator"]
+        for entry_data in hass.data.get(DOMAIN, {}).values()
+        if isinstance(entry_data, dict) and "coordinator" in entry_data
+    ]
+
+
+def _find_coordinator(
+    hass: HomeAssistant, growspace_id: str
+) -> GrowspaceCoordinator | None:
+    """Return the coordinator holding a growspace.
+
+    Args:
+        hass: The Home Assistant instance.
+        growspace_id: The ID of the growspace.
+
+    Returns:
+        The coordinator, or None if no loaded entry has the growspace.
+    """
+    return next(
+        (
+            coordinator
+            for coordinator in _coordinators(hass)
+            if growspace_id in coordinator.growspaces
+        ),
+        None,
+    )
+
+
+class GrowspaceSubscription:
+    """What one subscriber was last sent for a growspace.
+
+    Each update is compared against the sent copies, so a subscriber receives
+    a plant or the growspace fields only when they differ from what it holds.
+    """
+
+    def __init__(self, coordinator: GrowspaceCoordinator, growspace_id: str) -> None:
+        """Initialize the subscription.
+
+        Args:
+            coordinator: The coordinator holding the growspace.
+            growspace_id: The ID of the growspace.
+        """
+        self.coordinator = coordinator
+        self.growspace_id = growspace_id
+        self._growspace: dict[str, Any] | None = None
+        self._plants: dict[str, dict[str, Any]] = {}
+
+    def _growspace_dict(self) -> dict[str, Any] | None:
+        """Serialize the growspace, or return None if it was removed."""
+        growspace = self.coordinator.growspaces.get(self.growspace_id)
+        return growspace.to_dict() if growspace is not None else None
+
+    def snapshot(self) -> dict[str, Any]:
+        """Build the full state of the growspace and remember it as sent.
+
+        Returns:
+            The growspace, its plants keyed by ID and the data version.
+        """
+        self._growspace = self._growspace_dict()
+        self._plants = {
+            plant.plant_id: plant.to_dict()
+            for plant in self.coordinator.get_growspace_plants(self.growspace_id)
+        }
+        return {
+            "type": "snapshot",
+            "version": self.coordinator.data_version,
+            "growspace": self._growspace,
+            "plants": dict(self._plants),
+        }
+
+    def delta(self, changes: ChangeSet) -> dict[str, Any] | None:
+        """Build the differences since the last message.
+
+        Args:
+            changes: The change set of the coordinator update.
+
+        Returns:
+            The changed growspace fields, changed or added plants and removed
+            plant IDs, or None if nothing the subscriber holds changed.
+        """
+        current = {
+            plant.plant_id: plant
+            for plant in self.coordinator.get_growspace_plants(self.growspace_id)
+        }
+        candidates = current.keys() | self._plants.keys()
+        if not changes.full:
+            candidates &= changes.plant_ids
+
+        message: dict[str, Any] = {}
+        growspace = self._growspace_dict()
+        if growspace != self._growspace:
+            self._growspace = growspace
+            message["growspace"] = growspace
+
+        plants: dict[str, dict[str, Any]] = {}
+        removed: list[str] = []
+        for plant_id in sorted(candidates):
+            if plant_id in current:
+                plant = current[plant_id].to_dict()
+                if self._plants.get(plant_id) != plant:
+                    self._plants[plant_id] = plants[plant_id] = plant
+            elif self._plants.pop(plant_id, None) is not None:
+                removed.append(plant_id)
+        if plants:
+            message["plants"] = plants
+        if removed:
+            message["removed_plants"] = removed
+
+        if not message:
+            return None
+        return {"type": "delta", "version": self.coordinator.data_version, **message}
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_GET_PLANTS,
+        vol.Optional("growspace_id"): str,
+    }
+)
+@callback
+def websocket_get_plants(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the plants of one growspace, or of every growspace."""
+    growspace_id = msg.get("growspace_id")
+    if growspace_id is None:
+        plants = [
+            plant
+            for coordinator in _coordinators(hass)
+            for plant in coordinator.plants.values()
+        ]
+    elif (coordinator := _find_coordinator(hass, growspace_id)) is not None:
+        plants = coordinator.get_growspace_plants(growspace_id)
+    else:
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_NOT_FOUND,
+            f"Growspace {growspace_id} not found",
+        )
+        return
+
+    connection.send_result(
+        msg["id"], {"plants": {plant.plant_id: plant.to_dict() for plant in plants}}
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_SUBSCRIBE_GROWSPACE,
+        vol.Required("growspace_id"): str,
+    }
+)
+@callback
+def websocket_subscribe_growspace(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Send a growspace snapshot, then the differences after each update."""
+    growspace_id = msg["growspace_id"]
+    coordinator = _find_coordinator(hass, growspace_id)
+    if coordinator is None:
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_NOT_FOUND,
+            f"Growspace {growspace_id} not found",
+        )
+        return
+
+    subscription = GrowspaceSubscription(coordinator, growspace_id)
+
+    @callback
+    def forward_changes() -> None:
+        """Send what the latest coordinator update changed."""
+        message = subscription.delta(coordinator.last_changes)
+        if message is not None:
+            connection.send_message(websocket_api.event_message(msg["id"], message))
+
+    connection.subscriptions[msg["id"]] = coordinator.async_subscribe_growspace(
+        growspace_id, forward_changes
+    )
+    connection.send_result(msg["id"])
+    connection.send_message(
+        websocket_api.event_message(msg["id"], subscription.snapshot())
+    )
+    _LOGGER.debug("WebSocket subscriber added for growspace %s", growspace_id)
@@ -0,0 +1,89 @@
+"""Benchmark the offline Bayesian backtest of the Growspace Manager.
+
+Run from the repository root:
+
+    python -m tests.benchmark_backtest [days]
+
+Synthesises temperature, humidity and VPD readings every 10 seconds plus a
+12/12 light cycle for a late-flower growspace, then replays them through the
+stress, mold-risk and optimal-conditions sensors in one process and across a
+process pool, and checks that both replays count the same flips and alerts.
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+import math
+import os
+import random
+import sys
+import time
+
+from custom_components.growspace_manager.backtest import (
+    BacktestConfig,
+    ReplayState,
+    run_backtest,
+)
+
+SAMPLE_INTERVAL = 10
+START = 1_700_000_000.0
+ENV_CONFIG = {
+    "temperature_sensor": "sensor.temp",
+    "humidity_sensor": "sensor.humidity",
+    "vpd_sensor": "sensor.vpd",
+    "light_sensor": "light.grow_light",
+}
+
+
+def _history(days: float) -> list[ReplayState]:
+    """Build a synthetic history with daily cycles and random noise."""
+    rng = random.Random(days)
+    records = []
+    for step in range(int(days * 86400 / SAMPLE_INTERVAL)):
+        at = START + step * SAMPLE_INTERVAL
+        hour = (step * SAMPLE_INTERVAL / 3600) % 24
+        phase = math.sin(hour / 24 * 2 * math.pi)
+        temp = 24 + 4 * phase + rng.gauss(0, 0.3)
+        humidity = 58 - 8 * phase + rng.gauss(0, 1.5)
+        vpd = 1.1 + 0.4 * phase + rng.gauss(0, 0.05)
+        records.append(ReplayState("sensor.temp", f"{temp:.2f}", at, {}))
+        records.append(ReplayState("sensor.humidity", f"{humidity:.1f}", at + 2, {}))
+        records.append(ReplayState("sensor.vpd", f"{vpd:.2f}", at + 4, {}))
+        if step % (12 * 360) == 0:
+            state = "on" if (step // (12 * 360)) % 2 == 0 else "off"
+            records.append(ReplayState("light.grow_light", state, at, {}))
+    return records
+
+
+def main() -> None:
+    """Print replay timings for a single process and a process pool."""
+    days = float(sys.argv[1]) if len(sys.argv) > 1 else 7.0
+    records = _history(days)
+    config = BacktestConfig(
+        ENV_CONFIG, flower_start=date.today() - timedelta(days=45)
+    )
+    print(f"{len(records)} events over {days:g} days, {os.cpu_count()} CPUs")
+
+    summaries = set()
+    for label, workers in (("single process", 1), ("process pool", None)):
+        start = time.perf_counter()
+        result = run_backtest(records, config, max_workers=workers)
+        elapsed = time.perf_counter() - start
+        summary = result.summary()
+        summaries.add(
+            tuple(
+                (name, sensor["flips"], sensor["alerts"])
+                for name, sensor in summary["sensors"].items()
+            )
+        )
+        print(
+            f"{label:>15}: {elapsed:7.2f} s in {summary['chunks']} chunks, "
+            f"{days * 86400 / elapsed:,.0f}x real time"
+        )
+        for name, sensor in summary["sensors"].items():
+            print(f"{'':>17}{name}: {sensor}")
+    print("identical" if len(summaries) == 1 else "DIFFER")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark the Bayesian update engines of the Growspace Manager.
+
+Run from the repository root:
+
+    python -m tests.benchmark_bayesian
+
+Every growspace carries the stress, mold-risk and optimal-conditions sensors
+with a dozen observations each. The script times the original multiplicative
+loop against the current update, both run once per sensor, and checks that
+both engines reach the same decisions.
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+import time
+
+from custom_components.growspace_manager.bayesian_engine import posterior_probability
+
+GROWSPACE_COUNTS = (1, 10, 100)
+SENSORS_PER_GROWSPACE = 3
+OBSERVATIONS_PER_SENSOR = 12
+THRESHOLD = 0.5
+ROUNDS = 200
+
+
+def _multiplicative_posterior(prior, observations):
+    """Return the posterior of the original product-of-likelihoods update."""
+    if not observations:
+        return prior
+    prob_true = prior
+    prob_false = 1 - prior
+    for p_obs_given_true, p_obs_given_false in observations:
+        prob_true *= p_obs_given_true
+        prob_false *= p_obs_given_false
+    total = prob_true + prob_false
+    if total == 0:
+        return prior
+    return prob_true / total
+
+
+def _workload(growspaces: int) -> tuple[list[float], list[list[tuple[float, float]]]]:
+    """Build random priors and observation sets for every sensor."""
+    rng = random.Random(growspaces)
+    rows = growspaces * SENSORS_PER_GROWSPACE
+    priors = [rng.uniform(0.05, 0.5) for _ in range(rows)]
+    observation_sets = [
+        [
+            (rng.uniform(0.05, 0.99), rng.uniform(0.05, 0.99))
+            for _ in range(OBSERVATIONS_PER_SENSOR)
+        ]
+        for _ in range(rows)
+    ]
+    return priors, observation_sets
+
+
+def _time(func) -> float:
+    """Return the median runtime of `func` in microseconds."""
+    samples = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1_000_000
+
+
+def main() -> None:
+    """Print a comparison table for every growspace count."""
+    print(f"{'growspaces':>10} {'multiply us':>12} {'log-odds us':>12} {'decisions':>10}")
+    for growspaces in GROWSPACE_COUNTS:
+        priors, observation_sets = _workload(growspaces)
+        pairs = list(zip(priors, observation_sets))
+
+        def multiply():
+            return [_multiplicative_posterior(p, obs) for p, obs in pairs]
+
+        def log_odds():
+            return [posterior_probability(p, obs) for p, obs in pairs]
+
+        decisions = {
+            tuple(value > THRESHOLD for value in func())
+            for func in (multiply, log_odds)
+        }
+        print(
+            f"{growspaces:>10} {_time(multiply):>12.1f} {_time(log_odds):>12.1f} "
+            f"{'identical' if len(decisions) == 1 else 'DIFFER':>10}"
+        )
+
+if __name__ == "__main__":
+    main()
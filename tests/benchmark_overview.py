@@ -0,0 +1,91 @@
+"""Benchmark the growspace overview sensor attributes of the Growspace Manager.
+
+Run from the repository root:
+
+    python -m tests.benchmark_overview
+
+Builds a 10x10 commercial bench with a plant in every position and a
+dehumidifier, then times `extra_state_attributes` the way a state write calls
+it: a full rebuild after every data change versus the memoized attributes,
+where only the live device fields are read again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import tempfile
+import time
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.growspace_manager.coordinator import GrowspaceCoordinator
+from custom_components.growspace_manager.models import Growspace, Plant
+from custom_components.growspace_manager.sensor import GrowspaceOverviewSensor
+
+ROWS = 10
+PLANTS_PER_ROW = 10
+CALLS = 2_000
+ROUNDS = 5
+
+
+def _populate(coordinator: GrowspaceCoordinator) -> None:
+    """Fill a coordinator with one bench of ROWS x PLANTS_PER_ROW plants."""
+    coordinator.growspaces["bench"] = Growspace(
+        id="bench",
+        name="Bench",
+        rows=ROWS,
+        plants_per_row=PLANTS_PER_ROW,
+        environment_config={"dehumidifier_entity": "humidifier.bench"},
+    )
+    for index in range(ROWS * PLANTS_PER_ROW):
+        plant_id = f"plant_{index}"
+        coordinator.plants[plant_id] = Plant(
+            plant_id=plant_id,
+            growspace_id="bench",
+            strain=f"Strain {index % 8}",
+            row=index // PLANTS_PER_ROW + 1,
+            col=index % PLANTS_PER_ROW + 1,
+            stage="flower",
+            veg_start="2025-01-01",
+            flower_start="2025-02-15",
+        )
+    coordinator._rebuild_plant_index()
+
+
+def _time_calls(sensor: GrowspaceOverviewSensor, invalidate: bool) -> float:
+    """Return the mean microseconds per attribute build."""
+    samples = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            if invalidate:
+                sensor._attributes_key = None
+            sensor.extra_state_attributes
+        samples.append((time.perf_counter() - start) / CALLS)
+    return statistics.mean(samples) * 1e6
+
+
+async def main() -> None:
+    """Print rebuild versus memoized attribute timings."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        hass.states.async_set("humidifier.bench", "on", {"humidity": 50})
+        coordinator = GrowspaceCoordinator(hass, data={})
+        _populate(coordinator)
+        sensor = GrowspaceOverviewSensor(
+            coordinator, "bench", coordinator.growspaces["bench"]
+        )
+
+        rebuild = _time_calls(sensor, invalidate=True)
+        memoized = _time_calls(sensor, invalidate=False)
+        await hass.async_stop(force=True)
+
+    print(f"{ROWS}x{PLANTS_PER_ROW} bench, {CALLS} calls x {ROUNDS} rounds")
+    print(f"{'rebuild':>10}: {rebuild:9.1f} us per call")
+    print(f"{'memoized':>10}: {memoized:9.1f} us per call")
+    print(f"{'speedup':>10}: {rebuild / memoized:9.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
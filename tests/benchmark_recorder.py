@@ -0,0 +1,209 @@
+"""Measure the recorder footprint of the Growspace Manager's bulky attributes.
+
+Run from the repository root:
+
+    python -m tests.benchmark_recorder
+
+Replays one hour for a 10x10 bench: a temperature reading every 30 seconds
+feeding the plant stress sensor, a plant edit every minute rewriting the
+overview and strain library sensors, and a harvest every 20 minutes growing
+the strain analytics. Every state write is stored the way the recorder stores
+it: a states row per write, and a state_attributes row holding the JSON of
+the recorded attributes, shared by every write whose recorded attributes are
+identical. It prints the attribute bytes and rows per hour with every
+attribute recorded (before) and with `_unrecorded_attributes` excluded (after).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import math
+import tempfile
+from typing import Any
+
+from homeassistant.const import ATTR_FRIENDLY_NAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
+
+from custom_components.growspace_manager.binary_sensor import BayesianStressSensor
+from custom_components.growspace_manager.coordinator import GrowspaceCoordinator
+from custom_components.growspace_manager.models import Growspace, Plant
+from custom_components.growspace_manager.sensor import (
+    GrowspaceOverviewSensor,
+    StrainLibrarySensor,
+)
+
+ROWS = 10
+PLANTS_PER_ROW = 10
+STRAINS = 40
+READING_INTERVAL = 30
+PLANT_EDIT_INTERVAL = 60
+HARVEST_INTERVAL = 1200
+HOUR = 3600
+ENV_CONFIG = {
+    "temperature_sensor": "sensor.bench_temperature",
+    "humidity_sensor": "sensor.bench_humidity",
+    "light_sensor": "light.bench",
+    # Trend sensors keep the replay off the recorder's history queries
+    "temperature_trend_sensor": "binary_sensor.bench_temperature_trend",
+    "humidity_trend_sensor": "binary_sensor.bench_humidity_trend",
+}
+
+
+@dataclass
+class RecorderTally:
+    """The recorder rows and bytes one entity's writes would add."""
+
+    unrecorded: frozenset[str]
+    writes: int = 0
+    attribute_rows: int = 0
+    attribute_bytes: int = 0
+    _stored: set[bytes] = field(default_factory=set)
+
+    def record(self, attributes: dict[str, Any]) -> None:
+        """Store one state write, sharing identical attribute rows.
+
+        Args:
+            attributes: The entity's state attributes at the write.
+        """
+        self.writes += 1
+        shared = json_bytes(
+            {k: v for k, v in attributes.items() if k not in self.unrecorded}
+        )
+        if shared not in self._stored:
+            self._stored.add(shared)
+            self.attribute_rows += 1
+            self.attribute_bytes += len(shared)
+
+
+class RecordedEntity:
+    """Tallies an entity's writes with and without its unrecorded attributes."""
+
+    def __init__(self, name: str, entity: Any) -> None:
+        """Hook the entity's state writes.
+
+        Args:
+            name: The label to print.
+            entity: The entity to measure.
+        """
+        self.name = name
+        self.before = RecorderTally(frozenset())
+        self.after = RecorderTally(frozenset(entity._unrecorded_attributes))
+        self._entity = entity
+        entity.async_write_ha_state = self._write
+
+    def _write(self) -> None:
+        """Record the entity's attributes as a state write would."""
+        attributes = {
+            ATTR_FRIENDLY_NAME: self._entity.name,
+            **(self._entity.extra_state_attributes or {}),
+        }
+        self.before.record(attributes)
+        self.after.record(attributes)
+
+
+def _populate(coordinator: GrowspaceCoordinator) -> None:
+    """Fill a coordinator with one bench of ROWS x PLANTS_PER_ROW plants."""
+    coordinator.growspaces["bench"] = Growspace(
+        id="bench",
+        name="Bench",
+        rows=ROWS,
+        plants_per_row=PLANTS_PER_ROW,
+        environment_config=dict(ENV_CONFIG),
+    )
+    for index in range(ROWS * PLANTS_PER_ROW):
+        plant_id = f"plant_{index}"
+        coordinator.plants[plant_id] = Plant(
+            plant_id=plant_id,
+            growspace_id="bench",
+            strain=f"Strain {index % STRAINS}",
+            row=index // PLANTS_PER_ROW + 1,
+            col=index % PLANTS_PER_ROW + 1,
+            stage="flower",
+            veg_start="2025-01-01",
+            flower_start="2025-02-15",
+        )
+    coordinator._rebuild_plant_index()
+
+
+async def _replay_hour(
+    hass: HomeAssistant,
+    coordinator: GrowspaceCoordinator,
+    stress: BayesianStressSensor,
+    harvest: Callable[[int], Any],
+) -> None:
+    """Drive one hour of readings, plant edits and harvests."""
+    for second in range(0, HOUR, READING_INTERVAL):
+        # A slow daily swing with sensor noise around 27 C
+        temperature = 27 + 4 * math.sin(second / 900) + (second % 7) * 0.1
+        hass.states.async_set("sensor.bench_temperature", f"{temperature:.1f}")
+        await stress._async_update_probability()
+
+        if second % PLANT_EDIT_INTERVAL == 0:
+            plant_id = f"plant_{second // PLANT_EDIT_INTERVAL}"
+            coordinator._mark_plant_changed(plant_id)
+            coordinator.plants[plant_id].phenotype = f"Pheno {second}"
+            coordinator.async_update_listeners()
+        if second % HARVEST_INTERVAL == 0:
+            await harvest(second)
+
+
+async def main() -> None:
+    """Print the recorder bytes per hour before and after."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        hass.states.async_set("light.bench", "on")
+        hass.states.async_set("sensor.bench_humidity", "55")
+        hass.states.async_set("binary_sensor.bench_temperature_trend", "off")
+        hass.states.async_set("binary_sensor.bench_humidity_trend", "off")
+        coordinator = GrowspaceCoordinator(hass, data={})
+        library = coordinator.strains
+        await library.async_setup()
+        _populate(coordinator)
+
+        overview = GrowspaceOverviewSensor(
+            coordinator, "bench", coordinator.growspaces["bench"]
+        )
+        strain_library = StrainLibrarySensor(coordinator)
+        stress = BayesianStressSensor(coordinator, "bench", ENV_CONFIG)
+        stress.hass = hass
+        entities = [
+            RecordedEntity("stress", stress),
+            RecordedEntity("overview", overview),
+            RecordedEntity("strain library", strain_library),
+        ]
+        # Coordinator entities write on every update they are concerned with
+        coordinator.async_add_listener(overview._handle_coordinator_update)
+        coordinator.async_add_listener(strain_library._handle_coordinator_update)
+
+        async def harvest(second: int) -> None:
+            await library.record_harvests(
+                [
+                    (f"Strain {index}", "default", 30 + second % 11, 60 + index % 9)
+                    for index in range(STRAINS)
+                ]
+            )
+
+        await _replay_hour(hass, coordinator, stress, harvest)
+        await coordinator.async_flush()
+        await library.async_close()
+        await hass.async_stop(force=True)
+
+    print(f"{ROWS}x{PLANTS_PER_ROW} bench, {STRAINS} strains, one hour")
+    print(f"{'entity':>15} {'writes':>7} {'before':>18} {'after':>18}")
+    for entity in entities:
+        before, after = entity.before, entity.after
+        print(
+            f"{entity.name:>15} {before.writes:7d}"
+            f" {before.attribute_bytes:10d} B {before.attribute_rows:4d} rows"
+            f" {after.attribute_bytes:10d} B {after.attribute_rows:4d} rows"
+        )
+    before = sum(entity.before.attribute_bytes for entity in entities)
+    after = sum(entity.after.attribute_bytes for entity in entities)
+    print(f"{'total':>15} {'':>7} {before:10d} B/h {'':>5} {after:10d} B/h")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
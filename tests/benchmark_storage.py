@@ -0,0 +1,118 @@
+"""Benchmark single-file versus sharded storage for the Growspace Manager.
+
+Run from the repository root:
+
+    python -m tests.benchmark_storage
+
+For each garden size the script saves once to populate storage, then edits a
+single plant and saves again. It reports the mean latency of that incremental
+save and the bytes written to `.storage`, which is what a running instance pays
+on every plant update.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+import statistics
+import tempfile
+import time
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.growspace_manager.coordinator import GrowspaceCoordinator
+from custom_components.growspace_manager.models import Growspace, Plant
+
+PLANT_COUNTS = (100, 1_000, 10_000)
+PLANTS_PER_GROWSPACE = 50
+ROUNDS = 5
+
+
+def _storage_snapshot(storage_dir: Path) -> dict[Path, tuple[int, int]]:
+    """Return the modification time and size of every storage file."""
+    return {
+        path: (path.stat().st_mtime_ns, path.stat().st_size)
+        for path in storage_dir.glob("*")
+        if path.is_file()
+    }
+
+
+def _bytes_written(
+    before: dict[Path, tuple[int, int]], after: dict[Path, tuple[int, int]]
+) -> int:
+    """Sum the sizes of files that were created or rewritten."""
+    return sum(
+        size
+        for path, (mtime, size) in after.items()
+        if before.get(path, (None,))[0] != mtime
+    )
+
+
+def _populate(coordinator: GrowspaceCoordinator, plant_count: int) -> list[str]:
+    """Fill a coordinator with growspaces of `PLANTS_PER_GROWSPACE` plants each."""
+    plant_ids = []
+    for index in range(plant_count):
+        growspace_id = f"bench_{index // PLANTS_PER_GROWSPACE}"
+        if growspace_id not in coordinator.growspaces:
+            coordinator.growspaces[growspace_id] = Growspace(
+                id=growspace_id, name=growspace_id, rows=10, plants_per_row=5
+            )
+        plant_id = f"plant_{index}"
+        coordinator.plants[plant_id] = Plant(
+            plant_id=plant_id,
+            growspace_id=growspace_id,
+            strain=f"Strain {index % 20}",
+            row=(index % PLANTS_PER_GROWSPACE) // 5 + 1,
+            col=index % 5 + 1,
+            stage="veg",
+            veg_start="2025-01-01",
+        )
+        plant_ids.append(plant_id)
+    coordinator._rebuild_plant_index()
+    return plant_ids
+
+
+async def _run_backend(backend: str, plant_count: int) -> tuple[float, int]:
+    """Measure incremental save latency and bytes written for one backend."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        storage_dir = Path(config_dir, ".storage")
+        coordinator = GrowspaceCoordinator(
+            hass,
+            data={},
+            options={"global_settings": {"storage_backend": backend}},
+        )
+        coordinator.async_set_updated_data = lambda data: None
+        plant_ids = _populate(coordinator, plant_count)
+        await coordinator.async_save()
+
+        latencies = []
+        written = []
+        for round_number in range(ROUNDS):
+            plant_id = plant_ids[round_number * 7 % len(plant_ids)]
+            coordinator.plants[plant_id].phenotype = f"round {round_number}"
+            coordinator._mark_plant_changed(plant_id)
+            before = _storage_snapshot(storage_dir)
+            # Ensure the rewritten files get a distinct modification time
+            await asyncio.sleep(0.01)
+            start = time.perf_counter()
+            await coordinator.async_save()
+            latencies.append(time.perf_counter() - start)
+            written.append(_bytes_written(before, _storage_snapshot(storage_dir)))
+        await hass.async_stop(force=True)
+    return statistics.mean(latencies), int(statistics.mean(written))
+
+
+async def main() -> None:
+    """Print a comparison table for every garden size."""
+    print(f"{'plants':>8} {'backend':>8} {'save ms':>9} {'bytes written':>14}")
+    for plant_count in PLANT_COUNTS:
+        for backend in ("single", "sharded"):
+            latency, written = await _run_backend(backend, plant_count)
+            print(
+                f"{plant_count:>8} {backend:>8} {latency * 1000:>9.2f} {written:>14,}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
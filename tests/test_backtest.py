@@ -0,0 +1,163 @@
+"""Tests for the offline Bayesian backtest of the Growspace Manager integration."""
+
+import json
+import sqlite3
+
+import pytest
+
+from custom_components.growspace_manager.backtest import (
+    BacktestConfig,
+    ReplayState,
+    SensorReplay,
+    _count_flips_and_alerts,
+    load_csv,
+    load_history,
+    load_ndjson,
+    load_recorder_db,
+    run_backtest,
+)
+
+START = 1_700_000_000.0
+ENV_CONFIG = {
+    "temperature_sensor": "sensor.temp",
+    "humidity_sensor": "sensor.humidity",
+    "light_sensor": "light.grow_light",
+}
+
+
+def _temperatures(*readings: tuple[float, float]) -> list[ReplayState]:
+    """Build temperature records from (seconds after START, value) pairs."""
+    return [
+        ReplayState("sensor.temp", str(value), START + offset, {})
+        for offset, value in readings
+    ]
+
+
+def test_loaders_read_exports_and_recorder_database(tmp_path):
+    """Test that CSV, NDJSON and recorder database histories load alike."""
+    csv_path = tmp_path / "history.csv"
+    csv_path.write_text(
+        "entity_id,state,last_changed\n"
+        "sensor.temp,25.5,2023-11-14T22:13:20+00:00\n"
+        "light.grow_light,on,2023-11-14 22:13:30\n"
+    )
+    ndjson_path = tmp_path / "history.ndjson"
+    ndjson_path.write_text(
+        json.dumps(
+            {
+                "entity_id": "sensor.temp_trend",
+                "state": "on",
+                "last_updated": START,
+                "attributes": {"gradient": 0.2},
+            }
+        )
+        + "\n"
+    )
+    db_path = tmp_path / "home-assistant_v2.db"
+    connection = sqlite3.connect(db_path)
+    connection.executescript(
+        "CREATE TABLE states_meta (metadata_id INTEGER, entity_id TEXT);"
+        "CREATE TABLE state_attributes (attributes_id INTEGER, shared_attrs TEXT);"
+        "CREATE TABLE states (state_id INTEGER, state TEXT, last_updated_ts REAL,"
+        " metadata_id INTEGER, attributes_id INTEGER);"
+        "INSERT INTO states_meta VALUES (1, 'sensor.temp'), (2, 'sensor.other');"
+        "INSERT INTO state_attributes VALUES (7, '{\"unit\": \"C\"}');"
+        f"INSERT INTO states VALUES (1, '26', {START + 10}, 1, 7),"
+        f" (2, '25', {START}, 1, NULL), (3, '1', {START}, 2, NULL);"
+    )
+    connection.commit()
+    connection.close()
+
+    assert load_csv(csv_path) == [
+        ReplayState("sensor.temp", "25.5", START, {}),
+        ReplayState("light.grow_light", "on", START + 10, {}),
+    ]
+    assert load_history(ndjson_path) == load_ndjson(ndjson_path)
+    assert load_ndjson(ndjson_path)[0].attributes == {"gradient": 0.2}
+    assert load_recorder_db(db_path, ["sensor.temp"]) == [
+        ReplayState("sensor.temp", "25", START, {}),
+        ReplayState("sensor.temp", "26", START + 10, {"unit": "C"}),
+    ]
+    with pytest.raises(ValueError):
+        load_history(db_path)
+
+
+def test_replay_counts_flips_and_alerts_with_cooldown():
+    """Test that heat spikes flip the stress sensor and alert outside cooldown."""
+    config = BacktestConfig(ENV_CONFIG, sensor_types=("stress",))
+    records = [
+        ReplayState("light.grow_light", "on", START, {}),
+        ReplayState("sensor.humidity", "55", START, {}),
+        *_temperatures(
+            (0, 25), (60, 36), (120, 25), (180, 36), (240, 25), (900, 36)
+        ),
+    ]
+
+    result = run_backtest(records, config, max_workers=1)
+    stress = result.sensors["stress"]
+
+    assert stress.times == [START + offset for offset in (0, 60, 120, 180, 240, 900)]
+    assert [p >= stress.threshold for p in stress.probabilities] == [
+        False,
+        True,
+        False,
+        True,
+        False,
+        True,
+    ]
+    assert stress.flips == 5
+    # The second spike falls inside the five-minute notification cooldown
+    assert stress.alerts == 2
+
+
+def test_evaluation_interval_coalesces_events():
+    """Test that events inside the interval merge into one delayed evaluation."""
+    config = BacktestConfig(
+        ENV_CONFIG, sensor_types=("optimal",), evaluation_interval=5
+    )
+    records = _temperatures((0, 25), (1, 26), (2, 27), (3, 36), (20, 25))
+
+    result = run_backtest(records, config, max_workers=1)
+    optimal = result.sensors["optimal"]
+
+    assert optimal.times == [START, START + 5, START + 20]
+    # The delayed run sees the last reading before it, not the first
+    assert optimal.probabilities[1] < optimal.probabilities[0]
+
+
+def test_chunked_replay_matches_continuous_replay():
+    """Test that chunk boundaries carry entity state and trend history over."""
+    config = BacktestConfig(ENV_CONFIG, evaluation_interval=0)
+    records = [
+        ReplayState("light.grow_light", "on", START, {}),
+        ReplayState("sensor.humidity", "60", START, {}),
+        *_temperatures(
+            *((offset, 24 + (offset // 600) % 8) for offset in range(0, 7200, 60))
+        ),
+    ]
+
+    continuous = run_backtest(records, config, chunk_duration=86400, max_workers=1)
+    chunked = run_backtest(records, config, chunk_duration=1800, max_workers=1)
+
+    assert (continuous.chunks, chunked.chunks) == (1, 4)
+    for sensor_type, replay in continuous.sensors.items():
+        assert chunked.sensors[sensor_type].times == replay.times
+        assert chunked.sensors[sensor_type].probabilities == pytest.approx(
+            replay.probabilities
+        )
+        assert chunked.sensors[sensor_type].flips == replay.flips
+
+
+def test_flip_count_applies_hysteresis_and_dwell():
+    """Test that replayed flips settle like the live sensors."""
+    replay = SensorReplay(
+        "stress",
+        0.7,
+        times=[0, 10, 20, 30, 40, 100],
+        probabilities=[0.5, 0.72, 0.68, 0.9, 0.1, 0.1],
+    )
+
+    _count_flips_and_alerts(replay, 0, {"min_on_duration": 60})
+
+    # On at 10s, held through the dip to 0.68 and the drop at 40s, off at 100s
+    assert (replay.flips, replay.alerts) == (2, 1)
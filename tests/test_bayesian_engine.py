@@ -0,0 +1,117 @@
+"""Tests for the log-odds Bayesian engine of the Growspace Manager integration."""
+
+import random
+
+import pytest
+
+from custom_components.growspace_manager.bayesian_data import (
+    PROB_ACCEPTABLE,
+    PROB_GOOD,
+    PROB_PERFECT,
+    PROB_STRESS_OUT_OF_RANGE,
+)
+from custom_components.growspace_manager.bayesian_engine import (
+    observation_evidence,
+    posterior_from_evidence,
+    posterior_probability,
+)
+from custom_components.growspace_manager.bayesian_evaluator import (
+    evaluate_direct_humidity_stress,
+    evaluate_direct_temp_stress,
+    evaluate_direct_vpd_stress,
+    evaluate_optimal_temperature,
+)
+from custom_components.growspace_manager.models import EnvironmentState
+
+
+def _multiplicative_posterior(prior, observations):
+    """Reference implementation: the original product-of-likelihoods update."""
+    if not observations:
+        return prior
+    prob_true = prior
+    prob_false = 1 - prior
+    for p_obs_given_true, p_obs_given_false in observations:
+        prob_true *= p_obs_given_true
+        prob_false *= p_obs_given_false
+    total = prob_true + prob_false
+    if total == 0:
+        return prior
+    return prob_true / total
+
+
+def _evaluator_cases():
+    """Build observation sets with the rule functions of the evaluator."""
+    cases = []
+    for temp, humidity, vpd, flower_days in [
+        (25.0, 55.0, 1.2, 0),
+        (33.0, 75.0, 0.3, 10),
+        (17.0, 40.0, 2.0, 50),
+        (28.0, 68.0, 1.6, 40),
+    ]:
+        state = EnvironmentState(
+            temp=temp,
+            humidity=humidity,
+            vpd=vpd,
+            co2=None,
+            veg_days=0 if flower_days else 20,
+            flower_days=flower_days,
+            is_lights_on=True,
+            fan_off=False,
+        )
+        observations = []
+        for evaluate in (
+            evaluate_direct_temp_stress,
+            evaluate_direct_humidity_stress,
+            evaluate_direct_vpd_stress,
+        ):
+            observations.extend(evaluate(state, {})[0])
+        cases.append((0.15, observations))
+        cases.append((0.4, evaluate_optimal_temperature(state, {})[0]))
+    cases.extend(
+        [
+            (0.5, []),
+            (0.5, [(0, 0)]),
+            (0.5, [(0.0, 1.0), (0.0, 1.0)]),
+            (0.5, [(1.0, 0.0), (1.0, 0.0)]),
+            (0.3, [PROB_PERFECT, PROB_GOOD, PROB_ACCEPTABLE, PROB_STRESS_OUT_OF_RANGE]),
+        ]
+    )
+    return cases
+
+
+@pytest.mark.parametrize("prior, observations", _evaluator_cases())
+def test_log_odds_matches_multiplicative_update(prior, observations):
+    """Test that the direct and log-odds paths agree with the original update."""
+    expected = _multiplicative_posterior(prior, observations)
+
+    assert posterior_probability(prior, observations) == pytest.approx(expected)
+    log_odds = posterior_from_evidence(prior, (observation_evidence(observations),))
+    assert log_odds == pytest.approx(expected)
+
+
+def test_decisions_match_per_sensor_engine():
+    """Test that every sensor is decided like the old loop."""
+    rng = random.Random(42)
+    thresholds = [step / 20 for step in range(1, 20)]
+    for _ in range(300):
+        prior = rng.uniform(0.05, 0.95)
+        observations = [
+            (rng.uniform(0.05, 0.99), rng.uniform(0.05, 0.99))
+            for _ in range(rng.randint(0, 12))
+        ]
+        expected = _multiplicative_posterior(prior, observations)
+        scalar = posterior_probability(prior, observations)
+        for threshold in thresholds:
+            assert (scalar > threshold) == (expected > threshold)
+
+
+def test_many_observations_do_not_underflow():
+    """Test that long evidence chains keep their direction."""
+    observations = [(0.3, 0.2)] * 2000
+    # The multiplicative update underflows to 0/0 and returns the prior
+    assert _multiplicative_posterior(0.2, observations) == 0.2
+
+    assert posterior_probability(0.2, observations) == pytest.approx(1.0)
+    assert posterior_probability(0.2, [(0.2, 0.3)] * 2000) == pytest.approx(0.0)
+    # Near the float limits the direct update hands over to log-odds
+    assert posterior_probability(0.5, [(1e-200, 1e-150)] * 2) == pytest.approx(0.0)
@@ -0,0 +1,83 @@
+"""Tests for fitting Bayesian likelihoods from labeled history."""
+
+import pytest
+
+from custom_components.growspace_manager.backtest import ReplayState
+from custom_components.growspace_manager.bayesian_fitting import (
+    FitResult,
+    Incident,
+    LikelihoodFitter,
+    record_chunks,
+)
+
+START = 1_700_000_000.0
+HOUR = 3600.0
+ENV_CONFIG = {
+    "temperature_sensor": "sensor.temp",
+    "humidity_sensor": "sensor.humidity",
+    "light_sensor": "light.grow_light",
+}
+# Two three-hour heat incidents in two days of history
+INCIDENTS = [
+    Incident("stress", START + 6 * HOUR, START + 9 * HOUR),
+    Incident("stress", START + 30 * HOUR, START + 33 * HOUR),
+]
+
+
+def _history() -> list[ReplayState]:
+    """Build two days of readings every five minutes, hot during incidents."""
+    records = [
+        ReplayState("light.grow_light", "on", START, {}),
+        ReplayState("sensor.humidity", "55", START, {}),
+    ]
+    for step in range(0, 48 * 12):
+        at = START + step * 300
+        hot = any(incident.start <= at < incident.end for incident in INCIDENTS)
+        # One false alarm an hour outside the incidents
+        spike = not hot and step % 12 == 0
+        records.append(
+            ReplayState("sensor.temp", "33" if hot or spike else "25", at, {})
+        )
+    return records
+
+
+def _fit(chunk_duration: float, min_samples: int = 10) -> FitResult:
+    """Fit the synthetic history streamed in chunks of the given length."""
+    fitter = LikelihoodFitter(ENV_CONFIG, INCIDENTS, sample_interval=60)
+    for start, end, states in record_chunks(_history(), chunk_duration):
+        fitter.add_chunk(start, end, states)
+    return fitter.result(min_samples)
+
+
+def test_fit_separates_incident_likelihoods_and_prior():
+    """Test that rules firing during incidents get a high true likelihood."""
+    result = _fit(86400)
+
+    inside, outside = result.support["prob_temp_extreme_heat"]
+    assert inside == 2 * 180
+    assert result.priors["stress"] == pytest.approx(inside / (inside + outside), abs=1e-3)
+    true_likelihood, false_likelihood = result.likelihoods["prob_temp_extreme_heat"]
+    assert true_likelihood == pytest.approx(0.997, abs=1e-3)
+    # Each hourly spike lasts five one-minute samples
+    assert false_likelihood == pytest.approx(5 / 60, abs=0.01)
+    # The humidity rule never fired, so both sides stay near zero
+    assert result.likelihoods["prob_humidity_too_dry"][0] < 0.01
+    # No mold incidents were labeled
+    assert "mold_risk" not in result.priors
+    assert result.overrides["prior_stress"] == result.priors["stress"]
+
+
+def test_chunked_fit_matches_single_chunk():
+    """Test that streaming hourly chunks carries the last states over."""
+    assert _fit(3600) == _fit(86400)
+
+
+def test_min_samples_and_empty_history():
+    """Test that thinly supported values are not fitted."""
+    assert _fit(86400, min_samples=1000).overrides == {}
+
+    fitter = LikelihoodFitter(ENV_CONFIG, INCIDENTS)
+    fitter.add_chunk(START, START + HOUR, {})
+    assert fitter.result() == FitResult()
+    with pytest.raises(ValueError):
+        LikelihoodFitter(ENV_CONFIG, INCIDENTS, sample_interval=0)
@@ -0,0 +1,108 @@
+"""Tests for the incremental Bayesian rule evaluation of the Growspace Manager."""
+
+from dataclasses import replace
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.growspace_manager.bayesian_engine import posterior_probability
+from custom_components.growspace_manager.bayesian_evaluator import stress_rules
+from custom_components.growspace_manager.bayesian_incremental import (
+    DependentRule,
+    IncrementalEvaluator,
+    changed_fields,
+)
+from custom_components.growspace_manager.models import EnvironmentState
+
+STATE = EnvironmentState(
+    temp=31.0,
+    humidity=55.0,
+    vpd=1.2,
+    co2=900.0,
+    veg_days=20,
+    flower_days=0,
+    is_lights_on=True,
+    fan_off=False,
+)
+
+
+@pytest.fixture
+def stress_sensor():
+    """Return a minimal stand-in for a stress sensor with fallback trends."""
+    return SimpleNamespace(
+        env_config={
+            "temperature_sensor": "sensor.temp",
+            "humidity_sensor": "sensor.humidity",
+            "vpd_sensor": "sensor.vpd",
+        },
+        hass=MagicMock(),
+        _async_analyze_sensor_trend=AsyncMock(
+            return_value={"trend": "rising", "crossed_threshold": True}
+        ),
+    )
+
+
+def test_changed_fields():
+    """Test that only differing snapshot fields are reported."""
+    assert changed_fields(None, STATE) is None
+    assert changed_fields(STATE, STATE) == frozenset()
+    assert changed_fields(STATE, replace(STATE, humidity=70.0)) == {"humidity"}
+
+
+@pytest.mark.asyncio
+async def test_humidity_change_reruns_only_humidity_rules(stress_sensor):
+    """Test that a humidity update skips temperature, CO2 and VPD rules."""
+    evaluator = IncrementalEvaluator(stress_rules(stress_sensor))
+    await evaluator.async_evaluate(STATE)
+    assert evaluator.rules_run == len(evaluator.rules)
+    analyze = stress_sensor._async_analyze_sensor_trend
+    assert analyze.await_count == 3
+
+    updated = replace(STATE, humidity=85.0)
+    await evaluator.async_evaluate(updated)
+
+    # Humidity trend, humidity stress and desiccation
+    assert evaluator.rules_run == len(evaluator.rules) + 3
+    assert analyze.await_count == 4
+    assert analyze.await_args.args[0] == "sensor.humidity"
+
+    rebuilt = IncrementalEvaluator(stress_rules(stress_sensor))
+    await rebuilt.async_evaluate(updated)
+    assert evaluator.reasons == rebuilt.reasons
+    assert evaluator.attributes == rebuilt.attributes
+    assert evaluator.posterior(0.15) == pytest.approx(
+        posterior_probability(0.15, rebuilt.observations)
+    )
+
+
+@pytest.mark.asyncio
+async def test_rules_without_inputs_or_past_max_age_rerun():
+    """Test that volatile and expired rules run on every evaluation."""
+    volatile = MagicMock(return_value=([(0.9, 0.1)], [], {}))
+    timed = MagicMock(return_value=([(0.2, 0.6)], [(0.2, "Timed")], {}))
+    cached = MagicMock(return_value=([], [], {"cached": True}))
+    now = [100.0]
+    evaluator = IncrementalEvaluator(
+        [
+            DependentRule("volatile", None, volatile),
+            DependentRule("timed", frozenset({"temp"}), timed, max_age=60),
+            DependentRule("cached", frozenset({"temp"}), cached),
+        ],
+        clock=lambda: now[0],
+    )
+
+    await evaluator.async_evaluate(STATE)
+    now[0] = 130.0
+    await evaluator.async_evaluate(STATE)
+    assert (volatile.call_count, timed.call_count, cached.call_count) == (2, 1, 1)
+
+    now[0] = 161.0
+    await evaluator.async_evaluate(STATE)
+    assert (volatile.call_count, timed.call_count, cached.call_count) == (3, 2, 1)
+    assert evaluator.reasons == [(0.2, "Timed")]
+    assert evaluator.attributes == {"cached": True}
+
+    evaluator.invalidate()
+    await evaluator.async_evaluate(STATE)
+    assert cached.call_count == 2
@@ -0,0 +1,105 @@
+"""Tests for the Bayesian rule compiler of the Growspace Manager integration."""
+
+import pytest
+
+from custom_components.growspace_manager.bayesian_data import (
+    PROB_ACCEPTABLE,
+    PROB_GOOD,
+    PROB_PERFECT,
+    PROB_STRESS_OUT_OF_RANGE,
+)
+from custom_components.growspace_manager.bayesian_evaluator import (
+    evaluate_mold_risk_conditions,
+)
+from custom_components.growspace_manager.bayesian_rules import (
+    compile_table,
+    rules_for,
+)
+from custom_components.growspace_manager.models import EnvironmentState
+
+OPTIMAL_DAY_RULES = [
+    (("between", 24, 26), None, PROB_PERFECT, None),
+    (("between", 22, 28), None, PROB_GOOD, None),
+    (("between", 20, 29), None, PROB_ACCEPTABLE, None),
+    (("any",), None, PROB_STRESS_OUT_OF_RANGE, "Out ({value})"),
+]
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (19.99, PROB_STRESS_OUT_OF_RANGE),
+        (20, PROB_ACCEPTABLE),
+        (21.5, PROB_ACCEPTABLE),
+        (22, PROB_GOOD),
+        (24, PROB_PERFECT),
+        (26, PROB_PERFECT),
+        (26.01, PROB_GOOD),
+        (28.5, PROB_ACCEPTABLE),
+        (29, PROB_ACCEPTABLE),
+        (29.01, PROB_STRESS_OUT_OF_RANGE),
+    ],
+)
+def test_first_matching_rule_wins_at_every_boundary(value, expected):
+    """Test that overlapping inclusive ranges resolve in priority order."""
+    table = compile_table(OPTIMAL_DAY_RULES, {}, reason_index=1)
+    assert table.lookup(value).probability == expected
+
+
+def test_strict_conditions_and_overrides():
+    """Test exclusive bounds, unmatched values and env_config overrides."""
+    rules = [
+        (("gt", 32), "prob_heat", (0.98, 0.05), "Heat ({value})"),
+        (("inside", 16, 23), None, (0.85, 0.30), None),
+    ]
+    table = compile_table(rules, {"prob_heat": (0.6, 0.4)})
+
+    assert table.lookup(32) is None
+    assert table.lookup(16) is None
+    assert table.lookup(16.5).probability == (0.85, 0.30)
+    assert table.lookup(23) is None
+
+    observations, reasons = [], []
+    table.lookup(33.5).apply(33.5, observations, reasons)
+    assert observations == [(0.6, 0.4)]
+    assert reasons == [(0.6, "Heat (33.5)")]
+
+
+def test_rules_compile_once_per_env_config():
+    """Test that compiled rules are reused until the env_config is replaced."""
+    env_config = {"prob_temp_warm": (0.5, 0.4)}
+    rules = rules_for(env_config)
+    assert rules_for(env_config) is rules
+    assert rules.temp_stress["default"].lookup(29).probability == (0.5, 0.4)
+
+    replaced = {**env_config, "prob_temp_warm": (0.7, 0.2)}
+    assert rules_for(replaced) is not rules
+    assert rules_for(replaced).temp_stress["default"].lookup(29).probability == (
+        0.7,
+        0.2,
+    )
+
+
+def test_mold_risk_conditions_late_flower_night():
+    """Test the compiled mold-risk rules for a humid night in late flower."""
+    state = EnvironmentState(
+        temp=20,
+        humidity=65,
+        vpd=0.7,
+        co2=None,
+        veg_days=0,
+        flower_days=50,
+        is_lights_on=False,
+        fan_off=True,
+    )
+    observations, reasons = evaluate_mold_risk_conditions(state, {})
+
+    assert [reason for _, reason in reasons] == [
+        "Late Flower",
+        "Temp in danger zone (20)",
+        "Lights Off",
+        "Night Humidity High (65)",
+        "Night VPD Low (0.7)",
+        "Circulation Fan Off",
+    ]
+    assert observations[3] == (0.99, 0.10)
@@ -23,6 +23,7 @@ from custom_components.growspace_manager.binary_sensor import (
 import logging # Added this import
 
 from custom_components.growspace_manager.const import DOMAIN
+from custom_components.growspace_manager.environment_hub import EnvironmentHub
 
 MOCK_CONFIG_ENTRY_ID = "test_entry"
 
@@ -107,6 +108,20 @@ def mock_coordinator(mock_growspace):
     coordinator.is_notifications_enabled.return_value = True
     coordinator.async_add_listener = Mock()
     coordinator.calculate_days.side_effect = _calculate_days_side_effect
+
+    def _stage_summary_side_effect(growspace_id):
+        plants = coordinator.get_growspace_plants(growspace_id)
+        return {
+            "veg_days": max(
+                (coordinator.calculate_days(p.veg_start) for p in plants), default=0
+            ),
+            "flower_days": max(
+                (coordinator.calculate_days(p.flower_start) for p in plants),
+                default=0,
+            ),
+        }
+
+    coordinator.get_growspace_stage_summary.side_effect = _stage_summary_side_effect
     return coordinator
 
 
@@ -1046,6 +1061,94 @@ async def test_drying_sensor_skips_if_not_dry_growspace(
     mock_write_ha_state.assert_called_once()
 
 
+def _write_probabilities(sensor, probabilities, start, step=timedelta(seconds=10)):
+    """Write each probability in turn and return the on/off state after each."""
+    states = []
+    for index, probability in enumerate(probabilities):
+        sensor._probability = probability
+        with patch(
+            "custom_components.growspace_manager.binary_sensor.utcnow",
+            return_value=start + index * step,
+        ):
+            sensor._async_write_state()
+        states.append(sensor.is_on)
+    return states
+
+
+def test_bayesian_sensor_hysteresis_suppresses_flapping(mock_coordinator, env_config):
+    """Test that probabilities hovering around the threshold do not flap."""
+    sensor = BayesianStressSensor(
+        mock_coordinator,
+        "gs1",
+        {**env_config, "hysteresis_on": 0.05, "hysteresis_off": 0.05},
+    )
+    sensor.async_write_ha_state = MagicMock()
+
+    states = _write_probabilities(
+        sensor, [0.5, 0.72, 0.76, 0.68, 0.71, 0.66, 0.64], utcnow()
+    )
+
+    # On at threshold + 0.05, off only below threshold - 0.05 (0.70 threshold)
+    assert states == [False, False, True, True, True, True, False]
+    assert sensor.flips_suppressed == 3
+    assert sensor.stats["writes"] == sensor.async_write_ha_state.call_count == 7
+
+
+def test_bayesian_sensor_default_has_no_hysteresis(mock_coordinator, env_config):
+    """Test that without configured bands the sensor flips at the threshold."""
+    sensor = BayesianStressSensor(mock_coordinator, "gs1", env_config)
+    sensor.async_write_ha_state = MagicMock()
+
+    states = _write_probabilities(sensor, [0.5, 0.72, 0.68, 0.70], utcnow())
+
+    assert states == [False, True, False, True]
+    assert sensor.flips_suppressed == 0
+
+
+def test_bayesian_sensor_min_dwell_holds_state(mock_coordinator, env_config):
+    """Test that a state is held for its minimum duration, then re-checked."""
+    sensor = BayesianStressSensor(
+        mock_coordinator, "gs1", {**env_config, "min_on_duration": 60}
+    )
+    sensor.hass = MagicMock()
+    sensor.async_write_ha_state = MagicMock()
+    sensor.async_update_and_notify = MagicMock()
+
+    with patch(
+        "custom_components.growspace_manager.binary_sensor.async_call_later"
+    ) as mock_call_later:
+        states = _write_probabilities(sensor, [0.1, 0.9, 0.1, 0.1, 0.1], utcnow())
+        # The second timer request is ignored while the first is pending
+        mock_call_later.assert_called_once()
+        assert mock_call_later.call_args.args[1] == timedelta(seconds=50)
+
+    assert states == [False, True, True, True, True]
+    sensor._async_dwell_elapsed(utcnow())
+    sensor.hass.async_create_task.assert_called_once_with(
+        sensor.async_update_and_notify.return_value
+    )
+
+    start = utcnow() + timedelta(minutes=5)
+    assert _write_probabilities(sensor, [0.1], start) == [False]
+
+
+def test_bayesian_sensor_skips_immaterial_writes(mock_coordinator, env_config):
+    """Test that unchanged state, reasons and probability are not rewritten."""
+    sensor = BayesianStressSensor(mock_coordinator, "gs1", env_config)
+    sensor.async_write_ha_state = MagicMock()
+
+    _write_probabilities(sensor, [0.3, 0.301, 0.304, 0.31], utcnow())
+    assert sensor.stats == {
+        "writes": 2,
+        "writes_suppressed": 2,
+        "flips_suppressed": 0,
+    }
+
+    sensor._reasons = [(0.9, "High Heat (31)")]
+    _write_probabilities(sensor, [0.31], utcnow())
+    assert sensor.writes == 3
+
+
 def test_light_cycle_verification_sensor_is_on_property(mock_coordinator, env_config):
     """Test the is_on property of LightCycleVerificationSensor."""
     sensor = LightCycleVerificationSensor(mock_coordinator, "gs1", env_config)
@@ -1216,15 +1319,15 @@ async def test_light_cycle_async_added_to_hass_with_light_entity(
 
     await sensor.async_added_to_hass()
 
-    mock_coordinator.async_add_listener.assert_called_once_with(
-        sensor._handle_coordinator_update
+    mock_coordinator.async_subscribe_growspace.assert_called_once_with(
+        "gs1", sensor._handle_coordinator_update
     )
     mock_track_state_change.assert_called_once_with(
         sensor.hass,
         [sensor.light_entity_id],
         sensor._async_light_sensor_changed,
     )
-    sensor.async_on_remove.assert_called_once()
+    assert sensor.async_on_remove.call_count == 2
     sensor.async_update.assert_awaited_once()
 
 
@@ -1242,11 +1345,11 @@ async def test_light_cycle_async_added_to_hass_without_light_entity(
 
     await sensor.async_added_to_hass()
 
-    mock_coordinator.async_add_listener.assert_called_once_with(
-        sensor._handle_coordinator_update
+    mock_coordinator.async_subscribe_growspace.assert_called_once_with(
+        "gs1", sensor._handle_coordinator_update
     )
     mock_track_state_change.assert_not_called()
-    sensor.async_on_remove.assert_not_called()
+    sensor.async_on_remove.assert_called_once()
     sensor.async_update.assert_awaited_once()
 
 
@@ -1291,6 +1394,7 @@ class TestBayesianEnvironmentSensor:
             sensor.coordinator = mock_coordinator
             sensor.growspace_id = "gs1"
             sensor.env_config = env_config
+            sensor._hub = EnvironmentHub(mock_coordinator, "gs1", env_config)
             sensor._probability = 0.6789
             sensor.threshold = 0.5
             sensor._sensor_states = {"temp": 25, "humidity": 60}
@@ -1311,6 +1415,10 @@ class TestBayesianEnvironmentSensor:
         assert attrs["threshold"] == 0.5
         assert attrs["observations"] == {"temp": 25, "humidity": 60}
         assert attrs["reasons"] == ["Reason A", "Reason B", "Reason C"]
+        assert attrs["summary"] == {"probability": 0.7, "reasons": 3}
+        assert {"probability", "observations", "reasons"} <= (
+            base_sensor._unrecorded_attributes
+        )
 
     @pytest.mark.parametrize(
         "prior, observations, expected_probability",
@@ -1417,99 +1525,22 @@ class TestBayesianEnvironmentSensor:
         assert result == {"veg_days": 0, "flower_days": 0}
 
     @pytest.mark.asyncio
-    @patch("custom_components.growspace_manager.binary_sensor.async_track_state_change_event")
-    async def test_async_added_to_hass_scenarios(
-        self, mock_track_state_change, base_sensor
-    ):
-        """Test async_added_to_hass with different sensor configurations."""
+    async def test_async_added_to_hass_registers_with_hub(self, base_sensor):
+        """Test that async_added_to_hass listens to the shared environment hub."""
         base_sensor.hass = MagicMock()
         base_sensor.async_on_remove = MagicMock()
         base_sensor.async_update_and_notify = AsyncMock()
-        base_sensor.coordinator.async_add_listener = MagicMock()
-
-        # Scenario 1: All sensors configured
-        base_sensor.env_config = {
-            "temperature_sensor": "sensor.temp",
-            "humidity_sensor": "sensor.humidity",
-            "vpd_sensor": "sensor.vpd",
-            "co2_sensor": "sensor.co2",
-            "circulation_fan": "switch.fan",
-        }
-        await base_sensor.async_added_to_hass()
-        base_sensor.coordinator.async_add_listener.assert_called_once_with(
-            base_sensor._handle_coordinator_update
-        )
-        mock_track_state_change.assert_called_once_with(
-            base_sensor.hass,
-            [
-                "sensor.temp",
-                "sensor.humidity",
-                "sensor.vpd",
-                "sensor.co2",
-                "switch.fan",
-            ],
-            base_sensor._async_sensor_changed,
-        )
-        base_sensor.async_on_remove.assert_called_once()
-        base_sensor.async_update_and_notify.assert_awaited_once()
-
-        # Reset mocks for next scenario
-        base_sensor.coordinator.async_add_listener.reset_mock()
-        mock_track_state_change.reset_mock()
-        base_sensor.async_on_remove.reset_mock()
-        base_sensor.async_update_and_notify.reset_mock()
-
-        # Scenario 2: Some sensors are None
-        base_sensor.env_config = {
-            "temperature_sensor": "sensor.temp",
-            "humidity_sensor": None,
-            "vpd_sensor": "sensor.vpd",
-            "co2_sensor": None,
-            "circulation_fan": "switch.fan",
-        }
-        await base_sensor.async_added_to_hass()
-        mock_track_state_change.assert_called_once_with(
-            base_sensor.hass,
-            ["sensor.temp", "sensor.vpd", "switch.fan"],
-            base_sensor._async_sensor_changed,
-        )
+        base_sensor._hub = MagicMock()
 
-        # Reset mocks for next scenario
-        base_sensor.coordinator.async_add_listener.reset_mock()
-        mock_track_state_change.reset_mock()
-        base_sensor.async_on_remove.reset_mock()
-        base_sensor.async_update_and_notify.reset_mock()
-
-        # Scenario 3: No sensors configured
-        base_sensor.env_config = {
-            "temperature_sensor": None,
-            "humidity_sensor": None,
-            "vpd_sensor": None,
-            "co2_sensor": None,
-            "circulation_fan": None,
-        }
         await base_sensor.async_added_to_hass()
-        mock_track_state_change.assert_called_once_with(
-            base_sensor.hass, [], base_sensor._async_sensor_changed
-        )
 
-    def test_handle_coordinator_update_calls_async_update_and_notify(self, base_sensor):
-        """Test that _handle_coordinator_update calls async_update_and_notify."""
-        base_sensor.hass = MagicMock()
-        base_sensor.async_update_and_notify = MagicMock()
-        base_sensor._handle_coordinator_update()
-        base_sensor.hass.async_create_task.assert_called_once_with(
-            base_sensor.async_update_and_notify()
+        base_sensor._hub.async_add_evaluator.assert_called_once_with(
+            base_sensor.async_update_and_notify
         )
-
-    def test_async_sensor_changed_calls_async_update_and_notify(self, base_sensor):
-        """Test that _async_sensor_changed calls async_update_and_notify."""
-        base_sensor.hass = MagicMock()
-        base_sensor.async_update_and_notify = MagicMock()
-        base_sensor._async_sensor_changed(None)
-        base_sensor.hass.async_create_task.assert_called_once_with(
-            base_sensor.async_update_and_notify()
+        base_sensor.async_on_remove.assert_called_once_with(
+            base_sensor._hub.async_add_evaluator.return_value
         )
+        base_sensor.async_update_and_notify.assert_awaited_once()
 
     def test_get_sensor_value_no_sensor_id(self, base_sensor):
         """Test _get_sensor_value returns None if no sensor_id is provided."""
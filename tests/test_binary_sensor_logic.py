@@ -6,7 +6,6 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timedelta
 
 from homeassistant.core import HomeAssistant
-from homeassistant.util.dt import utcnow
 
 
 from custom_components.growspace_manager.binary_sensor import (
@@ -138,9 +137,12 @@ async def test_mold_risk_sensor_late_flower(
     set_sensor_state(hass, "sensor.vpd", 1.0)  # Low VPD at night
     await hass.async_block_till_done()
 
-    sensor._days_since = lambda date_str: (
-        utcnow().date() - datetime.fromisoformat(date_str).date()
-    ).days
+    mock_coordinator.get_growspace_stage_summary.return_value = {
+        "veg_days": 0,
+        "flower_days": 40,
+        "veg_week": 0,
+        "flower_week": 6,
+    }
 
     with (
         patch(
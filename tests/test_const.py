@@ -5,9 +5,11 @@ from datetime import date
 import voluptuous as vol
 
 from custom_components.growspace_manager.const import (
+    valid_date,
     valid_date_or_none,
     valid_growspace_id,
     ADD_PLANT_SCHEMA,
+    FIT_BAYESIAN_LIKELIHOODS_SCHEMA,
 )
 
 # --------------------
@@ -44,6 +46,20 @@ def test_valid_date_or_none_with_invalid_string():
     with pytest.raises(vol.Invalid):
         valid_date_or_none("not a date")
 
+def test_valid_date_rejects_empty_values():
+    """Test that valid_date requires a date, unlike valid_date_or_none."""
+    assert valid_date(date(2024, 5, 1)) == date(2024, 5, 1)
+    for value in (None, ""):
+        with pytest.raises(vol.Invalid):
+            valid_date(value)
+    with pytest.raises(vol.Invalid):
+        FIT_BAYESIAN_LIKELIHOODS_SCHEMA(
+            {
+                "growspace_id": "gs1",
+                "incidents": [{"sensor": "stress", "start": None, "end": "2024-05-01"}],
+            }
+        )
+
 # --------------------
 # valid_growspace_id
 # --------------------
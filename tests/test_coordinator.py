@@ -7,13 +7,15 @@ creation, updating, removal, and various stage transitions. It also tests
 data migration, validation, and helper methods.
 """
 
+import sqlite3
+
 import pytest
 from freezegun import freeze_time
 from datetime import date, datetime, timedelta
 from dateutil import parser
 from unittest.mock import patch, AsyncMock, MagicMock, Mock
 
-from custom_components.growspace_manager.const import DOMAIN
+from custom_components.growspace_manager.const import DOMAIN, STORAGE_KEY
 from custom_components.growspace_manager.config_flow import OptionsFlowHandler
 from custom_components.growspace_manager.coordinator import Growspace
 from custom_components.growspace_manager.coordinator import GrowspaceCoordinator
@@ -22,8 +24,10 @@ from custom_components.growspace_manager.const import (
     PLANT_STAGES,
     SPECIAL_GROWSPACES,
 )
+from homeassistant.exceptions import ServiceNotFound
 from homeassistant.helpers import entity_registry as er
 from custom_components.growspace_manager.models import Growspace
+from custom_components.growspace_manager.strain_library import StrainLibrary
 
 
 @pytest.fixture
@@ -1237,6 +1241,624 @@ async def test_async_switch_plants_different_growspaces(coordinator):
         await coordinator.async_switch_plants(plant1.plant_id, plant2.plant_id)
 
 
+@pytest.mark.asyncio
+async def test_plant_index_tracks_mutations(coordinator):
+    """Test that the plant index stays consistent across plant mutations.
+    Args:
+        coordinator: The mock GrowspaceCoordinator.
+    """
+    gs1 = await coordinator.async_add_growspace("GS1", rows=2, plants_per_row=2)
+    gs2 = await coordinator.async_add_growspace("GS2", rows=2, plants_per_row=2)
+    plant1 = await coordinator.async_add_plant(gs1.id, "Strain A", row=1, col=1)
+    plant2 = await coordinator.async_add_plant(gs1.id, "Strain B", row=1, col=2)
+    assert coordinator.verify_plant_index() == []
+
+    await coordinator.async_switch_plants(plant1.plant_id, plant2.plant_id)
+    assert coordinator.verify_plant_index() == []
+    with pytest.raises(ValueError, match="Strain A"):
+        coordinator._validate_position_not_occupied(gs1.id, 1, 2)
+
+    await coordinator.async_update_plant(
+        plant1.plant_id, growspace_id=gs2.id, row=2, col=2
+    )
+    assert coordinator.get_growspace_plants(gs1.id) == [plant2]
+    assert coordinator.get_growspace_plants(gs2.id) == [plant1]
+    assert coordinator._find_first_available_position(gs1.id) == (1, 2)
+    assert coordinator.verify_plant_index() == []
+
+    await coordinator.async_harvest_plant(plant2.plant_id, None, "dry", None)
+    assert coordinator.get_growspace_plants(gs1.id) == []
+    assert plant2 in coordinator.get_growspace_plants("dry")
+    assert coordinator.verify_plant_index() == []
+
+    await coordinator.async_remove_growspace(gs2.id)
+    assert plant1.plant_id not in coordinator.plants
+    assert coordinator.verify_plant_index() == []
+
+
+@pytest.mark.asyncio
+async def test_plant_index_mother_lookup(coordinator):
+    """Test that mothers are found by strain and phenotype through the index.
+    Args:
+        coordinator: The mock GrowspaceCoordinator.
+    """
+    mother = await coordinator.async_add_mother_plant(
+        phenotype="Pheno", strain="Strain M", row=1, col=1, stage="mother"
+    )
+    assert coordinator._find_mother_by_strain("strain m", "PHENO") is mother
+    assert coordinator._find_mother_by_strain("strain m", "other") is None
+
+    await coordinator.async_transition_plant_stage(mother.plant_id, "veg", None)
+    assert coordinator._find_mother_by_strain("Strain M", "Pheno") is None
+    assert coordinator.verify_plant_index() == []
+
+
+def test_plant_index_rebuilds_when_plants_replaced(coordinator):
+    """Test that the index rebuilds when the plants dictionary is swapped out.
+    Args:
+        coordinator: The mock GrowspaceCoordinator.
+    """
+    coordinator.plants = {"p1": Plant(plant_id="p1", growspace_id="gs1", strain="A")}
+    assert [p.plant_id for p in coordinator.get_growspace_plants("gs1")] == ["p1"]
+    assert coordinator.verify_plant_index() == []
+
+    coordinator.plants["p1"].row = 3
+    assert coordinator.verify_plant_index()
+    coordinator.reindex_plant("p1")
+    assert coordinator.verify_plant_index() == []
+
+
+@pytest.mark.asyncio
+async def test_async_save_write_through_counts(coordinator):
+    """Test that saves are written immediately when no delay is configured.
+    Args:
+        coordinator: The mock GrowspaceCoordinator.
+    """
+    await coordinator.async_save()
+    await coordinator.async_save()
+
+    assert coordinator.save_stats["requested"] == 2
+    assert coordinator.save_stats["written"] == 2
+    assert coordinator.save_stats["pending"] is False
+
+
+@pytest.mark.asyncio
+async def test_async_save_write_behind_coalesces(hass, hass_storage):
+    """Test that delayed saves are coalesced and written once on flush."""
+    coordinator = GrowspaceCoordinator(
+        hass, data={}, options={"global_settings": {"save_delay": 30}}
+    )
+    coordinator.async_set_updated_data = MagicMock()
+
+    gs = await coordinator.async_add_growspace("Write Behind GS")
+    await coordinator.async_add_plant(gs.id, "Strain A")
+    await coordinator.async_add_plant(gs.id, "Strain B")
+
+    assert coordinator.save_stats["requested"] == 3
+    assert coordinator.save_stats["written"] == 0
+    assert coordinator.save_stats["pending"] is True
+
+    await coordinator.async_flush()
+
+    assert coordinator.save_stats["written"] == 1
+    assert coordinator.save_stats["pending"] is False
+    assert len(hass_storage[STORAGE_KEY]["data"]["plants"]) == 2
+
+    # Nothing pending, so a second flush is a no-op
+    await coordinator.async_flush()
+    assert coordinator.save_stats["written"] == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_single_save_and_notification(hass):
+    """Test that a batch coalesces saves and listener notifications."""
+    coordinator = GrowspaceCoordinator(hass, data={})
+    mother = await coordinator.async_add_mother_plant("Pheno1", "StrainC", 1, 1)
+
+    listener = MagicMock()
+    unsub = coordinator.async_add_listener(listener)
+    writes_before = coordinator.save_stats["written"]
+
+    clones = await coordinator.async_take_clones(mother.plant_id, 4, None, None, None)
+
+    assert len(clones) == 4
+    assert listener.call_count == 1
+    assert coordinator.save_stats["written"] == writes_before + 1
+    unsub()
+
+
+@pytest.mark.asyncio
+async def test_batch_rolls_back_on_error(hass):
+    """Test that a failing batch restores in-memory state and skips saving."""
+    coordinator = GrowspaceCoordinator(hass, data={})
+    gs = await coordinator.async_add_growspace("Batch GS")
+    plant = await coordinator.async_add_plant(gs.id, "Strain A", row=1, col=1)
+
+    listener = MagicMock()
+    unsub = coordinator.async_add_listener(listener)
+    writes_before = coordinator.save_stats["written"]
+
+    with pytest.raises(RuntimeError):
+        async with coordinator.batch():
+            await coordinator.async_add_plant(gs.id, "Strain B", row=1, col=2)
+            await coordinator.async_update_plant(plant.plant_id, strain="Changed")
+            raise RuntimeError("boom")
+
+    assert list(coordinator.plants) == [plant.plant_id]
+    assert coordinator.plants[plant.plant_id].strain == "Strain A"
+    assert coordinator.get_growspace_plants(gs.id)[0].plant_id == plant.plant_id
+    assert coordinator.verify_plant_index() == []
+    assert coordinator.save_stats["written"] == writes_before
+    listener.assert_not_called()
+    unsub()
+
+
+@pytest.mark.asyncio
+async def test_batch_rollback_restores_only_touched_records(hass):
+    """Test that a batch journals the records it changes and restores them."""
+    coordinator = GrowspaceCoordinator(hass, data={})
+    gs = await coordinator.async_add_growspace("Batch GS", rows=1, plants_per_row=3)
+    p1 = await coordinator.async_add_plant(
+        gs.id, "Strain A", row=1, col=1, veg_start="2025-03-01"
+    )
+    p2 = await coordinator.async_add_plant(gs.id, "Strain B", row=1, col=2)
+    untouched = await coordinator.async_add_plant(gs.id, "Strain C", row=1, col=3)
+
+    with pytest.raises(RuntimeError):
+        async with coordinator.batch():
+            await coordinator.async_switch_plants(p1.plant_id, p2.plant_id)
+            await coordinator.async_update_growspace(
+                gs.id, name="Renamed", rows=1, plants_per_row=3
+            )
+            await coordinator.set_notifications_enabled(gs.id, False)
+            await coordinator.mark_notification_sent(p1.plant_id, "veg", 10)
+            new_gs = await coordinator.async_add_growspace("New GS")
+            # A summary cached from the changed state must not outlive the rollback
+            coordinator.get_plant_stage_summary(p1.plant_id)
+
+            assert set(coordinator._batch_plants) == {p1.plant_id, p2.plant_id}
+            assert set(coordinator._batch_growspaces) == {gs.id, new_gs.id}
+            raise RuntimeError("boom")
+
+    restored = coordinator.plants
+    assert (restored[p1.plant_id].row, restored[p1.plant_id].col) == (1, 1)
+    assert (restored[p2.plant_id].row, restored[p2.plant_id].col) == (1, 2)
+    assert coordinator.plants[untouched.plant_id] is untouched
+    assert coordinator.growspaces[gs.id].name == "Batch GS"
+    assert coordinator.is_notifications_enabled(gs.id) is True
+    assert new_gs.id not in coordinator.growspaces
+    assert new_gs.id not in coordinator._notifications_enabled
+    assert p1.plant_id not in coordinator._notifications_sent
+    assert coordinator._plant_stage_summaries == {}
+    assert coordinator.verify_plant_index() == []
+    assert coordinator._batch_plants == {}
+
+
+@pytest.mark.asyncio
+async def test_async_transition_plants_single_update(hass):
+    """Test that bulk transitions save and notify listeners once."""
+    coordinator = GrowspaceCoordinator(hass, data={})
+    gs = await coordinator.async_add_growspace("Bulk GS", rows=2, plants_per_row=2)
+    added = await coordinator.async_add_plants(
+        gs.id, [{"strain": "Strain A"}, {"strain": "Strain B"}]
+    )
+    plant_ids = [result["plant_id"] for result in added]
+
+    listener = MagicMock()
+    unsub = coordinator.async_add_listener(listener)
+    writes_before = coordinator.save_stats["written"]
+
+    results = await coordinator.async_transition_plants(
+        [*plant_ids, "missing"], "flower", "2025-01-01"
+    )
+
+    assert [result["success"] for result in results] == [True, True, False]
+    assert all(coordinator.plants[pid].stage == "flower" for pid in plant_ids)
+    assert coordinator.plants[plant_ids[0]].flower_start.startswith("2025-01-01")
+    assert listener.call_count == 1
+    assert coordinator.save_stats["written"] == writes_before + 1
+    unsub()
+
+    with pytest.raises(ValueError, match="Invalid stage"):
+        await coordinator.async_transition_plants(plant_ids, "bogus")
+
+
+@pytest.mark.asyncio
+async def test_async_move_plants_swaps_occupied(coordinator):
+    """Test that bulk moves swap with plants already in the target cell.
+
+    Args:
+        coordinator: The mock GrowspaceCoordinator.
+    """
+    gs = await coordinator.async_add_growspace("Move GS", rows=2, plants_per_row=2)
+    p1 = await coordinator.async_add_plant(gs.id, "Strain A", row=1, col=1)
+    p2 = await coordinator.async_add_plant(gs.id, "Strain B", row=1, col=2)
+
+    results = await coordinator.async_move_plants(
+        [
+            {"plant_id": p1.plant_id, "new_row": 1, "new_col": 2},
+            {"plant_id": p2.plant_id, "new_row": 5, "new_col": 5},
+        ]
+    )
+
+    assert results[0]["success"] is True
+    assert results[0]["swapped_with"] == p2.plant_id
+    assert results[1]["success"] is False
+    assert (p1.row, p1.col) == (1, 2)
+    assert (p2.row, p2.col) == (1, 1)
+    assert coordinator.verify_plant_index() == []
+
+
+@pytest.mark.asyncio
+async def test_async_harvest_plants_records_once(coordinator):
+    """Test that bulk harvests write strain analytics in one call.
+
+    Args:
+        coordinator: The mock GrowspaceCoordinator.
+    """
+    gs = await coordinator.async_add_growspace("Harvest GS", rows=2, plants_per_row=2)
+    plants = [
+        await coordinator.async_add_plant(
+            gs.id,
+            "Strain A",
+            row=1,
+            col=col,
+            stage="flower",
+            veg_start="2025-01-01",
+            flower_start="2025-02-01",
+        )
+        for col in (1, 2)
+    ]
+    coordinator.strains.record_harvest = AsyncMock()
+    coordinator.strains.record_harvests = AsyncMock()
+
+    results = await coordinator.async_harvest_plants(
+        [plant.plant_id for plant in plants], transition_date="2025-03-01"
+    )
+
+    assert all(result["success"] for result in results)
+    assert all(plant.stage == "dry" for plant in plants)
+    coordinator.strains.record_harvest.assert_not_called()
+    coordinator.strains.record_harvests.assert_awaited_once()
+    assert len(coordinator.strains.record_harvests.call_args.args[0]) == 2
+    assert coordinator._pending_harvests is None
+
+
+@freeze_time("2025-06-01")
+@pytest.mark.asyncio
+async def test_archive_finished_plants_moves_old_cures(hass, tmp_path):
+    """Test that long-cured plants move to the archive and can be read back."""
+    library = StrainLibrary(hass)
+    library._db_path = str(tmp_path / "strain_library.db")
+    await library.async_setup()
+    coordinator = GrowspaceCoordinator(
+        hass,
+        data={},
+        options={"global_settings": {"archive_after_days": 30}},
+        strain_library=library,
+    )
+    try:
+        gs = await coordinator.async_add_growspace("Cure Jars", rows=1, plants_per_row=3)
+        old = await coordinator.async_add_plant(
+            gs.id, "Strain A", col=1, stage="cure", cure_start="2025-04-01"
+        )
+        young = await coordinator.async_add_plant(
+            gs.id, "Strain A", col=2, stage="cure", cure_start="2025-05-25"
+        )
+        flowering = await coordinator.async_add_plant(
+            gs.id, "Strain B", col=3, stage="flower", flower_start="2025-01-01"
+        )
+        await coordinator.mark_notification_sent(old.plant_id, "cure", 30)
+
+        archived = await coordinator.async_archive_finished_plants()
+
+        assert archived == [old.plant_id]
+        assert old.plant_id not in coordinator.plants
+        assert old.plant_id not in coordinator._notifications_sent
+        assert {young.plant_id, flowering.plant_id} <= set(coordinator.plants)
+        assert coordinator.last_changes.plants_removed == {old.plant_id}
+
+        rows = await library.get_archived_plants(strain="Strain A")
+        assert [row["plant_id"] for row in rows] == [old.plant_id]
+        assert rows[0]["cure_start"].startswith("2025-04-01")
+        assert rows[0]["archived_at"]
+
+        # Explicit IDs skip plants that are not finished
+        assert await coordinator.async_archive_finished_plants(
+            plant_ids=[young.plant_id, flowering.plant_id]
+        ) == [young.plant_id]
+        assert len(await library.get_archived_plants(strain="Strain A", limit=1)) == 1
+        assert len(await library.get_archived_plants(plant_id=old.plant_id)) == 1
+    finally:
+        await library.async_close()
+
+
+@pytest.mark.asyncio
+async def test_archive_finished_plants_disabled_by_default(hass):
+    """Test that automatic archiving does nothing without a configured age."""
+    coordinator = GrowspaceCoordinator(hass, data={})
+    coordinator.strains.archive_plants = AsyncMock()
+    gs = await coordinator.async_add_growspace("Cure Jars")
+    await coordinator.async_add_plant(
+        gs.id, "Strain A", stage="cure", cure_start="2020-01-01"
+    )
+
+    assert await coordinator.async_archive_finished_plants() == []
+    coordinator.strains.archive_plants.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_scheduled_archive_logs_database_errors(hass, caplog):
+    """Test that a failing background archive is logged and keeps the plants."""
+    coordinator = GrowspaceCoordinator(
+        hass, data={}, options={"global_settings": {"archive_after_days": 30}}
+    )
+    coordinator.strains.archive_plants = AsyncMock(
+        side_effect=sqlite3.OperationalError("database is locked")
+    )
+    gs = await coordinator.async_add_growspace("Cure Jars")
+    plant = await coordinator.async_add_plant(
+        gs.id, "Strain A", stage="cure", cure_start="2020-01-01"
+    )
+
+    coordinator.async_schedule_archive()
+    await hass.async_block_till_done()
+
+    coordinator.strains.archive_plants.assert_awaited_once()
+    assert plant.plant_id in coordinator.plants
+    assert "Failed to archive finished plants" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_change_set_targets_subscribers(hass):
+    """Test that updates only reach subscribers of the touched plant and growspace."""
+    coordinator = GrowspaceCoordinator(hass, data={})
+    gs1 = await coordinator.async_add_growspace("GS 1")
+    gs2 = await coordinator.async_add_growspace("GS 2")
+    p1 = await coordinator.async_add_plant(gs1.id, "Strain A", row=1, col=1)
+    p2 = await coordinator.async_add_plant(gs2.id, "Strain B", row=1, col=1)
+
+    p1_listener, p2_listener = MagicMock(), MagicMock()
+    gs1_listener, gs2_listener = MagicMock(), MagicMock()
+    coordinator.async_subscribe_plant(p1.plant_id, p1_listener)
+    unsub_p2 = coordinator.async_subscribe_plant(p2.plant_id, p2_listener)
+    coordinator.async_subscribe_growspace(gs1.id, gs1_listener)
+    coordinator.async_subscribe_growspace(gs2.id, gs2_listener)
+
+    await coordinator.async_update_plant(p1.plant_id, strain="Renamed")
+
+    changes = coordinator.last_changes
+    assert changes.plants_changed == {p1.plant_id}
+    assert changes.growspaces_changed == {gs1.id}
+    assert not changes.is_structural
+    p1_listener.assert_called_once()
+    gs1_listener.assert_called_once()
+    p2_listener.assert_not_called()
+    gs2_listener.assert_not_called()
+
+    # Moving a plant between growspaces touches both
+    await coordinator.async_update_plant(p1.plant_id, growspace_id=gs2.id, col=2)
+    assert coordinator.last_changes.growspaces_changed == {gs1.id, gs2.id}
+    gs2_listener.assert_called_once()
+
+    # Updates without recorded changes reach everyone
+    unsub_p2()
+    coordinator.async_set_updated_data(coordinator.data)
+    assert coordinator.last_changes.full
+    assert p1_listener.call_count == 3
+    p2_listener.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_growspace_data_version_tracks_touched_growspaces(hass):
+    """Test that only updates touching a growspace advance its data version."""
+    coordinator = GrowspaceCoordinator(hass, data={})
+    gs1 = await coordinator.async_add_growspace("GS 1")
+    gs2 = await coordinator.async_add_growspace("GS 2")
+    plant = await coordinator.async_add_plant(gs1.id, "Strain A", row=1, col=1)
+    gs1_version = coordinator.growspace_data_version(gs1.id)
+    gs2_version = coordinator.growspace_data_version(gs2.id)
+    assert gs1_version > gs2_version
+
+    await coordinator.async_update_plant(plant.plant_id, strain="Renamed")
+    assert coordinator.growspace_data_version(gs1.id) > gs1_version
+    assert coordinator.growspace_data_version(gs2.id) == gs2_version
+
+    # Updates of unknown scope advance every growspace
+    coordinator.async_set_updated_data(coordinator.data)
+    assert coordinator.growspace_data_version(gs2.id) == coordinator.data_version
+
+
+@pytest.mark.asyncio
+async def test_change_set_structural_changes(hass):
+    """Test that additions and removals are published as structural changes."""
+    coordinator = GrowspaceCoordinator(hass, data={})
+    gs = await coordinator.async_add_growspace("GS")
+    assert coordinator.last_changes.growspaces_added == {gs.id}
+
+    async with coordinator.batch():
+        p1 = await coordinator.async_add_plant(gs.id, "Strain A", row=1, col=1)
+        p2 = await coordinator.async_add_plant(gs.id, "Strain A", row=1, col=2)
+
+    assert coordinator.last_changes.plants_added == {p1.plant_id, p2.plant_id}
+    assert coordinator.last_changes.is_structural
+
+    await coordinator.async_remove_growspace(gs.id)
+    assert coordinator.last_changes.plants_removed == {p1.plant_id, p2.plant_id}
+    assert coordinator.last_changes.growspaces_removed == {gs.id}
+
+
+@pytest.mark.asyncio
+async def test_stage_summary_cached_until_change_or_new_day(coordinator):
+    """Test that stage summaries are reused until a plant changes or the day rolls over.
+
+    Args:
+        coordinator: The mock GrowspaceCoordinator.
+    """
+    with freeze_time("2025-03-11 12:00:00"):
+        gs = await coordinator.async_add_growspace("Summary GS")
+        p1 = await coordinator.async_add_plant(
+            gs.id, "Strain A", row=1, col=1, veg_start="2025-03-01"
+        )
+        await coordinator.async_add_plant(
+            gs.id, "Strain B", row=1, col=2, veg_start="2025-02-25"
+        )
+
+        summary = coordinator.get_plant_stage_summary(p1.plant_id)
+        assert summary["veg_days"] == 10
+        assert summary["veg_week"] == 2
+        assert coordinator.get_plant_stage_summary(p1.plant_id) is summary
+
+        gs_summary = coordinator.get_growspace_stage_summary(gs.id)
+        assert gs_summary["veg_days"] == 14
+        assert gs_summary["flower_days"] == 0
+
+        await coordinator.async_update_plant(p1.plant_id, flower_start="2025-03-08")
+        summary = coordinator.get_plant_stage_summary(p1.plant_id)
+        assert summary["veg_days"] == 7
+        assert summary["flower_days"] == 3
+        assert coordinator.get_growspace_stage_summary(gs.id)["flower_days"] == 3
+
+    with freeze_time("2025-03-12 00:00:01"):
+        assert coordinator.get_plant_stage_summary(p1.plant_id)["flower_days"] == 4
+        assert coordinator.get_growspace_stage_summary(gs.id)["veg_days"] == 15
+
+    assert coordinator.get_plant_stage_summary("missing") == {}
+
+
+@pytest.mark.asyncio
+async def test_day_rollover_refreshes_listeners(hass):
+    """Test that the midnight callback publishes a full update and reschedules."""
+    coordinator = GrowspaceCoordinator(hass, data={})
+    listener = MagicMock()
+    unsub = coordinator.async_add_listener(listener)
+
+    with patch(
+        "custom_components.growspace_manager.coordinator.async_track_point_in_time"
+    ) as mock_track:
+        coordinator.async_start_day_rollover()
+        mock_track.assert_called_once()
+        callback_fn = mock_track.call_args.args[1]
+        next_midnight = mock_track.call_args.args[2]
+        assert (next_midnight.hour, next_midnight.minute) == (0, 0)
+
+        coordinator._plant_stage_summaries["p1"] = {"veg_days": 1}
+        callback_fn(next_midnight)
+
+        assert mock_track.call_count == 2
+        assert coordinator._plant_stage_summaries == {}
+        assert coordinator.last_changes.full
+        listener.assert_called_once()
+
+        coordinator.async_cancel_day_rollover()
+        mock_track.return_value.assert_called_once()
+    unsub()
+
+
+@freeze_time("2025-03-01")
+@pytest.mark.asyncio
+async def test_timed_notifications_wake_for_next_due_plant(hass):
+    """Test that timed notifications are scheduled from a heap of due dates."""
+    coordinator = GrowspaceCoordinator(hass, data={})
+    gs = await coordinator.async_add_growspace("Timed GS", rows=1, plants_per_row=2)
+    coordinator.options = {
+        "timed_notifications": [
+            {
+                "id": "n1",
+                "trigger_type": "veg",
+                "day": 10,
+                "message": "Top the plants",
+                "growspace_ids": [gs.id],
+            }
+        ]
+    }
+    late = await coordinator.async_add_plant(
+        gs.id, "Strain A", col=1, veg_start="2025-02-27"
+    )
+    early = await coordinator.async_add_plant(
+        gs.id, "Strain A", col=2, veg_start="2025-02-25"
+    )
+    coordinator._send_notification = AsyncMock()
+
+    with patch(
+        "custom_components.growspace_manager.coordinator.async_track_point_in_time"
+    ) as mock_track:
+        coordinator.async_start_timed_notifications()
+        mock_track.assert_called_once()
+        assert mock_track.call_args.args[2].date() == date(2025, 3, 7)
+
+        # Moving the late plant ahead reschedules only that plant
+        await coordinator.async_update_plant(late.plant_id, veg_start="2025-02-15")
+        assert coordinator._timed_due[(late.plant_id, "n1")] == date(2025, 2, 25)
+        assert mock_track.call_args.args[2].date() == date(2025, 2, 25)
+
+        await coordinator._async_check_timed_notifications()
+        coordinator._send_notification.assert_awaited_once_with(
+            gs.id, "Timed GS - Veg Day 10", "Top the plants"
+        )
+        assert coordinator._notifications_sent[late.plant_id]["timed_n1"] is True
+        assert mock_track.call_args.args[2].date() == date(2025, 3, 7)
+
+        # Already-sent notifications are not rescheduled
+        await coordinator.async_update_plant(late.plant_id, veg_start="2025-02-14")
+        assert (late.plant_id, "n1") not in coordinator._timed_due
+        assert (early.plant_id, "n1") in coordinator._timed_due
+
+        coordinator.async_cancel_timed_notifications()
+        assert coordinator._unsub_timed_notification is None
+
+
+@freeze_time("2025-03-01")
+@pytest.mark.asyncio
+async def test_timed_notifications_retry_after_send_failure(hass):
+    """Test that a failed send keeps the notification due and re-arms."""
+    coordinator = GrowspaceCoordinator(hass, data={})
+    gs = await coordinator.async_add_growspace("Timed GS", rows=1, plants_per_row=2)
+    coordinator.options = {
+        "timed_notifications": [
+            {
+                "id": "n1",
+                "trigger_type": "veg",
+                "day": 10,
+                "message": "Top the plants",
+                "growspace_ids": [gs.id],
+            }
+        ]
+    }
+    failing = await coordinator.async_add_plant(
+        gs.id, "Strain A", col=1, veg_start="2025-02-15"
+    )
+    working = await coordinator.async_add_plant(
+        gs.id, "Strain A", col=2, veg_start="2025-02-16"
+    )
+
+    async def send(growspace_id, title, message):
+        if coordinator._send_notification.await_count == 1:
+            raise ServiceNotFound("notify", "missing")
+
+    coordinator._send_notification = AsyncMock(side_effect=send)
+
+    with patch(
+        "custom_components.growspace_manager.coordinator.async_track_point_in_time"
+    ) as mock_track:
+        coordinator.async_start_timed_notifications()
+        await coordinator._async_check_timed_notifications()
+
+        # The failed send is neither marked sent nor dropped, the other goes out
+        assert coordinator._send_notification.await_count == 2
+        assert "timed_n1" not in coordinator._notifications_sent.get(
+            failing.plant_id, {}
+        )
+        assert coordinator._notifications_sent[working.plant_id]["timed_n1"] is True
+        assert coordinator._timed_due == {(failing.plant_id, "n1"): date(2025, 2, 25)}
+        # The retry waits for the next local midnight
+        assert mock_track.call_args.args[2].date() == date(2025, 3, 2)
+
+        await coordinator._async_check_timed_notifications()
+        assert coordinator._notifications_sent[failing.plant_id]["timed_n1"] is True
+        assert coordinator._timed_due == {}
+
+
 def test_guess_overview_entity_id(coordinator):
     """Test the _guess_overview_entity_id method.
     Args:
@@ -0,0 +1,177 @@
+"""Tests for the shared environment hub of the Growspace Manager integration."""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant, State
+from homeassistant.util import dt as dt_util
+
+from custom_components.growspace_manager.binary_sensor import (
+    BayesianMoldRiskSensor,
+    BayesianOptimalConditionsSensor,
+    BayesianStressSensor,
+)
+from custom_components.growspace_manager.environment_hub import (
+    EnvironmentHub,
+    async_start_trend_warmup,
+)
+
+ENV_CONFIG = {
+    "temperature_sensor": "sensor.temp",
+    "humidity_sensor": "sensor.humidity",
+    "vpd_sensor": "sensor.vpd",
+    "co2_sensor": None,
+    "circulation_fan": "switch.fan",
+}
+
+
+@pytest.fixture
+def mock_coordinator(hass: HomeAssistant):
+    """Provide a coordinator mock with one growspace."""
+    coordinator = MagicMock()
+    coordinator.hass = hass
+    growspace = MagicMock()
+    growspace.name = "Tent"
+    coordinator.growspaces = {"gs1": growspace}
+    coordinator.get_growspace_stage_summary.return_value = {
+        "veg_days": 10,
+        "flower_days": 0,
+    }
+    return coordinator
+
+
+@patch("custom_components.growspace_manager.environment_hub.async_track_state_change_event")
+def test_hub_subscribes_once_for_all_listeners(mock_track, mock_coordinator):
+    """Test that the hub tracks configured entities once, while it has listeners."""
+    hub = EnvironmentHub(mock_coordinator, "gs1", ENV_CONFIG)
+
+    remove_first = hub.async_add_listener(MagicMock())
+    remove_second = hub.async_add_listener(MagicMock())
+
+    mock_track.assert_called_once_with(
+        mock_coordinator.hass,
+        ["sensor.temp", "sensor.humidity", "sensor.vpd", "switch.fan"],
+        hub._async_state_changed,
+    )
+    mock_coordinator.async_subscribe_growspace.assert_called_once_with(
+        "gs1", hub._async_invalidate
+    )
+
+    remove_first()
+    mock_track.return_value.assert_not_called()
+    remove_second()
+    mock_track.return_value.assert_called_once()
+    mock_coordinator.async_subscribe_growspace.return_value.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_hub_builds_one_snapshot_per_change(hass: HomeAssistant, mock_coordinator):
+    """Test that sensors of a growspace share one snapshot per state change."""
+    hass.states.async_set("sensor.temp", "25")
+    hass.states.async_set("sensor.humidity", "60")
+    hass.states.async_set("sensor.vpd", "1.2")
+    hass.states.async_set("switch.fan", "on")
+
+    hub = EnvironmentHub(mock_coordinator, "gs1", ENV_CONFIG)
+    sensors = [
+        sensor_cls(mock_coordinator, "gs1", ENV_CONFIG, hub)
+        for sensor_cls in (
+            BayesianStressSensor,
+            BayesianMoldRiskSensor,
+            BayesianOptimalConditionsSensor,
+        )
+    ]
+    updates = MagicMock()
+    unsub = hub.async_add_listener(updates)
+    try:
+        for sensor in sensors:
+            sensor.hass = hass
+        states = [sensor._get_base_environment_state() for sensor in sensors]
+        assert states[0] is states[1] is states[2]
+        assert states[0].temp == 25.0
+        assert hub.stats == {"built": 1, "served": 3, "reads_saved": 2}
+
+        hass.states.async_set("sensor.temp", "30")
+        await hass.async_block_till_done()
+        updates.assert_called_once()
+
+        states = [sensor._get_base_environment_state() for sensor in sensors]
+        assert states[0].temp == 30.0
+        assert hub.stats == {"built": 2, "served": 6, "reads_saved": 4}
+        assert sensors[0]._sensor_states["temperature"] == 30.0
+    finally:
+        unsub()
+
+
+@pytest.mark.asyncio
+async def test_trend_analysis_reads_buffer_not_recorder(
+    hass: HomeAssistant, mock_coordinator
+):
+    """Test that a listening hub answers trend queries from its buffer."""
+    hass.states.async_set("sensor.temp", "25")
+    hub = EnvironmentHub(mock_coordinator, "gs1", ENV_CONFIG)
+    sensor = BayesianStressSensor(mock_coordinator, "gs1", ENV_CONFIG, hub)
+    sensor.hass = hass
+    unsub = hub.async_add_listener(MagicMock())
+    try:
+        for value in ("26", "27"):
+            hass.states.async_set("sensor.temp", value)
+            await hass.async_block_till_done()
+
+        with patch(
+            "custom_components.growspace_manager.binary_sensor.get_recorder_instance"
+        ) as mock_recorder:
+            analysis = await sensor._async_analyze_sensor_trend(
+                "sensor.temp", 30, 25.5
+            )
+        mock_recorder.assert_not_called()
+        assert analysis["trend"] == "rising"
+        assert analysis["crossed_threshold"] is True
+        assert (analysis["min"], analysis["max"]) == (26.0, 27.0)
+    finally:
+        unsub()
+
+
+@pytest.mark.asyncio
+async def test_shared_warmup_runs_one_query_for_all_hubs(
+    hass: HomeAssistant, mock_coordinator
+):
+    """Test that one recorder query seeds the trend buffers of every hub."""
+    hass.config.components.add("recorder")
+    now = dt_util.utcnow()
+    history_states = {
+        entity_id: [
+            State(entity_id, "20", last_updated=now - timedelta(minutes=20)),
+            State(entity_id, "23", last_updated=now - timedelta(minutes=5)),
+        ]
+        for entity_id in ("sensor.temp", "sensor.other_temp")
+    }
+    other_config = {**ENV_CONFIG, "temperature_sensor": "sensor.other_temp"}
+    hubs = [
+        EnvironmentHub(mock_coordinator, "gs1", ENV_CONFIG),
+        EnvironmentHub(mock_coordinator, "gs2", other_config),
+    ]
+
+    with patch(
+        "custom_components.growspace_manager.environment_hub.get_recorder_instance"
+    ) as mock_recorder:
+        mock_recorder.return_value.async_add_executor_job = AsyncMock(
+            return_value=history_states
+        )
+        async_start_trend_warmup(hass, hubs)
+        unsubs = [hub.async_add_listener(MagicMock()) for hub in hubs]
+        try:
+            buffers = [
+                await hubs[0].async_get_trend_buffer("sensor.temp"),
+                await hubs[1].async_get_trend_buffer("sensor.other_temp"),
+            ]
+        finally:
+            for unsub in unsubs:
+                unsub()
+
+    mock_recorder.return_value.async_add_executor_job.assert_awaited_once()
+    for buffer in buffers:
+        analysis = buffer.analyze(30 * 60, 19.0)
+        assert analysis["trend"] == "rising"
+        assert (analysis["min"], analysis["max"]) == (20.0, 23.0)
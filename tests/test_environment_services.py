@@ -1,9 +1,13 @@
 """Tests for the environment services."""
+from datetime import date, datetime
+
 import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
 from homeassistant.core import HomeAssistant, ServiceCall
+from custom_components.growspace_manager.bayesian_fitting import FitResult
 from custom_components.growspace_manager.services.environment import (
     handle_configure_environment,
+    handle_fit_bayesian_likelihoods,
     handle_remove_environment,
 )
 
@@ -90,3 +94,80 @@ async def test_environment_service_growspace_not_found(hass: HomeAssistant):
             "Growspace 'gs1' not found",
             title="Growspace Manager - Environment Config Error",
         )
+
+@pytest.mark.asyncio
+async def test_handle_fit_bayesian_likelihoods_applies_overrides(hass: HomeAssistant):
+    """Test that fitted values are returned and, with apply, stored."""
+    env_config = {"temperature_sensor": "sensor.temp", "prob_temp_warm": (0.65, 0.3)}
+    mock_coordinator = MagicMock()
+    mock_growspace = MagicMock()
+    mock_growspace.environment_config = env_config
+    mock_coordinator.growspaces = {"gs1": mock_growspace}
+    mock_coordinator.get_growspace_plants.return_value = []
+    mock_coordinator.async_save = AsyncMock()
+    mock_coordinator.async_refresh = AsyncMock()
+    result = FitResult(
+        samples=1000,
+        priors={"stress": 0.12},
+        likelihoods={"prob_temp_warm": (0.8, 0.1)},
+        support={"prior_stress": (120, 880), "prob_temp_warm": (120, 880)},
+    )
+
+    mock_call = MagicMock(spec=ServiceCall)
+    mock_call.data = {
+        "growspace_id": "gs1",
+        "incidents": [
+            {"sensor": "stress", "start": datetime(2024, 5, 1, 12), "end": date(2024, 5, 2)}
+        ],
+        "days": 7,
+        "sample_interval": 60,
+        "min_samples": 30,
+        "apply": True,
+    }
+
+    with patch(
+        "custom_components.growspace_manager.services.environment.async_fit_likelihoods",
+        AsyncMock(return_value=result),
+    ) as mock_fit, patch(
+        "custom_components.growspace_manager.services.environment.create_notification"
+    ) as mock_notification:
+        response = await handle_fit_bayesian_likelihoods(
+            hass, mock_coordinator, MagicMock(), mock_call
+        )
+
+    fitter = mock_fit.await_args.args[1]
+    assert fitter.entity_ids == ["sensor.temp"]
+    assert response["applied"] is True
+    assert response["reload_required"] is True
+    assert "reload the integration" in mock_notification.call_args.args[1]
+    assert response["likelihoods"] == {"prob_temp_warm": [0.8, 0.1]}
+    assert mock_growspace.environment_config == {
+        "temperature_sensor": "sensor.temp",
+        "prob_temp_warm": (0.8, 0.1),
+        "prior_stress": 0.12,
+    }
+    mock_coordinator.async_save.assert_awaited_once()
+    mock_coordinator.async_refresh.assert_awaited_once()
+
+    mock_growspace.environment_config = None
+    with patch(
+        "custom_components.growspace_manager.services.environment.create_notification"
+    ), pytest.raises(ValueError):
+        await handle_fit_bayesian_likelihoods(
+            hass, mock_coordinator, MagicMock(), mock_call
+        )
+
+    # An incident that ends before it starts is rejected before fitting
+    mock_growspace.environment_config = env_config
+    mock_call.data["incidents"] = [
+        {"sensor": "stress", "start": date(2024, 5, 2), "end": datetime(2024, 5, 1, 12)}
+    ]
+    with patch(
+        "custom_components.growspace_manager.services.environment.async_fit_likelihoods"
+    ) as mock_fit, patch(
+        "custom_components.growspace_manager.services.environment.create_notification"
+    ), pytest.raises(ValueError):
+        await handle_fit_bayesian_likelihoods(
+            hass, mock_coordinator, MagicMock(), mock_call
+        )
+    mock_fit.assert_not_called()
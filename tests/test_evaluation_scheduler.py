@@ -0,0 +1,99 @@
+"""Tests for the coalescing evaluation scheduler of the Growspace Manager."""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.growspace_manager.evaluation_scheduler import (
+    EvaluationScheduler,
+)
+
+
+@pytest.mark.asyncio
+async def test_burst_coalesces_into_one_rerun(hass: HomeAssistant):
+    """Test that a burst during a run leaves exactly one pending re-run."""
+    scheduler = EvaluationScheduler(hass, "gs1")
+    release = asyncio.Event()
+    calls = 0
+
+    async def evaluator() -> None:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+
+    remove = scheduler.async_add_evaluator(evaluator)
+    try:
+        scheduler.async_request()
+        await asyncio.sleep(0)
+        assert scheduler.queue_depth == 1
+
+        for _ in range(9):
+            scheduler.async_request()
+        assert scheduler.stats == {
+            "requests": 10,
+            "runs": 1,
+            "merged": 8,
+            "queue_depth": 2,
+        }
+
+        release.set()
+        await hass.async_block_till_done()
+        assert calls == 2
+        assert scheduler.runs == 2
+        assert scheduler.queue_depth == 0
+    finally:
+        remove()
+
+
+@pytest.mark.asyncio
+async def test_min_interval_defers_and_merges(hass: HomeAssistant):
+    """Test that requests inside the minimum interval wait for one timed run."""
+    scheduler = EvaluationScheduler(hass, "gs1", min_interval=60)
+    calls = 0
+
+    async def evaluator() -> None:
+        nonlocal calls
+        calls += 1
+
+    remove = scheduler.async_add_evaluator(evaluator)
+    try:
+        scheduler.async_request()
+        await hass.async_block_till_done()
+        assert calls == 1
+
+        scheduler.async_request()
+        scheduler.async_request()
+        await hass.async_block_till_done()
+        assert calls == 1
+        assert scheduler.queue_depth == 1
+        assert scheduler.merged == 1
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=61))
+        await hass.async_block_till_done()
+        assert calls == 2
+        assert scheduler.queue_depth == 0
+    finally:
+        remove()
+
+
+@pytest.mark.asyncio
+async def test_removing_last_evaluator_cancels_waiting_run(hass: HomeAssistant):
+    """Test that a run waiting for the interval is dropped with its evaluators."""
+    scheduler = EvaluationScheduler(hass, "gs1", min_interval=60)
+
+    async def evaluator() -> None:
+        """Do nothing."""
+
+    remove = scheduler.async_add_evaluator(evaluator)
+    scheduler.async_request()
+    await hass.async_block_till_done()
+    scheduler.async_request()
+    assert scheduler.queue_depth == 1
+
+    remove()
+    assert scheduler.queue_depth == 0
+    assert not scheduler.has_evaluators
@@ -12,7 +12,7 @@ from homeassistant.setup import async_setup_component
 from homeassistant.helpers import entity_registry as er
 
 from pytest_homeassistant_custom_component.common import MockConfigEntry
-from custom_components.growspace_manager import async_setup_entry, async_unload_entry, _register_services, async_reload_entry, _async_update_listener
+from custom_components.growspace_manager import async_setup, async_setup_entry, async_unload_entry, _register_services, async_reload_entry, _async_update_listener
 from custom_components.growspace_manager.const import (
     DOMAIN,
     ADD_GROWSPACE_SCHEMA,
@@ -76,6 +76,24 @@ def mock_strain_library_for_services():
     strain_library = MagicMock()
     return strain_library
 
+@pytest.mark.asyncio
+async def test_async_setup_registers_websocket_commands(mock_hass):
+    """Test that the WebSocket commands are registered once, outside entry setup."""
+    with patch(
+        "custom_components.growspace_manager.async_setup_websocket_api"
+    ) as mock_setup_websocket_api:
+        assert await async_setup(mock_hass, {})
+        mock_setup_websocket_api.assert_called_once_with(mock_hass)
+
+        entry = MockConfigEntry(domain=DOMAIN, data={}, options={})
+        entry.add_to_hass(mock_hass)
+        with patch("custom_components.growspace_manager.Store", return_value=AsyncMock()), \
+             patch("custom_components.growspace_manager.GrowspaceCoordinator", return_value=AsyncMock()), \
+             patch("custom_components.growspace_manager.StrainLibrary", return_value=AsyncMock()), \
+             patch("custom_components.growspace_manager._register_services", return_value=AsyncMock()):
+            assert await async_setup_entry(mock_hass, entry)
+        mock_setup_websocket_api.assert_called_once()
+
 @pytest.mark.asyncio
 async def test_async_setup_entry(mock_hass):
     """Test a successful setup of the integration entry."""
@@ -218,6 +236,22 @@ async def test_async_unload_entry(mock_hass):
     assert await async_unload_entry(mock_hass, entry)
     assert DOMAIN not in mock_hass.data
 
+@pytest.mark.asyncio
+async def test_async_unload_entry_flushes_pending_save(mock_hass):
+    """Test that unloading flushes any deferred coordinator save."""
+    entry = MockConfigEntry(domain=DOMAIN, data={}, options={}, entry_id="test_entry")
+    entry.add_to_hass(mock_hass)
+
+    coordinator = MagicMock()
+    coordinator.async_flush = AsyncMock()
+    mock_hass.data[DOMAIN] = {
+        entry.entry_id: {"created_entities": [], "coordinator": coordinator}
+    }
+    mock_hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
+
+    assert await async_unload_entry(mock_hass, entry)
+    coordinator.async_flush.assert_awaited_once()
+
 @pytest.mark.asyncio
 async def test_async_unload_entry_with_dynamic_entities(mock_hass):
     """Test unload with dynamic entities."""
@@ -92,6 +92,34 @@ def test_plant_from_dict_with_extra_fields():
     assert plant.plant_id == "p1"
     assert "extra_field" not in plant.to_dict()
 
+def test_plant_from_dict_normalizes_legacy_none_dates():
+    """Test that legacy "None" date strings are loaded as None."""
+    data = {
+        "plant_id": "p1",
+        "growspace_id": "gs1",
+        "strain": "OG",
+        "veg_start": "None",
+        "flower_start": "",
+    }
+    plant = Plant.from_dict(data)
+    assert plant.veg_start is None
+    assert plant.flower_start is None
+    assert plant.to_dict()["veg_start"] is None
+
+def test_plant_get_date_is_memoized_and_invalidated():
+    """Test that parsed stage dates are cached until the field is reassigned."""
+    plant = Plant(plant_id="p1", growspace_id="gs1", strain="OG", veg_start="2025-01-01T00:00:00")
+    assert plant.get_date("veg_start") == date(2025, 1, 1)
+    assert plant.get_date("veg_start") is plant.get_date("veg_start")
+
+    plant.veg_start = "2025-02-01"
+    assert plant.get_date("veg_start") == date(2025, 2, 1)
+    assert plant.to_dict()["veg_start"] == "2025-02-01"
+
+    plant.veg_start = "not a date"
+    assert plant.get_date("veg_start") is None
+    assert plant.get_date("flower_start") is None
+
 # --------------------
 # EnvironmentState Model Tests
 # --------------------
@@ -20,6 +20,8 @@ from custom_components.growspace_manager.services.plant import (
     handle_move_plant,
     handle_transition_plant_stage,
     handle_harvest_plant,
+    handle_transition_plants,
+    handle_harvest_plants,
 )
 
 from custom_components.growspace_manager.const import DOMAIN
@@ -2291,3 +2293,69 @@ async def test_take_clone_zero_clones(
 
     # Should default to 1
     mock_coordinator.async_add_plant.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_transition_plants_by_growspace(
+    hass: HomeAssistant, mock_coordinator, mock_strain_library, mock_plant
+):
+    """Test bulk transition targets every plant in a growspace."""
+    mock_coordinator.get_growspace_plants = Mock(return_value=[mock_plant])
+    mock_coordinator.async_transition_plants = AsyncMock(
+        return_value=[{"plant_id": "plant_1", "stage": "flower", "success": True}]
+    )
+
+    call = ServiceCall(
+        hass,
+        domain=DOMAIN,
+        service="transition_plants",
+        data={"growspace_id": "gs1", "new_stage": "flower"},
+    )
+
+    events = []
+    hass.bus.async_listen(f"{DOMAIN}_plant_transitioned", events.append)
+
+    response = await handle_transition_plants(hass, mock_coordinator, mock_strain_library, call)
+    await hass.async_block_till_done()
+
+    mock_coordinator.get_growspace_plants.assert_called_once_with("gs1")
+    mock_coordinator.async_transition_plants.assert_awaited_once_with(
+        ["plant_1"], "flower", None
+    )
+    assert response["succeeded"] == 1
+    assert response["failed"] == 0
+    assert len(events) == 1
+
+
+@pytest.mark.asyncio
+async def test_harvest_plants_reports_failures(
+    hass: HomeAssistant, mock_coordinator, mock_strain_library
+):
+    """Test bulk harvest returns per-plant results and only fires for successes."""
+    mock_coordinator.async_harvest_plants = AsyncMock(
+        return_value=[
+            {"plant_id": "p1", "growspace_id": "dry", "stage": "dry", "success": True},
+            {"plant_id": "p2", "success": False, "error": "Plant p2 does not exist"},
+        ]
+    )
+
+    call = ServiceCall(
+        hass,
+        domain=DOMAIN,
+        service="harvest_plants",
+        data={"plant_ids": ["p1", "p2"], "transition_date": date(2025, 3, 1)},
+    )
+
+    events = []
+    hass.bus.async_listen(f"{DOMAIN}_plant_harvested", events.append)
+
+    response = await handle_harvest_plants(hass, mock_coordinator, mock_strain_library, call)
+    await hass.async_block_till_done()
+
+    mock_coordinator.async_harvest_plants.assert_awaited_once_with(
+        ["p1", "p2"], target_growspace_id=None, transition_date="2025-03-01"
+    )
+    assert response["succeeded"] == 1
+    assert response["failed"] == 1
+    assert response["results"][1]["error"] == "Plant p2 does not exist"
+    assert len(events) == 1
@@ -22,7 +22,7 @@ from custom_components.growspace_manager.sensor import (
 )
 from custom_components.growspace_manager import sensor as sensor_module
 from custom_components.growspace_manager.coordinator import GrowspaceCoordinator
-from custom_components.growspace_manager.const import DOMAIN
+from custom_components.growspace_manager.const import DOMAIN, PLANT_STAGES
 
 
 # --------------------
@@ -66,6 +66,17 @@ def mock_coordinator():
     }
     coordinator.get_growspace_plants.return_value = list(coordinator.plants.values())
     coordinator.calculate_days_in_stage.side_effect = lambda plant, stage: 1
+    coordinator.get_plant_stage_summary.side_effect = lambda plant_id: {
+        **{f"{stage}_days": 1 for stage in PLANT_STAGES},
+        "veg_week": 1,
+        "flower_week": 1,
+    }
+    coordinator.get_growspace_stage_summary.return_value = {
+        "veg_days": 3,
+        "flower_days": 0,
+        "veg_week": 1,
+        "flower_week": 0,
+    }
     coordinator.should_send_notification.return_value = True
     coordinator.mark_notification_sent = AsyncMock()
     coordinator.async_add_listener = Mock()
@@ -237,6 +248,64 @@ def test_growspace_overview_sensor_state_and_attributes(mock_coordinator):
     # Grid positions
     assert attrs["grid"]["position_1_1"]["plant_id"] == "p1"
 
+def test_growspace_overview_sensor_caches_attributes_by_data_version(mock_coordinator):
+    """Test that the grid is rebuilt only on a new data version or day."""
+    mock_coordinator.growspace_data_version.return_value = 1
+    mock_coordinator.growspaces["gs1"].irrigation_config = {}
+    mock_coordinator.growspaces["gs1"].environment_config = {
+        "dehumidifier_entity": "humidifier.dehumidifier"
+    }
+    mock_coordinator.hass.states.get.return_value = Mock(
+        state="on", attributes={"humidity": 50}
+    )
+    gs = GrowspaceOverviewSensor(
+        mock_coordinator, "gs1", mock_coordinator.growspaces["gs1"]
+    )
+
+    first = gs.extra_state_attributes
+    mock_coordinator.hass.states.get.return_value = Mock(state="off", attributes={})
+    second = gs.extra_state_attributes
+
+    assert first["summary"] == {"plants": 1, "stages": {"veg": 1}}
+    assert "grid" in GrowspaceOverviewSensor._unrecorded_attributes
+    # Live device fields are re-read while the grid is reused
+    assert second["grid"] is first["grid"]
+    assert (first["dehumidifier_state"], second["dehumidifier_state"]) == ("on", "off")
+    assert mock_coordinator.get_growspace_plants.call_count == 1
+
+    mock_coordinator.growspace_data_version.return_value = 2
+    assert gs.extra_state_attributes["grid"] is not first["grid"]
+
+    with patch.object(sensor_module, "date") as mock_date:
+        mock_date.today.return_value = date.today() + timedelta(days=1)
+        gs.extra_state_attributes
+    assert mock_coordinator.get_growspace_plants.call_count == 3
+
+
+def test_growspace_overview_sensor_sparse_grid(mock_coordinator):
+    """Test that the sparse grid format leaves empty positions out."""
+    mock_coordinator.options = {"global_settings": {"grid_format": "sparse"}}
+    mock_coordinator.growspaces["gs1"].irrigation_config = {}
+    gs = GrowspaceOverviewSensor(
+        mock_coordinator, "gs1", mock_coordinator.growspaces["gs1"]
+    )
+
+    attrs = gs.extra_state_attributes
+    full = GrowspaceOverviewSensor(
+        mock_coordinator, "gs1", mock_coordinator.growspaces["gs1"]
+    )
+    full._sparse_grid = False
+    full_grid = full.extra_state_attributes["grid"]
+
+    # The sparse grid keeps the full grid's keys and entries, minus empty cells
+    assert attrs["grid"] == {
+        key: cell for key, cell in full_grid.items() if cell is not None
+    }
+    assert list(attrs["grid"]) == ["position_1_1"]
+    assert attrs["grid_format"] == "sparse"
+    assert attrs["occupancy"] == ["1", "0"]
+
+
 @pytest.mark.parametrize(
     "special_id, special_name",
     [
@@ -318,6 +387,32 @@ def test_plant_entity_missing_plant(mock_coordinator):
     assert entity.state == "unknown"
     assert entity.extra_state_attributes == {}
 
+@pytest.mark.asyncio
+async def test_plant_entity_writes_only_when_its_record_changes(mock_coordinator):
+    """Test that updates leaving the plant and its day counters as they were are skipped."""
+    entity = PlantEntity(mock_coordinator, mock_coordinator.plants["p1"])
+    entity.async_write_ha_state = Mock()
+    entity.async_on_remove = Mock()
+    await entity.async_added_to_hass()
+    update_callback = mock_coordinator.async_subscribe_plant.call_args[0][1]
+
+    update_callback()
+    entity.async_write_ha_state.assert_not_called()
+
+    mock_coordinator.plants["p1"].phenotype = "B"
+    update_callback()
+    update_callback()
+    assert entity.async_write_ha_state.call_count == 1
+
+    # The day rolling over moves the counters
+    mock_coordinator.get_plant_stage_summary.side_effect = lambda plant_id: {
+        **{f"{stage}_days": 2 for stage in PLANT_STAGES},
+        "veg_week": 1,
+        "flower_week": 1,
+    }
+    update_callback()
+    assert entity.async_write_ha_state.call_count == 2
+
 def test_plant_entity_parse_date_invalid(mock_coordinator):
     """Test _parse_date with an invalid date string."""
     entity = PlantEntity(mock_coordinator, mock_coordinator.plants["p1"])
@@ -407,6 +502,26 @@ def test_strain_library_sensor_state_and_attributes(mock_coordinator):
     assert pheno_c["total_harvests"] == 0
     assert pheno_c["description"] == "Not harvested yet"
 
+def test_strain_library_sensor_records_summary_only(mock_coordinator):
+    """Test that the analytics tree is unrecorded and summarized."""
+    mock_coordinator.strains.get_analytics.return_value = {
+        "strains": {
+            "Strain A": {
+                "analytics": {"total_harvests": 3},
+                "phenotypes": {"Pheno A": {}, "Pheno B": {}},
+            },
+            "Strain B": {"analytics": {"total_harvests": 0}, "phenotypes": {}},
+        },
+        "strain_list": ["Strain A", "Strain B"],
+    }
+    sensor = StrainLibrarySensor(mock_coordinator)
+
+    attrs = sensor.extra_state_attributes
+
+    assert attrs["strain_list"] == ["Strain A", "Strain B"]
+    assert attrs["summary"] == {"strains": 2, "phenotypes": 2, "harvests": 3}
+    assert sensor._unrecorded_attributes == {"strains", "strain_list"}
+
 # --------------------
 # GrowspaceListSensor
 # --------------------
@@ -10,7 +10,7 @@ from pytest_homeassistant_custom_component.common import mock_device_registry, m
 from custom_components.growspace_manager.sensor import async_setup_entry
 from custom_components.growspace_manager.coordinator import GrowspaceCoordinator
 from custom_components.growspace_manager.const import DOMAIN
-from custom_components.growspace_manager.models import Growspace, Plant
+from custom_components.growspace_manager.models import ChangeSet, Growspace, Plant
 
 @pytest.fixture
 def mock_hass():
@@ -206,4 +206,51 @@ async def test_handle_coordinator_update_remove_orphaned_plant(mock_hass, entity
         await listener_callback()
 
         # Assert that the entity was removed from the registry
-        mock_async_remove.assert_called_once_with("sensor.test_plant")
\ No newline at end of file
+        mock_async_remove.assert_called_once_with("sensor.test_plant")
+
+@pytest.mark.asyncio
+async def test_reconciliation_follows_structural_changes(mock_hass, entity_registry, device_registry):
+    """Test that only the plants in the change set are added or removed, in one batch."""
+    growspace = Growspace(id="gs1", name="Growspace 1", rows=2, plants_per_row=2)
+    p1, p2, p3, p4 = (
+        Plant(plant_id=f"p{i}", growspace_id="gs1", strain="Test Plant", row=1, col=i)
+        for i in range(1, 5)
+    )
+    coordinator = mock_hass.data[DOMAIN]["entry_1"]["coordinator"]
+    coordinator.growspaces = {"gs1": growspace}
+    coordinator.plants = {"p1": p1, "p2": p2}
+    coordinator.get_growspace_plants.return_value = [p1, p2]
+    async_add_entities = Mock()
+
+    await async_setup_entry(mock_hass, Mock(entry_id="entry_1", options={}), async_add_entities)
+    initial_entities = async_add_entities.call_args_list[0].args[0]
+    plant_entities = [e for e in initial_entities if hasattr(e, "_plant")]
+    for entity in plant_entities:
+        entity.async_remove = AsyncMock()
+    async_add_entities.reset_mock()
+    mock_hass.async_create_task = MagicMock()
+    listener_callback = coordinator.async_add_listener.call_args[0][0]
+
+    # p4 exists but is not in the change set, so it is not picked up yet
+    coordinator.plants = {"p3": p3, "p4": p4}
+    coordinator.last_changes = ChangeSet(plants_added={"p3"}, plants_removed={"p1", "p2"})
+    listener_callback()
+    await mock_hass.async_create_task.call_args[0][0]
+
+    async_add_entities.assert_called_once()
+    assert [e.unique_id for e in async_add_entities.call_args[0][0]] == [f"{DOMAIN}_p3"]
+    for entity in plant_entities:
+        entity.async_remove.assert_awaited_once()
+
+    # Field-only changes leave reconciliation alone
+    mock_hass.async_create_task.reset_mock()
+    coordinator.last_changes = ChangeSet(plants_changed={"p3"})
+    listener_callback()
+    mock_hass.async_create_task.assert_not_called()
+
+    # A full change set compares everything
+    async_add_entities.reset_mock()
+    coordinator.last_changes = ChangeSet(full=True)
+    listener_callback()
+    await mock_hass.async_create_task.call_args[0][0]
+    assert [e.unique_id for e in async_add_entities.call_args[0][0]] == [f"{DOMAIN}_p4"]
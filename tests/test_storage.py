@@ -0,0 +1,93 @@
+"""Tests for the sharded storage backend of the Growspace Manager integration."""
+
+import pytest
+from unittest.mock import MagicMock
+
+from custom_components.growspace_manager.const import STORAGE_KEY
+from custom_components.growspace_manager.coordinator import GrowspaceCoordinator
+
+SHARDED_OPTIONS = {"global_settings": {"storage_backend": "sharded"}}
+
+
+def _shard_key(growspace_id: str) -> str:
+    """Return the storage key of a growspace shard."""
+    return f"{STORAGE_KEY}.shard.{growspace_id}"
+
+
+@pytest.fixture
+def sharded_coordinator(hass):
+    """Provide a coordinator that persists to the sharded backend."""
+    coordinator = GrowspaceCoordinator(hass, data={}, options=SHARDED_OPTIONS)
+    coordinator.async_set_updated_data = MagicMock()
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_sharded_save_rewrites_only_changed_growspace(
+    sharded_coordinator, hass_storage
+):
+    """Test that editing a plant only rewrites its own growspace shard."""
+    coordinator = sharded_coordinator
+    gs_a = await coordinator.async_add_growspace("Tent A")
+    gs_b = await coordinator.async_add_growspace("Tent B")
+    plant_a = await coordinator.async_add_plant(gs_a.id, "Strain A")
+    plant_b = await coordinator.async_add_plant(gs_b.id, "Strain B")
+
+    assert STORAGE_KEY not in hass_storage
+    assert hass_storage[f"{STORAGE_KEY}.index"]["data"]["shards"] == sorted(
+        [gs_a.id, gs_b.id]
+    )
+    assert plant_b.plant_id in hass_storage[_shard_key(gs_b.id)]["data"]["plants"]
+
+    index_writes = coordinator.save_stats["index_writes"]
+    shard_writes = coordinator.save_stats["shard_writes"]
+    hass_storage[_shard_key(gs_b.id)]["data"]["plants"].clear()
+
+    await coordinator.async_update_plant(plant_a.plant_id, strain="Renamed")
+
+    assert coordinator.save_stats["shard_writes"] == shard_writes + 1
+    assert coordinator.save_stats["index_writes"] == index_writes
+    shard_a = hass_storage[_shard_key(gs_a.id)]["data"]
+    assert shard_a["plants"][plant_a.plant_id]["strain"] == "Renamed"
+    # The untouched shard was not rewritten
+    assert hass_storage[_shard_key(gs_b.id)]["data"]["plants"] == {}
+
+
+@pytest.mark.asyncio
+async def test_sharded_round_trip_and_shard_removal(
+    hass, sharded_coordinator, hass_storage
+):
+    """Test that sharded data reloads and removed growspaces lose their shard."""
+    coordinator = sharded_coordinator
+    gs_a = await coordinator.async_add_growspace("Tent A")
+    gs_b = await coordinator.async_add_growspace("Tent B")
+    plant = await coordinator.async_add_plant(gs_a.id, "Strain A")
+    await coordinator.mark_notification_sent(plant.plant_id, "veg", 21)
+
+    await coordinator.async_remove_growspace(gs_b.id)
+    assert _shard_key(gs_b.id) not in hass_storage
+
+    reloaded = GrowspaceCoordinator(hass, data={}, options=SHARDED_OPTIONS)
+    await reloaded.async_load()
+
+    assert set(reloaded.growspaces) == {gs_a.id}
+    assert reloaded.plants[plant.plant_id].strain == "Strain A"
+    assert not reloaded.should_send_notification(plant.plant_id, "veg", 21)
+
+
+@pytest.mark.asyncio
+async def test_switching_to_sharded_migrates_single_file(hass, hass_storage):
+    """Test that single-file data is moved into shards on first load."""
+    single = GrowspaceCoordinator(hass, data={})
+    single.async_set_updated_data = MagicMock()
+    gs = await single.async_add_growspace("Tent A")
+    plant = await single.async_add_plant(gs.id, "Strain A")
+    assert STORAGE_KEY in hass_storage
+
+    sharded = GrowspaceCoordinator(hass, data={}, options=SHARDED_OPTIONS)
+    await sharded.async_load()
+
+    assert STORAGE_KEY not in hass_storage
+    shard = hass_storage[_shard_key(gs.id)]["data"]
+    assert plant.plant_id in shard["plants"]
+    assert sharded.plants[plant.plant_id].growspace_id == gs.id
@@ -112,14 +112,15 @@ async def test_growspace_notification_switch_on_off(mock_coordinator):
 
 
 @pytest.mark.asyncio
-async def test_async_added_to_hass_calls_add_listener(mock_coordinator):
+async def test_async_added_to_hass_subscribes_to_growspace(mock_coordinator):
     growspace = SimpleNamespace(
         id="gs1", name="Growspace 1", notification_target="notify_me"
     )
     switch = GrowspaceNotificationSwitch(mock_coordinator, "gs1", growspace)
 
     await switch.async_added_to_hass()
-    # async_add_listener should be called once with async_write_ha_state
-    mock_coordinator.async_add_listener.assert_called_once_with(
-        switch.async_write_ha_state
+    # Only updates touching gs1 should write the switch state
+    mock_coordinator.async_subscribe_growspace.assert_called_once_with(
+        "gs1", switch.async_write_ha_state
     )
+    mock_coordinator.async_add_listener.assert_not_called()
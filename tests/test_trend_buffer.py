@@ -0,0 +1,71 @@
+"""Tests for the in-memory trend buffer of the Growspace Manager integration."""
+
+import pytest
+
+from custom_components.growspace_manager.trend_buffer import TrendBuffer
+
+NOW = 1_700_000_000.0
+
+
+def test_analyze_matches_recorder_semantics():
+    """Test trend, threshold, slope and range over a window."""
+    buffer = TrendBuffer(max_age=1800)
+    # Before the window: stands in for the start-time state
+    buffer.add(NOW - 1200, 24.0)
+    buffer.add(NOW - 600, 25.0)
+    buffer.add(NOW - 300, 26.0)
+    buffer.add(NOW, 27.0)
+
+    analysis = buffer.analyze(900, 23.5, now=NOW)
+
+    assert analysis["trend"] == "rising"
+    assert analysis["crossed_threshold"] is True
+    assert analysis["min"] == 24.0
+    assert analysis["max"] == 27.0
+    # 24 at -15 min, 25 at -10, 26 at -5, 27 at 0: one degree per five minutes
+    assert analysis["slope"] == pytest.approx(0.2)
+
+    assert buffer.analyze(900, 24.5, now=NOW)["crossed_threshold"] is False
+    # Only the value at the window start is left once the probe goes quiet
+    assert buffer.analyze(60, 0, now=NOW + 600)["trend"] == "stable"
+
+
+def test_single_sample_is_stable():
+    """Test that a window with fewer than two samples reports no trend."""
+    buffer = TrendBuffer(max_age=1800)
+    assert buffer.analyze(900, 0, now=NOW) == {
+        "trend": "stable",
+        "crossed_threshold": False,
+    }
+    buffer.add(NOW, 20.0)
+    assert buffer.analyze(900, 0, now=NOW)["trend"] == "stable"
+
+
+def test_buffer_is_bounded_by_age_and_count():
+    """Test that old samples are pruned but the window start value survives."""
+    buffer = TrendBuffer(max_age=600, max_samples=5)
+    for minute in range(20):
+        buffer.add(NOW + minute * 60, float(minute))
+
+    assert len(buffer) == 5
+    buffer = TrendBuffer(max_age=600)
+    for minute in range(20):
+        buffer.add(NOW + minute * 60, float(minute))
+    # Ten minutes of samples plus the one at the window start
+    assert len(buffer) == 11
+    assert buffer.window(600, now=NOW + 19 * 60)[0] == (NOW + 9 * 60, 9.0)
+
+
+def test_history_is_prepended_before_live_samples():
+    """Test that warm-up history never overrides live samples."""
+    buffer = TrendBuffer(max_age=1800)
+    buffer.add(NOW, 22.0)
+    buffer.add_history([(NOW - 600, 20.0), (NOW - 300, 21.0), (NOW, 99.0)])
+    buffer.add(NOW - 60, 50.0)
+
+    assert buffer.window(1800, now=NOW) == [
+        (NOW - 600, 20.0),
+        (NOW - 300, 21.0),
+        (NOW, 22.0),
+    ]
+    assert buffer.analyze(1800, 0, now=NOW)["trend"] == "rising"
@@ -13,6 +13,8 @@ from custom_components.growspace_manager.utils import (
     calculate_days_since,
     find_first_free_position,
     generate_growspace_grid,
+    generate_sparse_growspace_grid,
+    encode_row_bitmap,
 )
 from custom_components.growspace_manager.models import Plant, Growspace
 
@@ -124,3 +126,26 @@ def test_generate_growspace_grid_empty():
         [None, None],
         [None, None],
     ]
+
+
+def test_encode_row_bitmap():
+    """Test that occupied positions set one bit per column in each row."""
+    assert encode_row_bitmap(3, 40, [(1, 1), (1, 4), (3, 40), (4, 1), (2, 41)]) == [
+        "9",
+        "0",
+        "8000000000",
+    ]
+
+
+def test_generate_sparse_growspace_grid():
+    """Test that the sparse grid lists only the occupied positions."""
+    plants = [
+        Plant(plant_id="p1", row=1, col=1, strain="A", growspace_id="g1"),
+        Plant(plant_id="p2", row=2, col=3, strain="B", growspace_id="g1"),
+    ]
+    assert generate_sparse_growspace_grid(
+        2, 3, plants, lambda plant: plant.plant_id
+    ) == {
+        "grid": {"position_1_1": "p1", "position_2_3": "p2"},
+        "occupancy": ["1", "4"],
+    }
@@ -0,0 +1,107 @@
+"""Tests for the WebSocket commands of the Growspace Manager integration."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.growspace_manager.const import DOMAIN
+from custom_components.growspace_manager.coordinator import GrowspaceCoordinator
+from custom_components.growspace_manager.websocket_api import (
+    websocket_get_plants,
+    websocket_subscribe_growspace,
+)
+
+
+@pytest.fixture
+def connection():
+    """Provide a mock WebSocket connection."""
+    connection = MagicMock()
+    connection.subscriptions = {}
+    return connection
+
+
+@pytest.fixture
+def coordinator(hass):
+    """Provide a coordinator registered as a loaded config entry."""
+    coordinator = GrowspaceCoordinator(hass, data={})
+    hass.data.setdefault(DOMAIN, {})["entry"] = {"coordinator": coordinator}
+    return coordinator
+
+
+def _events(connection) -> list[dict]:
+    """Return the event payloads sent on a connection."""
+    return [call.args[0]["event"] for call in connection.send_message.call_args_list]
+
+
+@pytest.mark.asyncio
+async def test_get_plants(hass, coordinator, connection):
+    """Test that plants are returned per growspace or all together."""
+    gs1 = await coordinator.async_add_growspace("GS 1")
+    gs2 = await coordinator.async_add_growspace("GS 2")
+    p1 = await coordinator.async_add_plant(gs1.id, "Strain A")
+    p2 = await coordinator.async_add_plant(gs2.id, "Strain B")
+
+    websocket_get_plants(
+        hass, connection, {"id": 1, "type": "growspace_manager/get_plants"}
+    )
+    websocket_get_plants(
+        hass,
+        connection,
+        {"id": 2, "type": "growspace_manager/get_plants", "growspace_id": gs1.id},
+    )
+    websocket_get_plants(
+        hass,
+        connection,
+        {"id": 3, "type": "growspace_manager/get_plants", "growspace_id": "missing"},
+    )
+
+    first, second = connection.send_result.call_args_list
+    assert set(first.args[1]["plants"]) == {p1.plant_id, p2.plant_id}
+    assert second.args[1]["plants"] == {p1.plant_id: p1.to_dict()}
+    assert connection.send_error.call_args.args[:2] == (3, "not_found")
+
+
+@pytest.mark.asyncio
+async def test_subscribe_growspace_sends_snapshot_then_deltas(
+    hass, coordinator, connection
+):
+    """Test that subscribers receive only the plants that changed."""
+    gs1 = await coordinator.async_add_growspace("GS 1")
+    gs2 = await coordinator.async_add_growspace("GS 2")
+    p1 = await coordinator.async_add_plant(gs1.id, "Strain A", col=1)
+    p2 = await coordinator.async_add_plant(gs1.id, "Strain B", col=2)
+    other = await coordinator.async_add_plant(gs2.id, "Strain C")
+
+    websocket_subscribe_growspace(
+        hass,
+        connection,
+        {"id": 5, "type": "growspace_manager/subscribe_growspace", "growspace_id": gs1.id},
+    )
+    connection.send_result.assert_called_once_with(5)
+    snapshot = _events(connection)[0]
+    assert snapshot["type"] == "snapshot"
+    assert snapshot["growspace"]["name"] == "GS 1"
+    assert set(snapshot["plants"]) == {p1.plant_id, p2.plant_id}
+
+    await coordinator.async_update_plant(p1.plant_id, strain="Renamed")
+    await coordinator.async_update_plant(other.plant_id, strain="Elsewhere")
+    # A refresh with nothing new sends nothing
+    coordinator.async_set_updated_data(coordinator.data)
+    await coordinator.async_update_plant(p2.plant_id, growspace_id=gs2.id, col=2)
+
+    assert _events(connection)[1:] == [
+        {
+            "type": "delta",
+            "version": snapshot["version"] + 1,
+            "plants": {p1.plant_id: coordinator.plants[p1.plant_id].to_dict()},
+        },
+        {
+            "type": "delta",
+            "version": snapshot["version"] + 4,
+            "removed_plants": [p2.plant_id],
+        },
+    ]
+
+    connection.subscriptions[5]()
+    await coordinator.async_update_plant(p1.plant_id, strain="Unheard")
+    assert len(_events(connection)) == 3